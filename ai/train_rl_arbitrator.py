@@ -1,9 +1,10 @@
 import argparse
-import pandas as pd
-import numpy as np
+import math
 
+from ai.transitions import Transitions, iter_transitions, load_transitions
 from core.rl_arbitrator import RLArbitrator
 from core.rl_trainer import RLTrainer
+from core.state_encoder import StateEncoder
 
 # Default strategy universe. Extend this list to train on additional strategies.
 STRATEGIES = [
@@ -20,21 +21,15 @@ STRATEGIES = [
 ]
 
 
-def load_trade_data(path: str):
-    df = pd.read_csv(path)
-    transitions = []
-    for _, row in df.iterrows():
-        reward = 1.0 if row['pnl'] > 0 else -1.0
-        state = np.array([row['entry_price']], dtype=np.float32)
-        next_state = np.array([row['exit_price']], dtype=np.float32)
-        transitions.append((state, 0, reward, next_state, True))
-    return transitions
+def load_trade_data(path: str, strategies=STRATEGIES) -> Transitions:
+    """Read a whole trade log (CSV or Parquet) as transition arrays."""
+    return load_transitions(path, strategies)
 
 
 def main() -> None:
     parser = argparse.ArgumentParser()
     parser.add_argument("--algo", choices=["dqn", "ppo"], default="dqn")
-    parser.add_argument("--log", default="backtest_results/trade_log.csv")
+    parser.add_argument("--log", default="backtest_results/trade_log.csv", help="trade log, CSV or Parquet")
     parser.add_argument(
         "--add",
         action="append",
@@ -42,14 +37,23 @@ def main() -> None:
         metavar="STRATEGY",
         help="append additional strategy name",
     )
+    parser.add_argument("--chunksize", type=int, default=100_000, help="trades read and trained on per step")
+    parser.add_argument("--buffer", type=int, default=1_000_000, help="replay buffer capacity")
+    parser.add_argument("--epochs", type=int, default=1)
     args = parser.parse_args()
 
-    data = load_trade_data(args.log)
     strategies = STRATEGIES + args.add
-    arbitrator = RLArbitrator(strategies, state_size=1, algo=args.algo)
-    arbitrator.memory.extend(data)
+    encoder = StateEncoder()
+    arbitrator = RLArbitrator(strategies, state_size=encoder.dim, algo=args.algo, buffer_size=args.buffer)
     trainer = RLTrainer(arbitrator)
-    trainer.train(epochs=1)
+    trades = 0
+    for chunk in iter_transitions(args.log, strategies, args.chunksize, encoder):
+        if not len(chunk.actions):
+            continue
+        arbitrator.memory.add_batch(*chunk)
+        trades += len(chunk.actions)
+        loss = trainer.train(steps=args.epochs * math.ceil(len(chunk.actions) / trainer.batch_size))
+        print(f"Trained on {trades} trades, loss {loss:.4f}")
     arbitrator.model.save(f"arbitrator_{args.algo}.zip")
 
 
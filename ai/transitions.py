@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional, Sequence
+
+import numpy as np
+import pandas as pd
+
+from core.state_encoder import FEATURES, StateEncoder
+
+# Trade log columns the builder reads; the rest of the log is never loaded
+TRADE_COLUMNS = ["strategy", "symbol", "timeframe", "side", "entry_price", "exit_price", "pnl"]
+
+
+class Transitions(NamedTuple):
+    """Column arrays ready for ``ReplayBuffer.add_batch``."""
+
+    states: np.ndarray
+    actions: np.ndarray
+    rewards: np.ndarray
+    next_states: np.ndarray
+    dones: np.ndarray
+
+
+def build_transitions(
+    trades: pd.DataFrame, strategies: Sequence[str], encoder: Optional[StateEncoder] = None
+) -> Transitions:
+    """Turn trade log rows into one-step transitions in a single vectorized pass.
+
+    The action is the index of each row's ``strategy`` in ``strategies``;
+    rows for strategies outside that list are dropped. States encode the
+    symbol and timeframe with ``encoder``. The next state also carries the
+    trade's signed return, and the reward is +1 for a profitable trade,
+    -1 otherwise.
+    """
+    encoder = encoder or StateEncoder()
+    actions = pd.Index(list(strategies)).get_indexer(trades["strategy"])
+    known = actions >= 0
+    if not known.all():
+        trades = trades[known]
+        actions = actions[known]
+    frame = pd.DataFrame({
+        "symbol": trades["symbol"].astype(str).to_numpy(),
+        "timeframe": trades["timeframe"].astype(str).to_numpy(),
+    })
+    states = encoder.encode(frame)
+    entry = trades["entry_price"].to_numpy(dtype=np.float64)
+    exit_ = trades["exit_price"].to_numpy(dtype=np.float64)
+    direction = np.where(trades["side"].to_numpy() == "sell", -1.0, 1.0)
+    with np.errstate(invalid="ignore", divide="ignore"):
+        trade_return = np.nan_to_num((exit_ / entry - 1.0) * direction)
+    next_states = states.copy()
+    next_states[:, FEATURES.index("recent_return")] = np.tanh(trade_return)
+    rewards = np.where(trades["pnl"].to_numpy(dtype=np.float64) > 0, 1.0, -1.0).astype(np.float32)
+    return Transitions(states, actions.astype(np.int64), rewards, next_states, np.ones(len(actions), dtype=np.float32))
+
+
+def iter_trade_chunks(path: str, chunksize: int = 100_000) -> Iterator[pd.DataFrame]:
+    """Yield the trade log at ``path`` (CSV or Parquet) ``chunksize`` rows at a time."""
+    if Path(path).suffix in (".parquet", ".pq"):
+        import pyarrow.parquet as pq
+
+        for batch in pq.ParquetFile(path).iter_batches(batch_size=chunksize, columns=TRADE_COLUMNS):
+            yield batch.to_pandas()
+    else:
+        yield from pd.read_csv(path, usecols=TRADE_COLUMNS, chunksize=chunksize)
+
+
+def iter_transitions(
+    path: str,
+    strategies: Sequence[str],
+    chunksize: int = 100_000,
+    encoder: Optional[StateEncoder] = None,
+) -> Iterator[Transitions]:
+    """Stream a trade log as transition batches; memory stays bounded by ``chunksize``."""
+    encoder = encoder or StateEncoder()
+    for chunk in iter_trade_chunks(path, chunksize):
+        yield build_transitions(chunk, strategies, encoder)
+
+
+def load_transitions(path: str, strategies: Sequence[str], encoder: Optional[StateEncoder] = None) -> Transitions:
+    """Read a whole trade log into one set of transition arrays."""
+    parts = list(iter_transitions(path, strategies, encoder=encoder))
+    if not parts:
+        encoder = encoder or StateEncoder()
+        empty = np.zeros((0, encoder.dim), dtype=np.float32)
+        return Transitions(empty, np.zeros(0, np.int64), np.zeros(0, np.float32), empty, np.zeros(0, np.float32))
+    return Transitions(*(np.concatenate(column) for column in zip(*parts)))
@@ -0,0 +1,235 @@
+"""Performance metrics shared by the backtester and the live dashboard.
+
+The functions take whole equity curves or PnL arrays and use NumPy cumulative
+operations. :class:`RunningMetrics` and :class:`RunningDrawdown` keep the same
+statistics as running aggregates so live figures update in O(1) per trade.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+
+def _safe_div(num: float, den: float) -> float:
+    if den == 0:
+        return math.inf if num > 0 else 0.0
+    return num / den
+
+
+def drawdowns(equity: Sequence[float]) -> np.ndarray:
+    """Absolute distance of every point below its running peak."""
+    curve = np.asarray(equity, dtype=np.float64)
+    return np.maximum.accumulate(curve) - curve
+
+
+def max_drawdown(equity: Sequence[float]) -> float:
+    if len(equity) == 0:
+        return 0.0
+    return float(drawdowns(equity).max())
+
+
+def max_drawdown_pct(equity: Sequence[float]) -> float:
+    """Largest drawdown as a percentage of the peak it fell from."""
+    curve = np.asarray(equity, dtype=np.float64)
+    if curve.size == 0:
+        return 0.0
+    peak = np.maximum.accumulate(curve)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        pct = np.where(peak > 0, (peak - curve) / peak, 0.0)
+    return float(pct.max() * 100)
+
+
+def drawdown_duration(equity: Sequence[float]) -> int:
+    """Longest run of consecutive points below a previous peak."""
+    underwater = drawdowns(equity) > 0
+    if not underwater.any():
+        return 0
+    # Length of each run of True values
+    edges = np.diff(np.concatenate(([0], underwater.view(np.int8), [0])))
+    starts = np.flatnonzero(edges == 1)
+    ends = np.flatnonzero(edges == -1)
+    return int((ends - starts).max())
+
+
+def sharpe_ratio(returns: Sequence[float]) -> float:
+    """Mean over standard deviation of per-trade returns, scaled by sqrt(n)."""
+    r = np.asarray(returns, dtype=np.float64)
+    if r.size == 0:
+        return 0.0
+    std = r.std()
+    return float(r.mean() / std * np.sqrt(r.size)) if std != 0 else 0.0
+
+
+def sortino_ratio(returns: Sequence[float]) -> float:
+    """Like :func:`sharpe_ratio` but only penalising downside deviation."""
+    r = np.asarray(returns, dtype=np.float64)
+    if r.size == 0:
+        return 0.0
+    downside = np.sqrt(np.mean(np.minimum(r, 0.0) ** 2))
+    return float(r.mean() / downside * np.sqrt(r.size)) if downside != 0 else 0.0
+
+
+def profit_factor(pnls: Sequence[float]) -> float:
+    p = np.asarray(pnls, dtype=np.float64)
+    return _safe_div(float(p[p > 0].sum()), float(-p[p < 0].sum()))
+
+
+def summarize(
+    pnls: Sequence[float],
+    equity: Sequence[float],
+    initial_balance: float,
+    bars_in_market: int = 0,
+    total_bars: int = 0,
+) -> Dict[str, float]:
+    """Return the backtest summary for trade ``pnls`` and an ``equity`` curve."""
+    p = np.asarray(pnls, dtype=np.float64)
+    curve = np.asarray(equity, dtype=np.float64)
+    wins = p[p > 0]
+    losses = p[p <= 0]
+    n = p.size
+    expectancy = 0.0
+    if n:
+        avg_win = wins.mean() if wins.size else 0.0
+        avg_loss = -losses.mean() if losses.size else 0.0
+        prob_win = wins.size / n
+        expectancy = prob_win * avg_win - (1 - prob_win) * avg_loss
+    returns = p / initial_balance if initial_balance else p
+    final = float(curve[-1]) if curve.size else initial_balance
+    dd_pct = max_drawdown_pct(curve)
+    total_return_pct = (final / initial_balance - 1) * 100 if initial_balance else 0.0
+    return {
+        "net_profit": final - initial_balance,
+        "win_rate": wins.size / n * 100 if n else 0.0,
+        "sharpe_ratio": sharpe_ratio(returns),
+        "max_drawdown": max_drawdown(curve),
+        "expectancy": expectancy,
+        "trades": n,
+        "max_drawdown_pct": dd_pct,
+        "drawdown_duration": drawdown_duration(curve),
+        "sortino_ratio": sortino_ratio(returns),
+        "calmar_ratio": _safe_div(total_return_pct, dd_pct) if n else 0.0,
+        "profit_factor": profit_factor(p),
+        "exposure": bars_in_market / total_bars * 100 if total_bars else 0.0,
+    }
+
+
+class RunningDrawdown:
+    """Running peak and maximum drawdown of a value updated step by step."""
+
+    def __init__(self, start: float = 0.0) -> None:
+        self.reset(start)
+
+    def reset(self, start: float) -> None:
+        self.value = start
+        self.peak = start
+        self.max_drawdown = 0.0
+        self.max_drawdown_pct = 0.0
+        self.duration = 0
+        self.max_duration = 0
+
+    def update(self, value: float) -> None:
+        self.value = value
+        if value >= self.peak:
+            self.peak = value
+            self.duration = 0
+            return
+        self.duration += 1
+        self.max_duration = max(self.max_duration, self.duration)
+        dd = self.peak - value
+        if dd > self.max_drawdown:
+            self.max_drawdown = dd
+        if self.peak > 0:
+            self.max_drawdown_pct = max(self.max_drawdown_pct, dd / self.peak * 100)
+
+
+class RunningMetrics:
+    """Trade statistics maintained in O(1) per closed trade.
+
+    Mean and variance use Welford's update so long sessions stay accurate.
+    ``snapshot()`` returns the same keys as :func:`summarize` except
+    ``exposure``.
+    """
+
+    def __init__(self, initial_balance: float = 0.0) -> None:
+        self.initial_balance = initial_balance
+        self.count = 0
+        self.wins = 0
+        self.gross_profit = 0.0
+        self.gross_loss = 0.0
+        self.win_sum = 0.0
+        self.loss_sum = 0.0
+        self._mean = 0.0
+        self._m2 = 0.0
+        self._downside_sq = 0.0
+        self.equity = RunningDrawdown(initial_balance)
+
+    def update(self, pnl: float) -> None:
+        self.count += 1
+        if pnl > 0:
+            self.wins += 1
+            self.gross_profit += pnl
+            self.win_sum += pnl
+        else:
+            self.loss_sum += pnl
+            if pnl < 0:
+                self.gross_loss -= pnl
+        r = pnl / self.initial_balance if self.initial_balance else pnl
+        delta = r - self._mean
+        self._mean += delta / self.count
+        self._m2 += delta * (r - self._mean)
+        if r < 0:
+            self._downside_sq += r * r
+        self.equity.update(self.equity.value + pnl)
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.count * 100 if self.count else 0.0
+
+    @property
+    def profit_factor(self) -> float:
+        return _safe_div(self.gross_profit, self.gross_loss)
+
+    @property
+    def expectancy(self) -> float:
+        if not self.count:
+            return 0.0
+        losses = self.count - self.wins
+        avg_win = self.win_sum / self.wins if self.wins else 0.0
+        avg_loss = -self.loss_sum / losses if losses else 0.0
+        prob_win = self.wins / self.count
+        return prob_win * avg_win - (1 - prob_win) * avg_loss
+
+    @property
+    def sharpe_ratio(self) -> float:
+        if not self.count:
+            return 0.0
+        std = math.sqrt(self._m2 / self.count)
+        return self._mean / std * math.sqrt(self.count) if std != 0 else 0.0
+
+    @property
+    def sortino_ratio(self) -> float:
+        if not self.count:
+            return 0.0
+        downside = math.sqrt(self._downside_sq / self.count)
+        return self._mean / downside * math.sqrt(self.count) if downside != 0 else 0.0
+
+    def snapshot(self, initial_balance: Optional[float] = None) -> Dict[str, float]:
+        base = self.initial_balance if initial_balance is None else initial_balance
+        dd = self.equity
+        total_return_pct = (dd.value / base - 1) * 100 if base else 0.0
+        return {
+            "net_profit": dd.value - base,
+            "win_rate": self.win_rate,
+            "sharpe_ratio": self.sharpe_ratio,
+            "max_drawdown": dd.max_drawdown,
+            "expectancy": self.expectancy,
+            "trades": self.count,
+            "max_drawdown_pct": dd.max_drawdown_pct,
+            "drawdown_duration": dd.max_duration,
+            "sortino_ratio": self.sortino_ratio,
+            "calmar_ratio": _safe_div(total_return_pct, dd.max_drawdown_pct) if self.count else 0.0,
+            "profit_factor": self.profit_factor,
+        }
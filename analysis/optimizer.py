@@ -1,51 +1,237 @@
-import itertools
-from typing import Any, Dict, List, Tuple, Type
+from __future__ import annotations
 
-import yfinance as yf
+import csv
+import math
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, Type, Union
 
+import numpy as np
+import pandas as pd
+
+from backtest.engine import BacktestEngine
+from backtest.parallel import SharedFrameStore, _attach_frame
+from data.candle_store import CandleStore, TimeLike
 from strategies.base import BaseStrategy
-from backtest.backtester import Backtester
+from utils.indicator_cache import IndicatorCache
+
+Key = Tuple[str, str]
+Params = Dict[str, Any]
+# strategy class, params, bars per series (None for all), rung
+Task = Tuple[Type[BaseStrategy], Params, Optional[int], int]
+
+_WORKER_FRAMES: Dict[Key, pd.DataFrame] = {}
+_WORKER_CACHES: Dict[Key, IndicatorCache] = {}
+_WORKER_SEGMENTS: list = []
+_WORKER_CONFIG: Dict[str, float] = {}
+
+
+def _evaluate(
+    task: Task,
+    frames: Dict[Key, pd.DataFrame],
+    caches: Dict[Key, IndicatorCache],
+    config: Dict[str, float],
+) -> Dict[str, Any]:
+    """Backtest one parameter set on every series and return its summary row."""
+    strategy_cls, params, rows, rung = task
+    data = {key: df if rows is None else df.iloc[-rows:] for key, df in frames.items()}
+    strategies = []
+    for symbol, timeframe in data:
+        strategy = strategy_cls(symbol=symbol, timeframe=timeframe, **params)
+        strategy.indicator_cache = caches[(symbol, timeframe)]
+        strategies.append(strategy)
+    engine = BacktestEngine(data, strategies, config, keep_trades=False)
+    engine.run()
+    row: Dict[str, Any] = dict(params)
+    row.update(engine.summary())
+    row["trades"] = len(engine.trade_pnls)
+    row["bars"] = sum(len(df) for df in data.values())
+    row["rung"] = rung
+    return row
+
+
+def _init_worker(handles: Dict[Key, Any], config: Dict[str, float]) -> None:
+    _WORKER_CONFIG.update(config)
+    for key, handle in handles.items():
+        df, shm = _attach_frame(handle)
+        _WORKER_FRAMES[key] = df
+        _WORKER_CACHES[key] = IndicatorCache()
+        if shm is not None:
+            _WORKER_SEGMENTS.append(shm)
+
+
+def _evaluate_worker(task: Task) -> Dict[str, Any]:
+    return _evaluate(task, _WORKER_FRAMES, _WORKER_CACHES, _WORKER_CONFIG)
 
 
 class StrategyOptimizer:
-    """Optimize strategy parameters using historical data from yfinance."""
+    """Search strategy parameters with :class:`BacktestEngine` on local candles.
 
-    def __init__(self, strategy_cls: Type[BaseStrategy], param_grid: Dict[str, List[Any]], symbol: str, start: str, end: str):
+    Bars come from ``data`` or the candle store under ``store_dir``. Every
+    parameter set is backtested on each (symbol, timeframe) series, with the
+    indicator arrays shared through one :class:`IndicatorCache` per series.
+    Evaluations run on a process pool that maps the frames from shared
+    memory. Each finished row is appended to ``self.results``, passed to
+    ``on_result`` and written to ``results_path`` (CSV) straight away.
+    """
+
+    def __init__(
+        self,
+        strategy_cls: Type[BaseStrategy],
+        param_grid: Dict[str, List[Any]],
+        symbol: Union[str, Sequence[str], None] = None,
+        start: TimeLike = None,
+        end: TimeLike = None,
+        timeframe: Union[str, Sequence[str], None] = None,
+        data: Optional[Dict[Key, pd.DataFrame]] = None,
+        config: Optional[Dict[str, float]] = None,
+        metric: str = "net_profit",
+        workers: Optional[int] = None,
+        store_dir: Union[str, Path] = "data/processed",
+        results_path: Union[str, Path, None] = None,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None,
+    ) -> None:
         self.strategy_cls = strategy_cls
         self.param_grid = param_grid
         self.symbol = symbol
+        self.timeframe = timeframe
         self.start = start
         self.end = end
+        self.data = data
+        self.config = config or {}
+        self.metric = metric
+        self.workers = workers or os.cpu_count() or 1
+        self.store_dir = Path(store_dir)
+        self.results_path = Path(results_path) if results_path else None
+        self.on_result = on_result
+        self.results: List[Dict[str, Any]] = []
+        self._caches: Dict[Key, IndicatorCache] = {}
+
+    # ------------------------------------------------------------------
+    def _load(self) -> Dict[Key, pd.DataFrame]:
+        if self.data is None:
+            store = CandleStore(self.store_dir)
+            symbols = [self.symbol] if isinstance(self.symbol, str) else self.symbol
+            timeframes = [self.timeframe] if isinstance(self.timeframe, str) else self.timeframe
+            self.data = {
+                (sym, tf): store.read(sym, tf, self.start, self.end)
+                for sym, tf in store.keys()
+                if (symbols is None or sym in symbols) and (timeframes is None or tf in timeframes)
+            }
+            self.data = {key: df for key, df in self.data.items() if not df.empty}
+        if not self.data:
+            raise ValueError("no candle data to optimize on")
+        return self.data
+
+    @property
+    def size(self) -> int:
+        return math.prod(len(values) for values in self.param_grid.values())
+
+    def _params_at(self, index: int) -> Params:
+        """Decode the ``index``-th grid point without materialising the grid."""
+        params: Params = {}
+        for name in reversed(list(self.param_grid)):
+            values = self.param_grid[name]
+            index, pos = divmod(index, len(values))
+            params[name] = values[pos]
+        return {name: params[name] for name in self.param_grid}
+
+    def candidates(self) -> List[Params]:
+        return [self._params_at(i) for i in range(self.size)]
+
+    # ------------------------------------------------------------------
+    def _record(self, row: Dict[str, Any]) -> None:
+        self.results.append(row)
+        if self.results_path is not None:
+            new = not self.results_path.exists()
+            self.results_path.parent.mkdir(parents=True, exist_ok=True)
+            with self.results_path.open("a", newline="") as fh:
+                writer = csv.DictWriter(fh, fieldnames=list(row))
+                if new:
+                    writer.writeheader()
+                writer.writerow(row)
+        if self.on_result is not None:
+            self.on_result(row)
+
+    def _run(self, tasks: List[Task]) -> List[Dict[str, Any]]:
+        data = self._load()
+        rows: List[Dict[str, Any]] = []
+        if self.workers <= 1 or len(tasks) <= 1:
+            for key in data:
+                self._caches.setdefault(key, IndicatorCache())
+            for task in tasks:
+                row = _evaluate(task, data, self._caches, self.config)
+                self._record(row)
+                rows.append(row)
+            return rows
+        with SharedFrameStore(data) as store:
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(tasks)),
+                initializer=_init_worker,
+                initargs=(store.handles, self.config),
+            ) as pool:
+                for future in as_completed([pool.submit(_evaluate_worker, task) for task in tasks]):
+                    row = future.result()
+                    self._record(row)
+                    rows.append(row)
+        return rows
+
+    def _table(self, rows: List[Dict[str, Any]]) -> pd.DataFrame:
+        df = pd.DataFrame(rows)
+        if df.empty:
+            return df
+        return df.sort_values(self.metric, ascending=False, kind="stable").reset_index(drop=True)
+
+    # ------------------------------------------------------------------
+    def grid_search(self) -> pd.DataFrame:
+        """Evaluate every grid point on the full history."""
+        return self._table(self._run([(self.strategy_cls, p, None, 0) for p in self.candidates()]))
+
+    def random_search(self, n_iter: int, seed: Optional[int] = None) -> pd.DataFrame:
+        """Evaluate ``n_iter`` grid points drawn without replacement."""
+        indices = random.Random(seed).sample(range(self.size), min(n_iter, self.size))
+        return self._table(self._run([(self.strategy_cls, self._params_at(i), None, 0) for i in indices]))
+
+    def successive_halving(
+        self, eta: int = 3, min_bars: int = 500, candidates: Optional[List[Params]] = None
+    ) -> pd.DataFrame:
+        """Evaluate all candidates on recent bars and keep the best ``1/eta``.
+
+        Each rung multiplies the bars per series by ``eta`` until the
+        survivors are scored on the full history. Returns every evaluated row,
+        best of the last rung first.
+        """
+        pool = candidates if candidates is not None else self.candidates()
+        shortest = min(len(df) for df in self._load().values())
+        rungs = max(0, math.ceil(math.log(max(len(pool), 1), eta)))
+        rows: List[Dict[str, Any]] = []
+        for rung in range(rungs + 1):
+            bars: Optional[int] = min_bars * eta ** rung
+            if rung == rungs or bars >= shortest:
+                bars = None
+            scored = self._run([(self.strategy_cls, p, bars, rung) for p in pool])
+            rows.extend(scored)
+            if bars is None:
+                break
+            scored.sort(key=lambda r: r[self.metric], reverse=True)
+            keep = max(1, len(scored) // eta)
+            pool = [{name: row[name] for name in self.param_grid} for row in scored[:keep]]
+        table = pd.DataFrame(rows)
+        return table.sort_values(["rung", self.metric], ascending=False, kind="stable").reset_index(drop=True)
 
-    def _load_prices(self) -> List[float]:
-        df = yf.download(self.symbol, start=self.start, end=self.end, progress=False)
-        return df['Close'].dropna().tolist()
-
-    def _evaluate(self, trades: List[Tuple[str, float]], prices: List[float]) -> float:
-        position = 0
-        cash = 0.0
-        for side, price in trades:
-            if side == 'buy':
-                cash -= price
-                position += 1
-            elif side == 'sell':
-                cash += price
-                position -= 1
-        if position:
-            cash += position * prices[-1]
-        return cash
-
-    def optimize(self) -> Tuple[Dict[str, Any], float]:
-        prices = self._load_prices()
-        best_params: Dict[str, Any] = {}
-        best_score = float('-inf')
-        keys = list(self.param_grid.keys())
-        for values in itertools.product(*self.param_grid.values()):
-            params = dict(zip(keys, values))
-            strategy = self.strategy_cls(**params)
-            trades = Backtester(strategy).run(prices)
-            score = self._evaluate(trades, prices)
-            if score > best_score:
-                best_score = score
-                best_params = params
-        return best_params, best_score
+    def optimize(self, method: str = "grid", **kwargs: Any) -> Tuple[Params, float]:
+        """Run a search and return ``(best_params, best_score)``."""
+        searches = {
+            "grid": self.grid_search,
+            "random": self.random_search,
+            "halving": self.successive_halving,
+        }
+        if method not in searches:
+            raise ValueError(f"method must be one of {sorted(searches)}")
+        table = searches[method](**kwargs)
+        best = {name: table.at[0, name] for name in [*self.param_grid, self.metric]}
+        best = {name: v.item() if isinstance(v, np.generic) else v for name, v in best.items()}
+        score = best.pop(self.metric)
+        return best, float(score)
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple, Type
+
+import numpy as np
+import pandas as pd
+
+from backtest.engine import BacktestEngine
+from backtest.parallel import SharedFrameStore
+from strategies.base import BaseStrategy
+from utils.indicator_cache import IndicatorCache
+from . import optimizer
+from .optimizer import Key, Params, StrategyOptimizer
+
+# train_start, train_end, test_start, test_end as row positions (end exclusive)
+Window = Tuple[int, int, int, int]
+# strategy class, params, series key, windows
+Task = Tuple[Type[BaseStrategy], Params, Key, List[Window]]
+
+
+class _WindowSignals(BaseStrategy):
+    """Replay a slice of signals precomputed on the full series."""
+
+    def __init__(self, name: str, symbol: str, timeframe: str, risk_pct: float, signals) -> None:
+        super().__init__(name, symbol, timeframe, risk_pct)
+        self.signals = signals
+
+    def generate_signals(self, df):
+        return self.signals
+
+
+def _backtest_slice(
+    strategy: BaseStrategy, signals, df: pd.DataFrame, key: Key, start: int, end: int, config: Dict[str, float]
+) -> Dict[str, float]:
+    window = _WindowSignals(
+        strategy.name, key[0], key[1], strategy.risk_pct, tuple(a[start:end] for a in signals)
+    )
+    engine = BacktestEngine({key: df.iloc[start:end]}, [window], config, keep_trades=False)
+    engine.run()
+    summary = engine.summary()
+    summary["trades"] = len(engine.trade_pnls)
+    return summary
+
+
+def _walk(
+    task: Task, frames: Dict[Key, pd.DataFrame], caches: Dict[Key, IndicatorCache], config: Dict[str, float]
+) -> List[Tuple[Dict[str, float], Dict[str, float]]]:
+    """Score one parameter set on every train and test window of a series.
+
+    Signals are generated once over the whole series, so each window starts
+    with indicators already warmed up by the bars before it.
+    """
+    strategy_cls, params, key, windows = task
+    df = frames[key]
+    strategy = strategy_cls(symbol=key[0], timeframe=key[1], **params)
+    strategy.indicator_cache = caches[key]
+    signals = strategy.generate_signals(df)
+    if signals is None:
+        raise ValueError(f"{strategy_cls.__name__} has no vectorized generate_signals")
+    return [
+        (
+            _backtest_slice(strategy, signals, df, key, train_start, train_end, config),
+            _backtest_slice(strategy, signals, df, key, test_start, test_end, config),
+        )
+        for train_start, train_end, test_start, test_end in windows
+    ]
+
+
+def _walk_worker(task: Task):
+    return _walk(task, optimizer._WORKER_FRAMES, optimizer._WORKER_CACHES, optimizer._WORKER_CONFIG)
+
+
+class WalkForward:
+    """Walk-forward optimisation over rolling train/test windows.
+
+    Each (symbol, timeframe) series is split into windows of ``train_bars``
+    followed by ``test_bars``, advancing by ``step`` (``test_bars`` by
+    default; ``anchored`` keeps every train window starting at the first
+    bar). For each window the parameter set with the best train ``metric``
+    is selected and its test-window backtest reported. Windows are taken as
+    ``iloc`` views of the loaded frames, and each parameter set's signals are
+    computed once per series and sliced for every window, so indicator
+    warm-up carries over between adjacent windows instead of being redone.
+    Parameter sets are evaluated on a process pool.
+    """
+
+    def __init__(
+        self,
+        strategy_cls: Type[BaseStrategy],
+        param_grid: Dict[str, List[Any]],
+        train_bars: int,
+        test_bars: int,
+        step: Optional[int] = None,
+        anchored: bool = False,
+        data: Optional[Dict[Key, pd.DataFrame]] = None,
+        config: Optional[Dict[str, float]] = None,
+        metric: str = "net_profit",
+        workers: Optional[int] = None,
+        **store_kwargs: Any,
+    ) -> None:
+        self.optimizer = StrategyOptimizer(
+            strategy_cls, param_grid, data=data, config=config, metric=metric, workers=workers, **store_kwargs
+        )
+        self.strategy_cls = strategy_cls
+        self.train_bars = train_bars
+        self.test_bars = test_bars
+        self.step = step or test_bars
+        self.anchored = anchored
+        self.metric = metric
+        self.workers = workers or os.cpu_count() or 1
+        self.results = pd.DataFrame()
+
+    def windows(self, length: int) -> List[Window]:
+        windows = []
+        start = 0
+        while start + self.train_bars + self.test_bars <= length:
+            train_end = start + self.train_bars
+            windows.append((0 if self.anchored else start, train_end, train_end, train_end + self.test_bars))
+            start += self.step
+        return windows
+
+    def _scores(self, tasks: List[Task]) -> List[List[Tuple[Dict[str, float], Dict[str, float]]]]:
+        data = self.optimizer._load()
+        config = self.optimizer.config
+        if self.workers <= 1 or len(tasks) <= 1:
+            caches = {key: IndicatorCache() for key in data}
+            return [_walk(task, data, caches, config) for task in tasks]
+        with SharedFrameStore(data) as store:
+            with ProcessPoolExecutor(
+                max_workers=min(self.workers, len(tasks)),
+                initializer=optimizer._init_worker,
+                initargs=(store.handles, config),
+            ) as pool:
+                # Tasks for one series are adjacent so a worker's cache stays warm
+                return list(pool.map(_walk_worker, tasks, chunksize=max(1, len(tasks) // (4 * self.workers))))
+
+    def run(self) -> pd.DataFrame:
+        """Return one row per (symbol, timeframe, window) with the chosen params."""
+        data = self.optimizer._load()
+        candidates = self.optimizer.candidates()
+        tasks: List[Task] = []
+        for key, df in data.items():
+            windows = self.windows(len(df))
+            if windows:
+                tasks.extend((self.strategy_cls, params, key, windows) for params in candidates)
+        results = self._scores(tasks)
+        rows = []
+        for key, df in data.items():
+            windows = self.windows(len(df))
+            scored = [(task[1], result) for task, result in zip(tasks, results) if task[2] == key]
+            timestamps = df["timestamp"] if "timestamp" in df.columns else pd.Series(np.arange(len(df)))
+            for w, (train_start, train_end, test_start, test_end) in enumerate(windows):
+                params, (train, test) = max(
+                    ((params, result[w]) for params, result in scored), key=lambda item: item[1][0][self.metric]
+                )
+                row: Dict[str, Any] = {
+                    "symbol": key[0],
+                    "timeframe": key[1],
+                    "window": w,
+                    "train_start": timestamps.iloc[train_start],
+                    "test_start": timestamps.iloc[test_start],
+                    "test_end": timestamps.iloc[test_end - 1],
+                }
+                row.update(params)
+                row[f"train_{self.metric}"] = train[self.metric]
+                row.update({f"test_{name}": value for name, value in test.items()})
+                rows.append(row)
+        self.results = pd.DataFrame(rows)
+        return self.results
+
+    def summary(self) -> Dict[str, float]:
+        """Aggregate out-of-sample results over every window."""
+        results = self.results
+        if results.empty:
+            return {"windows": 0, "test_net_profit": 0.0, "profitable_windows": 0.0, "test_trades": 0}
+        return {
+            "windows": len(results),
+            "test_net_profit": float(results["test_net_profit"].sum()),
+            "profitable_windows": float((results["test_net_profit"] > 0).mean() * 100),
+            "test_trades": int(results["test_trades"].sum()),
+        }
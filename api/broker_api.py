@@ -1,4 +1,4 @@
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 from .config import Config
 from .open_api_http_future_private import OpenApiHttpFuturePrivate
@@ -29,3 +29,7 @@ class BrokerAPI:
             qty=str(qty),
             price=str(price),
         )
+
+    def cancel_orders(self, symbol: str, order_ids: List[str]) -> Dict[str, Any]:
+        """Cancel several orders of one symbol in a single request."""
+        return self.client.cancel_orders(symbol, [{"orderId": order_id} for order_id in order_ids])
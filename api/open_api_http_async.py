@@ -0,0 +1,322 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import random
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import aiohttp
+
+from api.config import Config
+from api.error_codes import ErrorCode
+from api.open_api_http_sign import get_auth_headers, sort_params
+from utils.rate_limiter import AsyncRateLimiter
+
+DEFAULT_BASE_URL = "https://fapi.bitunix.com"
+
+# Requests per second and burst for each endpoint class
+DEFAULT_LIMITS: Dict[str, Tuple[float, int]] = {
+    "market": (20.0, 20),
+    "account": (10.0, 10),
+    "trade": (10.0, 10),
+}
+
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+# Answers that mean the request was turned away before it was processed
+REJECTED_STATUSES = {429}
+
+
+def endpoint_class(path: str) -> str:
+    """
+    Map an API path to its rate limit class
+
+    Args:
+        path: Request path, e.g.: /api/v1/futures/market/tickers
+
+    Returns:
+        str: "market", "trade" or "account"
+    """
+    if "/market/" in path:
+        return "market"
+    if "/trade/" in path:
+        return "trade"
+    return "account"
+
+
+class AsyncOpenApiHttpFuture:
+    """
+    Async Bitunix futures REST client
+
+    All requests share one keep-alive connection pool and pass through a
+    token bucket per endpoint class. Idempotent requests (GET, or a body
+    carrying a ``clientId`` the exchange deduplicates on) answered with 429
+    or 5xx, or failing with a connection error or timeout, are retried with
+    exponential backoff (``Retry-After`` is honoured). Other requests, such
+    as an order without ``clientId``, may already have been executed when a
+    timeout or 5xx arrives, so they are only retried on 429 or when the
+    connection could not be opened. Public market endpoints are sent
+    unsigned; private ones are signed per request since every nonce must
+    be unique. Use as ``async with AsyncOpenApiHttpFuture(config) as client``.
+    """
+
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        base_url: Optional[str] = None,
+        limits: Optional[Dict[str, Tuple[float, int]]] = None,
+        max_connections: int = 50,
+        timeout: float = 10.0,
+        retries: int = 4,
+        backoff: float = 0.25,
+        max_backoff: float = 8.0,
+    ) -> None:
+        """
+        Initialize AsyncOpenApiHttpFuture class
+
+        Args:
+            config: Configuration object containing api_key and secret_key
+            base_url: Overrides ``config.uri_prefix``
+            limits: Per endpoint class ``(rate, burst)`` overriding DEFAULT_LIMITS
+            max_connections: Size of the shared connection pool
+            timeout: Total timeout per request attempt in seconds
+            retries: Retries after the first attempt
+            backoff: Delay before the first retry, doubled each time
+            max_backoff: Upper bound of the retry delay
+        """
+        self.config = config
+        self.api_key = config.api_key if config is not None else ""
+        self.secret_key = config.secret_key if config is not None else ""
+        self.base_url = (base_url or (config.uri_prefix if config is not None else "") or DEFAULT_BASE_URL).rstrip("/")
+        rates = dict(DEFAULT_LIMITS)
+        rates.update(limits or {})
+        self.limiters = {name: AsyncRateLimiter(rate, burst) for name, (rate, burst) in rates.items()}
+        self.max_connections = max_connections
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.retries = retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.session: Optional[aiohttp.ClientSession] = None
+        self.retried = 0
+
+    async def __aenter__(self) -> "AsyncOpenApiHttpFuture":
+        await self.open()
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        if self.session is None or self.session.closed:
+            connector = aiohttp.TCPConnector(limit=self.max_connections, ttl_dns_cache=300, keepalive_timeout=30)
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=self.timeout,
+                headers={"language": "en-US", "Content-Type": "application/json"},
+            )
+
+    async def close(self) -> None:
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _handle_payload(payload: Dict[str, Any]) -> Any:
+        if payload.get("code") != 0:
+            error = ErrorCode.get_by_code(payload.get("code"))
+            if error:
+                raise Exception(str(error))
+            raise Exception(f"Unknown Error: {payload.get('code')} - {payload.get('msg')}")
+        return payload.get("data")
+
+    @staticmethod
+    def _idempotent(method: str, data: Optional[Dict[str, Any]]) -> bool:
+        return method.upper() == "GET" or bool(data and data.get("clientId"))
+
+    def _delay(self, attempt: int, retry_after: Optional[str]) -> float:
+        if retry_after:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+        delay = min(self.backoff * 2 ** attempt, self.max_backoff)
+        return delay * (0.5 + random.random() / 2)
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        data: Optional[Dict[str, Any]] = None,
+        signed: Optional[bool] = None,
+    ) -> Any:
+        """
+        Send a request with rate limiting and retries
+
+        Args:
+            method: HTTP method
+            path: Request path starting with /api
+            params: Query parameters
+            data: JSON body
+            signed: Sign the request; defaults to True outside market endpoints
+
+        Returns:
+            Any: The ``data`` field of the response
+
+        Raises:
+            Exception: When the response is an error after all retries
+        """
+        await self.open()
+        kind = endpoint_class(path)
+        if signed is None:
+            signed = kind != "market"
+        params = {k: v for k, v in (params or {}).items() if v is not None}
+        body = json.dumps(data) if data is not None else ""
+        url = f"{self.base_url}{path}"
+        limiter = self.limiters.get(kind) or self.limiters["account"]
+        idempotent = self._idempotent(method, data)
+        retry_statuses = RETRY_STATUSES if idempotent else REJECTED_STATUSES
+        for attempt in range(self.retries + 1):
+            await limiter.acquire()
+            headers = get_auth_headers(self.api_key, self.secret_key, sort_params(params), body) if signed else None
+            last = attempt == self.retries
+            try:
+                async with self.session.request(
+                    method, url, params=params or None, data=body or None, headers=headers
+                ) as response:
+                    if response.status in retry_statuses and not last:
+                        self.retried += 1
+                        delay = self._delay(attempt, response.headers.get("Retry-After"))
+                        logging.warning(f"{method} {path} returned {response.status}, retrying in {delay:.2f}s")
+                        await asyncio.sleep(delay)
+                        continue
+                    if response.status != 200:
+                        raise Exception(f"HTTP Error: {response.status}")
+                    payload = await response.json(content_type=None)
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                # A failed connect never reached the exchange; anything later might have
+                sent = not isinstance(e, aiohttp.ClientConnectorError)
+                if last or (sent and not idempotent):
+                    raise
+                self.retried += 1
+                delay = self._delay(attempt, None)
+                logging.warning(f"{method} {path} failed ({e!r}), retrying in {delay:.2f}s")
+                await asyncio.sleep(delay)
+                continue
+            return self._handle_payload(payload)
+        raise Exception(f"HTTP Error: retries exhausted for {path}")
+
+    # ------------------------------------------------------------------
+    async def get_tickers(self, symbols: Optional[str] = None) -> Any:
+        """
+        Get futures trading pair market data
+
+        Args:
+            symbols: Futures trading pair, multiple separated by commas, e.g.: BTCUSDT,ETHUSDT
+        """
+        return await self.request("GET", "/api/v1/futures/market/tickers", {"symbols": symbols})
+
+    async def get_depth(self, symbol: str, limit: int = 100) -> Any:
+        return await self.request("GET", "/api/v1/futures/market/depth", {"symbol": symbol, "limit": limit})
+
+    async def get_kline(
+        self,
+        symbol: str,
+        interval: str,
+        limit: int = 100,
+        start_time: Optional[int] = None,
+        end_time: Optional[int] = None,
+        type: str = "LAST_PRICE",
+    ) -> Any:
+        params = {
+            "symbol": symbol,
+            "interval": interval,
+            "limit": limit,
+            "type": type,
+            "startTime": start_time,
+            "endTime": end_time,
+        }
+        return await self.request("GET", "/api/v1/futures/market/kline", params)
+
+    async def get_batch_funding_rate(self) -> Any:
+        return await self.request("GET", "/api/v1/futures/market/funding_rate/batch")
+
+    async def get_account(self, margin_coin: str = "USDT") -> Any:
+        return await self.request("GET", "/api/v1/futures/account", {"marginCoin": margin_coin})
+
+    async def place_order(
+        self,
+        symbol: str,
+        side: str,
+        order_type: str,
+        qty: str,
+        price: Optional[str] = None,
+        trade_side: str = "OPEN",
+        effect: str = "GTC",
+        reduce_only: bool = False,
+        client_id: Optional[str] = None,
+    ) -> Any:
+        data = {
+            "symbol": symbol,
+            "side": side,
+            "orderType": order_type,
+            "qty": qty,
+            "tradeSide": trade_side,
+            "effect": effect,
+            "reduceOnly": reduce_only,
+        }
+        if price is not None:
+            data["price"] = price
+        if client_id is not None:
+            data["clientId"] = client_id
+        return await self.request("POST", "/api/v1/futures/trade/place_order", data=data)
+
+    async def cancel_orders(self, symbol: str, order_list: List[Dict[str, str]]) -> Any:
+        data = {"symbol": symbol, "orderList": order_list}
+        return await self.request("POST", "/api/v1/futures/trade/cancel_orders", data=data)
+
+    # ------------------------------------------------------------------
+    async def tickers(self, symbols: Sequence[str], chunk: int = 50) -> Dict[str, Dict[str, Any]]:
+        """
+        Get tickers for many symbols, ``chunk`` symbols per request
+
+        Args:
+            symbols: Futures trading pairs
+            chunk: Symbols per request
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Ticker by symbol
+        """
+        groups = [",".join(symbols[i : i + chunk]) for i in range(0, len(symbols), chunk)]
+        results = await asyncio.gather(*(self.get_tickers(group) for group in groups))
+        return {row["symbol"]: row for rows in results for row in rows or []}
+
+    async def depths(self, symbols: Iterable[str], limit: int = 100) -> Dict[str, Any]:
+        """
+        Get order book depth for many symbols concurrently
+
+        Returns:
+            Dict[str, Any]: Depth by symbol; failures are logged and left out
+        """
+        symbols = list(symbols)
+        results = await asyncio.gather(*(self.get_depth(s, limit) for s in symbols), return_exceptions=True)
+        depths = {}
+        for symbol, result in zip(symbols, results):
+            if isinstance(result, Exception):
+                logging.error(f"Depth request failed for {symbol}: {result}")
+                continue
+            depths[symbol] = result
+        return depths
+
+    async def funding_rates(self, symbols: Optional[Iterable[str]] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get funding rates from the batch endpoint, optionally filtered
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Funding rate row by symbol
+        """
+        rows = await self.get_batch_funding_rate() or []
+        wanted = set(symbols) if symbols is not None else None
+        return {row["symbol"]: row for row in rows if wanted is None or row["symbol"] in wanted}
@@ -11,11 +11,18 @@ from api.config import Config
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(filename)s:%(lineno)d - %(message)s')
 
 class OpenApiWsFuturePublic:
-    def __init__(self, config: Config):
+    def __init__(self, config: Config, aggregator=None, order_books=None):
         """
         Initialize OpenApiWsFuturePublic class
+
+        Args:
+            config: Configuration object
+            aggregator: Optional CandleAggregator fed with every trade message
+            order_books: Optional OrderBookManager fed with every depth message
         """
         self.config = config
+        self.aggregator = aggregator
+        self.order_books = order_books
         self.base_url = config.public_ws_uri
         self.reconnect_interval = config.reconnect_interval
         self.message_queue = asyncio.Queue()
@@ -103,8 +110,10 @@ class OpenApiWsFuturePublic:
         try:
             if message['ch'] == 'trade':
                 # Handle real-time trade data
-                trade_data = message['data']
-                logging.info(f"Received trade data: {trade_data}")
+                if self.aggregator is not None:
+                    self.aggregator.on_message(message)
+                else:
+                    logging.info(f"Received trade data: {message['data']}")
                 
             elif message['ch'] == 'ticker':
                 # Handle 24-hour market data
@@ -113,8 +122,11 @@ class OpenApiWsFuturePublic:
                 
             elif message['ch'] == 'depth_book1':
                 # Handle order book depth data
-                depth_data = message['data']
-                logging.info(f"Received order book depth: {depth_data}")
+                if self.order_books is not None:
+                    self.order_books.on_message(message)
+                else:
+                    depth_data = message['data']
+                    logging.info(f"Received order book depth: {depth_data}")
                 
         except Exception as e:
             logging.error(f"Error processing message: {e}")
@@ -131,9 +143,11 @@ class OpenApiWsFuturePublic:
         
         while True:
             try:
-                ssl_context = ssl.create_default_context()
-                ssl_context.check_hostname = False
-                ssl_context.verify_mode = ssl.CERT_NONE
+                ssl_context = None
+                if self.base_url.startswith("wss://"):
+                    ssl_context = ssl.create_default_context()
+                    ssl_context.check_hostname = False
+                    ssl_context.verify_mode = ssl.CERT_NONE
                 async with websockets.connect(
                         self.base_url,
                         ssl=ssl_context,
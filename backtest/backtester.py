@@ -1,18 +1,28 @@
 from strategies.base import BaseStrategy
+from engine.events import TICK
+from engine.feeds import ReplayFeed
+from engine.trading_core import TradingCore
 
 
 class Backtester:
-    """Very simple backtesting engine."""
+    """Very simple backtesting engine.
+
+    Replays prices through :class:`TradingCore` without a broker and records
+    every buy or sell signal.
+    """
 
     def __init__(self, strategy: BaseStrategy):
         self.strategy = strategy
         self.trades = []
 
+    def _record(self, event, strategy, action) -> None:
+        if action in ("buy", "sell"):
+            self.trades.append((action, event.data["price"]))
+
     def run(self, prices: list[float]):
-        for price in prices:
-            self.strategy.on_data(price)
-            if self.strategy.should_buy():
-                self.trades.append(("buy", price))
-            elif self.strategy.should_sell():
-                self.trades.append(("sell", price))
+        core = TradingCore()
+        core.add_strategy(self.strategy, symbol="", timeframe=TICK)
+        core.on_signal(self._record)
+        core.add_feed(ReplayFeed(prices))
+        core.run()
         return self.trades
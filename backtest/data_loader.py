@@ -5,6 +5,8 @@ from typing import Dict, Tuple
 
 import pandas as pd
 
+from data.candle_store import CandleStore, TimeLike
+
 
 class CSVDataLoader:
     """Load preprocessed OHLCV data from a directory."""
@@ -23,4 +25,19 @@ class CSVDataLoader:
             if "timestamp" in df.columns:
                 df["timestamp"] = pd.to_datetime(df["timestamp"])
             data[(symbol, timeframe)] = df
-        return data
\ No newline at end of file
+        return data
+
+
+class CandleStoreLoader:
+    """Load OHLCV data for every key in a :class:`CandleStore`."""
+
+    def __init__(self, directory: str = "data/processed", start: TimeLike = None, end: TimeLike = None) -> None:
+        self.store = CandleStore(directory)
+        self.start = start
+        self.end = end
+
+    def load(self) -> Dict[Tuple[str, str], pd.DataFrame]:
+        return {
+            (symbol, timeframe): self.store.read(symbol, timeframe, self.start, self.end)
+            for symbol, timeframe in self.store.keys()
+        }
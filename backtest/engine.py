@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import math
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterator, List, Tuple
 
 import numpy as np
 import pandas as pd
 
-from strategies.base import BaseStrategy, Signal
+from analysis.metrics import summarize
+from core.bar_series import BarSeries
+from data.order_book import OrderBook
+from .kernel import simulate
+from strategies.base import ACTION_CODES, BUY, HOLD, SELL, BaseStrategy, Signal
 
 
 @dataclass
@@ -35,6 +40,10 @@ class BacktestEngine:
         strategies: List[BaseStrategy],
         config: Dict[str, float] | None = None,
         rl_arbitrator=None,
+        vectorized: bool = True,
+        order_books: Dict[str, OrderBook] | None = None,
+        use_kernel: bool = True,
+        keep_trades: bool = True,
     ) -> None:
         self.data = data
         self.strategies = strategies
@@ -46,74 +55,196 @@ class BacktestEngine:
         if config:
             self.config.update(config)
         self.trade_log: List[Trade] = []
+        # PnL of every closed trade in order; kept even when ``keep_trades``
+        # is off so sweeps can skip building Trade records
+        self.trade_pnls: List[float] = []
+        self.keep_trades = keep_trades
+        # Bars spent in a position and bars simulated, for exposure
+        self.bars_in_market = 0
+        self.total_bars = 0
         self.equity = self.config["initial_balance"]
         self.equity_curve: List[float] = [self.equity]
         self.strategy_results: Dict[str, List[float]] = {s.name: [] for s in strategies}
         self.rl_arbitrator = rl_arbitrator
+        self.vectorized = vectorized
+        # Optional per-symbol books used to size slippage by order quantity
+        self.order_books = order_books or {}
+        # Simulate precomputed signals in backtest.kernel; the per-bar loop
+        # below stays as the reference implementation
+        self.use_kernel = use_kernel
 
-    def _apply_slippage(self, price: float, side: str) -> float:
-        adj = price * self.config["slippage_pct"]
+    def _apply_slippage(self, price: float, side: str, symbol: str | None = None, qty: float | None = None) -> float:
+        pct = None
+        book = self.order_books.get(symbol) if symbol is not None else None
+        if book is not None and qty:
+            pct = book.slippage_pct(side, qty)
+        if pct is None:
+            pct = self.config["slippage_pct"]
+        adj = price * pct
         return price + adj if side == "buy" else price - adj
 
     def _apply_fee(self, price: float, qty: float) -> float:
         return price * qty * self.config["fee_pct"]
 
+    def _signal_stream(
+        self, strategy: BaseStrategy, df: pd.DataFrame | BarSeries
+    ) -> Iterator[Tuple[int, float | None, float | None]]:
+        """Yield ``(action, sl, tp)`` for every bar of ``df``.
+
+        Uses the strategy's vectorized ``generate_signals`` when available and
+        falls back to calling ``generate_signal`` on each growing slice. Slices
+        of a :class:`BarSeries` are views, so the fallback does not copy bars.
+        """
+        signals = strategy.generate_signals(df) if self.vectorized else None
+        if signals is None:
+            for i in range(len(df)):
+                signal = strategy.generate_signal(df[: i + 1])
+                if isinstance(signal, Signal):
+                    yield ACTION_CODES.get(signal.action, HOLD), signal.sl, signal.tp
+                else:
+                    yield HOLD, None, None
+            return
+        actions, sls, tps = signals
+        for action, sl, tp in zip(actions.tolist(), sls.tolist(), tps.tolist()):
+            yield action, None if math.isnan(sl) else sl, None if math.isnan(tp) else tp
+
+    def _record_kernel(
+        self, strategy: BaseStrategy, df: pd.DataFrame, symbol: str, timeframe: str, trades: np.ndarray
+    ) -> None:
+        pnls = trades["pnl"].tolist()
+        self.bars_in_market += int((trades["exit_idx"] - trades["entry_idx"]).sum())
+        self.trade_pnls.extend(pnls)
+        self.strategy_results[strategy.name].extend(pnls)
+        if not self.keep_trades:
+            for pnl in pnls:
+                self.equity += pnl
+                self.equity_curve.append(self.equity)
+            if self.rl_arbitrator is not None:
+                for pnl in pnls:
+                    self.rl_arbitrator.update(1.0 if pnl > 0 else -1.0, np.array([pnl]))
+            return
+        timestamps = df["timestamp"]
+        entry_times = timestamps.iloc[trades["entry_idx"]].tolist()
+        exit_times = timestamps.iloc[trades["exit_idx"]].tolist()
+        columns = zip(
+            trades["side"].tolist(),
+            entry_times,
+            exit_times,
+            trades["entry_price"].tolist(),
+            trades["exit_price"].tolist(),
+            trades["sl"].tolist(),
+            trades["tp"].tolist(),
+            trades["qty"].tolist(),
+            pnls,
+        )
+        for side, entry_time, exit_time, entry_price, exit_price, sl, tp, qty, pnl in columns:
+            self.equity += pnl
+            self.equity_curve.append(self.equity)
+            self.trade_log.append(
+                Trade(
+                    strategy=strategy.name,
+                    symbol=symbol,
+                    timeframe=timeframe,
+                    side="buy" if side == BUY else "sell",
+                    entry_time=entry_time,
+                    exit_time=exit_time,
+                    entry_price=entry_price,
+                    exit_price=exit_price,
+                    sl=None if math.isnan(sl) else sl,
+                    tp=None if math.isnan(tp) else tp,
+                    qty=qty,
+                    pnl=pnl,
+                )
+            )
+            if self.rl_arbitrator is not None:
+                self.rl_arbitrator.update(1.0 if pnl > 0 else -1.0, np.array([pnl]))
+
+    def _run_kernel(self, strategy: BaseStrategy, bars, df: pd.DataFrame, symbol: str, timeframe: str) -> bool:
+        """Simulate with :func:`backtest.kernel.simulate`; False if not applicable."""
+        if not (self.use_kernel and self.vectorized) or self.order_books:
+            return False
+        signals = strategy.generate_signals(bars)
+        if signals is None:
+            return False
+        trades, _ = simulate(
+            df["close"].to_numpy(),
+            df["high"].to_numpy(),
+            df["low"].to_numpy(),
+            *signals,
+            risk_pct=strategy.risk_pct,
+            equity=self.equity,
+            slippage_pct=self.config["slippage_pct"],
+            fee_pct=self.config["fee_pct"],
+        )
+        self._record_kernel(strategy, df, symbol, timeframe, trades)
+        return True
+
     def _run_single(self, strategy: BaseStrategy, df: pd.DataFrame, symbol: str, timeframe: str) -> None:
+        self.total_bars += len(df)
+        bars = BarSeries.from_frame(df) if strategy.accepts_bars else df
+        if self._run_kernel(strategy, bars, df, symbol, timeframe):
+            return
         position = None
         entry_price = 0.0
         qty = 0.0
         sl = None
         tp = None
         entry_time = None
-        for i in range(len(df)):
-            row = df.iloc[i]
-            context = df.iloc[: i + 1]
-            signal = strategy.generate_signal(context)
+        entry_index = 0
+        closes = df["close"].to_numpy()
+        highs = df["high"].to_numpy()
+        lows = df["low"].to_numpy()
+        timestamps = df["timestamp"]
+        for i, (action, signal_sl, signal_tp) in enumerate(self._signal_stream(strategy, bars)):
             if position is None:
-                if isinstance(signal, Signal) and signal.action in {"buy", "sell"}:
-                    side = signal.action
-                    entry_price = self._apply_slippage(row["close"], side)
-                    sl = signal.sl
-                    tp = signal.tp
-                    qty = (self.equity * strategy.risk_pct) / entry_price
+                if action != HOLD:
+                    side = "buy" if action == BUY else "sell"
+                    notional = self.equity * strategy.risk_pct
+                    entry_price = self._apply_slippage(closes[i], side, symbol, notional / closes[i])
+                    sl = signal_sl
+                    tp = signal_tp
+                    qty = notional / entry_price
                     position = side
-                    entry_time = row["timestamp"]
+                    entry_time = timestamps.iloc[i]
+                    entry_index = i
             else:
                 exit_reason = None
-                exit_price = row["close"]
+                exit_price = closes[i]
                 if position == "buy":
-                    if sl is not None and row["low"] <= sl:
+                    if sl is not None and lows[i] <= sl:
                         exit_price = sl
                         exit_reason = "sl"
-                    elif tp is not None and row["high"] >= tp:
+                    elif tp is not None and highs[i] >= tp:
                         exit_price = tp
                         exit_reason = "tp"
-                    elif isinstance(signal, Signal) and signal.action == "sell":
+                    elif action == SELL:
                         exit_reason = "signal"
                 else:
-                    if sl is not None and row["high"] >= sl:
+                    if sl is not None and highs[i] >= sl:
                         exit_price = sl
                         exit_reason = "sl"
-                    elif tp is not None and row["low"] <= tp:
+                    elif tp is not None and lows[i] <= tp:
                         exit_price = tp
                         exit_reason = "tp"
-                    elif isinstance(signal, Signal) and signal.action == "buy":
+                    elif action == BUY:
                         exit_reason = "signal"
                 if exit_reason:
-                    exit_price = self._apply_slippage(exit_price, "sell" if position == "buy" else "buy")
+                    exit_price = self._apply_slippage(exit_price, "sell" if position == "buy" else "buy", symbol, qty)
                     pnl = (exit_price - entry_price) * qty if position == "buy" else (entry_price - exit_price) * qty
                     fee = self._apply_fee(entry_price, qty) + self._apply_fee(exit_price, qty)
                     pnl -= fee
                     self.equity += pnl
                     self.equity_curve.append(self.equity)
                     self.strategy_results[strategy.name].append(pnl)
+                    self.trade_pnls.append(pnl)
+                    self.bars_in_market += i - entry_index
                     trade = Trade(
                         strategy=strategy.name,
                         symbol=symbol,
                         timeframe=timeframe,
                         side=position,
                         entry_time=entry_time,
-                        exit_time=row["timestamp"],
+                        exit_time=timestamps.iloc[i],
                         entry_price=entry_price,
                         exit_price=exit_price,
                         sl=sl,
@@ -131,13 +262,15 @@ class BacktestEngine:
                     tp = None
         # Close open position at last price
         if position is not None:
-            exit_price = self._apply_slippage(df.iloc[-1]["close"], "sell" if position == "buy" else "buy")
+            exit_price = self._apply_slippage(df.iloc[-1]["close"], "sell" if position == "buy" else "buy", symbol, qty)
             pnl = (exit_price - entry_price) * qty if position == "buy" else (entry_price - exit_price) * qty
             fee = self._apply_fee(entry_price, qty) + self._apply_fee(exit_price, qty)
             pnl -= fee
             self.equity += pnl
             self.equity_curve.append(self.equity)
             self.strategy_results[strategy.name].append(pnl)
+            self.trade_pnls.append(pnl)
+            self.bars_in_market += len(df) - 1 - entry_index
             trade = Trade(
                 strategy=strategy.name,
                 symbol=symbol,
@@ -177,36 +310,13 @@ class BacktestEngine:
 
     # Metrics
     def summary(self) -> Dict[str, float]:
-        profits = [t.pnl for t in self.trade_log]
-        win_trades = [p for p in profits if p > 0]
-        loss_trades = [p for p in profits if p <= 0]
-        sharpe = 0.0
-        if profits:
-            returns = np.array(profits) / self.config["initial_balance"]
-            if returns.std() != 0:
-                sharpe = returns.mean() / returns.std() * np.sqrt(len(returns))
-        max_dd = 0.0
-        peak = self.equity_curve[0]
-        for val in self.equity_curve:
-            if val > peak:
-                peak = val
-            dd = peak - val
-            if dd > max_dd:
-                max_dd = dd
-        expectancy = 0.0
-        if profits:
-            avg_win = np.mean(win_trades) if win_trades else 0.0
-            avg_loss = -np.mean(loss_trades) if loss_trades else 0.0
-            prob_win = len(win_trades) / len(profits)
-            expectancy = prob_win * avg_win - (1 - prob_win) * avg_loss
-        win_rate = len(win_trades) / len(profits) * 100 if profits else 0.0
-        return {
-            "net_profit": self.equity - self.config["initial_balance"],
-            "win_rate": win_rate,
-            "sharpe_ratio": sharpe,
-            "max_drawdown": max_dd,
-            "expectancy": expectancy,
-        }
+        return summarize(
+            self.trade_pnls,
+            self.equity_curve,
+            self.config["initial_balance"],
+            self.bars_in_market,
+            self.total_bars,
+        )
 
     def per_strategy_metrics(self) -> Dict[str, Dict[str, float]]:
         metrics: Dict[str, Dict[str, float]] = {}
@@ -220,6 +330,11 @@ class BacktestEngine:
         return metrics
 
     def save_trade_log(self, path: str = "backtest_results/trade_log.csv") -> None:
+        """Write the trade log as CSV, or as Parquet when ``path`` ends in .parquet."""
         Path(path).parent.mkdir(exist_ok=True)
-        df = pd.DataFrame([t.__dict__ for t in self.trade_log])
-        df.to_csv(path, index=False)
\ No newline at end of file
+        # Build column by column instead of one dict per trade
+        df = pd.DataFrame({f.name: [getattr(t, f.name) for t in self.trade_log] for f in fields(Trade)})
+        if Path(path).suffix in (".parquet", ".pq"):
+            df.to_parquet(path, index=False)
+        else:
+            df.to_csv(path, index=False)
\ No newline at end of file
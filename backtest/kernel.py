@@ -0,0 +1,167 @@
+from __future__ import annotations
+
+from typing import Tuple
+
+import numpy as np
+
+try:  # optional JIT; the same loop runs on plain lists without it
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is not a hard dependency
+    njit = None
+
+TRADE_DTYPE = np.dtype(
+    [
+        ("entry_idx", np.int64),
+        ("exit_idx", np.int64),
+        ("side", np.int8),
+        ("entry_price", np.float64),
+        ("exit_price", np.float64),
+        ("sl", np.float64),
+        ("tp", np.float64),
+        ("qty", np.float64),
+        ("pnl", np.float64),
+    ]
+)
+
+
+def _walk(closes, highs, lows, actions, sls, tps, entry_idx, exit_idx, sides, exit_raw, trade_sl, trade_tp):
+    """Run the position state machine and fill the preallocated event arrays.
+
+    Mirrors ``BacktestEngine._run_single``: entries happen on a non-hold
+    action while flat, and an open position checks SL, then TP, then an
+    opposite signal on every later bar. Returns the number of trades.
+    """
+    n = len(closes)
+    count = 0
+    side = 0
+    sl = np.nan
+    tp = np.nan
+    for i in range(n):
+        action = actions[i]
+        if side == 0:
+            if action != 0:
+                side = action
+                sl = sls[i]
+                tp = tps[i]
+                entry_idx[count] = i
+                sides[count] = side
+                trade_sl[count] = sl
+                trade_tp[count] = tp
+            continue
+        price = closes[i]
+        hit = False
+        if side == 1:
+            if sl == sl and lows[i] <= sl:
+                price = sl
+                hit = True
+            elif tp == tp and highs[i] >= tp:
+                price = tp
+                hit = True
+            elif action == -1:
+                hit = True
+        else:
+            if sl == sl and highs[i] >= sl:
+                price = sl
+                hit = True
+            elif tp == tp and lows[i] <= tp:
+                price = tp
+                hit = True
+            elif action == 1:
+                hit = True
+        if hit:
+            exit_idx[count] = i
+            exit_raw[count] = price
+            count += 1
+            side = 0
+    if side != 0:
+        exit_idx[count] = n - 1
+        exit_raw[count] = closes[n - 1]
+        count += 1
+    return count
+
+
+_walk_jit = njit(cache=True)(_walk) if njit is not None else None
+
+
+def simulate(
+    closes: np.ndarray,
+    highs: np.ndarray,
+    lows: np.ndarray,
+    actions: np.ndarray,
+    sls: np.ndarray,
+    tps: np.ndarray,
+    risk_pct: float,
+    equity: float,
+    slippage_pct: float = 0.0,
+    fee_pct: float = 0.0,
+) -> Tuple[np.ndarray, float]:
+    """Simulate trades over precomputed signal arrays.
+
+    ``actions`` holds ``BUY``/``SELL``/``HOLD`` codes and ``sls``/``tps`` use
+    ``NaN`` for no level, as returned by ``BaseStrategy.generate_signals``.
+    Returns a :data:`TRADE_DTYPE` array and the final equity. Prices, fees and
+    compounding follow the same arithmetic as the reference loop in
+    :class:`backtest.engine.BacktestEngine`, so results are bit-identical.
+    """
+    n = len(closes)
+    trades = np.zeros(0, dtype=TRADE_DTYPE)
+    if n == 0:
+        return trades, equity
+    size = n // 2 + 1
+    entry_idx = np.empty(size, dtype=np.int64)
+    exit_idx = np.empty(size, dtype=np.int64)
+    sides = np.empty(size, dtype=np.int8)
+    exit_raw = np.empty(size, dtype=np.float64)
+    trade_sl = np.empty(size, dtype=np.float64)
+    trade_tp = np.empty(size, dtype=np.float64)
+    outputs = (entry_idx, exit_idx, sides, exit_raw, trade_sl, trade_tp)
+    closes = np.ascontiguousarray(closes, dtype=np.float64)
+    if _walk_jit is not None:
+        count = _walk_jit(
+            closes,
+            np.ascontiguousarray(highs, dtype=np.float64),
+            np.ascontiguousarray(lows, dtype=np.float64),
+            np.ascontiguousarray(actions, dtype=np.int8),
+            np.ascontiguousarray(sls, dtype=np.float64),
+            np.ascontiguousarray(tps, dtype=np.float64),
+            *outputs,
+        )
+    else:
+        # Python lists index far faster than NumPy scalars in a plain loop
+        count = _walk(
+            closes.tolist(),
+            np.asarray(highs, dtype=np.float64).tolist(),
+            np.asarray(lows, dtype=np.float64).tolist(),
+            np.asarray(actions).tolist(),
+            np.asarray(sls, dtype=np.float64).tolist(),
+            np.asarray(tps, dtype=np.float64).tolist(),
+            *outputs,
+        )
+    trades = np.zeros(count, dtype=TRADE_DTYPE)
+    if not count:
+        return trades, equity
+    trades["entry_idx"] = entry_idx[:count]
+    trades["exit_idx"] = exit_idx[:count]
+    trades["side"] = sides[:count]
+    trades["sl"] = trade_sl[:count]
+    trades["tp"] = trade_tp[:count]
+    # Slippage moves entries against the trade and exits against the unwind
+    long = trades["side"] == 1
+    raw_entry = closes[trades["entry_idx"]]
+    entry_adj = raw_entry * slippage_pct
+    trades["entry_price"] = np.where(long, raw_entry + entry_adj, raw_entry - entry_adj)
+    exit_adj = exit_raw[:count] * slippage_pct
+    trades["exit_price"] = np.where(long, exit_raw[:count] - exit_adj, exit_raw[:count] + exit_adj)
+    # Position size compounds on equity, so walk the (few) trades in order
+    qtys = trades["qty"]
+    pnls = trades["pnl"]
+    for k, (is_long, entry, exit) in enumerate(
+        zip(long.tolist(), trades["entry_price"].tolist(), trades["exit_price"].tolist())
+    ):
+        qty = (equity * risk_pct) / entry
+        pnl = (exit - entry) * qty if is_long else (entry - exit) * qty
+        pnl -= entry * qty * fee_pct + exit * qty * fee_pct
+        equity += pnl
+        qtys[k] = qty
+        pnls[k] = pnl
+    return trades, equity
@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from strategies.base import BaseStrategy
+from .engine import BacktestEngine, Trade
+
+Key = Tuple[str, str]
+# column name, dtype, time zone (datetime columns only)
+ColumnSpec = Tuple[str, str, Optional[str]]
+# ("shm", segment name, rows, columns) or ("pickle", frame)
+FrameHandle = Union[Tuple[str, str, int, List[ColumnSpec]], Tuple[str, pd.DataFrame]]
+
+_WORKER_FRAMES: Dict[Key, pd.DataFrame] = {}
+_WORKER_SEGMENTS: List[shared_memory.SharedMemory] = []
+_WORKER_CONFIG: Dict[str, float] = {}
+
+
+def _column_spec(name: str, col: pd.Series) -> Optional[ColumnSpec]:
+    """Describe a column that can live in shared memory, or return None."""
+    dtype = col.dtype
+    if isinstance(dtype, pd.DatetimeTZDtype):
+        return name, str(dtype), str(dtype.tz)
+    if isinstance(dtype, np.dtype) and dtype.kind in "biufM":
+        return name, str(dtype), None
+    return None
+
+
+def _layout(rows: int, columns: List[ColumnSpec]) -> Tuple[List[Tuple[np.dtype, int]], int]:
+    """Return each column's storage dtype and offset, and the segment size.
+
+    Datetimes are stored as int64 nanoseconds since the epoch (UTC for
+    tz-aware columns); every column starts on an 8-byte boundary.
+    """
+    slots, offset = [], 0
+    for _, dtype, tz in columns:
+        storage = np.dtype(np.int64) if tz is not None or np.dtype(dtype).kind == "M" else np.dtype(dtype)
+        slots.append((storage, offset))
+        offset += -(-rows * storage.itemsize // 8) * 8
+    return slots, offset
+
+
+def _views(buf, rows: int, columns: List[ColumnSpec]) -> List[np.ndarray]:
+    slots, _ = _layout(rows, columns)
+    return [np.ndarray((rows,), dtype=storage, buffer=buf, offset=offset) for storage, offset in slots]
+
+
+class SharedFrameStore:
+    """Copy OHLCV frames into shared memory once so workers can map them.
+
+    Each frame becomes one segment holding every column contiguously in its
+    own dtype; datetime columns are kept as int64 nanoseconds and rebuilt
+    with their unit and time zone. Workers get back the same column order
+    and dtypes as the original frame. Frames that cannot be laid out this
+    way (object or extension columns, or a non-default index) are pickled
+    to each worker instead.
+    """
+
+    def __init__(self, data: Dict[Key, pd.DataFrame]) -> None:
+        self.segments: List[shared_memory.SharedMemory] = []
+        self.handles: Dict[Key, FrameHandle] = {}
+        for key, df in data.items():
+            columns = [_column_spec(name, df[name]) for name in df.columns]
+            default_index = isinstance(df.index, pd.RangeIndex) and df.index.equals(pd.RangeIndex(len(df)))
+            if not default_index or not df.columns.is_unique or any(spec is None for spec in columns):
+                self.handles[key] = ("pickle", df)
+                continue
+            rows = len(df)
+            shm = shared_memory.SharedMemory(create=True, size=max(_layout(rows, columns)[1], 1))
+            for (name, dtype, tz), view in zip(columns, _views(shm.buf, rows, columns)):
+                if tz is not None or np.dtype(dtype).kind == "M":
+                    view[:] = pd.DatetimeIndex(df[name]).as_unit("ns").asi8
+                else:
+                    view[:] = df[name].to_numpy()
+            self.segments.append(shm)
+            self.handles[key] = ("shm", shm.name, rows, columns)
+
+    def close(self) -> None:
+        for shm in self.segments:
+            shm.close()
+            shm.unlink()
+        self.segments.clear()
+
+    def __enter__(self) -> "SharedFrameStore":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def _attach_frame(handle: FrameHandle) -> Tuple[pd.DataFrame, Optional[shared_memory.SharedMemory]]:
+    """Rebuild a frame from its handle; the segment is None for pickled frames."""
+    if handle[0] == "pickle":
+        return handle[1], None
+    _, name, rows, columns = handle
+    shm = shared_memory.SharedMemory(name=name)
+    arrays = {}
+    for (col, dtype, tz), view in zip(columns, _views(shm.buf, rows, columns)):
+        if tz is not None:
+            arrays[col] = pd.Series(view.view("datetime64[ns]")).dt.tz_localize("UTC").dt.tz_convert(tz).astype(dtype)
+        elif np.dtype(dtype).kind == "M":
+            arrays[col] = view.view("datetime64[ns]").astype(dtype, copy=False)
+        else:
+            arrays[col] = view
+    return pd.DataFrame(arrays, copy=False), shm
+
+
+def _init_worker(handles: Dict[Key, FrameHandle], config: Dict[str, float]) -> None:
+    _WORKER_CONFIG.update(config)
+    for key, handle in handles.items():
+        df, shm = _attach_frame(handle)
+        _WORKER_FRAMES[key] = df
+        if shm is not None:
+            _WORKER_SEGMENTS.append(shm)
+
+
+def _run_cell(
+    config: Dict[str, float], key: Key, df: pd.DataFrame, strategy: BaseStrategy
+) -> Tuple[List[Trade], int, int]:
+    """Return the cell's trades, bars in market and bars simulated."""
+    engine = BacktestEngine({key: df}, [strategy], config)
+    engine._run_single(strategy, df, key[0], key[1])
+    return engine.trade_log, engine.bars_in_market, engine.total_bars
+
+
+def _run_worker_cell(cell: Tuple[Key, BaseStrategy]) -> Tuple[List[Trade], int, int]:
+    key, strategy = cell
+    return _run_cell(_WORKER_CONFIG, key, _WORKER_FRAMES[key], strategy)
+
+
+class ParallelBacktestEngine(BacktestEngine):
+    """Run every (symbol, timeframe, strategy) cell on a process pool.
+
+    Frames are placed in shared memory once and mapped by each worker, so only
+    the small strategy objects are pickled per task. Every cell sizes its
+    positions from ``initial_balance`` so results do not depend on scheduling
+    or on ``workers`` (``workers=1`` runs the cells inline); trades are merged
+    back in data order, then strategy order. Unlike :class:`BacktestEngine`
+    there is no ``rl_arbitrator``: cells run in separate processes and could
+    not update a shared one.
+    """
+
+    def __init__(
+        self,
+        data: Dict[Key, pd.DataFrame],
+        strategies: List[BaseStrategy],
+        config: Dict[str, float] | None = None,
+        workers: int | None = None,
+    ) -> None:
+        super().__init__(data, strategies, config)
+        self.workers = workers or os.cpu_count() or 1
+
+    def _cells(self) -> List[Tuple[Key, BaseStrategy]]:
+        cells = []
+        for key in self.data:
+            for strategy in self.strategies:
+                if (strategy.symbol, strategy.timeframe) == key:
+                    cells.append((key, strategy))
+        return cells
+
+    def run(self) -> None:
+        cells = self._cells()
+        if self.workers <= 1 or len(cells) <= 1:
+            results = [_run_cell(self.config, key, self.data[key], s) for key, s in cells]
+        else:
+            with SharedFrameStore({key: self.data[key] for key, _ in cells}) as store:
+                with ProcessPoolExecutor(
+                    max_workers=min(self.workers, len(cells)),
+                    initializer=_init_worker,
+                    initargs=(store.handles, self.config),
+                ) as pool:
+                    results = list(pool.map(_run_worker_cell, cells))
+        for trades, bars_in_market, total_bars in results:
+            self.bars_in_market += bars_in_market
+            self.total_bars += total_bars
+            for trade in trades:
+                self.trade_log.append(trade)
+                self.strategy_results[trade.strategy].append(trade.pnl)
+                self.trade_pnls.append(trade.pnl)
+                self.equity += trade.pnl
+                self.equity_curve.append(self.equity)
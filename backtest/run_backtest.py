@@ -1,3 +1,4 @@
+import argparse
 import os
 import importlib
 import inspect
@@ -5,8 +6,8 @@ import logging
 
 
 from strategies.base import BaseStrategy
-from backtest.data_loader import CSVDataLoader
-from backtest.engine import BacktestEngine
+from backtest.data_loader import CandleStoreLoader, CSVDataLoader
+from backtest.parallel import ParallelBacktestEngine
 
 logging.basicConfig(level=logging.INFO)
 
@@ -45,11 +46,16 @@ def _instantiate_strategies(data: dict) -> list[BaseStrategy]:
     return strategies
 
 
-def run() -> None:
-    loader = CSVDataLoader()
-    data = loader.load()
+def run(workers: int = 1, data: dict | None = None) -> ParallelBacktestEngine:
+    if data is None:
+        data = CandleStoreLoader().load()
+    if not data:
+        # fall back to legacy per-file CSVs
+        data = CSVDataLoader().load()
     strategies = _instantiate_strategies(data)
-    engine = BacktestEngine(data, strategies)
+    # Always the cell runner: it sizes every cell from the initial balance,
+    # so results do not depend on --workers (1 runs the cells inline)
+    engine = ParallelBacktestEngine(data, strategies, workers=workers)
     engine.run()
     for trade in engine.trade_log:
         logging.info(
@@ -62,7 +68,11 @@ def run() -> None:
     engine.save_trade_log()
     summary = engine.summary()
     logging.info("Backtest summary: %s", summary)
+    return engine
 
 
 if __name__ == "__main__":
-    run()
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--workers", type=int, default=1, help="processes for the parallel runner")
+    args = parser.parse_args()
+    run(args.workers)
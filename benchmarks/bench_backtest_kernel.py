@@ -0,0 +1,66 @@
+"""Time the trade simulation kernel against the reference per-bar loop.
+
+Run with ``python -m benchmarks.bench_backtest_kernel [rows]``. Signals are
+precomputed once by ``LiquiditySweepBot.generate_signals`` so only the
+position state machine is timed.
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from backtest import kernel
+from backtest.engine import BacktestEngine
+from strategies.liquidity_sweep import LiquiditySweepBot
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, rows)))
+    spread = np.abs(rng.normal(0, 0.001, rows)) * close
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2020-01-01", periods=rows, freq="min"),
+            "open": close,
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": 1.0,
+        }
+    )
+
+
+class _Precomputed(LiquiditySweepBot):
+    def __init__(self, signals):
+        super().__init__("BTCUSDT", "1m")
+        self.signals = signals
+
+    def generate_signals(self, df):
+        return self.signals
+
+
+def main(rows: int = 1_000_000) -> None:
+    df = _frame(rows)
+    signals = LiquiditySweepBot("BTCUSDT", "1m").generate_signals(df)
+    config = {"slippage_pct": 0.0005, "fee_pct": 0.001}
+    timings = {}
+    for use_kernel in (False, True):
+        engine = BacktestEngine({("BTCUSDT", "1m"): df}, [_Precomputed(signals)], config, use_kernel=use_kernel)
+        start = time.perf_counter()
+        engine.run()
+        timings[use_kernel] = (time.perf_counter() - start, len(engine.trade_log))
+    start = time.perf_counter()
+    trades, _ = kernel.simulate(
+        df["close"].to_numpy(), df["high"].to_numpy(), df["low"].to_numpy(), *signals, risk_pct=0.03, equity=10_000.0
+    )
+    raw = time.perf_counter() - start
+    print(f"rows: {rows}  trades: {len(trades)}  numba: {kernel.njit is not None}")
+    print(f"reference loop     {timings[False][0]:8.2f} s")
+    print(f"engine + kernel    {timings[True][0]:8.2f} s")
+    print(f"simulate() only    {raw:8.2f} s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
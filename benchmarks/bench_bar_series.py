@@ -0,0 +1,73 @@
+"""Compare per-bar allocations of strategies fed DataFrame slices or BarSeries views.
+
+Run with ``python -m benchmarks.bench_bar_series [rows]``. For each strategy the
+last 200 bars are evaluated one growing slice at a time, as the live engine
+does, and the peak transient allocation and latency per bar are reported.
+"""
+
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import pandas as pd
+
+from core.bar_series import BarSeries
+from strategies.breakout import BreakoutBot
+from strategies.grid import GridBot
+from strategies.liquidity_sweep import LiquiditySweepBot
+from strategies.mean_reversion_bot import MeanReversionBot
+from strategies.scalper import ScalperBot
+from strategies.swing import SwingBot
+
+STRATEGIES = [ScalperBot, SwingBot, MeanReversionBot, BreakoutBot, GridBot, LiquiditySweepBot]
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, rows)))
+    spread = np.abs(rng.normal(0, 0.002, rows)) * close
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=rows, freq="min"),
+            "open": close,
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.lognormal(3, 0.5, rows),
+        }
+    )
+
+
+def _measure(strategy, slices) -> tuple[float, float]:
+    peaks = []
+    tracemalloc.start()
+    for data in slices:
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        strategy.generate_signal(data())
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+    start = time.perf_counter()
+    for data in slices:
+        strategy.generate_signal(data())
+    return float(np.mean(peaks)), (time.perf_counter() - start) / len(slices)
+
+
+def main(rows: int = 2000) -> None:
+    df = _frame(rows)
+    bars = BarSeries.from_frame(df)
+    steps = range(rows - 200, rows)
+    print(f"rows: {rows}, bars evaluated: {len(steps)}")
+    print(f"{'strategy':<20}{'frame KiB/bar':>15}{'bars KiB/bar':>15}{'frame us/bar':>15}{'bars us/bar':>15}")
+    for cls in STRATEGIES:
+        frame_mem, frame_t = _measure(cls("TEST", "1m"), [lambda i=i: df.iloc[: i + 1] for i in steps])
+        bars_mem, bars_t = _measure(cls("TEST", "1m"), [lambda i=i: bars[: i + 1] for i in steps])
+        print(
+            f"{cls.__name__:<20}{frame_mem / 1024:15.1f}{bars_mem / 1024:15.1f}"
+            f"{frame_t * 1e6:15.1f}{bars_t * 1e6:15.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
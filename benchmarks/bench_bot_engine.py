@@ -0,0 +1,76 @@
+"""Measure multi-symbol tick dispatch through BotEngine's asyncio workers.
+
+Run with ``python -m benchmarks.bench_bot_engine [symbols] [ticks_per_symbol]``.
+"""
+
+import asyncio
+import sys
+import time
+
+import numpy as np
+
+from engine.bot_engine import BotEngine
+from strategies.base import BaseStrategy
+
+
+class _Orders:
+    def place_order(self, side, symbol, qty, price=None, order_type="market"):
+        return {"side": side, "symbol": symbol, "qty": qty}
+
+
+class _Risk:
+    def size_position(self, balance, price):
+        return 1.0
+
+
+class _Momentum(BaseStrategy):
+    """Trade when price crosses its running mean of the last 50 ticks."""
+
+    def __init__(self) -> None:
+        super().__init__("Momentum")
+        self.prices = []
+        self.side = "hold"
+
+    def on_data(self, price: float) -> None:
+        self.prices.append(price)
+        del self.prices[:-50]
+
+    def generate_signal(self):
+        mean = sum(self.prices) / len(self.prices)
+        want = "buy" if self.prices[-1] > mean else "sell"
+        if want == self.side:
+            return "hold"
+        self.side = want
+        return want
+
+
+async def _session(engine: BotEngine, symbols, prices) -> float:
+    await engine.start()
+    start = time.perf_counter()
+    for row in prices:
+        for symbol, price in zip(symbols, row):
+            engine.submit_tick(symbol, price)
+        await asyncio.sleep(0)
+    await engine.drain()
+    elapsed = time.perf_counter() - start
+    await engine.stop()
+    return elapsed
+
+
+def main(symbols: int = 200, ticks: int = 500) -> None:
+    names = [f"SYM{i}USDT" for i in range(symbols)]
+    engine = BotEngine(order_manager=_Orders(), risk_manager=_Risk())
+    for name in names:
+        engine.add_route(name, "tick", _Momentum())
+    rng = np.random.default_rng(0)
+    prices = (100 * np.exp(np.cumsum(rng.normal(0, 0.001, (ticks, symbols)), axis=0))).tolist()
+    elapsed = asyncio.run(_session(engine, names, prices))
+    latency = engine.latency_snapshot()
+    p99 = sorted(stats["p99"] for stats in latency.values())
+    orders = sum(state.orders for state in engine.symbols.values())
+    print(f"{symbols} symbols x {ticks} ticks: {symbols * ticks / elapsed:,.0f} ticks/s, {orders:,} orders")
+    print(f"per-symbol p99 latency: median {p99[len(p99) // 2] * 1e3:.2f} ms, worst {p99[-1] * 1e3:.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,73 @@
+"""Compare load time and disk size of the candle store against CSV files.
+
+Run with ``python -m benchmarks.bench_candle_store [rows]``.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from data.candle_store import CandleStore
+from data.feature_engineering import preprocess_and_engineer_features
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.001, rows)))
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2020-01-01", periods=rows, freq="min"),
+            "open": close,
+            "high": close * 1.001,
+            "low": close * 0.999,
+            "close": close,
+            "volume": rng.lognormal(3, 1, rows),
+        }
+    )
+    return preprocess_and_engineer_features(df)
+
+
+def _size(path: Path) -> int:
+    if path.is_file():
+        return path.stat().st_size
+    return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+def _timed(func, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(rows: int = 525_600) -> None:
+    df = _frame(rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        csv_path = root / "BTCUSDT_1m.csv"
+        df.to_csv(csv_path, index=False)
+        store = CandleStore(root / "store")
+        store.append("BTCUSDT", "1m", df)
+
+        def load_csv():
+            frame = pd.read_csv(csv_path)
+            frame["timestamp"] = pd.to_datetime(frame["timestamp"])
+
+        last_day = df["timestamp"].iloc[-1] - pd.Timedelta(days=1)
+        print(f"rows: {rows}")
+        print(f"csv   size {_size(csv_path) / 1e6:8.1f} MB  full load {_timed(load_csv) * 1e3:8.1f} ms")
+        print(
+            f"store size {_size(root / 'store') / 1e6:8.1f} MB  full load "
+            f"{_timed(lambda: store.read('BTCUSDT', '1m')) * 1e3:8.1f} ms  last day "
+            f"{_timed(lambda: store.read('BTCUSDT', '1m', start=last_day)) * 1e3:8.1f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 525_600)
@@ -0,0 +1,63 @@
+"""Measure event throughput of the event loop and the trading core.
+
+Run with ``python -m benchmarks.bench_event_core [bars] [symbols]``.
+"""
+
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from engine.brokers import SimulatedBroker
+from engine.events import BAR, EventLoop
+from engine.feeds import FrameFeed
+from engine.trading_core import TradingCore
+from strategies.liquidity_sweep import LiquiditySweepBot
+
+
+def _frame(rows: int, seed: int) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, rows)))
+    spread = np.abs(rng.normal(0, 0.002, rows)) * close
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=rows, freq="min"),
+            "open": close,
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.lognormal(3, 0.5, rows),
+        }
+    )
+
+
+def main(bars: int = 50_000, symbols: int = 4) -> None:
+    data = {(f"SYM{i}", "1m"): _frame(bars, i) for i in range(symbols)}
+    events = bars * symbols
+
+    loop = EventLoop()
+    loop.subscribe(BAR, lambda event: None)
+    loop.add_feed(FrameFeed(data))
+    start = time.perf_counter()
+    loop.run()
+    loop_elapsed = time.perf_counter() - start
+
+    strategies = [LiquiditySweepBot(symbol=sym, timeframe=tf) for sym, tf in data]
+    core = TradingCore(strategies, SimulatedBroker(slippage_pct=0.0005, fee_pct=0.001), bar_capacity=bars)
+    core.add_feed(FrameFeed(data))
+    start = time.perf_counter()
+    processed = core.run()
+    core.close_positions()
+    core_elapsed = time.perf_counter() - start
+
+    print(f"{events:,} bars over {symbols} symbols")
+    print(f"event loop only : {events / loop_elapsed:,.0f} events/s")
+    print(
+        f"trading core    : {processed / core_elapsed:,.0f} events/s "
+        f"({core.evaluations / events:.2f} evaluations per bar, {len(core.trade_log)} trades)"
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
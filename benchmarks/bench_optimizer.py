@@ -0,0 +1,56 @@
+"""Throughput of a ScalperBot parameter sweep.
+
+Run with ``python -m benchmarks.bench_optimizer [rows] [workers]``.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+import pandas as pd
+
+from analysis.optimizer import StrategyOptimizer
+from strategies.scalper import ScalperBot
+
+GRID = {
+    "fast": [3, 5, 8, 10, 12],
+    "slow": [13, 21, 34, 55],
+    "vol_window": [10, 20, 40],
+    "vol_threshold": [0.002, 0.003, 0.005, 0.008, 0.01],
+    "risk_pct": [0.005, 0.01],
+}
+
+
+def _frame(rows: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, rows)))
+    spread = np.abs(rng.normal(0, 0.002, rows)) * close
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=rows, freq="min"),
+            "open": close,
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": 1.0,
+        }
+    )
+
+
+def main(rows: int = 50_000, workers: int = os.cpu_count() or 1) -> None:
+    optimizer = StrategyOptimizer(ScalperBot, GRID, data={("BTCUSDT", "1m"): _frame(rows)}, workers=workers)
+    for method, kwargs in (("grid", {}), ("halving", {"min_bars": 2_000})):
+        optimizer.results.clear()
+        start = time.perf_counter()
+        params, score = optimizer.optimize(method, **kwargs)
+        elapsed = time.perf_counter() - start
+        print(
+            f"{method:<8} {len(optimizer.results):5d} evaluations in {elapsed:6.1f} s "
+            f"({len(optimizer.results) / elapsed:6.1f}/s)  best {params} -> {score:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    args = [int(a) for a in sys.argv[1:]]
+    main(*args)
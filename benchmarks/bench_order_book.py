@@ -0,0 +1,54 @@
+"""Measure incremental update throughput of the local order book.
+
+Run with ``python -m benchmarks.bench_order_book [updates]``.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from data.order_book import OrderBook
+
+
+def main(updates: int = 500_000) -> None:
+    rng = np.random.default_rng(0)
+    tick = 0.1
+    book = OrderBook("BTCUSDT")
+    book.apply_snapshot(
+        [(100.0 - tick * (i + 1), 1.0) for i in range(200)],
+        [(100.0 + tick * i, 1.0) for i in range(200)],
+    )
+    # Updates cluster near the touch, as they do on a live feed
+    offsets = np.minimum(rng.geometric(0.2, updates), 200) - 1
+    sides = rng.random(updates) < 0.5
+    qtys = np.where(rng.random(updates) < 0.2, 0.0, rng.lognormal(0, 1, updates))
+    levels = [
+        ([(100.0 - tick * (o + 1), q)], ()) if bid else ((), [(100.0 + tick * o, q)])
+        for o, bid, q in zip(offsets.tolist(), sides.tolist(), qtys.tolist())
+    ]
+
+    start = time.perf_counter()
+    for bids, asks in levels:
+        book.apply_update(bids, asks)
+    elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(100_000):
+        book.mid
+        book.spread
+    top_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(10_000):
+        book.slippage_pct("buy", 25.0)
+    fill_elapsed = time.perf_counter() - start
+
+    print(f"updates: {updates}  levels: {len(book.bids)} bids / {len(book.asks)} asks")
+    print(f"apply_update  {updates / elapsed:12,.0f} updates/s")
+    print(f"mid + spread  {100_000 / top_elapsed:12,.0f} reads/s")
+    print(f"slippage_pct  {10_000 / fill_elapsed:12,.0f} estimates/s")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 500_000)
@@ -0,0 +1,47 @@
+"""Measure RL arbitrator decisions per second, one by one and batched.
+
+Run with ``python -m benchmarks.bench_rl_arbitrator [keys] [rounds]``.
+"""
+
+import sys
+import time
+
+import numpy as np
+import torch
+
+from core.rl_arbitrator import RLArbitrator
+
+STRATEGIES = [f"Strategy{i}" for i in range(10)]
+
+
+def main(keys: int = 1_000, rounds: int = 20) -> None:
+    torch.set_num_threads(1)
+    arbitrator = RLArbitrator(STRATEGIES, state_size=8)
+    states = np.random.default_rng(0).normal(size=(keys, 8)).astype(np.float32)
+    pairs = [(f"SYM{i}USDT", "1m") for i in range(keys)]
+
+    # The previous path: one model.predict call per decision
+    sample = states[: min(keys, 500)]
+    start = time.perf_counter()
+    for state in sample:
+        arbitrator.model.predict(state, deterministic=True)
+    predict = len(sample) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for pair, state in zip(pairs[: len(sample)], sample):
+        arbitrator.select_strategy(*pair, state=state)
+    single = len(sample) / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        arbitrator.select_batch(pairs, states)
+    batched = keys * rounds / (time.perf_counter() - start)
+
+    print(f"model.predict per decision : {predict:>12,.0f} decisions/s")
+    print(f"select_strategy (NumPy)    : {single:>12,.0f} decisions/s")
+    print(f"select_batch               : {batched:>12,.0f} decisions/s ({keys} keys per call)")
+    print(f"batched speedup            : {batched / predict:.0f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
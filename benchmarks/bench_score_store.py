@@ -0,0 +1,62 @@
+"""Compare the whole-file JSON score store with the ring-buffer append-log store.
+
+Run with ``python -m benchmarks.bench_score_store [keys] [updates]``.
+"""
+
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from storage.strategy_score_store import StrategyScoreStore
+
+
+def _updates(keys: int, updates: int):
+    rng = random.Random(3)
+    return [(f"strategy_{rng.randrange(keys)}/SYM{rng.randrange(20)}", rng.uniform(-1, 1)) for _ in range(updates)]
+
+
+def _rewrite(path: Path, updates) -> float:
+    # The previous store: pop(0), full rescans and a JSON rewrite per update
+    scores = {}
+    start = time.perf_counter()
+    for name, result in updates:
+        profile = scores.setdefault(name, {"hit_rate": 0.0, "avg_return": 0.0, "recent_outcomes": []})
+        outcomes = profile["recent_outcomes"]
+        outcomes.append(result)
+        if len(outcomes) > 100:
+            outcomes.pop(0)
+        profile["hit_rate"] = sum(1 for r in outcomes if r > 0) / len(outcomes)
+        profile["avg_return"] = sum(outcomes) / len(outcomes)
+        with open(path, "w") as f:
+            json.dump(scores, f)
+    return time.perf_counter() - start
+
+
+def _append_log(path: Path, updates) -> float:
+    store = StrategyScoreStore(str(path))
+    start = time.perf_counter()
+    for name, result in updates:
+        store.update_score(name, result)
+        store.save()
+    store.compact()
+    elapsed = time.perf_counter() - start
+    store.close()
+    return elapsed
+
+
+def main(keys: int = 100, updates: int = 5_000) -> None:
+    batch = _updates(keys, updates)
+    with tempfile.TemporaryDirectory() as tmp:
+        rewrite = _rewrite(Path(tmp) / "rewrite.json", batch)
+        append_log = _append_log(Path(tmp) / "scores.json", batch)
+    print(f"keys           : {len({name for name, _ in batch}):,}")
+    print(f"JSON rewrite   : {updates / rewrite:,.0f} updates/s")
+    print(f"append log     : {updates / append_log:,.0f} updates/s (including final compaction)")
+    print(f"speedup        : {rewrite / append_log:.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:3]))
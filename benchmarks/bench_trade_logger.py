@@ -0,0 +1,58 @@
+"""Compare per-row commits with the batched WAL trade journal.
+
+Run with ``python -m benchmarks.bench_trade_logger [rows]``.
+"""
+
+import sqlite3
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from utils.trade_logger import INSERT, TradeLogger
+
+
+def _trades(rows: int):
+    return [
+        {"timestamp": f"2024-01-01T00:00:{i:08d}", "side": "buy", "symbol": f"S{i % 50}", "qty": 1.0, "price": 100.0}
+        for i in range(rows)
+    ]
+
+
+def _per_row(path: Path, trades) -> float:
+    # The previous journal: default rollback journal and a commit per trade
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE trades (id INTEGER PRIMARY KEY AUTOINCREMENT,"
+        " timestamp TEXT, side TEXT, symbol TEXT, qty REAL, price REAL)"
+    )
+    start = time.perf_counter()
+    for trade in trades:
+        conn.execute(INSERT, TradeLogger._row(trade))
+        conn.commit()
+    elapsed = time.perf_counter() - start
+    conn.close()
+    return elapsed
+
+
+def _batched(path: Path, trades) -> float:
+    logger = TradeLogger(str(path))
+    start = time.perf_counter()
+    for trade in trades:
+        logger.log_trade(trade)
+    logger.close()
+    return time.perf_counter() - start
+
+
+def main(rows: int = 20_000) -> None:
+    trades = _trades(rows)
+    with tempfile.TemporaryDirectory() as tmp:
+        per_row = _per_row(Path(tmp) / "per_row.db", trades)
+        batched = _batched(Path(tmp) / "batched.db", trades)
+    print(f"per-row commit : {rows / per_row:,.0f} inserts/s")
+    print(f"batched WAL    : {rows / batched:,.0f} inserts/s (including flush on close)")
+    print(f"speedup        : {per_row / batched:.1f}x")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
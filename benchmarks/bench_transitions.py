@@ -0,0 +1,76 @@
+"""Compare row-by-row trade log loading with the columnar transition builder.
+
+Run with ``python -m benchmarks.bench_transitions [trades]``.
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from ai.train_rl_arbitrator import STRATEGIES
+from ai.transitions import iter_transitions
+
+
+def _log(trades: int) -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    entry = rng.uniform(90, 110, trades)
+    return pd.DataFrame(
+        {
+            "strategy": rng.choice(STRATEGIES, trades),
+            "symbol": [f"S{i % 200}USDT" for i in range(trades)],
+            "timeframe": rng.choice(["1m", "5m", "1h"], trades),
+            "side": rng.choice(["buy", "sell"], trades),
+            "entry_time": pd.Timestamp("2024-01-01"),
+            "exit_time": pd.Timestamp("2024-01-02"),
+            "entry_price": entry,
+            "exit_price": entry * (1 + rng.normal(0, 0.01, trades)),
+            "sl": np.nan,
+            "tp": np.nan,
+            "qty": 1.0,
+            "pnl": rng.normal(0, 1, trades),
+        }
+    )
+
+
+def _iterrows(path: str) -> int:
+    # The previous loader: iterrows and two one-element arrays per trade
+    df = pd.read_csv(path)
+    transitions = []
+    for _, row in df.iterrows():
+        reward = 1.0 if row["pnl"] > 0 else -1.0
+        state = np.array([row["entry_price"]], dtype=np.float32)
+        next_state = np.array([row["exit_price"]], dtype=np.float32)
+        transitions.append((state, 0, reward, next_state, True))
+    return len(transitions)
+
+
+def main(trades: int = 200_000) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = str(Path(tmp) / "trades.csv")
+        parquet_path = str(Path(tmp) / "trades.parquet")
+        log = _log(trades)
+        log.to_csv(csv_path, index=False)
+        log.to_parquet(parquet_path, index=False)
+
+        start = time.perf_counter()
+        _iterrows(csv_path)
+        rows = time.perf_counter() - start
+
+        timings = {}
+        for name, path in (("CSV", csv_path), ("Parquet", parquet_path)):
+            start = time.perf_counter()
+            built = sum(len(chunk.actions) for chunk in iter_transitions(path, STRATEGIES))
+            timings[name] = time.perf_counter() - start
+            assert built == trades
+
+    print(f"iterrows CSV         : {trades / rows:>12,.0f} trades/s")
+    for name, elapsed in timings.items():
+        print(f"columnar {name:<12}: {trades / elapsed:>12,.0f} trades/s ({rows / elapsed:.0f}x)")
+
+
+if __name__ == "__main__":
+    main(*(int(arg) for arg in sys.argv[1:2]))
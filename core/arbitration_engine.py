@@ -2,27 +2,44 @@ from __future__ import annotations
 
 from typing import Iterable, Dict, Any
 
+import numpy as np
+import pandas as pd
+
 from engine.score_manager import ScoreManager
-from .state_encoder import encode_state
+from .state_encoder import StateEncoder
 from .rl_arbitrator import RLArbitrator
 from .rl_trainer import RLTrainer
 
 
 class ArbitrationEngine:
-    """RL-powered strategy arbitration."""
+    """RL-powered strategy arbitration.
+
+    States are built with :class:`StateEncoder`, the encoder used by
+    ``ai.train_rl_arbitrator``, so a model trained offline can be loaded
+    into ``self.arbitrator``.
+    """
 
     def __init__(self, strategies: Iterable[str], score_manager: ScoreManager) -> None:
         self.score_manager = score_manager
-        self.arbitrator = RLArbitrator(strategies, state_dim=8)
+        self.encoder = StateEncoder()
+        self.arbitrator = RLArbitrator(strategies, state_size=self.encoder.dim)
         self.trainer = RLTrainer(self.arbitrator)
         # link arbitrator to trainer
         self.arbitrator.trainer = self.trainer
 
+    def _state(self, symbol: str, timeframe: str, market_data: Dict[str, Any], scores: Dict[str, float]) -> np.ndarray:
+        row = {k: v for k, v in market_data.items() if isinstance(v, (int, float)) and not isinstance(v, bool)}
+        for name in ("strategy_hit_ratio", "confidence_average"):
+            if name in scores:
+                row[name] = scores[name]
+        row.update(symbol=symbol, timeframe=timeframe)
+        return self.encoder.encode(pd.DataFrame([row]))[0]
+
     def select_strategy(self, symbol: str, timeframe: str, market_data: Dict[str, Any]) -> str:
         scores = {name: self.score_manager.get_score(name) for name in market_data.keys()}
-        state = encode_state(symbol, timeframe, market_data, scores)
+        state = self._state(symbol, timeframe, market_data, scores)
         try:
-            return self.arbitrator.select_strategy(state)
+            return self.arbitrator.select_strategy(symbol, timeframe, state=state)
         except Exception:
             return max(scores, key=scores.get)
 
@@ -35,8 +52,8 @@ class ArbitrationEngine:
         market_data: Dict[str, Any],
     ) -> None:
         scores = {name: self.score_manager.get_score(name) for name in market_data.keys()}
-        next_state = encode_state(symbol, timeframe, market_data, scores)
+        next_state = self._state(symbol, timeframe, market_data, scores)
         try:
             self.arbitrator.update(reward, next_state)
         except Exception:
-            pass
\ No newline at end of file
+            pass
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Mapping, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+BAR_COLUMNS: Tuple[str, ...] = ("open", "high", "low", "close", "volume")
+
+
+class BarSeries:
+    """Growable OHLCV buffer backed by contiguous float64 arrays.
+
+    Each column is a contiguous row of a ``(columns, capacity)`` block and
+    timestamps are kept as int64 nanoseconds. Appends are amortised O(1)
+    (capacity doubles when full) and ``series["close"]`` or ``series[a:b]``
+    return zero-copy views. ``capacity`` is only the initial allocation.
+
+    With ``max_bars`` the series is a rolling window of the most recent
+    ``max_bars`` bars: older bars are dropped and the block never grows past
+    ``max(capacity, 2 * max_bars)`` columns. The window slides through the
+    block and is moved back to its start once it reaches the end, so
+    appends stay amortised O(1).
+
+    Views keep pointing at the old block after the buffer grows or slides,
+    so take them after appending rather than holding them across appends.
+    """
+
+    def __init__(
+        self, columns: Sequence[str] = BAR_COLUMNS, capacity: int = 1024, max_bars: Optional[int] = None
+    ) -> None:
+        if max_bars is not None:
+            if max_bars < 1:
+                raise ValueError("max_bars must be positive")
+            capacity = max(capacity, 2 * max_bars)
+        self._names: Tuple[str, ...] = tuple(columns)
+        self._index: Dict[str, int] = {name: i for i, name in enumerate(self._names)}
+        self._values = np.empty((len(self._names), max(1, capacity)), dtype=np.float64)
+        self._timestamps = np.empty(max(1, capacity), dtype=np.int64)
+        self._start = 0
+        self._size = 0
+        self._view = False
+        self.max_bars = max_bars
+        # Bars ever appended, including those dropped from the window
+        self.total = 0
+
+    @classmethod
+    def from_frame(cls, df: pd.DataFrame, columns: Optional[Sequence[str]] = None) -> "BarSeries":
+        """Copy the bar columns of ``df`` (``BAR_COLUMNS`` present by default)."""
+        names = [c for c in (columns or BAR_COLUMNS) if c in df.columns]
+        series = cls(names, capacity=len(df))
+        series.extend(df)
+        return series
+
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def empty(self) -> bool:
+        return self._size == 0
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        return self._names
+
+    @property
+    def capacity(self) -> int:
+        return self._values.shape[1]
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        return self._timestamps[self._start : self._start + self._size]
+
+    def __getitem__(self, key: Union[str, slice]) -> Any:
+        if isinstance(key, str):
+            row = self._values[self._index[key]]
+            return row[self._start : self._start + self._size]
+        if isinstance(key, slice):
+            start, stop, step = key.indices(self._size)
+            if step != 1:
+                raise ValueError("BarSeries slices must be contiguous")
+            return self._slice(start, max(start, stop))
+        raise KeyError(key)
+
+    def _slice(self, start: int, stop: int) -> "BarSeries":
+        view = object.__new__(BarSeries)
+        view._names = self._names
+        view._index = self._index
+        view._values = self._values
+        view._timestamps = self._timestamps
+        view._start = self._start + start
+        view._size = stop - start
+        view._view = True
+        view.max_bars = None
+        view.total = view._size
+        return view
+
+    def window(self, length: int) -> "BarSeries":
+        """Return a view over the last ``length`` bars."""
+        return self._slice(max(0, self._size - length), self._size)
+
+    def last(self, name: str) -> float:
+        return float(self._values[self._index[name], self._start + self._size - 1])
+
+    # ------------------------------------------------------------------
+    def _reserve(self, extra: int) -> None:
+        if self._view:
+            raise ValueError("cannot append to a BarSeries view")
+        if self._start + self._size + extra <= self.capacity:
+            return
+        start, size = self._start, self._size
+        if self.max_bars is not None:
+            # Move the rows still inside the window back to the start of the block
+            keep = min(size, self.max_bars)
+            start, size = start + size - keep, keep
+            if size + extra <= self.capacity:
+                self._values[:, :size] = self._values[:, start : start + size]
+                self._timestamps[:size] = self._timestamps[start : start + size]
+                self._start, self._size = 0, size
+                return
+        capacity = self.capacity
+        while capacity < size + extra:
+            capacity *= 2
+        values = np.empty((len(self._names), capacity), dtype=np.float64)
+        values[:, :size] = self._values[:, start : start + size]
+        timestamps = np.empty(capacity, dtype=np.int64)
+        timestamps[:size] = self._timestamps[start : start + size]
+        self._values = values
+        self._timestamps = timestamps
+        self._start, self._size = 0, size
+
+    def _trim(self) -> None:
+        if self.max_bars is not None and self._size > self.max_bars:
+            self._start += self._size - self.max_bars
+            self._size = self.max_bars
+
+    def append(self, bar: Mapping[str, Any]) -> None:
+        """Append one bar given as a mapping of column name to value.
+
+        An integer ``timestamp`` is read as epoch milliseconds, as emitted by
+        the exchange and :class:`data.candle_aggregator.CandleAggregator`.
+        """
+        self._reserve(1)
+        i = self._start + self._size
+        for name, row in self._index.items():
+            self._values[row, i] = bar[name]
+        ts = bar.get("timestamp", 0)
+        self._timestamps[i] = ts * 1_000_000 if isinstance(ts, (int, np.integer)) else pd.Timestamp(ts).value
+        self._size += 1
+        self.total += 1
+        self._trim()
+
+    def extend(self, df: pd.DataFrame) -> None:
+        """Append every row of ``df`` (only the last ``max_bars`` when bounded)."""
+        self.total += len(df)
+        if self.max_bars is not None and len(df) > self.max_bars:
+            df = df.iloc[-self.max_bars :]
+        n = len(df)
+        if not n:
+            return
+        self._reserve(n)
+        i = self._start + self._size
+        for name, row in self._index.items():
+            self._values[row, i : i + n] = df[name].to_numpy(dtype=np.float64)
+        if "timestamp" in df.columns:
+            ts = df["timestamp"]
+            if not pd.api.types.is_datetime64_any_dtype(ts):
+                ts = pd.to_datetime(ts)
+            self._timestamps[i : i + n] = ts.to_numpy(dtype="datetime64[ns]").view(np.int64)
+        else:
+            self._timestamps[i : i + n] = 0
+        self._size += n
+        self._trim()
+
+    def frame_view(self) -> pd.DataFrame:
+        """Return a read-only DataFrame over the buffer without copying.
+
+        Building it costs O(columns), not O(bars). Like other views it is
+        only valid until the next append.
+        """
+        data: Dict[str, np.ndarray] = {"timestamp": self.timestamps.view("datetime64[ns]")}
+        data.update((name, self[name]) for name in self._names)
+        for values in data.values():
+            values.flags.writeable = False
+        return pd.DataFrame(data, copy=False)
+
+    def to_frame(self) -> pd.DataFrame:
+        """Return a DataFrame copy for code that still needs pandas."""
+        df = pd.DataFrame({name: self[name].copy() for name in self._names})
+        df.insert(0, "timestamp", pd.to_datetime(self.timestamps))
+        return df
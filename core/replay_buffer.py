@@ -0,0 +1,91 @@
+from __future__ import annotations
+
+from typing import Iterable, Iterator, Tuple
+
+import numpy as np
+
+Transition = Tuple[np.ndarray, int, float, np.ndarray, bool]
+
+
+class ReplayBuffer:
+    """Fixed-capacity ring of transitions in preallocated NumPy arrays.
+
+    Once full, new transitions overwrite the oldest. ``append``/``extend``
+    accept the ``(state, action, reward, next_state, done)`` tuples the
+    arbitrator records; ``add_batch`` takes whole columns. ``total`` counts
+    every transition ever added, so ``since(cursor)`` can hand new rows to
+    a trainer incrementally.
+    """
+
+    def __init__(self, capacity: int, state_size: int) -> None:
+        self.capacity = capacity
+        self.state_size = state_size
+        self.states = np.zeros((capacity, state_size), dtype=np.float32)
+        self.actions = np.zeros(capacity, dtype=np.int64)
+        self.rewards = np.zeros(capacity, dtype=np.float32)
+        self.next_states = np.zeros((capacity, state_size), dtype=np.float32)
+        self.dones = np.zeros(capacity, dtype=np.float32)
+        self.total = 0
+
+    def __len__(self) -> int:
+        return min(self.total, self.capacity)
+
+    def append(self, transition: Transition) -> None:
+        state, action, reward, next_state, done = transition
+        i = self.total % self.capacity
+        self.states[i] = np.ravel(state)[: self.state_size]
+        self.actions[i] = action
+        self.rewards[i] = reward
+        self.next_states[i] = np.ravel(next_state)[: self.state_size]
+        self.dones[i] = done
+        self.total += 1
+
+    def extend(self, transitions: Iterable[Transition]) -> None:
+        for transition in transitions:
+            self.append(transition)
+
+    def add_batch(
+        self,
+        states: np.ndarray,
+        actions: np.ndarray,
+        rewards: np.ndarray,
+        next_states: np.ndarray,
+        dones: np.ndarray,
+    ) -> None:
+        """Append whole columns; only the last ``capacity`` rows are kept."""
+        n = len(actions)
+        if n > self.capacity:
+            skip = n - self.capacity
+            self.total += skip
+            states, actions, rewards = states[skip:], actions[skip:], rewards[skip:]
+            next_states, dones = next_states[skip:], dones[skip:]
+            n = self.capacity
+        idx = (self.total + np.arange(n)) % self.capacity
+        self.states[idx] = states
+        self.actions[idx] = actions
+        self.rewards[idx] = rewards
+        self.next_states[idx] = next_states
+        self.dones[idx] = dones
+        self.total += n
+
+    def _rows(self, idx: np.ndarray) -> Tuple[np.ndarray, ...]:
+        return self.states[idx], self.actions[idx], self.rewards[idx], self.next_states[idx], self.dones[idx]
+
+    def sample(self, batch_size: int, rng: np.random.Generator | None = None) -> Tuple[np.ndarray, ...]:
+        """Return ``batch_size`` random rows as (states, actions, rewards, next_states, dones)."""
+        rng = rng or np.random.default_rng()
+        return self._rows(rng.integers(0, len(self), size=batch_size))
+
+    def since(self, cursor: int) -> Tuple[Tuple[np.ndarray, ...], int]:
+        """Rows added after ``cursor`` (a previous ``total``) and the new cursor."""
+        start = max(cursor, self.total - len(self))
+        idx = np.arange(start, self.total) % self.capacity
+        return self._rows(idx), self.total
+
+    def __iter__(self) -> Iterator[Transition]:
+        (states, actions, rewards, next_states, dones), _ = self.since(0)
+        for row in zip(states, actions, rewards, next_states, dones):
+            yield row[0], int(row[1]), float(row[2]), row[3], bool(row[4])
+
+    def clear(self) -> None:
+        self.total = 0
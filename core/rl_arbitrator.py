@@ -1,10 +1,18 @@
 from __future__ import annotations
 
-from typing import Iterable, List
+from typing import Dict, Iterable, List, Sequence, Tuple
 import numpy as np
 import gymnasium as gym
+import torch
 from stable_baselines3 import DQN, PPO
 
+from .replay_buffer import ReplayBuffer
+
+ACTIVATIONS = {
+    torch.nn.ReLU: lambda x: np.maximum(x, 0.0, out=x),
+    torch.nn.Tanh: lambda x: np.tanh(x, out=x),
+}
+
 
 class ArbitrationEnv(gym.Env):
     """Simple environment to satisfy RL algorithms."""
@@ -24,20 +32,86 @@ class ArbitrationEnv(gym.Env):
         return self.state, 0.0, True, False, {}
 
 
+class NumpyPolicy:
+    """Frozen NumPy copy of a policy's action-scoring MLP.
+
+    Holds the Q-network of a DQN policy, or the actor of a PPO policy, so
+    decisions run without torch. Instances are never mutated; new weights
+    arrive as a new instance and replace the old one by reference.
+    """
+
+    def __init__(self, layers: List[Tuple[np.ndarray, np.ndarray, object]]) -> None:
+        self.layers = layers
+
+    @classmethod
+    def from_model(cls, model) -> "NumpyPolicy":
+        policy = model.policy
+        if hasattr(policy, "q_net"):
+            modules = list(policy.q_net.q_net)
+        else:
+            modules = list(policy.mlp_extractor.policy_net) + [policy.action_net]
+        layers: List[list] = []
+        with torch.no_grad():
+            for module in modules:
+                if isinstance(module, torch.nn.Linear):
+                    weight = module.weight.detach().cpu().numpy().T.astype(np.float32)
+                    layers.append([weight, module.bias.detach().cpu().numpy().astype(np.float32), None])
+                elif type(module) in ACTIVATIONS:
+                    layers[-1][2] = ACTIVATIONS[type(module)]
+                else:
+                    raise ValueError(f"unsupported policy layer {module!r}")
+        return cls([tuple(layer) for layer in layers])
+
+    def __call__(self, obs: np.ndarray) -> np.ndarray:
+        """Return action scores (Q-values or logits), shape ``(n, n_actions)``."""
+        x = obs
+        for weight, bias, activation in self.layers:
+            x = x @ weight
+            x += bias
+            if activation is not None:
+                x = activation(x)
+        return x
+
+
+def policy_state(model) -> Dict[str, np.ndarray]:
+    """Policy weights as NumPy arrays, suitable for pickling between processes."""
+    return {k: v.detach().cpu().numpy() for k, v in model.policy.state_dict().items()}
+
+
 class RLArbitrator:
-    """Strategy selector powered by reinforcement learning."""
+    """Strategy selector powered by reinforcement learning.
+
+    Decisions are scored by a :class:`NumpyPolicy` snapshot of the model.
+    ``select_batch`` scores many (symbol, timeframe) states in one forward
+    pass. ``load_state`` installs weights trained elsewhere by swapping the
+    snapshot, so selection never waits on training. Transitions recorded by
+    ``update`` go into a preallocated :class:`ReplayBuffer`.
+    """
 
-    def __init__(self, strategies: Iterable[str], state_size: int = 1, algo: str = "dqn") -> None:
+    def __init__(
+        self,
+        strategies: Iterable[str],
+        state_size: int = 1,
+        algo: str = "dqn",
+        buffer_size: int = 100_000,
+    ) -> None:
         self.strategies = list(strategies)
+        self.state_size = state_size
         self.env = ArbitrationEnv(len(self.strategies), state_size)
         self.algo = algo
         if algo == "ppo":
-            self.model = PPO("MlpPolicy", self.env, verbose=0)
+            self.model = PPO("MlpPolicy", self.env, verbose=0, device="cpu")
         else:
-            self.model = DQN("MlpPolicy", self.env, verbose=0)
+            self.model = DQN("MlpPolicy", self.env, verbose=0, device="cpu")
+        self.policy = NumpyPolicy.from_model(self.model)
         self.last_state: np.ndarray | None = None
         self.last_action: int | None = None
-        self.memory: List[tuple] = []
+        self.pending: Dict[Tuple[str, str], Tuple[np.ndarray, int]] = {}
+        self.memory = ReplayBuffer(buffer_size, state_size)
+
+    @property
+    def action_space(self) -> gym.spaces.Discrete:
+        return self.env.action_space
 
     # --------------------------------------------------------------
     def add_strategy(self, name: str) -> None:
@@ -46,19 +120,74 @@ class RLArbitrator:
         self.env.action_space = gym.spaces.Discrete(len(self.strategies))
         self.model.set_env(self.env)
 
+    def refresh_policy(self) -> None:
+        """Re-snapshot the model after training it in this process."""
+        self.policy = NumpyPolicy.from_model(self.model)
+
+    def load_state(self, state: Dict[str, np.ndarray]) -> None:
+        """Install policy weights produced by ``policy_state`` elsewhere."""
+        self.model.policy.load_state_dict({k: torch.as_tensor(v) for k, v in state.items()})
+        self.refresh_policy()
+
     # --------------------------------------------------------------
-    def select_strategy(self, symbol: str, timeframe: str, strategies: Iterable[str], state: Iterable[float] | None = None) -> str:
-        obs = np.array(state if state is not None else [0.0], dtype=np.float32)
-        action, _ = self.model.predict(obs, deterministic=True)
-        self.last_state = obs
-        self.last_action = int(action)
+    def _obs(self, states) -> np.ndarray:
+        obs = np.asarray(states, dtype=np.float32)
+        return obs.reshape(len(obs), self.state_size)
+
+    def select_batch(
+        self,
+        keys: Sequence[Tuple[str, str]],
+        states,
+        strategies: Iterable[str] | None = None,
+    ) -> List[str]:
+        """Pick a strategy for each ``(symbol, timeframe)`` key in one forward pass.
+
+        ``states`` has one row per key. ``strategies`` restricts the choice
+        to those names. The chosen actions are remembered per key for
+        ``update(..., key=key)``.
+        """
+        obs = self._obs(states)
+        scores = self.policy(obs)
+        if strategies is not None:
+            names = set(strategies)
+            allowed = [i for i, name in enumerate(self.strategies) if name in names and i < scores.shape[1]]
+            if allowed:
+                mask = np.full(scores.shape[1], -np.inf, dtype=scores.dtype)
+                mask[allowed] = 0.0
+                scores = scores + mask
+        actions = scores.argmax(axis=1)
+        for key, row, action in zip(keys, obs, actions):
+            self.pending[key] = (row, int(action))
+        if len(obs):
+            self.last_state, self.last_action = obs[-1], int(actions[-1])
+        n = len(self.strategies)
         # fall back if action out of range
-        idx = self.last_action % len(self.strategies)
-        return self.strategies[idx]
+        return [self.strategies[a % n] for a in actions.tolist()]
+
+    def select_strategy(
+        self,
+        symbol: str,
+        timeframe: str,
+        strategies: Iterable[str] | None = None,
+        state: Iterable[float] | None = None,
+    ) -> str:
+        obs = np.zeros(self.state_size, dtype=np.float32) if state is None else state
+        return self.select_batch([(symbol, timeframe)], [obs], strategies)[0]
 
     # --------------------------------------------------------------
-    def update(self, reward: float, next_state: Iterable[float], done: bool = True) -> None:
-        if self.last_state is None or self.last_action is None:
+    def update(
+        self,
+        reward: float,
+        next_state: Iterable[float],
+        done: bool = True,
+        key: Tuple[str, str] | None = None,
+    ) -> None:
+        """Record the outcome of the last decision, or of ``key``'s last decision."""
+        if key is not None:
+            state, action = self.pending.pop(key, (None, None))
+        else:
+            state, action = self.last_state, self.last_action
+        if state is None or action is None:
             return
         next_obs = np.array(next_state, dtype=np.float32)
-        self.memory.append((self.last_state, self.last_action, reward, next_obs, done))
\ No newline at end of file
+        self.memory.append((state, action, reward, next_obs, done))
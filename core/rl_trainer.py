@@ -1,54 +1,217 @@
 from __future__ import annotations
 
-from typing import Iterable
+import logging
+import math
+import multiprocessing as mp
+import queue
+import threading
+import time
+from typing import Any, Dict, Optional
+
 import numpy as np
-import gymnasium as gym
+import torch
+import torch.nn.functional as F
+from stable_baselines3.common.utils import polyak_update
 
-from stable_baselines3.common.base_class import BaseAlgorithm
-from stable_baselines3 import PPO, DQN
+from .rl_arbitrator import RLArbitrator, policy_state
 
 
-class ReplayEnv(gym.Env):
-    """Environment that replays recorded transitions."""
+class RLTrainer:
+    """Train RL arbitrator from recorded transitions.
 
-    def __init__(self, transitions: Iterable[tuple], obs_space: gym.Space, act_space: gym.Space) -> None:
-        super().__init__()
-        self.transitions = list(transitions)
-        self.observation_space = obs_space
-        self.action_space = act_space
-        self.idx = 0
+    Each step samples a minibatch from the arbitrator's replay buffer and
+    updates the policy directly: a TD update against the target network
+    for DQN, and a one-step advantage actor-critic update for PPO. The
+    buffer is kept, so older transitions are replayed again later.
+    """
 
-    def reset(self, *, seed=None, options=None):
-        self.idx = 0
-        return self.transitions[0][0], {}
+    def __init__(self, arbitrator, batch_size: int = 32, target_update: int = 100, seed: int | None = None) -> None:
+        self.arbitrator = arbitrator
+        self.batch_size = batch_size
+        self.target_update = target_update
+        self.rng = np.random.default_rng(seed)
+        self.updates = 0
 
-    def step(self, action):  # pragma: no cover - simple replay
-        s, a, r, n, d = self.transitions[self.idx]
-        self.idx += 1
-        return n, r, d, False, {}
+    # --------------------------------------------------------------
+    def _dqn_loss(self, obs, actions, rewards, next_obs, dones) -> torch.Tensor:
+        model = self.arbitrator.model
+        with torch.no_grad():
+            next_q = model.policy.q_net_target(next_obs).max(dim=1).values
+            target = rewards + (1.0 - dones) * model.gamma * next_q
+        q = model.policy.q_net(obs).gather(1, actions[:, None]).squeeze(1)
+        return F.smooth_l1_loss(q, target)
 
+    def _ppo_loss(self, obs, actions, rewards, next_obs, dones) -> torch.Tensor:
+        model = self.arbitrator.model
+        values, log_prob, entropy = model.policy.evaluate_actions(obs, actions)
+        values = values.squeeze(1)
+        with torch.no_grad():
+            target = rewards + (1.0 - dones) * model.gamma * model.policy.predict_values(next_obs).squeeze(1)
+        advantage = (target - values).detach()
+        ent = entropy.mean() if entropy is not None else torch.zeros(())
+        return -(advantage * log_prob).mean() + model.vf_coef * F.mse_loss(values, target) - model.ent_coef * ent
 
-class RLTrainer:
-    """Train RL arbitrator from recorded transitions."""
+    def step(self) -> float:
+        """One gradient step on a sampled minibatch; returns the loss."""
+        model = self.arbitrator.model
+        states, actions, rewards, next_states, dones = self.arbitrator.memory.sample(self.batch_size, self.rng)
+        batch = (
+            torch.as_tensor(states),
+            torch.as_tensor(actions),
+            torch.as_tensor(rewards),
+            torch.as_tensor(next_states),
+            torch.as_tensor(dones),
+        )
+        policy = model.policy
+        policy.set_training_mode(True)
+        loss = self._ppo_loss(*batch) if self.arbitrator.algo == "ppo" else self._dqn_loss(*batch)
+        policy.optimizer.zero_grad()
+        loss.backward()
+        torch.nn.utils.clip_grad_norm_(policy.parameters(), model.max_grad_norm)
+        policy.optimizer.step()
+        policy.set_training_mode(False)
+        self.updates += 1
+        if self.arbitrator.algo != "ppo" and self.updates % self.target_update == 0:
+            polyak_update(policy.q_net.parameters(), policy.q_net_target.parameters(), model.tau)
+        return loss.item()
+
+    def train(self, epochs: int = 1, steps: int | None = None) -> float:
+        """Run ``steps`` minibatch updates (default: ``epochs`` passes over the buffer).
+
+        Returns the mean loss and refreshes the arbitrator's decision snapshot.
+        """
+        size = len(self.arbitrator.memory)
+        if not size:
+            return 0.0
+        if steps is None:
+            steps = epochs * math.ceil(size / self.batch_size)
+        losses = [self.step() for _ in range(steps)]
+        self.arbitrator.refresh_policy()
+        return float(np.mean(losses)) if losses else 0.0
+
+
+def _train_worker(config: Dict[str, Any], state: Dict[str, np.ndarray], batch_size: int, jobs, results) -> None:
+    torch.set_num_threads(1)
+    arbitrator = RLArbitrator(**config)
+    arbitrator.load_state(state)
+    trainer = RLTrainer(arbitrator, batch_size=batch_size)
+    while True:
+        job = jobs.get()
+        if job is None:
+            return
+        job_id, rows, steps = job
+        try:
+            arbitrator.memory.add_batch(*rows)
+            loss = trainer.train(steps=steps)
+            results.put((job_id, (policy_state(arbitrator.model), loss, len(arbitrator.memory))))
+        except Exception as e:
+            results.put((job_id, e))
+
+
+class BackgroundTrainer:
+    """Train a copy of an arbitrator's policy in a separate process.
 
-    def __init__(self, arbitrator, batch_size: int = 32) -> None:
+    Every ``interval`` seconds, transitions recorded since the last round
+    are shipped to the worker process. The worker keeps its own replay
+    buffer and runs ``steps`` minibatch updates, then sends back the new
+    weights. They are loaded into the live arbitrator with ``load_state``,
+    which swaps its decision snapshot in one assignment, so
+    ``select_batch`` never waits on training.
+
+    Rows count as shipped once their job is queued, so a round that times
+    out is not resent. Every job carries an id and results for any other
+    job (such as the late answer to a timed-out round) are discarded.
+    """
+
+    def __init__(
+        self,
+        arbitrator: RLArbitrator,
+        interval: float = 60.0,
+        steps: int = 200,
+        batch_size: int = 64,
+        timeout: float = 300.0,
+    ) -> None:
         self.arbitrator = arbitrator
+        self.interval = interval
+        self.steps = steps
         self.batch_size = batch_size
+        self.timeout = timeout
+        self.generation = 0
+        self.last_loss: Optional[float] = None
+        self.trained_rows = 0
+        self._cursor = 0
+        self._job = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._process: Optional[mp.Process] = None
+        self._thread: Optional[threading.Thread] = None
 
-    # --------------------------------------------------------------
-    def train(self, epochs: int = 1) -> None:
-        if not self.arbitrator.memory:
-            return
-        env = ReplayEnv(
-            self.arbitrator.memory,
-            self.arbitrator.env.observation_space,
-            self.arbitrator.env.action_space,
+    def start(self) -> "BackgroundTrainer":
+        # spawn, not fork: the parent may already be running torch threads
+        ctx = mp.get_context("spawn")
+        self._jobs = ctx.Queue()
+        self._results = ctx.Queue()
+        config = {
+            "strategies": self.arbitrator.strategies,
+            "state_size": self.arbitrator.state_size,
+            "algo": self.arbitrator.algo,
+            "buffer_size": self.arbitrator.memory.capacity,
+        }
+        state = policy_state(self.arbitrator.model)
+        self._process = ctx.Process(
+            target=_train_worker,
+            args=(config, state, self.batch_size, self._jobs, self._results),
+            name="rl-trainer",
+            daemon=True,
         )
-        self.arbitrator.model.set_env(env)
-        steps = len(self.arbitrator.memory) * epochs
-        if isinstance(self.arbitrator.model, PPO):
-            self.arbitrator.model.learn(total_timesteps=steps)
-        else:
-            self.arbitrator.model.learn(total_timesteps=steps)
-        self.arbitrator.memory.clear()
-        env.close()
+        self._process.start()
+        self._thread = threading.Thread(target=self._run, name="rl-trainer-sync", daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            try:
+                self.train_once()
+            except Exception as e:
+                logging.error(f"Background RL training failed: {e}")
+
+    def train_once(self) -> bool:
+        """Ship new transitions, train one round and install the result.
+
+        Returns False when there was nothing to train on.
+        """
+        with self._lock:
+            rows, cursor = self.arbitrator.memory.since(self._cursor)
+            if not cursor:
+                return False
+            self._job += 1
+            self._jobs.put((self._job, rows, self.steps))
+            self._cursor = cursor
+            deadline = time.monotonic() + self.timeout
+            while True:
+                try:
+                    job_id, result = self._results.get(timeout=max(deadline - time.monotonic(), 0.0))
+                except queue.Empty:
+                    raise TimeoutError(f"RL training round {self._job} did not finish in {self.timeout}s") from None
+                if job_id == self._job:
+                    break
+                logging.warning(f"Discarding result of stale RL training round {job_id}")
+            if isinstance(result, Exception):
+                raise result
+            state, self.last_loss, self.trained_rows = result
+            self.arbitrator.load_state(state)
+            self.generation += 1
+            return True
+
+    def close(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        if self._process is not None:
+            self._jobs.put(None)
+            self._process.join(timeout=10)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
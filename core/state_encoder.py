@@ -1,4 +1,38 @@
+from __future__ import annotations
+
+import hashlib
+from typing import Dict, Iterable, Mapping, Tuple
+
 import numpy as np
+import pandas as pd
+
+# Numeric inputs of StateEncoder, in output column order
+FEATURES = (
+    "returns",
+    "log_returns",
+    "volatility_5",
+    "volatility_20",
+    "rsi",
+    "macd",
+    "macd_signal",
+    "ema_gap_10",
+    "ema_gap_20",
+    "bb_position",
+    "recent_return",
+    "drawdown",
+    "strategy_hit_ratio",
+    "confidence_average",
+)
+
+
+def _digest(name: str) -> int:
+    # Python's hash() is salted per process; blake2b is the same everywhere
+    return int.from_bytes(hashlib.blake2b(name.encode(), digest_size=8).digest(), "little")
+
+
+def stable_id(name: str, buckets: int = 1000) -> float:
+    """Map ``name`` to ``[0, 1)`` identically in every process."""
+    return (_digest(name) % buckets) / buckets
 
 
 def encode_state(symbol: str, timeframe: str, market_data: dict, strategy_scores: dict) -> np.ndarray:
@@ -9,8 +43,8 @@ def encode_state(symbol: str, timeframe: str, market_data: dict, strategy_scores
     drawdown = market_data.get("drawdown", 0.0)
     hit_ratio = strategy_scores.get("strategy_hit_ratio", 0.0)
     confidence_avg = strategy_scores.get("confidence_average", 0.0)
-    symbol_id = (hash(symbol) % 1000) / 1000.0
-    timeframe_id = (hash(timeframe) % 1000) / 1000.0
+    symbol_id = stable_id(symbol)
+    timeframe_id = stable_id(timeframe)
 
     state = np.array([
         volatility_5,
@@ -24,4 +58,125 @@ def encode_state(symbol: str, timeframe: str, market_data: dict, strategy_scores
     ], dtype=np.float32)
 
     # basic normalization using tanh to keep values bounded
-    return np.tanh(state)
\ No newline at end of file
+    return np.tanh(state)
+
+
+class EmbeddingTable:
+    """Stable name -> vector lookup for symbols or timeframes.
+
+    Each vector is drawn from a generator seeded with a digest of the name,
+    so a name maps to the same embedding in every process whatever order
+    names are first seen in. Vectors are computed once and cached; ``lookup``
+    resolves a whole column with one index lookup.
+    """
+
+    def __init__(self, dim: int, names: Iterable[str] = (), scale: float = 0.5) -> None:
+        self.dim = dim
+        self.scale = scale
+        self.ids: Dict[str, int] = {}
+        self.vectors = np.zeros((0, dim), dtype=np.float32)
+        self._index = pd.Index([], dtype=object)
+        self.add(names)
+
+    def vector(self, name: str) -> np.ndarray:
+        rng = np.random.default_rng(_digest(name))
+        return (rng.standard_normal(self.dim) * self.scale).astype(np.float32)
+
+    def add(self, names: Iterable[str]) -> None:
+        new = [name for name in dict.fromkeys(names) if name not in self.ids]
+        if not new:
+            return
+        for name in new:
+            self.ids[name] = len(self.ids)
+        self.vectors = np.vstack([self.vectors] + [self.vector(name)[None, :] for name in new])
+        self._index = pd.Index(list(self.ids), dtype=object)
+
+    def lookup(self, names) -> np.ndarray:
+        """Return the ``(len(names), dim)`` embeddings, adding unseen names."""
+        codes = self._index.get_indexer(names)
+        if (codes < 0).any():
+            self.add(pd.unique(np.asarray(names, dtype=object)[codes < 0]))
+            codes = self._index.get_indexer(names)
+        return self.vectors[codes]
+
+
+class StateEncoder:
+    """Encode many (symbol, timeframe) market states in one call.
+
+    ``encode`` takes a frame with ``symbol`` and ``timeframe`` columns plus
+    feature columns from :mod:`data.feature_engineering` (``close``,
+    ``returns``, ``rsi_14``, ``macd``, ``bb_upper`` ...) and optional
+    ``recent_return``, ``drawdown``, ``strategy_hit_ratio`` and
+    ``confidence_average``. It returns an ``(N, dim)`` float32 matrix: the
+    :data:`FEATURES` squashed with tanh, then the symbol and timeframe
+    embeddings. Missing columns and NaNs encode as zero.
+    """
+
+    def __init__(
+        self,
+        symbols: Iterable[str] = (),
+        timeframes: Iterable[str] = ("1m", "5m", "15m", "1h", "4h", "1d"),
+        embedding_dim: int = 4,
+    ) -> None:
+        self.embedding_dim = embedding_dim
+        self.symbols = EmbeddingTable(embedding_dim, symbols)
+        self.timeframes = EmbeddingTable(embedding_dim, timeframes)
+
+    @property
+    def dim(self) -> int:
+        return len(FEATURES) + 2 * self.embedding_dim
+
+    @staticmethod
+    def _features(frame: pd.DataFrame) -> np.ndarray:
+        n = len(frame)
+
+        def col(name: str) -> np.ndarray:
+            if name in frame:
+                return frame[name].to_numpy(dtype=np.float64, na_value=np.nan)
+            return np.full(n, np.nan)
+
+        close = col("close")
+        close = np.where(close != 0, close, np.nan)
+        band = col("bb_upper") - col("bb_lower")
+        out = np.empty((n, len(FEATURES)), dtype=np.float64)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            out[:, 0] = col("returns")
+            out[:, 1] = col("log_returns")
+            out[:, 2] = col("volatility_5")
+            out[:, 3] = col("volatility_20")
+            out[:, 4] = (col("rsi_14") - 50.0) / 50.0
+            # Price-level features as percent of close so symbols are comparable
+            out[:, 5] = col("macd") / close * 100.0
+            out[:, 6] = col("macd_signal") / close * 100.0
+            out[:, 7] = (close / col("ema_10") - 1.0) * 100.0
+            out[:, 8] = (close / col("ema_20") - 1.0) * 100.0
+            out[:, 9] = np.where(band > 0, (close - col("bb_lower")) / band * 2.0 - 1.0, np.nan)
+            out[:, 10] = col("recent_return")
+            out[:, 11] = col("drawdown")
+            out[:, 12] = col("strategy_hit_ratio")
+            out[:, 13] = col("confidence_average")
+        np.nan_to_num(out, copy=False, nan=0.0, posinf=0.0, neginf=0.0)
+        return np.tanh(out, out=out)
+
+    def encode(self, frame: pd.DataFrame) -> np.ndarray:
+        """Return the ``(len(frame), dim)`` float32 state matrix."""
+        out = np.empty((len(frame), self.dim), dtype=np.float32)
+        k = len(FEATURES)
+        out[:, :k] = self._features(frame)
+        out[:, k : k + self.embedding_dim] = self.symbols.lookup(frame["symbol"].to_numpy())
+        out[:, k + self.embedding_dim :] = self.timeframes.lookup(frame["timeframe"].to_numpy())
+        return out
+
+    def encode_latest(self, frames: Mapping[Tuple[str, str], pd.DataFrame]) -> Tuple[list, np.ndarray]:
+        """Encode the last row of each feature frame keyed by (symbol, timeframe).
+
+        Returns the keys in order and their state matrix, ready for
+        ``RLArbitrator.select_batch``.
+        """
+        keys = list(frames)
+        if not keys:
+            return [], np.empty((0, self.dim), dtype=np.float32)
+        last = pd.concat([frames[key].iloc[-1:] for key in keys], ignore_index=True)
+        last["symbol"] = [symbol for symbol, _ in keys]
+        last["timeframe"] = [timeframe for _, timeframe in keys]
+        return keys, self.encode(last)
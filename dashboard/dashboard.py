@@ -1,59 +1,78 @@
 from __future__ import annotations
 
+import math
+
 from flask import Flask, jsonify, render_template_string
 
+from analysis.metrics import RunningDrawdown, RunningMetrics
+
 
 class PerformanceMetrics:
-    """Track trades and compute basic performance statistics."""
+    """Track trades and compute basic performance statistics.
+
+    Win/loss stats and drawdown are kept as running aggregates, so every
+    query is O(1) no matter how many trades have been recorded. Round trips
+    pair a sell with the last buy of the same ``symbol``, so one instance
+    can be shared by an engine trading many symbols.
+    """
 
     def __init__(self, initial_balance: float = 0.0) -> None:
-        self.initial_balance = initial_balance
-        self.balance = initial_balance
         self.trades: list[tuple[str, float, float]] = []
+        self.round_trips = RunningMetrics()
+        self._entries: dict[str, float] = {}
+        self.balance = initial_balance
+        self.initial_balance = initial_balance
+
+    @property
+    def initial_balance(self) -> float:
+        return self._initial_balance
 
-    def record_trade(self, side: str, qty: float, price: float) -> None:
+    @initial_balance.setter
+    def initial_balance(self, value: float) -> None:
+        # Drawdown is measured from the initial balance, so replay the trades
+        self._initial_balance = value
+        self._equity = RunningDrawdown(value)
+        bal = value
+        for side, qty, price in self.trades:
+            bal = bal - qty * price if side == "buy" else bal + qty * price
+            self._equity.update(bal)
+
+    def record_trade(self, side: str, qty: float, price: float, symbol: str = "") -> None:
         side = side.lower()
         self.trades.append((side, qty, price))
         if side == "buy":
             self.balance -= qty * price
-        elif side == "sell":
-            self.balance += qty * price
+            self._entries[symbol] = price
+            self._equity.update(self._equity.value - qty * price)
+        else:
+            if side == "sell":
+                self.balance += qty * price
+                entry = self._entries.pop(symbol, None)
+                if entry is not None:
+                    self.round_trips.update(price - entry)
+            self._equity.update(self._equity.value + qty * price)
 
     def pnl(self) -> float:
         return self.balance - self.initial_balance
 
     def win_rate(self) -> float:
-        results = []
-        entry = None
-        for side, qty, price in self.trades:
-            if side == "buy":
-                entry = price
-            elif side == "sell" and entry is not None:
-                results.append(price - entry)
-                entry = None
-        if not results:
-            return 0.0
-        wins = sum(1 for r in results if r > 0)
-        return wins / len(results) * 100
+        return self.round_trips.win_rate
 
     def drawdown(self) -> float:
-        equity = [self.initial_balance]
-        bal = self.initial_balance
-        for side, qty, price in self.trades:
-            if side == "buy":
-                bal -= qty * price
-            else:
-                bal += qty * price
-            equity.append(bal)
-        peak = equity[0]
-        max_dd = 0.0
-        for val in equity:
-            if val > peak:
-                peak = val
-            dd = peak - val
-            if dd > max_dd:
-                max_dd = dd
-        return max_dd
+        return self._equity.max_drawdown
+
+    def snapshot(self) -> dict[str, float]:
+        pf = self.round_trips.profit_factor
+        return {
+            "pnl": self.pnl(),
+            "win_rate": self.win_rate(),
+            "drawdown": self.drawdown(),
+            "drawdown_pct": self._equity.max_drawdown_pct,
+            "round_trips": self.round_trips.count,
+            # JSON has no infinity; report a loss-free record as null
+            "profit_factor": pf if math.isfinite(pf) else None,
+            "expectancy": self.round_trips.expectancy,
+        }
 
 
 metrics = PerformanceMetrics()
@@ -77,13 +96,7 @@ def index() -> str:
 
 @app.route("/metrics")
 def metrics_route():
-    return jsonify(
-        {
-            "pnl": metrics.pnl(),
-            "win_rate": metrics.win_rate(),
-            "drawdown": metrics.drawdown(),
-        }
-    )
+    return jsonify(metrics.snapshot())
 
 
 def start_dashboard(port: int = 5000) -> None:
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+from .candle_store import interval_ms
+
+BAR_FIELDS = ("timestamp", "open", "high", "low", "close", "volume")
+BarCallback = Callable[[str, str, Dict[str, float]], None]
+
+
+class BarRing:
+    """Fixed-capacity ring buffer of closed OHLCV bars."""
+
+    def __init__(self, capacity: int = 1000) -> None:
+        self.capacity = capacity
+        self.timestamps = np.zeros(capacity, dtype=np.int64)
+        self.values = np.zeros((capacity, 5), dtype=np.float64)
+        self.count = 0
+
+    def __len__(self) -> int:
+        return min(self.count, self.capacity)
+
+    def append(self, bar: Dict[str, float]) -> None:
+        idx = self.count % self.capacity
+        self.timestamps[idx] = bar["timestamp"]
+        self.values[idx] = (bar["open"], bar["high"], bar["low"], bar["close"], bar["volume"])
+        self.count += 1
+
+    def _order(self) -> np.ndarray:
+        n = len(self)
+        start = self.count - n
+        return (np.arange(start, start + n)) % self.capacity
+
+    def frame(self) -> pd.DataFrame:
+        """Return the buffered bars, oldest first."""
+        order = self._order()
+        df = pd.DataFrame(self.values[order], columns=list(BAR_FIELDS[1:]))
+        df.insert(0, "timestamp", pd.to_datetime(self.timestamps[order], unit="ms"))
+        return df
+
+
+def _trade_time_ms(value: Any) -> int:
+    if isinstance(value, (int, float)):
+        return int(value)
+    if isinstance(value, str) and value.isdigit():
+        return int(value)
+    return int(datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp() * 1000)
+
+
+class CandleAggregator:
+    """Build rolling OHLCV bars per symbol from a stream of trades.
+
+    Each ``(symbol, timeframe)`` keeps the bar currently forming and a
+    :class:`BarRing` of closed bars. When a trade falls into a new bucket the
+    previous bar is closed and every subscriber receives
+    ``callback(symbol, timeframe, bar)``. Trades older than the forming bar
+    are dropped.
+    """
+
+    def __init__(self, timeframes: Iterable[str] = ("1m", "5m", "15m", "1h", "4h"), capacity: int = 1000) -> None:
+        self.timeframes = {tf: interval_ms(tf) for tf in sorted(timeframes, key=interval_ms)}
+        self.capacity = capacity
+        self.forming: Dict[Tuple[str, str], Dict[str, float]] = {}
+        self.closed: Dict[Tuple[str, str], BarRing] = {}
+        self.last_closed: Dict[Tuple[str, str], int] = {}
+        self.subscribers: List[BarCallback] = []
+
+    def subscribe(self, callback: BarCallback) -> None:
+        self.subscribers.append(callback)
+
+    # ------------------------------------------------------------------
+    def _close(self, symbol: str, timeframe: str, bar: Dict[str, float]) -> None:
+        key = (symbol, timeframe)
+        ring = self.closed.get(key)
+        if ring is None:
+            ring = self.closed[key] = BarRing(self.capacity)
+        ring.append(bar)
+        self.last_closed[key] = bar["timestamp"]
+        for callback in self.subscribers:
+            try:
+                callback(symbol, timeframe, dict(bar))
+            except Exception as e:
+                logging.error(f"Bar subscriber failed: {e}")
+
+    def on_trade(self, symbol: str, ts_ms: int, price: float, qty: float) -> None:
+        for timeframe, length in self.timeframes.items():
+            key = (symbol, timeframe)
+            bucket = ts_ms - ts_ms % length
+            bar = self.forming.get(key)
+            if bar is not None and bucket < bar["timestamp"]:
+                continue
+            if bar is None and bucket <= self.last_closed.get(key, -1):
+                continue
+            if bar is None or bucket > bar["timestamp"]:
+                if bar is not None:
+                    self._close(symbol, timeframe, bar)
+                self.forming[key] = {
+                    "timestamp": bucket,
+                    "open": price,
+                    "high": price,
+                    "low": price,
+                    "close": price,
+                    "volume": qty,
+                }
+                continue
+            if price > bar["high"]:
+                bar["high"] = price
+            if price < bar["low"]:
+                bar["low"] = price
+            bar["close"] = price
+            bar["volume"] += qty
+
+    def on_message(self, message: Dict[str, Any]) -> None:
+        """Feed a ``trade`` channel payload from :class:`OpenApiWsFuturePublic`."""
+        if message.get("ch") != "trade":
+            return
+        symbol = message.get("symbol", "")
+        for trade in message.get("data", []):
+            self.on_trade(symbol, _trade_time_ms(trade["t"]), float(trade["p"]), float(trade["v"]))
+
+    def flush(self, now_ms: int) -> None:
+        """Close every forming bar whose interval ended before ``now_ms``."""
+        for (symbol, timeframe), bar in list(self.forming.items()):
+            if bar["timestamp"] + self.timeframes[timeframe] <= now_ms:
+                del self.forming[(symbol, timeframe)]
+                self._close(symbol, timeframe, bar)
+
+    # ------------------------------------------------------------------
+    def current(self, symbol: str, timeframe: str) -> Optional[Dict[str, float]]:
+        bar = self.forming.get((symbol, timeframe))
+        return dict(bar) if bar is not None else None
+
+    def bars(self, symbol: str, timeframe: str) -> pd.DataFrame:
+        """Return closed bars as a DataFrame, oldest first."""
+        ring = self.closed.get((symbol, timeframe))
+        if ring is None:
+            return pd.DataFrame(columns=list(BAR_FIELDS))
+        return ring.frame()
@@ -0,0 +1,222 @@
+from __future__ import annotations
+
+import re
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.ipc as ipc
+
+TimeLike = Union[str, int, pd.Timestamp, None]
+
+_UNIT_MS = {"m": 60_000, "h": 3_600_000, "d": 86_400_000, "w": 604_800_000}
+
+
+def interval_ms(interval: str) -> int:
+    """Return the bar length of an interval such as ``1m`` or ``4h``."""
+    match = re.fullmatch(r"(\d+)([mhdw])", interval)
+    if not match:
+        raise ValueError(f"Unsupported interval: {interval}")
+    return int(match.group(1)) * _UNIT_MS[match.group(2)]
+
+
+def closed_bars(df: pd.DataFrame, interval: str, now: TimeLike = None) -> pd.DataFrame:
+    """Drop bars of ``interval`` that are still forming at ``now`` (default: UTC now)."""
+    if df.empty:
+        return df
+    now_ts = pd.Timestamp(now) if now is not None else pd.Timestamp.now(tz="UTC").tz_localize(None)
+    closes = pd.to_datetime(df["timestamp"]) + pd.Timedelta(milliseconds=interval_ms(interval))
+    return df[closes <= now_ts]
+
+
+def _to_ns(value: TimeLike) -> Optional[int]:
+    if value is None:
+        return None
+    return int(pd.Timestamp(value).value)
+
+
+class CandleStore:
+    """Append-only columnar candle store keyed by (symbol, timeframe).
+
+    Bars live under ``root/<symbol>/<timeframe>/`` as Arrow IPC partitions
+    named ``<first_ns>_<last_ns>.arrow``. Numeric columns are stored as
+    float64/int64 and ``timestamp`` as ``timestamp[ns]``. Reads memory-map
+    only the partitions overlapping the requested range.
+
+    An append may start at the last stored timestamp; that bar is then
+    replaced, so a kline fetched while still forming gets its final values
+    on the next fetch. The new partition supersedes the old bar at read
+    time, so nothing is rewritten. Once a key has more than
+    ``compact_every`` partitions, the trailing partitions smaller than
+    ``partition_bytes`` are merged into one file.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path] = "data/store",
+        compact_every: int = 64,
+        partition_bytes: int = 64 << 20,
+    ) -> None:
+        self.root = Path(root)
+        self.compact_every = compact_every
+        self.partition_bytes = partition_bytes
+
+    # ------------------------------------------------------------------
+    def _dir(self, symbol: str, timeframe: str) -> Path:
+        return self.root / symbol / timeframe
+
+    def _partitions(self, symbol: str, timeframe: str) -> List[Tuple[int, int, Path]]:
+        directory = self._dir(symbol, timeframe)
+        if not directory.exists():
+            return []
+        parts = []
+        for path in directory.glob("*.arrow"):
+            first, last = path.stem.split("_")
+            parts.append((int(first), int(last), path))
+        return sorted(parts)
+
+    def keys(self) -> List[Tuple[str, str]]:
+        if not self.root.exists():
+            return []
+        return sorted(
+            (tf_dir.parent.name, tf_dir.name)
+            for tf_dir in self.root.glob("*/*")
+            if tf_dir.is_dir() and any(tf_dir.glob("*.arrow"))
+        )
+
+    def has(self, symbol: str, timeframe: str) -> bool:
+        return bool(self._partitions(symbol, timeframe))
+
+    def first_timestamp(self, symbol: str, timeframe: str) -> Optional[pd.Timestamp]:
+        parts = self._partitions(symbol, timeframe)
+        if not parts:
+            return None
+        return pd.Timestamp(parts[0][0])
+
+    def last_timestamp(self, symbol: str, timeframe: str) -> Optional[pd.Timestamp]:
+        parts = self._partitions(symbol, timeframe)
+        if not parts:
+            return None
+        return pd.Timestamp(max(last for _, last, _ in parts))
+
+    # ------------------------------------------------------------------
+    @staticmethod
+    def _to_table(df: pd.DataFrame) -> pa.Table:
+        columns = {}
+        for name in df.columns:
+            col = df[name]
+            if name == "timestamp":
+                columns[name] = pa.array(pd.to_datetime(col).to_numpy(dtype="datetime64[ns]"))
+            elif pd.api.types.is_bool_dtype(col):
+                columns[name] = pa.array(col.to_numpy())
+            elif pd.api.types.is_integer_dtype(col):
+                columns[name] = pa.array(col.to_numpy(dtype=np.int64))
+            elif pd.api.types.is_numeric_dtype(col):
+                columns[name] = pa.array(col.to_numpy(dtype=np.float64))
+            else:
+                columns[name] = pa.array(col.tolist())
+        return pa.table(columns)
+
+    def append(self, symbol: str, timeframe: str, df: pd.DataFrame) -> int:
+        """Write bars outside the stored range and return how many.
+
+        Bars older than the first stored one are written as an earlier
+        partition (backfilled history). Bars from the last stored one onward
+        are appended, and a bar at the last stored timestamp replaces it.
+        """
+        if df.empty:
+            return 0
+        if "timestamp" not in df.columns:
+            raise ValueError("candles require a timestamp column")
+        frame = df.assign(timestamp=pd.to_datetime(df["timestamp"]))
+        frame = frame.sort_values("timestamp").drop_duplicates("timestamp", keep="last")
+        last = self.last_timestamp(symbol, timeframe)
+        if last is None:
+            pieces = [frame]
+        else:
+            first = self.first_timestamp(symbol, timeframe)
+            pieces = [frame[frame["timestamp"] < first], frame[frame["timestamp"] >= last]]
+        written = 0
+        for piece in pieces:
+            if not piece.empty:
+                self._write(symbol, timeframe, self._to_table(piece.reset_index(drop=True)))
+                written += len(piece)
+        if self.compact_every and len(self._partitions(symbol, timeframe)) > self.compact_every:
+            self.compact(symbol, timeframe, self.partition_bytes)
+        return written
+
+    def _write(self, symbol: str, timeframe: str, table: pa.Table) -> Path:
+        directory = self._dir(symbol, timeframe)
+        directory.mkdir(parents=True, exist_ok=True)
+        ts = table.column("timestamp").to_numpy().view(np.int64)
+        path = directory / f"{ts[0]}_{ts[-1]}.arrow"
+        tmp = path.with_suffix(".tmp")
+        with pa.OSFile(str(tmp), "wb") as sink:
+            with ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        tmp.replace(path)
+        return path
+
+    # ------------------------------------------------------------------
+    def read_table(self, symbol: str, timeframe: str, start: TimeLike = None, end: TimeLike = None) -> pa.Table:
+        """Return bars with ``start <= timestamp <= end`` as an Arrow table."""
+        lo, hi = _to_ns(start), _to_ns(end)
+        parts = self._partitions(symbol, timeframe)
+        tables = []
+        for k, (first, last, path) in enumerate(parts):
+            if (lo is not None and last < lo) or (hi is not None and first > hi):
+                continue
+            table = ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+            ts = table.column("timestamp").to_numpy().view(np.int64)
+            i = 0 if lo is None else int(np.searchsorted(ts, lo, side="left"))
+            j = len(ts) if hi is None else int(np.searchsorted(ts, hi, side="right"))
+            if k + 1 < len(parts):
+                # The next partition starts at or after this one's last bar and replaces it
+                j = min(j, int(np.searchsorted(ts, parts[k + 1][0], side="left")))
+            if j > i:
+                tables.append(table.slice(i, j - i))
+        if not tables:
+            return pa.table({})
+        return pa.concat_tables(tables, promote_options="default")
+
+    def read(self, symbol: str, timeframe: str, start: TimeLike = None, end: TimeLike = None) -> pd.DataFrame:
+        """Return bars with ``start <= timestamp <= end`` as a DataFrame."""
+        return self.read_table(symbol, timeframe, start, end).to_pandas()
+
+    # ------------------------------------------------------------------
+    def compact(self, symbol: str, timeframe: str, max_bytes: Optional[int] = None) -> None:
+        """Merge the partitions of a key into a single file.
+
+        With ``max_bytes``, only the trailing run of partitions smaller than
+        that is merged, so large history files are not rewritten.
+        """
+        parts = self._partitions(symbol, timeframe)
+        if max_bytes is not None:
+            i = len(parts)
+            while i > 0 and parts[i - 1][2].stat().st_size < max_bytes:
+                i -= 1
+            parts = parts[i:]
+        if len(parts) < 2:
+            return
+        table = self.read_table(symbol, timeframe, parts[0][0]).combine_chunks()
+        new_path = self._write(symbol, timeframe, table)
+        for _, _, path in parts:
+            if path != new_path:
+                path.unlink()
+
+    def import_csv(self, path: Union[str, Path], symbol: str, timeframe: str) -> int:
+        """Append the bars from a legacy ``SYMBOL_TF.csv`` file."""
+        df = pd.read_csv(path)
+        return self.append(symbol, timeframe, df)
+
+    def import_csv_dir(self, directory: Union[str, Path]) -> int:
+        """Import every ``SYMBOL_TF.csv`` under ``directory``."""
+        total = 0
+        for path in Path(directory).glob("*.csv"):
+            if "_" not in path.stem:
+                continue
+            symbol, timeframe = path.stem.split("_", 1)
+            total += self.import_csv(path, symbol, timeframe)
+        return total
@@ -1,6 +1,14 @@
+from __future__ import annotations
+
+from typing import Dict, Optional
+
 import pandas as pd
 import numpy as np
 
+# Bars of history needed by the widest rolling feature (20-bar std of returns)
+ROLLING_WARMUP = 21
+NUMERIC_COLUMNS = ["open", "high", "low", "close", "volume"]
+
 
 def compute_rsi(series: pd.Series, period: int = 14) -> pd.Series:
     """Return the Relative Strength Index."""
@@ -14,6 +22,77 @@ def compute_rsi(series: pd.Series, period: int = 14) -> pd.Series:
     return rsi
 
 
+def _ewm(series: pd.Series, span: int, seed: Optional[float] = None, start: int = 0) -> pd.Series:
+    """``adjust=False`` EWM, optionally continuing from ``seed`` at row ``start``.
+
+    Seeding with the previous EWM value reproduces the exact recurrence of a
+    full recomputation, so continued values are bit-for-bit identical.
+    """
+    if seed is None:
+        return series.ewm(span=span, adjust=False).mean()
+    tail = pd.concat([pd.Series([seed]), series.iloc[start:]], ignore_index=True)
+    values = tail.ewm(span=span, adjust=False).mean().to_numpy()[1:]
+    out = pd.Series(np.nan, index=series.index)
+    out.iloc[start:] = values
+    return out
+
+
+def _add_features(
+    processed: pd.DataFrame, seeds: Optional[Dict[str, float]] = None, start: int = 0
+) -> Dict[str, float]:
+    """Append feature columns in place and return the final EWM states.
+
+    Rows before ``start`` are warm-up context for the rolling windows; EWM
+    features for them are left empty and continue from ``seeds`` instead.
+    """
+    seeds = seeds or {}
+    close = processed["close"]
+    processed["returns"] = close.pct_change()
+    processed["log_returns"] = np.log(close / close.shift(1))
+
+    # Simple moving averages for backward compatibility
+    processed["close_ma_5"] = close.rolling(window=5).mean()
+    processed["close_ma_10"] = close.rolling(window=10).mean()
+
+    processed["volatility_5"] = processed["returns"].rolling(window=5).std()
+    processed["volatility_20"] = processed["returns"].rolling(window=20).std()
+
+    processed["ema_10"] = _ewm(close, 10, seeds.get("ema_10"), start)
+    processed["ema_20"] = _ewm(close, 20, seeds.get("ema_20"), start)
+
+    processed["rsi_14"] = compute_rsi(close, 14)
+
+    ema_12 = _ewm(close, 12, seeds.get("ema_12"), start)
+    ema_26 = _ewm(close, 26, seeds.get("ema_26"), start)
+    processed["macd"] = ema_12 - ema_26
+    processed["macd_signal"] = _ewm(processed["macd"], 9, seeds.get("macd_signal"), start)
+
+    sma_20 = close.rolling(window=20).mean()
+    std_20 = close.rolling(window=20).std()
+    processed["bb_upper"] = sma_20 + 2 * std_20
+    processed["bb_lower"] = sma_20 - 2 * std_20
+
+    if processed.empty:
+        return dict(seeds)
+    return {
+        "ema_10": processed["ema_10"].iloc[-1],
+        "ema_20": processed["ema_20"].iloc[-1],
+        "ema_12": ema_12.iloc[-1],
+        "ema_26": ema_26.iloc[-1],
+        "macd_signal": processed["macd_signal"].iloc[-1],
+    }
+
+
+def _prepare(df: pd.DataFrame) -> pd.DataFrame:
+    processed = df.copy()
+    if "timestamp" in processed.columns:
+        processed = processed.sort_values("timestamp").reset_index(drop=True)
+
+    numeric_cols = [c for c in NUMERIC_COLUMNS if c in processed.columns]
+    processed[numeric_cols] = processed[numeric_cols].apply(pd.to_numeric, errors="coerce")
+    return processed
+
+
 def preprocess_and_engineer_features(df: pd.DataFrame) -> pd.DataFrame:
     """Preprocess OHLCV data and create simple technical features.
 
@@ -28,37 +107,42 @@ def preprocess_and_engineer_features(df: pd.DataFrame) -> pd.DataFrame:
     pandas.DataFrame
         DataFrame with engineered features appended.
     """
-    processed = df.copy()
-    if "timestamp" in processed.columns:
-        processed = processed.sort_values("timestamp").reset_index(drop=True)
+    processed = _prepare(df)
+    _add_features(processed)
+    return processed
 
-    numeric_cols = [c for c in ["open", "high", "low", "close", "volume"] if c in processed.columns]
-    processed[numeric_cols] = processed[numeric_cols].apply(pd.to_numeric, errors="coerce")
-
-    processed["returns"] = processed["close"].pct_change()
-    processed["log_returns"] = np.log(processed["close"] / processed["close"].shift(1))
-
-    # Simple moving averages for backward compatibility
-    processed["close_ma_5"] = processed["close"].rolling(window=5).mean()
-    processed["close_ma_10"] = processed["close"].rolling(window=10).mean()
-
-    processed["volatility_5"] = processed["returns"].rolling(window=5).std()
-    processed["volatility_20"] = processed["returns"].rolling(window=20).std()
 
-    processed["ema_10"] = processed["close"].ewm(span=10, adjust=False).mean()
-    processed["ema_20"] = processed["close"].ewm(span=20, adjust=False).mean()
+class IncrementalFeatureEngineer:
+    """Compute features for appended candles without touching old rows.
 
-    processed["rsi_14"] = compute_rsi(processed["close"], 14)
+    Keeps the last EWM values and the last :data:`ROLLING_WARMUP` raw bars,
+    so each update costs time proportional to the new rows only. EWM based
+    columns match :func:`preprocess_and_engineer_features` exactly; rolling
+    columns match it up to floating point rounding.
+    """
 
-    processed["macd"] = (
-        processed["close"].ewm(span=12, adjust=False).mean()
-        - processed["close"].ewm(span=26, adjust=False).mean()
-    )
-    processed["macd_signal"] = processed["macd"].ewm(span=9, adjust=False).mean()
+    def __init__(self) -> None:
+        self.seeds: Optional[Dict[str, float]] = None
+        self.tail: Optional[pd.DataFrame] = None
 
-    sma_20 = processed["close"].rolling(window=20).mean()
-    std_20 = processed["close"].rolling(window=20).std()
-    processed["bb_upper"] = sma_20 + 2 * std_20
-    processed["bb_lower"] = sma_20 - 2 * std_20
+    def fit(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Process a full history and remember the state at its end."""
+        processed = _prepare(df)
+        self.seeds = _add_features(processed)
+        self.tail = processed[list(df.columns)].tail(ROLLING_WARMUP).reset_index(drop=True)
+        return processed
 
-    return processed
\ No newline at end of file
+    def update(self, new_rows: pd.DataFrame) -> pd.DataFrame:
+        """Return feature rows for candles appended after the fitted history."""
+        if self.tail is None or self.tail.empty:
+            return self.fit(new_rows)
+        fresh = _prepare(new_rows)
+        if "timestamp" in fresh.columns and "timestamp" in self.tail.columns:
+            fresh = fresh[fresh["timestamp"] > self.tail["timestamp"].iloc[-1]]
+        if fresh.empty:
+            return fresh
+        context = pd.concat([self.tail, fresh[self.tail.columns]], ignore_index=True)
+        start = len(self.tail)
+        self.seeds = _add_features(context, self.seeds, start)
+        self.tail = context[self.tail.columns].tail(ROLLING_WARMUP).reset_index(drop=True)
+        return context.iloc[start:].reset_index(drop=True)
@@ -1,13 +1,21 @@
+import asyncio
 import requests
+import pandas as pd
 from typing import List, Dict, Any
 
 BASE_URL = "https://fapi.bitunix.com/api/v1/futures/market/kline"
+MAX_KLINE_LIMIT = 200
 
 
 def get_klines(symbol: str, interval: str, limit: int = 100,
                start_time: int | None = None,
-               end_time: int | None = None) -> List[Dict[str, Any]]:
-    """Fetch OHLCV data from Bitunix public API."""
+               end_time: int | None = None,
+               session: requests.Session | None = None,
+               base_url: str = BASE_URL) -> List[Dict[str, Any]]:
+    """Fetch OHLCV data from Bitunix public API.
+
+    Pass a ``session`` to reuse pooled connections across calls.
+    """
     params = {
         "symbol": symbol,
         "interval": interval,
@@ -19,9 +27,40 @@ def get_klines(symbol: str, interval: str, limit: int = 100,
     if end_time is not None:
         params["endTime"] = end_time
 
-    response = requests.get(BASE_URL, params=params, timeout=10)
+    http = session if session is not None else requests
+    response = http.get(base_url, params=params, timeout=10)
     response.raise_for_status()
     payload = response.json()
     if payload.get("code") != 0:
         raise RuntimeError(payload.get("msg", "API error"))
     return payload.get("data", [])
+
+
+def klines_to_frame(rows: List[Dict[str, Any]]) -> pd.DataFrame:
+    """Convert raw kline rows into a typed OHLCV DataFrame."""
+    df = pd.DataFrame(rows)
+    df = df.rename(columns={
+        "time": "timestamp",
+        "baseVol": "volume"
+    })
+    expected = ["timestamp", "open", "high", "low", "close", "volume"]
+    for col in expected:
+        if col not in df.columns:
+            raise ValueError(f"Missing required column: {col}")
+    df["timestamp"] = pd.to_datetime(df["timestamp"].astype("int64"), unit="ms")
+    df[["open", "high", "low", "close", "volume"]] = df[["open", "high", "low", "close", "volume"]].astype(float)
+    return df
+
+
+async def fetch_klines_async(client, symbols: List[str], interval: str, limit: int = 100,
+                             start_time: int | None = None,
+                             end_time: int | None = None) -> Dict[str, pd.DataFrame]:
+    """Fetch klines for many symbols concurrently through an async client.
+
+    ``client`` is an :class:`api.open_api_http_async.AsyncOpenApiHttpFuture`,
+    whose pooled connections and rate limits are shared by all requests.
+    """
+    rows = await asyncio.gather(
+        *(client.get_kline(symbol, interval, limit, start_time, end_time) for symbol in symbols)
+    )
+    return {symbol: klines_to_frame(data) if data else pd.DataFrame() for symbol, data in zip(symbols, rows)}
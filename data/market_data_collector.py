@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Tuple, Union
 import os
@@ -7,10 +8,13 @@ import os
 
 import os
 import pandas as pd
+import requests
+from requests.adapters import HTTPAdapter
 
-from .fetch_api import get_klines
+from .fetch_api import get_klines, klines_to_frame
 from api import bitunix_broker, binance_api
-from .feature_engineering import preprocess_and_engineer_features
+from .candle_store import CandleStore, closed_bars
+from .feature_engineering import IncrementalFeatureEngineer
 
 
 # Create default raw data storage directory
@@ -46,50 +50,82 @@ def _convert_to_dataframe(rows: List[Dict[str, Any]]) -> pd.DataFrame:
 
 
 class MarketDataCollector:
-    def __init__(self, raw_save_dir: Path = Path("data/raw"), save_dir: Union[str, Path] = ("data/raw")):
+    def __init__(
+        self,
+        raw_save_dir: Path = Path("data/raw"),
+        save_dir: Union[str, Path] = ("data/raw"),
+        processed_dir: Union[str, Path] = "data/processed",
+        max_concurrency: int = 16,
+    ):
+        # ``save_dir`` used to receive a second copy of the raw CSV; raw bars
+        # are now written once, to the candle store under ``raw_save_dir``.
         self.save_dir = Path(save_dir)
-        self.save_dir.mkdir(parents=True, exist_ok=True)
-        self.raw_save_dir = raw_save_dir
+        self.raw_save_dir = Path(raw_save_dir)
+        self.raw_store = CandleStore(self.raw_save_dir)
+        self.processed_store = CandleStore(processed_dir)
+        self.max_concurrency = max_concurrency
+        # Per-key feature state so repeated fetches only process new bars
+        self._engineers: Dict[Tuple[str, str], IncrementalFeatureEngineer] = {}
+        # One keep-alive pool shared by every request from this collector
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=max_concurrency)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+
+    def _fetch(self, symbol: str, timeframe: str, limit: int) -> pd.DataFrame:
+        data = get_klines(symbol, timeframe, limit, session=self.session)
+        return klines_to_frame(data)
+
+    def _persist(self, symbol: str, timeframe: str, df: pd.DataFrame) -> None:
+        # The newest kline is still forming; it is stored once it has closed,
+        # so neither the store nor the feature state keeps its partial values
+        df = closed_bars(df, timeframe)
+        if df.empty:
+            return
+        # Only bars newer than the stored history are appended
+        self.raw_store.append(symbol, timeframe, df)
+        # Run feature engineering on the bars not seen by this collector yet
+        engineer = self._engineers.get((symbol, timeframe))
+        if engineer is None:
+            engineer = self._engineers[(symbol, timeframe)] = IncrementalFeatureEngineer()
+            processed_df = engineer.fit(df)
+        else:
+            processed_df = engineer.update(df)
+        # Save processed dataset for later use
+        self.processed_store.append(symbol, timeframe, processed_df)
 
     def _get_single_ohlcv(
         self, symbol: str, timeframe: str, limit: int = 200, save: bool = True
     ) -> pd.DataFrame:
-        # Only use get_klines now
-        data = get_klines(symbol, timeframe, limit)
-
-        df = pd.DataFrame(data)
-        df = df.rename(columns={
-            "time": "timestamp",
-            "baseVol": "volume"
-        })
-        expected = ["timestamp", "open", "high", "low", "close", "volume"]
-        for col in expected:
-            if col not in df.columns:
-                raise ValueError(f"Missing required column: {col}")
-        df["timestamp"] = pd.to_datetime(df["timestamp"].astype(int), unit="ms")
-        df[["open", "high", "low", "close", "volume"]] = df[["open", "high", "low", "close", "volume"]].astype(float)
-        print("RAW API response sample:", data[:2])
-
+        df = self._fetch(symbol, timeframe, limit)
+        print("RAW API response sample:", df.head(2).to_dict("records"))
         if save:
-            # Save raw CSV
-            self.save_dir.mkdir(parents=True, exist_ok=True)
-            raw_path = self.save_dir / f"{symbol}_{timeframe}.csv"
-            df.to_csv(raw_path, index=False)
-            self.raw_save_dir.mkdir(parents=True, exist_ok=True)
-            df.to_csv(self.raw_save_dir / f"{symbol}_{timeframe}.csv", index=False)
-        # Run feature engineering on the fetched data
-        processed_df = preprocess_and_engineer_features(df)
-
-        # Save processed dataset for later use
-        if save:
-            os.makedirs("data/processed", exist_ok=True)
-            processed_df.to_csv(
-                f"data/processed/{symbol}_{timeframe}.csv", index=False
-            )
-
-
+            self._persist(symbol, timeframe, df)
         return df
 
+    def _get_many_ohlcv(
+        self, keys: List[Tuple[str, str]], limit: int, save: bool
+    ) -> Dict[Tuple[str, str], pd.DataFrame]:
+        """Fetch ``keys`` concurrently and persist each frame as it arrives.
+
+        Fetches run on a bounded pool; feature engineering and store writes
+        run on a separate worker so they never delay an outstanding request.
+        """
+        frames: Dict[Tuple[str, str], pd.DataFrame] = {}
+        writes: List[Future] = []
+        with ThreadPoolExecutor(max_workers=1) as writer, ThreadPoolExecutor(
+            max_workers=max(1, min(self.max_concurrency, len(keys)))
+        ) as pool:
+            pending = {pool.submit(self._fetch, sym, tf, limit): (sym, tf) for sym, tf in keys}
+            for fut in as_completed(pending):
+                key = pending[fut]
+                frames[key] = fut.result()
+                if save:
+                    writes.append(writer.submit(self._persist, key[0], key[1], frames[key]))
+            for write in writes:
+                write.result()
+        return {key: frames[key] for key in keys}
+
     def get_ohlcv(
         self,
         symbol: Union[str, Iterable[str]],
@@ -101,11 +137,8 @@ class MarketDataCollector:
             return self._get_single_ohlcv(symbol, timeframe, limit, save)
         symbols = [symbol] if isinstance(symbol, str) else list(symbol)
         timeframes = [timeframe] if isinstance(timeframe, str) else list(timeframe)
-        results: Dict[Tuple[str, str], pd.DataFrame] = {}
-        for sym in symbols:
-            for tf in timeframes:
-                results[(sym, tf)] = self._get_single_ohlcv(sym, tf, limit, save)
-        return results
+        keys = [(sym, tf) for sym in symbols for tf in timeframes]
+        return self._get_many_ohlcv(keys, limit, save)
 
 
 def load_cached_or_fetch(
@@ -113,21 +146,15 @@ def load_cached_or_fetch(
     timeframe: Union[str, Iterable[str]],
     limit: int = 100,
 ) -> Union[pd.DataFrame, Dict[Tuple[str, str], pd.DataFrame]]:
+    store = CandleStore(RAW_DATA_DIR)
     if isinstance(symbol, str) and isinstance(timeframe, str):
-        path = RAW_DATA_DIR / f"{symbol}_{timeframe}.csv"
-        if path.exists():
-            return pd.read_csv(path, parse_dates=["timestamp"])
+        if store.has(symbol, timeframe):
+            return store.read(symbol, timeframe)
         return MarketDataCollector().get_ohlcv(symbol, timeframe, limit)
     symbols = [symbol] if isinstance(symbol, str) else list(symbol)
     timeframes = [timeframe] if isinstance(timeframe, str) else list(timeframe)
 
-    results: Dict[Tuple[str, str], pd.DataFrame] = {}
-    collector = MarketDataCollector()
-    for sym in symbols:
-        for tf in timeframes:
-            path = RAW_DATA_DIR / f"{sym}_{tf}.csv"
-            if path.exists():
-                results[(sym, tf)] = pd.read_csv(path, parse_dates=["timestamp"])
-            else:
-                results[(sym, tf)] = collector.get_ohlcv(sym, tf, limit)
-    return results
+    keys = [(sym, tf) for sym in symbols for tf in timeframes]
+    missing = [key for key in keys if not store.has(*key)]
+    fetched = MarketDataCollector()._get_many_ohlcv(missing, limit, True) if missing else {}
+    return {key: fetched[key] if key in fetched else store.read(*key) for key in keys}
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+Level = Sequence[Any]  # [price, qty] as numbers or strings
+
+
+class BookSide:
+    """One side of an L2 book kept as sorted NumPy buffers.
+
+    Prices are stored as ascending keys with the best level last (bids use the
+    price, asks its negation), so the top of book is read in O(1) and updates
+    near the touch only shift a few entries. Buffers double when full.
+    """
+
+    def __init__(self, is_bid: bool, capacity: int = 256) -> None:
+        self.sign = 1.0 if is_bid else -1.0
+        self.keys = np.empty(capacity, dtype=np.float64)
+        self.qtys = np.empty(capacity, dtype=np.float64)
+        self.size = 0
+
+    def __len__(self) -> int:
+        return self.size
+
+    def clear(self) -> None:
+        self.size = 0
+
+    def _grow(self) -> None:
+        capacity = len(self.keys) * 2
+        for name in ("keys", "qtys"):
+            old = getattr(self, name)
+            new = np.empty(capacity, dtype=np.float64)
+            new[: self.size] = old[: self.size]
+            setattr(self, name, new)
+
+    def set(self, price: float, qty: float) -> None:
+        """Set the resting quantity at ``price``; zero removes the level."""
+        key = price * self.sign
+        n = self.size
+        # updates mostly hit the touch, so check the top before bisecting
+        if n and self.keys[n - 1] < key:
+            idx = n
+        else:
+            idx = int(np.searchsorted(self.keys[:n], key))
+        exists = idx < n and self.keys[idx] == key
+        if qty <= 0:
+            if exists:
+                self.keys[idx : n - 1] = self.keys[idx + 1 : n]
+                self.qtys[idx : n - 1] = self.qtys[idx + 1 : n]
+                self.size -= 1
+            return
+        if exists:
+            self.qtys[idx] = qty
+            return
+        if n == len(self.keys):
+            self._grow()
+        self.keys[idx + 1 : n + 1] = self.keys[idx:n].copy()
+        self.qtys[idx + 1 : n + 1] = self.qtys[idx:n].copy()
+        self.keys[idx] = key
+        self.qtys[idx] = qty
+        self.size += 1
+
+    def load(self, levels: Iterable[Level]) -> None:
+        """Replace the side with ``levels`` in any order."""
+        arr = np.asarray([(float(p), float(q)) for p, q in levels], dtype=np.float64).reshape(-1, 2)
+        arr = arr[arr[:, 1] > 0]
+        while len(self.keys) < len(arr):
+            self._grow()
+        keys = arr[:, 0] * self.sign
+        order = np.argsort(keys, kind="stable")
+        self.size = len(arr)
+        self.keys[: self.size] = keys[order]
+        self.qtys[: self.size] = arr[order, 1]
+
+    @property
+    def best(self) -> Optional[float]:
+        return self.keys[self.size - 1] * self.sign if self.size else None
+
+    def top(self, levels: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
+        """Return ``(prices, qtys)`` for the best ``levels``, best first."""
+        n = self.size if levels is None else min(levels, self.size)
+        start = self.size - n
+        return self.keys[start : self.size][::-1] * self.sign, self.qtys[start : self.size][::-1]
+
+
+class OrderBook:
+    """In-memory L2 order book for one symbol."""
+
+    def __init__(self, symbol: str = "") -> None:
+        self.symbol = symbol
+        self.bids = BookSide(is_bid=True)
+        self.asks = BookSide(is_bid=False)
+        self.ts: Optional[int] = None
+
+    # ------------------------------------------------------------------
+    def apply_snapshot(self, bids: Iterable[Level], asks: Iterable[Level], ts: Optional[int] = None) -> None:
+        self.bids.load(bids)
+        self.asks.load(asks)
+        self.ts = ts
+
+    def apply_update(self, bids: Iterable[Level] = (), asks: Iterable[Level] = (), ts: Optional[int] = None) -> None:
+        """Apply incremental levels; a quantity of zero deletes the level."""
+        for price, qty in bids:
+            self.bids.set(float(price), float(qty))
+        for price, qty in asks:
+            self.asks.set(float(price), float(qty))
+        if ts is not None:
+            self.ts = ts
+
+    # ------------------------------------------------------------------
+    @property
+    def best_bid(self) -> Optional[float]:
+        return self.bids.best
+
+    @property
+    def best_ask(self) -> Optional[float]:
+        return self.asks.best
+
+    @property
+    def mid(self) -> Optional[float]:
+        if not self.bids.size or not self.asks.size:
+            return None
+        return (self.bids.best + self.asks.best) / 2
+
+    @property
+    def spread(self) -> Optional[float]:
+        if not self.bids.size or not self.asks.size:
+            return None
+        return self.asks.best - self.bids.best
+
+    def weighted_price(self, side: str, levels: int = 5) -> Optional[float]:
+        """Depth-weighted price of the best ``levels`` on ``side`` ("bid" or "ask")."""
+        book_side = self.bids if side in {"bid", "sell"} else self.asks
+        prices, qtys = book_side.top(levels)
+        total = qtys.sum()
+        if total <= 0:
+            return None
+        return float((prices * qtys).sum() / total)
+
+    def estimate_fill(self, side: str, qty: float) -> Optional[float]:
+        """Average price for a market order of ``qty`` walking the book.
+
+        A ``buy`` consumes asks and a ``sell`` consumes bids. Any quantity
+        beyond the visible depth is assumed to fill at the worst level.
+        """
+        book_side = self.asks if side == "buy" else self.bids
+        if not book_side.size or qty <= 0:
+            return None
+        prices, qtys = book_side.top()
+        filled_before = np.concatenate(([0.0], np.cumsum(qtys)[:-1]))
+        take = np.clip(qty - filled_before, 0.0, qtys)
+        remaining = qty - take.sum()
+        cost = float((prices * take).sum()) + remaining * float(prices[-1])
+        return cost / qty
+
+    def slippage_pct(self, side: str, qty: float) -> Optional[float]:
+        """Expected adverse move from mid for a market order of ``qty``."""
+        mid = self.mid
+        avg = self.estimate_fill(side, qty)
+        if mid is None or avg is None:
+            return None
+        return (avg - mid) / mid if side == "buy" else (mid - avg) / mid
+
+
+class OrderBookManager:
+    """Maintain one :class:`OrderBook` per symbol from REST and WS depth data."""
+
+    def __init__(self) -> None:
+        self.books: Dict[str, OrderBook] = {}
+
+    def book(self, symbol: str) -> OrderBook:
+        book = self.books.get(symbol)
+        if book is None:
+            book = self.books[symbol] = OrderBook(symbol)
+        return book
+
+    def on_depth(self, symbol: str, depth: Dict[str, Any]) -> OrderBook:
+        """Load a snapshot as returned by ``OpenApiHttpFuturePublic.get_depth``."""
+        book = self.book(symbol)
+        book.apply_snapshot(depth.get("bids", []), depth.get("asks", []))
+        return book
+
+    def on_message(self, message: Dict[str, Any]) -> Optional[OrderBook]:
+        """Apply a ``depth_book1`` push (top of book snapshot) from the public WS."""
+        if message.get("ch") != "depth_book1":
+            return None
+        data = message.get("data", {})
+        book = self.book(message.get("symbol", ""))
+        book.apply_snapshot(data.get("b", []), data.get("a", []), message.get("ts"))
+        return book
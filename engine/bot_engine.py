@@ -1,47 +1,274 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from core.bar_series import BarSeries
 from strategies.base import BaseStrategy
 from execution.order_manager import OrderManager
 from risk.risk_manager import RiskManager
 from dashboard.dashboard import PerformanceMetrics
-from utils.telegram_notifier import send_telegram_alert
+from utils.latency import LatencyHistogram
+from utils.telegram_notifier import TelegramDispatcher
+
+TICK = "tick"
+
+
+@dataclass
+class SymbolState:
+    """Market data and timing kept per routed symbol."""
+
+    symbol: str
+    bars: Dict[str, BarSeries] = field(default_factory=dict)
+    last_price: Optional[float] = None
+    signals: int = 0
+    orders: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    queue: Optional[asyncio.Queue] = None
+    task: Optional[asyncio.Task] = None
 
 
 class BotEngine:
-    """Orchestrates strategy signals and order execution."""
+    """Orchestrates strategy signals and order execution.
+
+    Strategies are routed by ``(symbol, timeframe)``; timeframe ``"tick"``
+    receives raw prices and any other timeframe receives closed bars. A
+    strategy instance keeps its own indicator state, so register one
+    instance per route. The single ``strategy`` argument is kept as a
+    shortcut that routes it on ``symbol`` (or its own symbol).
+
+    ``on_price_update``/``on_bar`` run synchronously. For many symbols,
+    ``await start()`` and hand data in with ``submit_tick``/``submit_bar``
+    (safe from any thread): each symbol gets an asyncio queue and worker,
+    so symbols are evaluated concurrently while events for one symbol stay
+    in order. Routes added with ``cpu_bound=True`` are evaluated on a thread
+    pool and orders are placed off the event loop. Per-symbol latency, from
+    submission until the event is handled, is available from
+    :meth:`latency_snapshot`.
+
+    Without an ``order_manager`` the engine only counts buy/sell signals
+    per symbol (``SymbolState.signals``) and places nothing.
+
+    Each bar series keeps the last ``max_bars`` bars (``None`` keeps them
+    all); ``bar_capacity`` is only the initial allocation.
+    """
 
     def __init__(
         self,
-        strategy: BaseStrategy,
-        order_manager: OrderManager,
-        risk_manager: RiskManager,
+        strategy: BaseStrategy | None = None,
+        order_manager: OrderManager | None = None,
+        risk_manager: RiskManager | None = None,
         metrics: PerformanceMetrics | None = None,
-        notifier:  None = None,
+        notifier: TelegramDispatcher | None = None,
         initial_balance: float = 1.0,
+        bar_capacity: int = 1024,
+        max_bars: int | None = 10_000,
+        symbol: str | None = None,
+        workers: int | None = None,
     ) -> None:
         self.strategy = strategy
         self.order_manager = order_manager
-        self.risk_manager = risk_manager
+        self.risk_manager = risk_manager or RiskManager()
         self.metrics = metrics
         self.notifier = notifier
         self.balance = initial_balance
+        self.bar_capacity = bar_capacity
+        self.max_bars = max_bars
+        self.workers = workers
+        self.routes: Dict[Tuple[str, str], List[BaseStrategy]] = {}
+        self.symbols: Dict[str, SymbolState] = {}
+        self._cpu_bound: Set[int] = set()
+        self._executor: ThreadPoolExecutor | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self.symbol = symbol or (strategy.symbol if strategy is not None else "")
+        self.timeframe = (strategy.timeframe if strategy is not None else "") or TICK
+        if strategy is not None:
+            self.add_route(self.symbol, self.timeframe, strategy)
         if self.metrics:
             self.metrics.initial_balance = initial_balance
             self.metrics.balance = initial_balance
 
-    def on_price_update(self, price: float) -> None:
-        self.strategy.on_data(price)
-        if self.strategy.should_buy():
-            qty = self.risk_manager.size_position(self.balance, price)
-            order = self.order_manager.place_order("BUY", "BTCUSDT", qty, price)
-            if self.metrics:
-                self.metrics.record_trade("buy", qty, price)
-                self.balance = self.metrics.balance
-            if self.notifier:
-                self.notifier.send_telegram_alert(order)
-        elif self.strategy.should_sell():
-            qty = self.risk_manager.size_position(self.balance, price)
-            order = self.order_manager.place_order("SELL", "BTCUSDT", qty, price)
-            if self.metrics:
-                self.metrics.record_trade("sell", qty, price)
-                self.balance = self.metrics.balance
-            if self.notifier:
-                self.notifier.send_telegram_alert(order)
+    @property
+    def bars(self) -> BarSeries:
+        """Bars of the default route, kept for single-strategy callers."""
+        return self._state(self.symbol).bars.setdefault(self.timeframe, self._new_bars())
+
+    def _new_bars(self) -> BarSeries:
+        return BarSeries(capacity=self.bar_capacity, max_bars=self.max_bars)
+
+    # ------------------------------------------------------------------
+    def _state(self, symbol: str) -> SymbolState:
+        state = self.symbols.get(symbol)
+        if state is None:
+            state = self.symbols[symbol] = SymbolState(symbol)
+            if self._loop is not None:
+                self._start_worker(state)
+        return state
+
+    def add_route(self, symbol: str, timeframe: str, strategy: BaseStrategy, cpu_bound: bool = False) -> None:
+        """Send ``symbol`` data of ``timeframe`` (or ``"tick"``) to ``strategy``."""
+        self.routes.setdefault((symbol, timeframe or TICK), []).append(strategy)
+        if cpu_bound:
+            self._cpu_bound.add(id(strategy))
+        self._state(symbol)
+
+    def latency_snapshot(self) -> Dict[str, Dict[str, float]]:
+        return {symbol: state.latency.snapshot() for symbol, state in self.symbols.items()}
+
+    # ------------------------------------------------------------------
+    def _place(self, action: str, price: float, symbol: str) -> Optional[Tuple[Any, float]]:
+        if action not in ("buy", "sell"):
+            return None
+        self._state(symbol).signals += 1
+        if self.order_manager is None:
+            # Signal-only engine: the signal is counted but nothing is traded
+            logging.info(f"{action.upper()} signal for {symbol} @ {price:g} (no order manager)")
+            return None
+        qty = self.risk_manager.size_position(self.balance, price)
+        return self.order_manager.place_order(action.upper(), symbol, qty, price), qty
+
+    def _record(self, action: str, price: float, symbol: str, placed: Optional[Tuple[Any, float]]) -> None:
+        if placed is None:
+            return
+        order, qty = placed
+        self._state(symbol).orders += 1
+        if self.metrics:
+            self.metrics.record_trade(action, qty, price, symbol)
+            self.balance = self.metrics.balance
+        if self.notifier:
+            # Only queues the alert; delivery happens on the dispatcher thread
+            self.notifier.send(f"{action.upper()} {symbol} {qty:g} @ {price:g}")
+
+    def _execute(self, action: str, price: float, symbol: str | None = None) -> None:
+        symbol = symbol or self.symbol
+        self._record(action, price, symbol, self._place(action, price, symbol))
+
+    def _signal(self, state: SymbolState, timeframe: str, strategy: BaseStrategy, price: float) -> str:
+        """Evaluate ``strategy`` once for the latest tick or bar."""
+        if timeframe != TICK and strategy.accepts_bars:
+            action, _, _ = strategy.evaluate(state.bars[timeframe])
+            return action
+        strategy.on_data(price)
+        action, _, _ = strategy.evaluate()
+        return action
+
+    def _ingest(self, state: SymbolState, timeframe: str, data: Any) -> float:
+        if timeframe == TICK:
+            price = float(data)
+        else:
+            bars = state.bars.get(timeframe)
+            if bars is None:
+                bars = state.bars[timeframe] = self._new_bars()
+            bars.append(data)
+            price = data["close"]
+        state.last_price = price
+        return price
+
+    def _dispatch(self, symbol: str, timeframe: str, data: Any, started: float) -> None:
+        strategies = self.routes.get((symbol, timeframe))
+        if not strategies:
+            return
+        state = self._state(symbol)
+        price = self._ingest(state, timeframe, data)
+        for strategy in strategies:
+            self._execute(self._signal(state, timeframe, strategy, price), price, symbol)
+        state.latency.record(time.perf_counter() - started)
+
+    def on_price_update(self, price: float, symbol: str | None = None) -> None:
+        self._dispatch(symbol or self.symbol, TICK, price, time.perf_counter())
+
+    def on_bar(self, bar: Dict[str, float], symbol: str | None = None, timeframe: str | None = None) -> None:
+        """Append a closed candle and act on the strategies routed to it."""
+        timeframe = timeframe or self.timeframe
+        if timeframe == TICK:
+            self.on_price_update(bar["close"], symbol)
+            return
+        self._dispatch(symbol or self.symbol, timeframe, bar, time.perf_counter())
+
+    # ------------------------------------------------------------------
+    def _start_worker(self, state: SymbolState) -> None:
+        state.queue = asyncio.Queue()
+        state.task = self._loop.create_task(self._worker(state))
+
+    async def start(self) -> None:
+        """Start one dispatch worker per symbol on the running event loop."""
+        self._loop = asyncio.get_running_loop()
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="bot-engine")
+        for state in self.symbols.values():
+            if state.task is None:
+                self._start_worker(state)
+
+    async def _worker(self, state: SymbolState) -> None:
+        while True:
+            item = await state.queue.get()
+            try:
+                if item is None:
+                    return
+                await self._handle(state, *item)
+            except Exception as e:
+                logging.error(f"Dispatch failed for {state.symbol}: {e}")
+            finally:
+                state.queue.task_done()
+
+    async def _handle(self, state: SymbolState, timeframe: str, data: Any, started: float) -> None:
+        strategies = self.routes.get((state.symbol, timeframe))
+        if not strategies:
+            return
+        price = self._ingest(state, timeframe, data)
+        for strategy in strategies:
+            if id(strategy) in self._cpu_bound:
+                action = await self._loop.run_in_executor(
+                    self._executor, self._signal, state, timeframe, strategy, price
+                )
+            else:
+                action = self._signal(state, timeframe, strategy, price)
+            if action in ("buy", "sell"):
+                placed = await self._loop.run_in_executor(self._executor, self._place, action, price, state.symbol)
+                self._record(action, price, state.symbol, placed)
+        state.latency.record(time.perf_counter() - started)
+
+    def _enqueue(self, symbol: str, timeframe: str, data: Any) -> bool:
+        if self._loop is None:
+            raise RuntimeError("call 'await start()' before submitting events")
+        state = self.symbols.get(symbol)
+        if state is None:
+            # Only routed symbols get a queue and worker
+            logging.warning(f"Ignoring {timeframe} event for unrouted symbol {symbol}")
+            return False
+        item = (timeframe, data, time.perf_counter())
+        self._loop.call_soon_threadsafe(lambda: state.queue.put_nowait(item))
+        return True
+
+    def submit_tick(self, symbol: str, price: float) -> bool:
+        """Queue a price; returns False (and drops it) when ``symbol`` has no route."""
+        return self._enqueue(symbol, TICK, price)
+
+    def submit_bar(self, symbol: str, timeframe: str, bar: Dict[str, float]) -> bool:
+        """Queue a closed bar; returns False (and drops it) when ``symbol`` has no route."""
+        return self._enqueue(symbol, timeframe, bar)
+
+    async def drain(self) -> None:
+        """Wait until every submitted event has been handled."""
+        # Let pending call_soon_threadsafe callbacks enqueue their events
+        await asyncio.sleep(0)
+        await asyncio.gather(*(state.queue.join() for state in self.symbols.values() if state.queue is not None))
+
+    async def stop(self) -> None:
+        """Handle queued events, stop the workers and the thread pool."""
+        await self.drain()
+        states = [state for state in self.symbols.values() if state.task is not None]
+        for state in states:
+            state.queue.put_nowait(None)
+        await asyncio.gather(*(state.task for state in states))
+        for state in states:
+            state.queue = None
+            state.task = None
+        self._loop = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
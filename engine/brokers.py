@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from data.order_book import OrderBook
+from execution.order_manager import OrderManager
+from .events import FILL, Event, EventLoop
+
+
+@dataclass
+class Order:
+    """Market order raised by :class:`engine.trading_core.TradingCore`.
+
+    Entries set ``notional`` and let the broker size the quantity from the
+    fill price; exits set ``qty`` to the open position size.
+    """
+
+    ts: int
+    symbol: str
+    timeframe: str
+    side: str  # "buy" or "sell"
+    price: float  # reference price the order was raised at
+    strategy: str = ""
+    qty: Optional[float] = None
+    notional: Optional[float] = None
+    reason: str = "entry"
+    sl: Optional[float] = None
+    tp: Optional[float] = None
+
+
+class Broker:
+    """Turn orders into ``fill`` events on the loop."""
+
+    def submit(self, order: Order, loop: EventLoop) -> None:
+        raise NotImplementedError
+
+    @staticmethod
+    def _fill(
+        loop: EventLoop, order: Order, price: float, qty: float, fee: float, raw: Any = None, rejected: bool = False
+    ) -> None:
+        loop.put(
+            Event(
+                order.ts,
+                FILL,
+                order.symbol,
+                order.timeframe,
+                {"order": order, "price": price, "qty": qty, "fee": fee, "raw": raw, "rejected": rejected},
+            )
+        )
+
+
+class SimulatedBroker(Broker):
+    """Fill at the reference price with slippage and fees, like BacktestEngine.
+
+    With an order book for the symbol, slippage is sized by quantity from
+    the book; otherwise ``slippage_pct`` applies.
+    """
+
+    def __init__(
+        self, slippage_pct: float = 0.0, fee_pct: float = 0.0, order_books: Optional[Dict[str, OrderBook]] = None
+    ) -> None:
+        self.slippage_pct = slippage_pct
+        self.fee_pct = fee_pct
+        self.order_books = order_books or {}
+
+    def _slip(self, price: float, side: str, symbol: str, qty: Optional[float]) -> float:
+        pct = None
+        book = self.order_books.get(symbol)
+        if book is not None and qty:
+            pct = book.slippage_pct(side, qty)
+        if pct is None:
+            pct = self.slippage_pct
+        adj = price * pct
+        return price + adj if side == "buy" else price - adj
+
+    def submit(self, order: Order, loop: EventLoop) -> None:
+        if order.qty is None:
+            price = self._slip(order.price, order.side, order.symbol, order.notional / order.price)
+            qty = order.notional / price
+        else:
+            price = self._slip(order.price, order.side, order.symbol, order.qty)
+            qty = order.qty
+        self._fill(loop, order, price, qty, price * qty * self.fee_pct)
+
+
+class LiveBroker(Broker):
+    """Send orders through an :class:`OrderManager` and report the fills.
+
+    The fill price is taken from the exchange response when it carries one
+    and falls back to the reference price.
+    """
+
+    def __init__(self, order_manager: OrderManager, fee_pct: float = 0.0) -> None:
+        self.order_manager = order_manager
+        self.fee_pct = fee_pct
+
+    def submit(self, order: Order, loop: EventLoop) -> None:
+        qty = order.qty if order.qty is not None else order.notional / order.price
+        try:
+            response = self.order_manager.place_order(order.side.upper(), order.symbol, qty, order.price)
+        except Exception as e:
+            logging.error(f"Order failed for {order.symbol}: {e}")
+            self._fill(loop, order, order.price, 0.0, 0.0, rejected=True)
+            return
+        price = order.price
+        if isinstance(response, dict):
+            for field in ("avgPrice", "price"):
+                try:
+                    price = float(response[field])
+                    break
+                except (KeyError, TypeError, ValueError):
+                    continue
+        self._fill(loop, order, price, qty, price * qty * self.fee_pct, response)
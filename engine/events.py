@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import heapq
+import itertools
+import queue
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import Any, Callable, DefaultDict, Dict, Iterator, List, Optional, Tuple
+
+BAR = "bar"
+TICK = "tick"
+FILL = "fill"
+
+# Order of events sharing a timestamp: fills settle before the next bar or tick
+PRIORITY = {FILL: 0, BAR: 1, TICK: 2}
+
+Handler = Callable[["Event"], None]
+
+
+@dataclass
+class Event:
+    """Timestamped market or execution event."""
+
+    ts: int  # epoch milliseconds
+    kind: str
+    symbol: str = ""
+    timeframe: str = ""
+    data: Dict[str, Any] = field(default_factory=dict)
+
+
+class EventLoop:
+    """Single-threaded priority-queue event loop.
+
+    Pull feeds (iterables of events in time order) are merged lazily: only
+    the next event of each feed sits in the heap. Push feeds and other
+    threads hand events in through :meth:`put_threadsafe`. Events are
+    ordered by timestamp, then :data:`PRIORITY`, then arrival.
+    """
+
+    def __init__(self) -> None:
+        self._heap: List[Tuple[int, int, int, Event, Optional[Iterator[Event]]]] = []
+        self._seq = itertools.count()
+        self._inbox: "queue.SimpleQueue[Event]" = queue.SimpleQueue()
+        self.handlers: DefaultDict[str, List[Handler]] = defaultdict(list)
+        self.processed = 0
+        self._running = False
+
+    def subscribe(self, kind: str, handler: Handler) -> None:
+        self.handlers[kind].append(handler)
+
+    def _push(self, event: Event, source: Optional[Iterator[Event]] = None) -> None:
+        heapq.heappush(self._heap, (event.ts, PRIORITY.get(event.kind, 3), next(self._seq), event, source))
+
+    def put(self, event: Event) -> None:
+        """Schedule ``event``; only call from the loop's own thread."""
+        self._push(event)
+
+    def put_threadsafe(self, event: Event) -> None:
+        self._inbox.put(event)
+
+    def add_feed(self, feed: Any) -> None:
+        """Register a feed with ``events()`` (pull) or ``attach(loop)`` (push)."""
+        if hasattr(feed, "attach"):
+            feed.attach(self)
+            return
+        source = iter(feed.events())
+        first = next(source, None)
+        if first is not None:
+            self._push(first, source)
+
+    def _drain_inbox(self) -> None:
+        while True:
+            try:
+                self._push(self._inbox.get_nowait())
+            except queue.Empty:
+                return
+
+    def stop(self) -> None:
+        self._running = False
+        # Wake a blocked ``run`` so it notices
+        self._inbox.put(Event(0, "stop"))
+
+    def run(self, until: Optional[int] = None, block: bool = False, timeout: Optional[float] = None) -> int:
+        """Dispatch events in order and return how many were processed.
+
+        Stops when the queue is empty, or with ``block=True`` waits for
+        pushed events until :meth:`stop` is called (or ``timeout`` seconds
+        pass without one). Events after ``until`` are left queued.
+        """
+        self._running = True
+        processed = 0
+        while self._running:
+            self._drain_inbox()
+            if not self._heap:
+                if not block:
+                    break
+                try:
+                    self._push(self._inbox.get(timeout=timeout))
+                except queue.Empty:
+                    break
+                continue
+            ts, _, _, event, source = self._heap[0]
+            if until is not None and ts > until:
+                break
+            heapq.heappop(self._heap)
+            if source is not None:
+                upcoming = next(source, None)
+                if upcoming is not None:
+                    self._push(upcoming, source)
+            if event.kind == "stop":
+                continue
+            for handler in self.handlers.get(event.kind, ()):
+                handler(event)
+            processed += 1
+        self._running = False
+        self.processed += processed
+        return processed
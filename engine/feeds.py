@@ -0,0 +1,111 @@
+from __future__ import annotations
+
+import heapq
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Sequence, Tuple, Union
+
+import numpy as np
+import pandas as pd
+
+from core.bar_series import BAR_COLUMNS
+from data.candle_aggregator import CandleAggregator
+from data.candle_store import CandleStore, TimeLike
+from .events import BAR, TICK, Event, EventLoop
+
+Key = Tuple[str, str]
+
+
+def _bar_events(symbol: str, timeframe: str, columns: Dict[str, np.ndarray], ts_ms: np.ndarray) -> Iterator[Event]:
+    names = [name for name in BAR_COLUMNS if name in columns]
+    # Python lists iterate far faster than NumPy scalars
+    rows = zip(ts_ms.tolist(), *(np.asarray(columns[name], dtype=np.float64).tolist() for name in names))
+    for ts, *values in rows:
+        bar = dict(zip(names, values))
+        bar["timestamp"] = ts
+        yield Event(ts, BAR, symbol, timeframe, bar)
+
+
+def _frame_events(symbol: str, timeframe: str, df: pd.DataFrame) -> Iterator[Event]:
+    ts = pd.to_datetime(df["timestamp"]).to_numpy(dtype="datetime64[ns]").view(np.int64) // 1_000_000
+    return _bar_events(symbol, timeframe, {name: df[name].to_numpy() for name in df.columns}, ts)
+
+
+def _merge(streams: Iterable[Iterator[Event]]) -> Iterator[Event]:
+    return heapq.merge(*streams, key=lambda event: event.ts)
+
+
+class FrameFeed:
+    """Replay closed bars from in-memory DataFrames keyed by (symbol, timeframe)."""
+
+    def __init__(self, data: Dict[Key, pd.DataFrame]) -> None:
+        self.data = data
+
+    def events(self) -> Iterator[Event]:
+        return _merge(_frame_events(sym, tf, df) for (sym, tf), df in self.data.items() if not df.empty)
+
+
+class StoreFeed:
+    """Replay bars from a :class:`CandleStore` one Arrow batch at a time."""
+
+    def __init__(
+        self,
+        store_dir: Union[str, Path] = "data/processed",
+        symbols: Optional[Sequence[str]] = None,
+        timeframes: Optional[Sequence[str]] = None,
+        start: TimeLike = None,
+        end: TimeLike = None,
+    ) -> None:
+        self.store = CandleStore(store_dir)
+        self.symbols = symbols
+        self.timeframes = timeframes
+        self.start = start
+        self.end = end
+
+    def _key_events(self, symbol: str, timeframe: str) -> Iterator[Event]:
+        table = self.store.read_table(symbol, timeframe, self.start, self.end)
+        if table.num_rows == 0:
+            return
+        for batch in table.to_batches():
+            columns = {name: batch.column(name).to_numpy(zero_copy_only=False) for name in batch.schema.names}
+            ts = columns.pop("timestamp").view(np.int64) // 1_000_000
+            yield from _bar_events(symbol, timeframe, columns, ts)
+
+    def events(self) -> Iterator[Event]:
+        keys = [
+            (sym, tf)
+            for sym, tf in self.store.keys()
+            if (self.symbols is None or sym in self.symbols) and (self.timeframes is None or tf in self.timeframes)
+        ]
+        return _merge(self._key_events(sym, tf) for sym, tf in keys)
+
+
+class ReplayFeed:
+    """Replay a list of prices as tick events, one millisecond apart by default."""
+
+    def __init__(self, prices: Sequence[float], symbol: str = "", start_ms: int = 0, step_ms: int = 1) -> None:
+        self.prices = prices
+        self.symbol = symbol
+        self.start_ms = start_ms
+        self.step_ms = step_ms
+
+    def events(self) -> Iterator[Event]:
+        for i, price in enumerate(self.prices):
+            ts = self.start_ms + i * self.step_ms
+            yield Event(ts, TICK, self.symbol, "", {"price": float(price), "timestamp": ts})
+
+
+class AggregatorFeed:
+    """Push bars closed by a live :class:`CandleAggregator` into the loop.
+
+    Subscribing happens in :meth:`attach`, so the websocket thread feeding
+    the aggregator only enqueues events; strategies run on the loop thread.
+    """
+
+    def __init__(self, aggregator: CandleAggregator) -> None:
+        self.aggregator = aggregator
+
+    def attach(self, loop: EventLoop) -> None:
+        def on_bar(symbol: str, timeframe: str, bar: Dict[str, float]) -> None:
+            loop.put_threadsafe(Event(int(bar["timestamp"]), BAR, symbol, timeframe, bar))
+
+        self.aggregator.subscribe(on_bar)
@@ -1,29 +1,43 @@
-from collections import deque
-from typing import Deque, Dict
+from typing import Dict, Optional, Tuple
 
-from utils.indicators import atr
+from utils.streaming_indicators import ATR, RollingMax, RollingMin
 
 
 class RegimeDetector:
-    """Classify regime based on ATR and volatility bands."""
+    """Classify regime based on ATR and volatility bands.
+
+    ``on_data`` feeds a single stream read by ``detect()``. Bars from
+    ``on_bar`` are tracked separately per (symbol, timeframe), so one
+    detector subscribed to :class:`data.candle_aggregator.CandleAggregator`
+    never mixes series; read them with ``detect(symbol, timeframe)``.
+    """
 
     def __init__(self, atr_period: int = 14, band_mult: float = 1.5) -> None:
         self.atr_period = atr_period
         self.band_mult = band_mult
-        self.highs: Deque[float] = deque(maxlen=atr_period * 2)
-        self.lows: Deque[float] = deque(maxlen=atr_period * 2)
-        self.closes: Deque[float] = deque(maxlen=atr_period * 2)
+        self.atr = ATR(atr_period)
+        self.band_high = RollingMax(atr_period * 2)
+        self.band_low = RollingMin(atr_period * 2)
+        self._series: Dict[Tuple[str, str], "RegimeDetector"] = {}
 
     def on_data(self, candle: Dict[str, float]) -> None:
-        self.highs.append(candle["high"])
-        self.lows.append(candle["low"])
-        self.closes.append(candle["close"])
+        self.atr.update(candle["high"], candle["low"], candle["close"])
+        self.band_high.update(candle["high"])
+        self.band_low.update(candle["low"])
 
-    def detect(self) -> str:
-        if len(self.closes) < self.atr_period + 1:
-            return "unknown"
-        atr_val = atr(list(self.highs), list(self.lows), list(self.closes), self.atr_period)
+    def on_bar(self, symbol: str, timeframe: str, bar: Dict[str, float]) -> None:
+        """Bar-closed callback for :class:`data.candle_aggregator.CandleAggregator`."""
+        detector = self._series.get((symbol, timeframe))
+        if detector is None:
+            detector = self._series[(symbol, timeframe)] = RegimeDetector(self.atr_period, self.band_mult)
+        detector.on_data(bar)
+
+    def detect(self, symbol: Optional[str] = None, timeframe: Optional[str] = None) -> str:
+        if symbol is not None:
+            detector = self._series.get((symbol, timeframe))
+            return detector.detect() if detector is not None else "unknown"
+        atr_val = self.atr.value
         if atr_val is None:
             return "unknown"
-        band = max(self.highs) - min(self.lows)
+        band = self.band_high.value - self.band_low.value
         return "trending" if band > atr_val * self.band_mult else "ranging"
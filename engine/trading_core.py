@@ -0,0 +1,280 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import Any, Callable, DefaultDict, Dict, Iterable, List, Optional, Tuple
+
+import pandas as pd
+
+from analysis.metrics import RunningMetrics, summarize
+from backtest.engine import Trade
+from core.bar_series import BarSeries
+from strategies.base import BaseStrategy
+from .brokers import Broker, Order
+from .events import BAR, FILL, TICK, Event, EventLoop
+
+Key = Tuple[str, str]
+# id(strategy), symbol, timeframe
+Slot = Tuple[int, str, str]
+SignalListener = Callable[[Event, BaseStrategy, str], None]
+
+
+@dataclass
+class Position:
+    side: str
+    qty: float
+    entry_price: float
+    entry_fee: float
+    entry_time: pd.Timestamp
+    entry_bar: int
+    strategy: str = ""
+    sl: Optional[float] = None
+    tp: Optional[float] = None
+
+
+class TradingCore:
+    """Event-driven strategy runner shared by backtests, replays and live trading.
+
+    Strategies are routed by ``(symbol, timeframe)``: bar events go to the
+    strategies registered for their key and tick events to those registered
+    with timeframe ``"tick"`` (an empty symbol matches every symbol). Each
+    strategy's signal is evaluated exactly once per event. Orders go to the
+    ``broker`` and positions change only when its ``fill`` events arrive, so
+    the same code path runs against :class:`SimulatedBroker` in a backtest
+    and :class:`LiveBroker` when trading. Without a broker the core only
+    reports signals to :meth:`on_signal` listeners.
+
+    Strategies with ``accepts_bars`` read the :class:`BarSeries` directly.
+    Others get a read-only DataFrame over the same buffer (built in
+    O(columns) per event); strategies that need a private, writable frame
+    must copy it, which makes a replay quadratic in its length again.
+
+    ``bar_capacity`` is the initial bar allocation per series; set
+    ``max_bars`` to keep only that many recent bars in long live runs.
+
+    Entries, SL/TP checks, sizing and fees follow ``BacktestEngine``, so a
+    single strategy on one series produces the same trades. Several
+    strategies share equity in event order rather than one after another.
+    """
+
+    def __init__(
+        self,
+        strategies: Iterable[BaseStrategy] = (),
+        broker: Optional[Broker] = None,
+        initial_balance: float = 10000.0,
+        loop: Optional[EventLoop] = None,
+        bar_capacity: int = 1024,
+        max_bars: Optional[int] = None,
+        keep_trades: bool = True,
+    ) -> None:
+        self.loop = loop or EventLoop()
+        self.broker = broker
+        self.initial_balance = initial_balance
+        self.bar_capacity = bar_capacity
+        self.max_bars = max_bars
+        self.keep_trades = keep_trades
+        self.bar_routes: DefaultDict[Key, List[BaseStrategy]] = defaultdict(list)
+        self.tick_routes: DefaultDict[str, List[BaseStrategy]] = defaultdict(list)
+        self.bars: Dict[Key, BarSeries] = {}
+        self.last_event: Dict[Key, Event] = {}
+        self.positions: Dict[Slot, Position] = {}
+        self._orders: Dict[int, Tuple[Slot, Optional[float], Optional[float]]] = {}
+        self._busy: set = set()
+        self.listeners: List[SignalListener] = []
+        self.trade_log: List[Trade] = []
+        self.trade_pnls: List[float] = []
+        self.equity = initial_balance
+        self.equity_curve: List[float] = [initial_balance]
+        self.metrics = RunningMetrics(initial_balance)
+        self.bars_in_market = 0
+        self.total_bars = 0
+        self.evaluations = 0
+        for strategy in strategies:
+            self.add_strategy(strategy)
+        self.loop.subscribe(BAR, self.on_bar)
+        self.loop.subscribe(TICK, self.on_tick)
+        self.loop.subscribe(FILL, self.on_fill)
+
+    # ------------------------------------------------------------------
+    def add_strategy(
+        self, strategy: BaseStrategy, symbol: Optional[str] = None, timeframe: Optional[str] = None
+    ) -> None:
+        """Route events to ``strategy``; defaults to its own symbol and timeframe."""
+        symbol = strategy.symbol if symbol is None else symbol
+        timeframe = timeframe or strategy.timeframe or TICK
+        if timeframe == TICK:
+            self.tick_routes[symbol].append(strategy)
+        else:
+            self.bar_routes[(symbol, timeframe)].append(strategy)
+
+    def add_feed(self, feed: Any) -> None:
+        self.loop.add_feed(feed)
+
+    def on_signal(self, listener: SignalListener) -> None:
+        self.listeners.append(listener)
+
+    def run(self, until: Optional[int] = None, block: bool = False, timeout: Optional[float] = None) -> int:
+        return self.loop.run(until=until, block=block, timeout=timeout)
+
+    # ------------------------------------------------------------------
+    def on_bar(self, event: Event) -> None:
+        key = (event.symbol, event.timeframe)
+        strategies = self.bar_routes.get(key)
+        if not strategies:
+            return
+        bars = self.bars.get(key)
+        if bars is None:
+            bars = self.bars[key] = BarSeries(capacity=self.bar_capacity, max_bars=self.max_bars)
+        bars.append(event.data)
+        self.last_event[key] = event
+        self.total_bars += len(strategies)
+        bar = event.data
+        frame = None
+        for strategy in strategies:
+            if strategy.accepts_bars:
+                view = bars
+            else:
+                if frame is None:
+                    # Zero-copy frame over the buffer, so the per-bar cost does not grow with history
+                    frame = bars.frame_view()
+                view = frame
+            self._step(event, strategy, view, bar["close"], bar["high"], bar["low"])
+
+    def on_tick(self, event: Event) -> None:
+        price = event.data["price"]
+        self.last_event[(event.symbol, TICK)] = event
+        strategies = self.tick_routes.get(event.symbol, [])
+        if event.symbol:
+            strategies = [*strategies, *self.tick_routes.get("", ())]
+        for strategy in strategies:
+            strategy.on_data(price)
+            self._step(event, strategy, None, price, price, price)
+
+    def _step(self, event: Event, strategy: BaseStrategy, bars: Any, close: float, high: float, low: float) -> None:
+        self.evaluations += 1
+        action, sl, tp = strategy.evaluate(bars)
+        for listener in self.listeners:
+            listener(event, strategy, action)
+        if self.broker is None:
+            return
+        timeframe = event.timeframe or TICK
+        slot = (id(strategy), event.symbol, timeframe)
+        if slot in self._busy:
+            return
+        position = self.positions.get(slot)
+        if position is None:
+            if action in ("buy", "sell"):
+                order = Order(
+                    event.ts,
+                    event.symbol,
+                    timeframe,
+                    action,
+                    close,
+                    strategy.name,
+                    notional=self.equity * strategy.risk_pct,
+                    sl=sl,
+                    tp=tp,
+                )
+                self._submit(slot, order)
+            return
+        reason = None
+        price = close
+        if position.side == "buy":
+            if position.sl is not None and low <= position.sl:
+                price, reason = position.sl, "sl"
+            elif position.tp is not None and high >= position.tp:
+                price, reason = position.tp, "tp"
+            elif action == "sell":
+                reason = "signal"
+        else:
+            if position.sl is not None and high >= position.sl:
+                price, reason = position.sl, "sl"
+            elif position.tp is not None and low <= position.tp:
+                price, reason = position.tp, "tp"
+            elif action == "buy":
+                reason = "signal"
+        if reason:
+            self._exit(slot, position, event.ts, price, reason)
+
+    def _submit(self, slot: Slot, order: Order) -> None:
+        self._busy.add(slot)
+        self._orders[id(order)] = (slot, order.sl, order.tp)
+        self.broker.submit(order, self.loop)
+
+    def _exit(self, slot: Slot, position: Position, ts: int, price: float, reason: str) -> None:
+        side = "sell" if position.side == "buy" else "buy"
+        self._submit(slot, Order(ts, slot[1], slot[2], side, price, position.strategy, qty=position.qty, reason=reason))
+
+    def _bar_index(self, symbol: str, timeframe: str) -> int:
+        bars = self.bars.get((symbol, timeframe))
+        return bars.total - 1 if bars is not None else 0
+
+    def on_fill(self, event: Event) -> None:
+        data = event.data
+        order: Order = data["order"]
+        pending = self._orders.pop(id(order), None)
+        if pending is None:
+            return
+        slot, sl, tp = pending
+        self._busy.discard(slot)
+        if data.get("rejected"):
+            return
+        if order.reason == "entry":
+            self.positions[slot] = Position(
+                side=order.side,
+                qty=data["qty"],
+                entry_price=data["price"],
+                entry_fee=data["fee"],
+                entry_time=pd.Timestamp(event.ts, unit="ms"),
+                entry_bar=self._bar_index(order.symbol, order.timeframe),
+                strategy=order.strategy,
+                sl=sl,
+                tp=tp,
+            )
+            return
+        position = self.positions.pop(slot)
+        exit_price = data["price"]
+        qty = position.qty
+        if position.side == "buy":
+            pnl = (exit_price - position.entry_price) * qty
+        else:
+            pnl = (position.entry_price - exit_price) * qty
+        fee = position.entry_fee + data["fee"]
+        pnl -= fee
+        self.equity += pnl
+        self.equity_curve.append(self.equity)
+        self.trade_pnls.append(pnl)
+        self.metrics.update(pnl)
+        self.bars_in_market += self._bar_index(order.symbol, order.timeframe) - position.entry_bar
+        if self.keep_trades:
+            self.trade_log.append(
+                Trade(
+                    strategy=order.strategy,
+                    symbol=order.symbol,
+                    timeframe=order.timeframe,
+                    side=position.side,
+                    entry_time=position.entry_time,
+                    exit_time=pd.Timestamp(event.ts, unit="ms"),
+                    entry_price=position.entry_price,
+                    exit_price=exit_price,
+                    sl=position.sl,
+                    tp=position.tp,
+                    qty=qty,
+                    pnl=pnl,
+                )
+            )
+
+    def close_positions(self) -> None:
+        """Exit every open position at the last seen price, as a backtest ends."""
+        for slot, position in list(self.positions.items()):
+            if slot in self._busy:
+                continue
+            event = self.last_event.get((slot[1], slot[2]))
+            if event is None:
+                continue
+            price = event.data["price"] if event.kind == TICK else event.data["close"]
+            self._exit(slot, position, event.ts, price, "end")
+        self.loop.run()
+
+    def summary(self) -> Dict[str, float]:
+        return summarize(self.trade_pnls, self.equity_curve, self.initial_balance, self.bars_in_market, self.total_bars)
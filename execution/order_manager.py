@@ -1,27 +1,68 @@
-from typing import Any, Dict, Optional
+import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from api.broker_api import BrokerAPI
 from utils.trade_logger import TradeLogger
 
 
+@dataclass
+class OrderIntent:
+    """Order queued for the next batch, resolved through ``future``."""
+
+    side: str
+    symbol: str
+    qty: float
+    price: Optional[float] = None
+    order_type: str = "market"
+    future: Future = field(default_factory=Future)
+
+
 class OrderManager:
-    """Send orders through BrokerAPI and log them."""
+    """Send orders through BrokerAPI and log them.
 
-    def __init__(self, broker: BrokerAPI, logger: Optional[TradeLogger] = None) -> None:
+    ``place_order`` sends one order straight away. ``submit`` queues an
+    :class:`OrderIntent` and returns a future instead; queued intents are
+    sent by ``flush`` (or after ``linger`` seconds when ``auto_flush`` is
+    on). A flush merges same-side market intents per symbol and limit
+    intents at the same price, and sends the results concurrently, so a
+    batch of rebalance orders costs about one broker round trip. Buys and
+    sells are never netted against each other. When intents were merged,
+    each caller gets the broker response with its own ``qty`` and the
+    merged order under ``"order"``.
+    ``cancel`` groups cancellations into one ``cancel_orders`` call per
+    symbol when the broker supports it. Placed orders are handed to the
+    :class:`TradeLogger`, which buffers them for its own writer thread;
+    ``close`` waits until they are committed.
+    """
+
+    def __init__(
+        self,
+        broker: BrokerAPI,
+        logger: Optional[TradeLogger] = None,
+        max_workers: int = 64,
+        linger: float = 0.005,
+        auto_flush: bool = True,
+    ) -> None:
         self.broker = broker
         self.logger = logger
         self.orders: list[Dict[str, Any]] = []
+        self.max_workers = max_workers
+        self.linger = linger
+        self.auto_flush = auto_flush
+        self._pending: List[OrderIntent] = []
+        self._cancels: Dict[str, List[Tuple[str, Future]]] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._dispatcher: Optional[threading.Thread] = None
 
-    def place_order(
-        self,
-        side: str,
-        symbol: str,
-        qty: float,
-        price: float | None = None,
-        order_type: str = "market",
-    ) -> Dict[str, Any]:
-        side = side.lower()
-        order_type = order_type.lower()
+    # ------------------------------------------------------------------
+    def _send(self, side: str, symbol: str, qty: float, price: float | None, order_type: str) -> Dict[str, Any]:
         if order_type == "market":
             order = self.broker.market_order(symbol, side, qty)
         elif order_type == "limit":
@@ -32,5 +73,148 @@ class OrderManager:
             raise ValueError("order_type must be 'market' or 'limit'")
         self.orders.append(order)
         if self.logger:
-            self.logger.log_trade(order)
+            try:
+                # Only validates and buffers the row; the logger's writer thread commits it
+                self.logger.log_trade(order)
+            except Exception as e:
+                # The order is placed either way; a bad journal row must not fail it
+                logging.error(f"Journal write failed for {symbol}: {e}")
         return order
+
+    def place_order(
+        self,
+        side: str,
+        symbol: str,
+        qty: float,
+        price: float | None = None,
+        order_type: str = "market",
+    ) -> Dict[str, Any]:
+        return self._send(side.lower(), symbol, qty, price, order_type.lower())
+
+    # ------------------------------------------------------------------
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="orders")
+        return self._executor
+
+    def _schedule(self) -> None:
+        if not self.auto_flush:
+            return
+        if self._dispatcher is None:
+            self._dispatcher = threading.Thread(target=self._dispatch, name="order-dispatch", daemon=True)
+            self._dispatcher.start()
+        self._wake.set()
+
+    def _dispatch(self) -> None:
+        while not self._closed:
+            self._wake.wait()
+            self._wake.clear()
+            if self._closed:
+                return
+            # Let intents raised together land in the same batch
+            time.sleep(self.linger)
+            self.flush()
+
+    def submit(
+        self,
+        side: str,
+        symbol: str,
+        qty: float,
+        price: float | None = None,
+        order_type: str = "market",
+    ) -> Future:
+        """Queue an order and return a future for the broker response."""
+        if self._closed:
+            raise RuntimeError("order manager is closed")
+        intent = OrderIntent(side.lower(), symbol, qty, price, order_type.lower())
+        with self._lock:
+            self._pending.append(intent)
+        self._schedule()
+        return intent.future
+
+    def cancel(self, symbol: str, order_id: str) -> Future:
+        """Queue a cancellation; sent with the next flush."""
+        future: Future = Future()
+        with self._lock:
+            self._cancels.setdefault(symbol, []).append((order_id, future))
+        self._schedule()
+        return future
+
+    @staticmethod
+    def _coalesce(intents: Iterable[OrderIntent]) -> List[Tuple[OrderIntent, List[OrderIntent]]]:
+        """Merge same-side market intents per symbol and limit intents per price level."""
+        groups: Dict[Tuple, List[OrderIntent]] = {}
+        for intent in intents:
+            if intent.order_type == "market":
+                key: Tuple = (intent.symbol, "market", intent.side)
+            else:
+                key = (intent.symbol, intent.order_type, intent.side, intent.price)
+            groups.setdefault(key, []).append(intent)
+        merged = []
+        for group in groups.values():
+            first = group[0]
+            qty = sum(i.qty for i in group)
+            merged.append((OrderIntent(first.side, first.symbol, qty, first.price, first.order_type), group))
+        return merged
+
+    def _run_intent(self, intent: OrderIntent, group: List[OrderIntent]) -> None:
+        try:
+            result = self._send(intent.side, intent.symbol, intent.qty, intent.price, intent.order_type)
+        except Exception as e:
+            logging.error(f"Order failed for {intent.symbol}: {e}")
+            for caller in group:
+                caller.future.set_exception(e)
+            return
+        if len(group) == 1:
+            group[0].future.set_result(result)
+            return
+        for caller in group:
+            # Each caller's share of the merged order
+            caller.future.set_result({**result, "qty": caller.qty, "order": result})
+
+    def _run_cancels(self, symbol: str, cancels: List[Tuple[str, Future]]) -> None:
+        ids = [order_id for order_id, _ in cancels]
+        try:
+            if hasattr(self.broker, "cancel_orders"):
+                results = [self.broker.cancel_orders(symbol, ids)] * len(ids)
+            else:
+                results = [self.broker.cancel_order(symbol, order_id) for order_id in ids]
+        except Exception as e:
+            logging.error(f"Cancel failed for {symbol}: {e}")
+            for _, future in cancels:
+                future.set_exception(e)
+            return
+        for (_, future), result in zip(cancels, results):
+            future.set_result(result)
+
+    def flush(self) -> List[Future]:
+        """Send every queued intent and cancellation; return their futures."""
+        with self._lock:
+            intents, self._pending = self._pending, []
+            cancels, self._cancels = self._cancels, {}
+        futures = [intent.future for intent in intents]
+        futures += [future for group in cancels.values() for _, future in group]
+        pool = self._pool()
+        for symbol, group in cancels.items():
+            pool.submit(self._run_cancels, symbol, group)
+        for intent, group in self._coalesce(intents):
+            pool.submit(self._run_intent, intent, group)
+        return futures
+
+    def place_orders(self, orders: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Submit ``orders`` (``place_order`` keyword dicts) as one batch and wait."""
+        futures = [self.submit(**order) for order in orders]
+        self.flush()
+        return [future.result() for future in futures]
+
+    # ------------------------------------------------------------------
+    def close(self) -> None:
+        """Send queued orders, then wait for them and their journal rows."""
+        self.flush()
+        self._closed = True
+        self._wake.set()
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        if self.logger is not None and hasattr(self.logger, "flush"):
+            self.logger.flush()
@@ -11,7 +11,7 @@ from analysis.replay_engine import ReplayEngine
 from utils.trade_logger import TradeLogger
 from data.market_data_collector import MarketDataCollector
 from utils.logger import get_logger
-from utils.telegram_notifier import send_telegram_alert
+from utils.telegram_notifier import TelegramDispatcher
 from dashboard.dashboard import metrics, start_dashboard
 import schedule
 import threading
@@ -54,7 +54,7 @@ def _extract_close(candle: object) -> float | None:
     return data["close"] if data else None
 
 
-def run_demo(use_real_api: bool = False, use_collector: bool = True) -> None:
+def run_demo(use_real_api: bool = False, use_collector: bool = True, symbol: str = "ETHUSDT") -> None:
     logger = get_logger("main")
 
     strategies = {
@@ -71,7 +71,7 @@ def run_demo(use_real_api: bool = False, use_collector: bool = True) -> None:
 
     if use_collector:
         collector = MarketDataCollector()
-        df = collector.get_ohlcv("ETHUSDT", "5m", 20)
+        df = collector.get_ohlcv(symbol, "5m", 20)
         candles = df.to_dict("records")
         logger.info("Fetched %d candles", len(df))
         logger.info("First candle: %s", candles[0] if candles else "no data")
@@ -98,20 +98,23 @@ def run_demo(use_real_api: bool = False, use_collector: bool = True) -> None:
     chat_id = os.getenv("TELEGRAM_CHAT_ID")
     notifier = None
     if token and chat_id:
-        notifier = send_telegram_alert(metrics)
-        notifier.schedule_summary()
+        notifier = TelegramDispatcher(token, chat_id)
+        schedule.every().hour.do(lambda: notifier.send(f"📊 Summary: {metrics.snapshot()}"))
 
     dashboard_thread = threading.Thread(target=start_dashboard, daemon=True)
     dashboard_thread.start()
 
-    engine = BotEngine(active_strategy, order_manager, risk_manager, metrics, notifier)
+    engine = BotEngine(active_strategy, order_manager, risk_manager, metrics, notifier, symbol=symbol)
     for price in prices:
         logger.info("Price %.2f (%s)", price, regime_detector.detect())
         engine.on_price_update(price)
         schedule.run_pending()
         time.sleep(0.1)
 
+    order_manager.close()
     trade_logger.close()
+    if notifier:
+        notifier.close()
 
 
 if __name__ == "__main__":
@@ -51,9 +51,18 @@ class RiskManager:
         lows_list = list(lows)
         closes_list = list(closes)
         atr_val = atr(highs_list, lows_list, closes_list, self.atr_period)
-        if atr_val is None or not closes_list:
+        if not closes_list:
+            return None
+        return self.levels_from_atr(closes_list[-1], atr_val)
+
+    def levels_from_atr(self, price: float, atr_val: float | None) -> Optional[Tuple[float, float]]:
+        """Stop loss and take profit around ``price`` for a known ATR reading.
+
+        Lets callers holding a :class:`utils.streaming_indicators.ATR` skip the
+        full recomputation done by :meth:`atr_levels`.
+        """
+        if atr_val is None:
             return None
-        price = closes_list[-1]
         sl = price - atr_val * self.sl_mult
         tp = price + atr_val * self.tp_mult
         return sl, tp
@@ -24,7 +24,7 @@ _sym_db = _symbol_database.Default()
 
 
 
-DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x16strategy_manager.proto\x12\x08strategy\"\x9f\x01\n\rSignalMessage\x12\x15\n\rstrategy_name\x18\x01 \x01(\t\x12\x0e\n\x06symbol\x18\x02 \x01(\t\x12\x11\n\ttimeframe\x18\x03 \x01(\t\x12\x13\n\x0bsignal_type\x18\x04 \x01(\t\x12\x12\n\nconfidence\x18\x05 \x01(\x01\x12\x13\n\x0b\x65ntry_price\x18\x06 \x01(\x01\x12\n\n\x02sl\x18\x07 \x01(\x01\x12\n\n\x02tp\x18\x08 \x01(\x01\"T\n\x0e\x45xecutionOrder\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x0c\n\x04side\x18\x02 \x01(\t\x12\x0c\n\x04size\x18\x03 \x01(\x01\x12\n\n\x02sl\x18\x04 \x01(\x01\x12\n\n\x02tp\x18\x05 \x01(\x01\"N\n\x11\x45xecutionResponse\x12(\n\x06orders\x18\x01 \x03(\x0b\x32\x18.strategy.ExecutionOrder\x12\x0f\n\x07message\x18\x02 \x01(\t2U\n\x0fStrategyManager\x12\x42\n\nSendSignal\x12\x17.strategy.SignalMessage\x1a\x1b.strategy.ExecutionResponseb\x06proto3')
+DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(b'\n\x16strategy_manager.proto\x12\x08strategy\"\x9f\x01\n\rSignalMessage\x12\x15\n\rstrategy_name\x18\x01 \x01(\t\x12\x0e\n\x06symbol\x18\x02 \x01(\t\x12\x11\n\ttimeframe\x18\x03 \x01(\t\x12\x13\n\x0bsignal_type\x18\x04 \x01(\t\x12\x12\n\nconfidence\x18\x05 \x01(\x01\x12\x13\n\x0b\x65ntry_price\x18\x06 \x01(\x01\x12\n\n\x02sl\x18\x07 \x01(\x01\x12\n\n\x02tp\x18\x08 \x01(\x01\"T\n\x0e\x45xecutionOrder\x12\x0e\n\x06symbol\x18\x01 \x01(\t\x12\x0c\n\x04side\x18\x02 \x01(\t\x12\x0c\n\x04size\x18\x03 \x01(\x01\x12\n\n\x02sl\x18\x04 \x01(\x01\x12\n\n\x02tp\x18\x05 \x01(\x01\"N\n\x11\x45xecutionResponse\x12(\n\x06orders\x18\x01 \x03(\x0b\x32\x18.strategy.ExecutionOrder\x12\x0f\n\x07message\x18\x02 \x01(\t\"7\n\x0bSignalBatch\x12(\n\x07signals\x18\x01 \x03(\x0b\x32\x17.strategy.SignalMessage\"?\n\rBatchResponse\x12.\n\tresponses\x18\x01 \x03(\x0b\x32\x1b.strategy.ExecutionResponse2\xdf\x01\n\x0fStrategyManager\x12\x42\n\nSendSignal\x12\x17.strategy.SignalMessage\x1a\x1b.strategy.ExecutionResponse\x12=\n\x0bSendSignals\x12\x15.strategy.SignalBatch\x1a\x17.strategy.BatchResponse\x12I\n\rStreamSignals\x12\x17.strategy.SignalMessage\x1a\x1b.strategy.ExecutionResponse(\x01\x30\x01\x62\x06proto3')
 
 _globals = globals()
 _builder.BuildMessageAndEnumDescriptors(DESCRIPTOR, _globals)
@@ -37,6 +37,10 @@ if not _descriptor._USE_C_DESCRIPTORS:
   _globals['_EXECUTIONORDER']._serialized_end=282
   _globals['_EXECUTIONRESPONSE']._serialized_start=284
   _globals['_EXECUTIONRESPONSE']._serialized_end=362
-  _globals['_STRATEGYMANAGER']._serialized_start=364
-  _globals['_STRATEGYMANAGER']._serialized_end=449
+  _globals['_SIGNALBATCH']._serialized_start=364
+  _globals['_SIGNALBATCH']._serialized_end=419
+  _globals['_BATCHRESPONSE']._serialized_start=421
+  _globals['_BATCHRESPONSE']._serialized_end=484
+  _globals['_STRATEGYMANAGER']._serialized_start=487
+  _globals['_STRATEGYMANAGER']._serialized_end=710
 # @@protoc_insertion_point(module_scope)
@@ -39,6 +39,16 @@ class StrategyManagerStub(object):
                 request_serializer=strategy__manager__pb2.SignalMessage.SerializeToString,
                 response_deserializer=strategy__manager__pb2.ExecutionResponse.FromString,
                 _registered_method=True)
+        self.SendSignals = channel.unary_unary(
+                '/strategy.StrategyManager/SendSignals',
+                request_serializer=strategy__manager__pb2.SignalBatch.SerializeToString,
+                response_deserializer=strategy__manager__pb2.BatchResponse.FromString,
+                _registered_method=True)
+        self.StreamSignals = channel.stream_stream(
+                '/strategy.StrategyManager/StreamSignals',
+                request_serializer=strategy__manager__pb2.SignalMessage.SerializeToString,
+                response_deserializer=strategy__manager__pb2.ExecutionResponse.FromString,
+                _registered_method=True)
 
 
 class StrategyManagerServicer(object):
@@ -50,6 +60,18 @@ class StrategyManagerServicer(object):
         context.set_details('Method not implemented!')
         raise NotImplementedError('Method not implemented!')
 
+    def SendSignals(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
+    def StreamSignals(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details('Method not implemented!')
+        raise NotImplementedError('Method not implemented!')
+
 
 def add_StrategyManagerServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -58,6 +80,16 @@ def add_StrategyManagerServicer_to_server(servicer, server):
                     request_deserializer=strategy__manager__pb2.SignalMessage.FromString,
                     response_serializer=strategy__manager__pb2.ExecutionResponse.SerializeToString,
             ),
+            'SendSignals': grpc.unary_unary_rpc_method_handler(
+                    servicer.SendSignals,
+                    request_deserializer=strategy__manager__pb2.SignalBatch.FromString,
+                    response_serializer=strategy__manager__pb2.BatchResponse.SerializeToString,
+            ),
+            'StreamSignals': grpc.stream_stream_rpc_method_handler(
+                    servicer.StreamSignals,
+                    request_deserializer=strategy__manager__pb2.SignalMessage.FromString,
+                    response_serializer=strategy__manager__pb2.ExecutionResponse.SerializeToString,
+            ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
             'strategy.StrategyManager', rpc_method_handlers)
@@ -95,3 +127,57 @@ class StrategyManager(object):
             timeout,
             metadata,
             _registered_method=True)
+
+    @staticmethod
+    def SendSignals(request,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            '/strategy.StrategyManager/SendSignals',
+            strategy__manager__pb2.SignalBatch.SerializeToString,
+            strategy__manager__pb2.BatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
+
+    @staticmethod
+    def StreamSignals(request_iterator,
+            target,
+            options=(),
+            channel_credentials=None,
+            call_credentials=None,
+            insecure=False,
+            compression=None,
+            wait_for_ready=None,
+            timeout=None,
+            metadata=None):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            '/strategy.StrategyManager/StreamSignals',
+            strategy__manager__pb2.SignalMessage.SerializeToString,
+            strategy__manager__pb2.ExecutionResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True)
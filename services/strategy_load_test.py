@@ -0,0 +1,130 @@
+"""Load-test the StrategyManager gRPC service.
+
+Sends signals from ``--clients`` concurrent callers using one of the three
+RPC shapes and reports signals per second and latency percentiles. Without
+``--target`` a local server with a silent execution router is started in
+process, writing its files to a temporary directory.
+
+Run with ``python -m services.strategy_load_test --mode stream --signals 20000``.
+"""
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Dict, List
+
+import grpc
+
+from services.grpc import strategy_manager_pb2, strategy_manager_pb2_grpc
+from services.strategy_manager_server import StrategyManager, create_server
+from utils.latency import LatencyHistogram
+
+MODES = ("unary", "batch", "stream")
+
+
+class _SilentRouter:
+    def execute(self, order: Dict) -> None:
+        pass
+
+
+def _signals(count: int, symbols: int = 50, strategies: int = 10) -> List[strategy_manager_pb2.SignalMessage]:
+    rng = random.Random(7)
+    return [
+        strategy_manager_pb2.SignalMessage(
+            strategy_name=f"strategy_{rng.randrange(strategies)}",
+            symbol=f"SYM{rng.randrange(symbols)}USDT",
+            timeframe=rng.choice(("1m", "5m", "15m")),
+            signal_type=rng.choice(("buy", "sell")),
+            confidence=rng.random(),
+            entry_price=100.0,
+            sl=99.0,
+            tp=102.0,
+        )
+        for _ in range(count)
+    ]
+
+
+async def _client(
+    stub: strategy_manager_pb2_grpc.StrategyManagerStub,
+    signals: List[strategy_manager_pb2.SignalMessage],
+    mode: str,
+    batch: int,
+    latency: LatencyHistogram,
+) -> None:
+    if mode == "unary":
+        for signal in signals:
+            start = time.perf_counter()
+            await stub.SendSignal(signal)
+            latency.record(time.perf_counter() - start)
+    elif mode == "batch":
+        for i in range(0, len(signals), batch):
+            start = time.perf_counter()
+            await stub.SendSignals(strategy_manager_pb2.SignalBatch(signals=signals[i : i + batch]))
+            latency.record(time.perf_counter() - start)
+    else:
+        call = stub.StreamSignals()
+        for signal in signals:
+            start = time.perf_counter()
+            await call.write(signal)
+            await call.read()
+            latency.record(time.perf_counter() - start)
+        await call.done_writing()
+
+
+async def run(
+    target: str | None = None,
+    mode: str = "stream",
+    signals: int = 10_000,
+    clients: int = 8,
+    batch: int = 100,
+) -> Dict[str, float]:
+    """Drive the service and return throughput and latency figures."""
+    server = manager = tmp = None
+    if target is None:
+        tmp = tempfile.TemporaryDirectory()
+        manager = StrategyManager(
+            scores_file=str(Path(tmp.name) / "scores.json"),
+            log_file=str(Path(tmp.name) / "log.csv"),
+            execution_router=_SilentRouter(),
+        )
+        server, port = await create_server(manager, "127.0.0.1:0")
+        target = f"127.0.0.1:{port}"
+    payload = _signals(signals)
+    shares = [payload[i::clients] for i in range(clients)]
+    latency = LatencyHistogram()
+    try:
+        async with grpc.aio.insecure_channel(target) as channel:
+            stub = strategy_manager_pb2_grpc.StrategyManagerStub(channel)
+            start = time.perf_counter()
+            await asyncio.gather(*(_client(stub, share, mode, batch, latency) for share in shares))
+            elapsed = time.perf_counter() - start
+    finally:
+        if server is not None:
+            await server.stop(grace=None)
+            await manager.close()
+            tmp.cleanup()
+    stats = latency.snapshot()
+    return {"signals_per_s": signals / elapsed, "p50_ms": stats["p50"] * 1e3, "p99_ms": stats["p99"] * 1e3}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--target", help="host:port of a running server; default starts one locally")
+    parser.add_argument("--mode", choices=MODES, default=None, help="RPC shape; default runs all three")
+    parser.add_argument("--signals", type=int, default=10_000)
+    parser.add_argument("--clients", type=int, default=8)
+    parser.add_argument("--batch", type=int, default=100, help="signals per SendSignals call")
+    args = parser.parse_args()
+    for mode in [args.mode] if args.mode else MODES:
+        result = asyncio.run(run(args.target, mode, args.signals, args.clients, args.batch))
+        print(
+            f"{mode:>6}: {result['signals_per_s']:>9,.0f} signals/s  "
+            f"p50 {result['p50_ms']:.2f} ms  p99 {result['p99_ms']:.2f} ms (per call)"
+        )
+
+
+if __name__ == "__main__":
+    main()
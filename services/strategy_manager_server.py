@@ -1,9 +1,10 @@
-import json
+import asyncio
 import csv
-from concurrent import futures
-import grpc
+import logging
 from datetime import datetime
-from typing import Dict, Any
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import grpc
 
 from services.grpc import strategy_manager_pb2, strategy_manager_pb2_grpc
 from engine.score_manager import ScoreManager
@@ -20,13 +21,34 @@ class ExecutionRouter:
 
 
 class StrategyManager(strategy_manager_pb2_grpc.StrategyManagerServicer):
-    def __init__(self, capital: float = 1.0, scores_file: str = "strategy_scores.json", log_file: str = "execution_log.csv") -> None:
+    """Score incoming signals and turn them into execution orders.
+
+    Signals arrive through ``SendSignal``, the ``SendSignals`` batch RPC or
+    the ``StreamSignals`` bidirectional stream. All three hand their
+    signals to one actor task, which is the only code that touches the
+    scores, ``active_symbols`` and ``daily_loss``, so decisions never race.
+    Persistence is debounced: score updates and CSV rows are written at
+    most once per ``flush_interval`` seconds, from a worker thread, using
+    a snapshot taken on the actor's loop. Call ``start`` before serving
+    and ``close`` on shutdown to write what is left and compact the
+    scores file.
+    """
+
+    def __init__(
+        self,
+        capital: float = 1.0,
+        scores_file: str = "strategy_scores.json",
+        log_file: str = "execution_log.csv",
+        flush_interval: float = 1.0,
+        execution_router: Optional[ExecutionRouter] = None,
+    ) -> None:
         self.capital = capital
         self.scores_file = scores_file
         self.log_file = log_file
+        self.flush_interval = flush_interval
         self.score_manager = ScoreManager()
         self.score_store = StrategyScoreStore(scores_file)
-        self.execution_router = ExecutionRouter()
+        self.execution_router = execution_router or ExecutionRouter()
         self.risk_manager = RiskManager()
         self.risk_profiles = {
             "default": {"max_risk": 0.02, "preferred_timeframes": ["1m", "5m"]},
@@ -34,7 +56,15 @@ class StrategyManager(strategy_manager_pb2_grpc.StrategyManagerServicer):
         self.active_symbols: Dict[str, str] = {}
         self.daily_loss = 0.0
         self._load_scores()
+        self._log_file = None
         self._log_writer = None
+        self._log_rows: List[List[Any]] = []
+        self._dirty = False
+        self._inbox: Optional[asyncio.Queue] = None
+        self._actor: Optional[asyncio.Task] = None
+        self._persister: Optional[asyncio.Task] = None
+        self._changed: Optional[asyncio.Event] = None
+        self._write_lock: Optional[asyncio.Lock] = None
 
     # ------------------------------------------------------------------
     @staticmethod
@@ -69,11 +99,6 @@ class StrategyManager(strategy_manager_pb2_grpc.StrategyManagerServicer):
         for name, profile in self.score_store.scores.items():
             self.score_manager.scores[name] = profile.get("avg_return", 0.0)
 
-    def _save_scores(self) -> None:
-        for name, value in self.score_manager.get_all().items():
-            self.score_store.update_score(name, value)
-        self.score_store.save()
-
     def _get_log_writer(self) -> csv.writer:
         if self._log_writer is None:
             header = ["timestamp", "strategy", "symbol", "side", "size", "sl", "tp"]
@@ -82,16 +107,46 @@ class StrategyManager(strategy_manager_pb2_grpc.StrategyManagerServicer):
                 need_header = not open(self.log_file).readline()
             except Exception:
                 need_header = True
-            f = open(self.log_file, "a", newline="")
-            self._log_writer = csv.writer(f)
+            self._log_file = open(self.log_file, "a", newline="")
+            self._log_writer = csv.writer(self._log_file)
             if need_header:
                 self._log_writer.writerow(header)
         return self._log_writer
 
+    def _write(self, snapshot: Optional[Tuple[List[Any], Optional[str]]], rows: List[List[Any]]) -> None:
+        """Runs on a worker thread; touches only the files, never live state."""
+        if rows:
+            self._get_log_writer().writerows(rows)
+            self._log_file.flush()
+        if snapshot is not None:
+            self.score_store.write(snapshot)
+
+    async def persist(self) -> None:
+        """Write the scores and pending log rows now."""
+        async with self._write_lock:
+            # Snapshot on the loop, between actor steps, so it is consistent
+            snapshot = self.score_store.snapshot() if self._dirty else None
+            rows, self._log_rows = self._log_rows, []
+            self._dirty = False
+            if snapshot is None and not rows:
+                return
+            await asyncio.to_thread(self._write, snapshot, rows)
+
+    async def _persist_loop(self) -> None:
+        while True:
+            await self._changed.wait()
+            # Debounce: let a burst of signals land in one write
+            await asyncio.sleep(self.flush_interval)
+            self._changed.clear()
+            try:
+                await self.persist()
+            except Exception as e:
+                logging.error(f"Persisting strategy scores failed: {e}")
+
     # ------------------------------------------------------------------
-    def SendSignal(self, request: strategy_manager_pb2.SignalMessage, context: grpc.ServicerContext) -> strategy_manager_pb2.ExecutionResponse:
+    def _decide(self, request: strategy_manager_pb2.SignalMessage) -> strategy_manager_pb2.ExecutionResponse:
         sig = self._pb_to_signal(request)
-        print(
+        logging.debug(
             f"Received {sig.strategy_name} signal {sig.action} ({sig.confidence:.2f}) for {sig.symbol}"
         )
         name = sig.strategy_name
@@ -129,8 +184,7 @@ class StrategyManager(strategy_manager_pb2_grpc.StrategyManagerServicer):
         self.execution_router.execute(order)
         self.daily_loss += -reward if reward < 0 else 0.0
 
-        writer = self._get_log_writer()
-        writer.writerow([
+        self._log_rows.append([
             datetime.utcnow().isoformat(),
             name,
             sig.symbol,
@@ -140,18 +194,107 @@ class StrategyManager(strategy_manager_pb2_grpc.StrategyManagerServicer):
             sig.tp,
         ])
         self.score_store.update_score(name, reward)
-        self._save_scores()
+        self._dirty = True
+        self._changed.set()
         exec_order = strategy_manager_pb2.ExecutionOrder(**order)
         return strategy_manager_pb2.ExecutionResponse(orders=[exec_order], message="ok")
 
+    async def _run_actor(self) -> None:
+        while True:
+            item = await self._inbox.get()
+            if item is None:
+                return
+            requests, future = item
+            if future.cancelled():
+                continue
+            try:
+                future.set_result([self._decide(request) for request in requests])
+            except Exception as e:
+                logging.error(f"Signal handling failed: {e}")
+                future.set_exception(e)
 
-def serve(port: int = 50051) -> None:
-    server = grpc.server(futures.ThreadPoolExecutor(max_workers=10))
-    strategy_manager_pb2_grpc.add_StrategyManagerServicer_to_server(StrategyManager(), server)
-    server.add_insecure_port(f"[::]:{port}")
-    server.start()
+    async def start(self) -> None:
+        """Start the actor and persistence tasks on the running loop."""
+        if self._actor is not None:
+            return
+        self._inbox = asyncio.Queue()
+        self._changed = asyncio.Event()
+        self._write_lock = asyncio.Lock()
+        self._actor = asyncio.create_task(self._run_actor())
+        self._persister = asyncio.create_task(self._persist_loop())
+
+    async def decide(
+        self, requests: List[strategy_manager_pb2.SignalMessage]
+    ) -> List[strategy_manager_pb2.ExecutionResponse]:
+        """Queue ``requests`` on the actor and wait for their responses."""
+        if self._actor is None:
+            await self.start()
+        future = asyncio.get_running_loop().create_future()
+        self._inbox.put_nowait((requests, future))
+        return await future
+
+    async def close(self) -> None:
+        """Stop the actor, then write the final scores and log rows."""
+        if self._actor is None:
+            return
+        self._inbox.put_nowait(None)
+        await self._actor
+        self._persister.cancel()
+        try:
+            await self._persister
+        except asyncio.CancelledError:
+            pass
+        await self.persist()
+        await asyncio.to_thread(self.score_store.compact)
+        if self._log_file is not None:
+            self._log_file.close()
+            self._log_file = self._log_writer = None
+        self._actor = self._persister = None
+
+    # ------------------------------------------------------------------
+    async def SendSignal(
+        self, request: strategy_manager_pb2.SignalMessage, context: grpc.aio.ServicerContext
+    ) -> strategy_manager_pb2.ExecutionResponse:
+        return (await self.decide([request]))[0]
+
+    async def SendSignals(
+        self, request: strategy_manager_pb2.SignalBatch, context: grpc.aio.ServicerContext
+    ) -> strategy_manager_pb2.BatchResponse:
+        responses = await self.decide(list(request.signals))
+        return strategy_manager_pb2.BatchResponse(responses=responses)
+
+    async def StreamSignals(
+        self,
+        request_iterator: AsyncIterator[strategy_manager_pb2.SignalMessage],
+        context: grpc.aio.ServicerContext,
+    ) -> AsyncIterator[strategy_manager_pb2.ExecutionResponse]:
+        async for request in request_iterator:
+            yield (await self.decide([request]))[0]
+
+
+async def create_server(manager: StrategyManager, address: str = "[::]:50051") -> tuple[grpc.aio.Server, int]:
+    """Build a started ``grpc.aio`` server for ``manager``; returns it and its port."""
+    await manager.start()
+    server = grpc.aio.server()
+    strategy_manager_pb2_grpc.add_StrategyManagerServicer_to_server(manager, server)
+    port = server.add_insecure_port(address)
+    await server.start()
+    return server, port
+
+
+async def _serve(port: int) -> None:
+    manager = StrategyManager()
+    server, _ = await create_server(manager, f"[::]:{port}")
     print(f"StrategyManager gRPC server running on port {port}")
-    server.wait_for_termination()
+    try:
+        await server.wait_for_termination()
+    finally:
+        await server.stop(grace=1.0)
+        await manager.close()
+
+
+def serve(port: int = 50051) -> None:
+    asyncio.run(_serve(port))
 
 
 if __name__ == "__main__":
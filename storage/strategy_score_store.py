@@ -1,53 +1,239 @@
+import atexit
 import json
+import logging
+import os
+import threading
+import time
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional, Tuple
+
+# One appended log line: (seq, strategy_name, result, last_updated)
+Record = Tuple[int, str, float, str]
+
+
+class OutcomeWindow:
+    """Fixed-size ring of the most recent outcomes with running totals."""
+
+    __slots__ = ("values", "start", "count", "total", "wins")
+
+    def __init__(self, size: int) -> None:
+        self.values: List[float] = [0.0] * size
+        self.start = 0
+        self.count = 0
+        self.total = 0.0
+        self.wins = 0
+
+    def push(self, value: float) -> None:
+        size = len(self.values)
+        if self.count < size:
+            self.values[(self.start + self.count) % size] = value
+            self.count += 1
+        else:
+            old = self.values[self.start]
+            self.total -= old
+            self.wins -= old > 0
+            self.values[self.start] = value
+            self.start = (self.start + 1) % size
+            if self.start == 0:
+                # Re-add once per lap so float error in the running sum cannot build up
+                self.total = sum(self.values) - value
+        self.total += value
+        self.wins += value > 0
+
+    def outcomes(self) -> List[float]:
+        size = len(self.values)
+        return [self.values[(self.start + i) % size] for i in range(self.count)]
+
+    @property
+    def hit_rate(self) -> float:
+        return self.wins / self.count if self.count else 0.0
+
+    @property
+    def average(self) -> float:
+        return self.total / self.count if self.count else 0.0
 
 
 class StrategyScoreStore:
-    """Persist strategy performance statistics to JSON."""
+    """Persist strategy performance statistics to JSON.
+
+    Each key keeps its last ``window`` outcomes in an :class:`OutcomeWindow`,
+    so ``update_score`` is O(1). Updates are appended to ``<path>.log``. Every
+    ``compact_every`` records the full state is written to ``path`` through a
+    temporary file and an atomic rename, and the log is emptied. A crash
+    therefore leaves either the old or the new snapshot, and loading replays
+    the log on top of it. Each profile stores the ``seq`` of its last applied
+    record, so records already in the snapshot are never counted twice.
+    ``save`` writes at most once per ``save_interval`` seconds however often
+    it is called, and ``close`` (also run at exit) writes what is left.
+    """
 
-    def __init__(self, path: str = "strategy_scores.json") -> None:
+    def __init__(
+        self,
+        path: str = "strategy_scores.json",
+        window: int = 100,
+        save_interval: float = 1.0,
+        compact_every: int = 10_000,
+    ) -> None:
         self.path = Path(path)
-        self.scores: Dict[str, Dict[str, Any]] = {}
+        self.log_path = self.path.with_name(self.path.name + ".log")
+        self.window = window
+        self.save_interval = save_interval
+        self.compact_every = compact_every
+        self._windows: Dict[str, OutcomeWindow] = {}
+        self._meta: Dict[str, Dict[str, Any]] = {}
+        self._pending: List[Record] = []
+        self._seq = 0
+        self._logged = 0
+        self._last_save = 0.0
+        self._lock = threading.Lock()
+        self._io_lock = threading.RLock()
         self.load()
+        atexit.register(self.close)
 
     # ------------------------------------------------------------------
-    def load(self) -> None:
-        try:
-            with open(self.path, "r") as f:
-                self.scores = json.load(f)
-        except FileNotFoundError:
-            self.scores = {}
+    def _apply(self, seq: int, name: str, result: float, updated: str) -> None:
+        window = self._windows.get(name)
+        if window is None:
+            window = self._windows[name] = OutcomeWindow(self.window)
+            self._meta[name] = {"seq": 0, "last_updated": ""}
+        window.push(result)
+        meta = self._meta[name]
+        meta["seq"] = seq
+        meta["last_updated"] = updated
 
-    def save(self) -> None:
-        with open(self.path, "w") as f:
-            json.dump(self.scores, f)
+    def load(self) -> None:
+        with self._lock:
+            self._windows, self._meta, self._pending = {}, {}, []
+            try:
+                with open(self.path, "r") as f:
+                    snapshot = json.load(f)
+            except FileNotFoundError:
+                snapshot = {}
+            for name, profile in snapshot.items():
+                if not isinstance(profile, dict):
+                    # Older files stored a bare score per strategy
+                    profile = {"recent_outcomes": [float(profile)]}
+                window = self._windows[name] = OutcomeWindow(self.window)
+                for result in profile.get("recent_outcomes", [])[-self.window :]:
+                    window.push(result)
+                self._meta[name] = {"seq": profile.get("seq", 0), "last_updated": profile.get("last_updated", "")}
+            self._seq = max((meta["seq"] for meta in self._meta.values()), default=0)
+            self._logged = 0
+            try:
+                with open(self.log_path, "rb") as f:
+                    lines = f.readlines()
+            except FileNotFoundError:
+                lines = []
+            good = 0
+            for number, line in enumerate(lines):
+                try:
+                    seq, name, result, updated = json.loads(line)
+                except ValueError:
+                    # Only the last line can be torn by a crash mid-append; cut
+                    # it off so the next append starts on a fresh line
+                    if number != len(lines) - 1:
+                        raise
+                    logging.warning(f"Dropping truncated record at the end of {self.log_path}")
+                    with open(self.log_path, "r+b") as f:
+                        f.truncate(good)
+                    break
+                good += len(line)
+                if not line.endswith(b"\n"):
+                    with open(self.log_path, "ab") as f:
+                        f.write(b"\n")
+                self._logged += 1
+                self._seq = max(self._seq, seq)
+                if seq > self._meta.get(name, {}).get("seq", 0):
+                    self._apply(seq, name, result, updated)
 
     # ------------------------------------------------------------------
+    def _profile(self, name: str) -> Dict[str, Any]:
+        window = self._windows[name]
+        meta = self._meta[name]
+        return {
+            "strategy_name": name,
+            "hit_rate": window.hit_rate,
+            "avg_return": window.average,
+            "recent_outcomes": window.outcomes(),
+            "last_updated": meta["last_updated"],
+            "seq": meta["seq"],
+        }
+
+    @property
+    def scores(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            return {name: self._profile(name) for name in self._windows}
+
     def get_score(self, strategy_name: str) -> Dict[str, Any] | None:
-        return self.scores.get(strategy_name)
+        with self._lock:
+            return self._profile(strategy_name) if strategy_name in self._windows else None
 
     def update_score(self, strategy_name: str, result: float) -> Dict[str, Any]:
-        profile = self.scores.get(
-            strategy_name,
-            {
-                "strategy_name": strategy_name,
-                "hit_rate": 0.0,
-                "avg_return": 0.0,
-                "recent_outcomes": [],
-                "last_updated": "",
-            },
-        )
-        outcomes = profile["recent_outcomes"]
-        outcomes.append(result)
-        if len(outcomes) > 100:
-            outcomes.pop(0)
-        wins = sum(1 for r in outcomes if r > 0)
-        profile["hit_rate"] = wins / len(outcomes)
-        profile["avg_return"] = sum(outcomes) / len(outcomes)
-        profile["recent_outcomes"] = outcomes
-        profile["last_updated"] = datetime.utcnow().isoformat()
-        self.scores[strategy_name] = profile
-        return profile
+        """Record ``result`` and return the key's summary (without the outcome list)."""
+        updated = datetime.utcnow().isoformat()
+        with self._lock:
+            self._seq += 1
+            self._apply(self._seq, strategy_name, float(result), updated)
+            self._pending.append((self._seq, strategy_name, float(result), updated))
+            window = self._windows[strategy_name]
+        return {
+            "strategy_name": strategy_name,
+            "hit_rate": window.hit_rate,
+            "avg_return": window.average,
+            "last_updated": updated,
+        }
+
+    # ------------------------------------------------------------------
+    def snapshot(self) -> Tuple[List[Record], Optional[str]]:
+        """Take the pending records, plus the full state when a compaction is due.
+
+        Hand the result to ``write``, possibly from another thread. Snapshots
+        must be written in the order they were taken.
+        """
+        with self._lock:
+            records, self._pending = self._pending, []
+            self._logged += len(records)
+            state = None
+            if self._logged >= self.compact_every:
+                state = json.dumps({name: self._profile(name) for name in self._windows})
+                self._logged = 0
+        return records, state
+
+    def write(self, snapshot: Tuple[List[Record], Optional[str]]) -> None:
+        records, state = snapshot
+        with self._io_lock:
+            if records:
+                with open(self.log_path, "a") as f:
+                    f.write("".join(json.dumps(record) + "\n" for record in records))
+                    f.flush()
+                    os.fsync(f.fileno())
+            if state is not None:
+                tmp = self.path.with_name(self.path.name + ".tmp")
+                with open(tmp, "w") as f:
+                    f.write(state)
+                    f.flush()
+                    os.fsync(f.fileno())
+                os.replace(tmp, self.path)
+                # Records in the log are now covered by the snapshot's seqs
+                open(self.log_path, "w").close()
+
+    def save(self, force: bool = False) -> None:
+        """Append pending updates to the log, at most once per ``save_interval``."""
+        now = time.monotonic()
+        if not force and now - self._last_save < self.save_interval:
+            return
+        self._last_save = now
+        with self._io_lock:
+            self.write(self.snapshot())
+
+    def compact(self) -> None:
+        """Write a full snapshot now and empty the log."""
+        with self._io_lock:
+            with self._lock:
+                self._logged = self.compact_every
+            self.write(self.snapshot())
 
+    def close(self) -> None:
+        self.save(force=True)
+        atexit.unregister(self.close)
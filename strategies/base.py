@@ -1,13 +1,30 @@
 from __future__ import annotations
 
-from typing import Optional
+from typing import Callable, Iterable, Optional, Tuple, Union
+from core.bar_series import BarSeries
 from core.signal import Signal
 import time
 
+import numpy as np
+import pandas as pd
+
+# Action codes used by the vectorized ``generate_signals`` protocol
+HOLD = 0
+BUY = 1
+SELL = -1
+ACTION_CODES = {"hold": HOLD, "buy": BUY, "sell": SELL}
+
+Bars = Union[pd.DataFrame, BarSeries]
+
 
 class BaseStrategy:
     """Base class for trading strategies."""
 
+    # Set by strategies whose signal methods accept a BarSeries as well as a DataFrame
+    accepts_bars = False
+    # Optional IndicatorCache shared by strategies run over the same bars
+    indicator_cache = None
+
     def __init__(self, name: str = "Base", symbol: str = "", timeframe: str = "", risk_pct: float = 0.01) -> None:
         self.name = name
         self.symbol = symbol
@@ -33,6 +50,30 @@ class BaseStrategy:
             strategy_name=self.name,
         )
 
+    @staticmethod
+    def _empty_signals(length: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return all-hold ``(actions, sl, tp)`` arrays of ``length`` bars."""
+        return (
+            np.full(length, HOLD, dtype=np.int8),
+            np.full(length, np.nan),
+            np.full(length, np.nan),
+        )
+
+    @staticmethod
+    def _has_columns(df: Bars, columns: Iterable[str]) -> bool:
+        return isinstance(df, (pd.DataFrame, BarSeries)) and set(columns).issubset(df.columns)
+
+    @staticmethod
+    def _column(df: Bars, name: str) -> np.ndarray:
+        """Return column ``name`` as float64; a zero-copy view where possible."""
+        return np.asarray(df[name], dtype=np.float64)
+
+    def _indicator(self, df: Bars, key: Tuple, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        """Return ``compute()``, memoized in :attr:`indicator_cache` when set."""
+        if self.indicator_cache is None:
+            return compute()
+        return self.indicator_cache.get((len(df),) + key, compute)
+
     def on_data(self, price: float) -> None:
         """Receive new price data."""
         raise NotImplementedError
@@ -41,6 +82,27 @@ class BaseStrategy:
         """Return :class:`Signal` or string based on latest data."""
         raise NotImplementedError
 
+    def generate_signals(self, df) -> Optional[Tuple[np.ndarray, np.ndarray, np.ndarray]]:
+        """Return per-bar ``(actions, sl, tp)`` arrays for the whole of ``df``.
+
+        Entry ``i`` must equal what :meth:`generate_signal` returns for
+        ``df.iloc[: i + 1]``. ``actions`` holds :data:`BUY`, :data:`SELL` or
+        :data:`HOLD` codes and ``sl``/``tp`` are ``NaN`` where no level is set.
+        Strategies without a vectorized implementation return ``None``.
+        """
+        return None
+
+    def evaluate(self, df=None) -> Tuple[str, Optional[float], Optional[float]]:
+        """Call :meth:`generate_signal` once and return ``(action, sl, tp)``.
+
+        Lets callers branch on buy and sell without evaluating the strategy
+        twice, as calling :meth:`should_buy` then :meth:`should_sell` does.
+        """
+        sig = self.generate_signal() if df is None else self.generate_signal(df)
+        if isinstance(sig, Signal):
+            return sig.action, sig.sl, sig.tp
+        return sig if sig in ACTION_CODES else "hold", None, None
+
     def should_buy(self) -> bool:
         """Return True if a buy signal is generated."""
         sig = self.generate_signal()
@@ -1,14 +1,17 @@
 from collections import deque
 from typing import Deque
 
-import pandas as pd
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
 
-from .base import BaseStrategy, Signal
+from .base import BaseStrategy, Bars, Signal, BUY, SELL
 
 
 class BreakoutBot(BaseStrategy):
     """Channel breakout strategy."""
 
+    accepts_bars = True
+
     def __init__(self, symbol: str, timeframe: str = "1h", risk_pct: float = 0.02, window: int = 20, vol_mult: float = 1.5) -> None:
         super().__init__("BreakoutBot", symbol, timeframe, risk_pct)
         self.window = window
@@ -24,20 +27,16 @@ class BreakoutBot(BaseStrategy):
         self.volumes.append(candle["volume"])
         self.close = candle["close"]
 
-    def generate_signal(self, df: pd.DataFrame) -> Signal:
+    def generate_signal(self, df: Bars) -> Signal:
         try:
-            if not isinstance(df, pd.DataFrame) or df.empty:
-                return self._signal("hold")
-            required = {"high", "low", "close", "volume"}
-            if not required.issubset(df.columns):
+            if not self._has_columns(df, ("high", "low", "close", "volume")) or df.empty:
                 return self._signal("hold")
-            for _, candle in df.tail(1).iterrows():
-                self.on_data({
-                    "high": float(candle["high"]),
-                    "low": float(candle["low"]),
-                    "volume": float(candle["volume"]),
-                    "close": float(candle["close"]),
-                })
+            self.on_data({
+                "high": float(self._column(df, "high")[-1]),
+                "low": float(self._column(df, "low")[-1]),
+                "volume": float(self._column(df, "volume")[-1]),
+                "close": float(self._column(df, "close")[-1]),
+            })
             if len(self.highs) < self.window:
                 return self._signal("hold")
             avg_vol = sum(self.volumes) / len(self.volumes)
@@ -53,3 +52,37 @@ class BreakoutBot(BaseStrategy):
         except Exception as e:
             print(f"Strategy {self.name} failed: {e}")
         return self._signal("hold")
+
+    def generate_signals(self, df: Bars) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Vectorized signals assuming the candle buffers start empty."""
+        actions, sl, tp = self._empty_signals(len(df))
+        if not self._has_columns(df, ("high", "low", "close", "volume")) or df.empty:
+            return actions, sl, tp
+        highs = self._column(df, "high")
+        lows = self._column(df, "low")
+        closes = self._column(df, "close")
+        volumes = self._column(df, "volume")
+        for i in range(max(0, len(df) - self.window), len(df)):
+            self.on_data({
+                "high": float(highs[i]),
+                "low": float(lows[i]),
+                "volume": float(volumes[i]),
+                "close": float(closes[i]),
+            })
+        n, w = len(df), self.window
+        if w < 2 or n < w:
+            return actions, sl, tp
+        # Left-to-right window sums so the average matches sum(deque) exactly
+        total = volumes[: n - w + 1].copy()
+        for k in range(1, w):
+            total += volumes[k : n - w + 1 + k]
+        avg_vol = total / w
+        prev_high = sliding_window_view(highs, w - 1).max(axis=1)[: n - w + 1]
+        prev_low = sliding_window_view(lows, w - 1).min(axis=1)[: n - w + 1]
+        close = closes[w - 1 :]
+        surge = volumes[w - 1 :] > avg_vol * self.vol_mult
+        buy = (close > prev_high) & surge
+        sell = ~buy & (close < prev_low) & surge
+        actions[w - 1 :][buy] = BUY
+        actions[w - 1 :][sell] = SELL
+        return actions, sl, tp
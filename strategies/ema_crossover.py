@@ -1,8 +1,5 @@
-from collections import deque
-from typing import Deque
-
 from .base import BaseStrategy, Signal
-from utils.indicators import ema
+from utils.streaming_indicators import EMA
 
 
 class EMACrossoverStrategy(BaseStrategy):
@@ -12,16 +9,17 @@ class EMACrossoverStrategy(BaseStrategy):
         super().__init__(name="EMA Crossover")
         self.fast = fast
         self.slow = slow
-        self.prices: Deque[float] = deque(maxlen=slow)
+        self._fast = EMA(fast)
+        self._slow = EMA(slow)
         self.fast_ema = None
         self.slow_ema = None
 
     def on_data(self, price: float) -> None:
-        self.prices.append(price)
-        if len(self.prices) >= self.slow:
-            price_list = list(self.prices)
-            self.fast_ema = ema(price_list, self.fast)
-            self.slow_ema = ema(price_list, self.slow)
+        fast_ema = self._fast.update(price)
+        slow_ema = self._slow.update(price)
+        if self._slow.ready:
+            self.fast_ema = fast_ema
+            self.slow_ema = slow_ema
 
     def generate_signal(self) -> Signal:
         if self.fast_ema is None or self.slow_ema is None:
@@ -1,14 +1,16 @@
 from __future__ import annotations
 
-import pandas as pd
+import numpy as np
 
-from .base import BaseStrategy, Signal
-from utils.indicators import atr
+from .base import BaseStrategy, Bars, Signal, BUY, SELL
+from utils.indicators import atr, atr_series
 
 
 class GridBot(BaseStrategy):
     """ATR-based dynamic grid trading bot."""
 
+    accepts_bars = True
+
     def __init__(
         self,
         symbol: str,
@@ -20,20 +22,15 @@ class GridBot(BaseStrategy):
         self.grid_mult = grid_mult
         self.last_level = None
 
-    def generate_signal(self, df: pd.DataFrame) -> Signal:
+    def generate_signal(self, df: Bars) -> Signal:
         try:
-            if not isinstance(df, pd.DataFrame) or len(df) < 15:
-                return self._signal("hold")
-            required = {"high", "low", "close"}
-            if not required.issubset(df.columns):
+            if not self._has_columns(df, ("high", "low", "close")) or len(df) < 15:
                 return self._signal("hold")
-            highs = df["high"].astype(float).tolist()
-            lows = df["low"].astype(float).tolist()
-            closes = df["close"].astype(float).tolist()
-            atr_val = atr(highs, lows, closes, 14)
+            closes = self._column(df, "close")
+            atr_val = atr(self._column(df, "high"), self._column(df, "low"), closes, 14)
             if atr_val is None:
                 return self._signal("hold")
-            price = closes[-1]
+            price = float(closes[-1])
             grid_size = atr_val * self.grid_mult
             if self.last_level is None:
                 self.last_level = price
@@ -48,3 +45,28 @@ class GridBot(BaseStrategy):
         except Exception as e:
             print(f"Strategy {self.name} failed: {e}")
             return self._signal("hold")
+
+    def generate_signals(self, df: Bars) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        actions, sl, tp = self._empty_signals(len(df))
+        if not self._has_columns(df, ("high", "low", "close")) or len(df) < 15:
+            return actions, sl, tp
+        closes = self._column(df, "close")
+        atr_vals = atr_series(self._column(df, "high"), self._column(df, "low"), closes, 14).to_numpy()
+        closes = closes.tolist()
+        # Grid levels are path dependent, so walk the bars once with the
+        # precomputed ATR instead of recomputing it per slice.
+        level = self.last_level
+        for i in range(14, len(closes)):
+            price = closes[i]
+            grid_size = atr_vals[i] * self.grid_mult
+            if level is None:
+                level = price
+                continue
+            if price >= level + grid_size:
+                level = price
+                actions[i] = SELL
+            elif price <= level - grid_size:
+                level = price
+                actions[i] = BUY
+        self.last_level = level
+        return actions, sl, tp
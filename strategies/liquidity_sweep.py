@@ -1,28 +1,29 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
-from .base import BaseStrategy, Signal
+from .base import BaseStrategy, Bars, Signal, BUY, SELL
 
 
 class LiquiditySweepBot(BaseStrategy):
     """Simplified smart money concept strategy."""
 
+    accepts_bars = True
+
     def __init__(self, symbol: str, timeframe: str = "15m", risk_pct: float = 0.03) -> None:
         super().__init__("LiquiditySweepBot", symbol, timeframe, risk_pct)
 
-    def generate_signal(self, df: pd.DataFrame) -> Signal:
+    def generate_signal(self, df: Bars) -> Signal:
         try:
-            if not isinstance(df, pd.DataFrame) or len(df) < 5:
-                return self._signal("hold")
-            if not {"high", "low"}.issubset(df.columns):
+            if not self._has_columns(df, ("high", "low")) or len(df) < 5:
                 return self._signal("hold")
-            highs = df["high"].astype(float)
-            lows = df["low"].astype(float)
-            recent_high = highs.iloc[-1]
-            recent_low = lows.iloc[-1]
-            prev_high = highs.iloc[-5:-1].max()
-            prev_low = lows.iloc[-5:-1].min()
+            highs = self._column(df, "high")
+            lows = self._column(df, "low")
+            recent_high = highs[-1]
+            recent_low = lows[-1]
+            prev_high = highs[-5:-1].max()
+            prev_low = lows[-5:-1].min()
             if recent_high > prev_high:
                 return self._signal("sell", 0.4)
             if recent_low < prev_low:
@@ -31,3 +32,17 @@ class LiquiditySweepBot(BaseStrategy):
         except Exception as e:
             print(f"Strategy {self.name} failed: {e}")
             return self._signal("hold")
+
+    def generate_signals(self, df: Bars) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        actions, sl, tp = self._empty_signals(len(df))
+        if not self._has_columns(df, ("high", "low")) or len(df) < 5:
+            return actions, sl, tp
+        highs = pd.Series(self._column(df, "high"), copy=False)
+        lows = pd.Series(self._column(df, "low"), copy=False)
+        prev_high = highs.rolling(4).max().shift(1).to_numpy()
+        prev_low = lows.rolling(4).min().shift(1).to_numpy()
+        sell = highs.to_numpy() > prev_high
+        buy = ~sell & (lows.to_numpy() < prev_low)
+        actions[sell] = SELL
+        actions[buy] = BUY
+        return actions, sl, tp
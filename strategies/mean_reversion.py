@@ -2,15 +2,16 @@
 
 from collections import deque
 from typing import Deque
-import pandas as pd
 
-from .base import BaseStrategy, Signal
+from .base import BaseStrategy, Bars, Signal
 from utils.indicators import simple_moving_average
 
 
 class MeanReversionStrategy(BaseStrategy):
     """Buy when price dips below the moving average and sell on rallies."""
 
+    accepts_bars = True
+
     def __init__(self, window: int = 10, threshold: float = 0.01) -> None:
         super().__init__(name="Mean Reversion")
         self.window = window
@@ -20,11 +21,11 @@ class MeanReversionStrategy(BaseStrategy):
     def on_data(self, price: float) -> None:  # type: ignore[override]
         self.prices.append(price)
 
-    def generate_signal(self, df: pd.DataFrame) -> Signal:
+    def generate_signal(self, df: Bars) -> Signal:
         try:
-            if not isinstance(df, pd.DataFrame) or "close" not in df.columns or len(df) < self.window:
+            if not self._has_columns(df, ("close",)) or len(df) < self.window:
                 return self._signal("hold")
-            prices = df["close"].astype(float).iloc[-self.window :].tolist()
+            prices = self._column(df, "close")[-self.window :].tolist()
             sma = simple_moving_average(prices, self.window)
             if sma is None:
                 return self._signal("hold")
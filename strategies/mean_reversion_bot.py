@@ -1,30 +1,54 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 
-from .base import BaseStrategy, Signal
+from .base import BaseStrategy, Bars, Signal, BUY, SELL
 
 
 class MeanReversionBot(BaseStrategy):
     """Bollinger band mean reversion with volume divergence."""
 
+    accepts_bars = True
+
     def __init__(self, symbol: str, timeframe: str = "1h", risk_pct: float = 0.02, window: int = 20) -> None:
         super().__init__("MeanReversionBot", symbol, timeframe, risk_pct)
         self.window = window
 
-    def generate_signal(self, df: pd.DataFrame) -> Signal:
+    def generate_signal(self, df: Bars) -> Signal:
         if len(df) < self.window + 1:
             return self._signal("hold")
-        close = df["close"]
+        prices = self._column(df, "close")
+        volumes = self._column(df, "volume")
+        close = pd.Series(prices, copy=False)
         mean = close.rolling(self.window).mean().iloc[-1]
         std = close.rolling(self.window).std().iloc[-1]
         upper = mean + 2 * std
         lower = mean - 2 * std
-        vol_mean = df["volume"].rolling(self.window).mean().iloc[-1]
-        vol = df["volume"].iloc[-1]
-        price = close.iloc[-1]
+        vol_mean = pd.Series(volumes, copy=False).rolling(self.window).mean().iloc[-1]
+        vol = volumes[-1]
+        price = prices[-1]
         if price < lower and vol > vol_mean:
             return self._signal("buy", 0.5)
         if price > upper and vol > vol_mean:
             return self._signal("sell", 0.5)
         return self._signal("hold")
+
+    def generate_signals(self, df: Bars) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        actions, sl, tp = self._empty_signals(len(df))
+        if len(df) < self.window + 1:
+            return actions, sl, tp
+        price = self._column(df, "close")
+        vol = self._column(df, "volume")
+        close = pd.Series(price, copy=False)
+        mean = close.rolling(self.window).mean()
+        std = close.rolling(self.window).std()
+        upper = (mean + 2 * std).to_numpy()
+        lower = (mean - 2 * std).to_numpy()
+        vol_mean = pd.Series(vol, copy=False).rolling(self.window).mean().to_numpy()
+        active = np.arange(1, len(df) + 1) >= self.window + 1
+        buy = active & (price < lower) & (vol > vol_mean)
+        sell = active & (price > upper) & (vol > vol_mean)
+        actions[buy] = BUY
+        actions[sell] = SELL
+        return actions, sl, tp
@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 from typing import Optional
 
-from .base import BaseStrategy, Signal
-from utils.indicators import atr
+from .base import BaseStrategy, Bars, Signal, BUY, SELL
+from utils.indicators import atr, atr_series
 
 
 class ScalperBot(BaseStrategy):
     """EMA cross scalper with volatility filter."""
 
+    accepts_bars = True
+
     def __init__(
         self,
         symbol: str,
@@ -26,27 +29,26 @@ class ScalperBot(BaseStrategy):
         self.vol_window = vol_window
         self.vol_threshold = vol_threshold
 
-    def _volatility(self, df: pd.DataFrame) -> Optional[float]:
-        if len(df) < self.vol_window + 1:
+    def _volatility(self, close: pd.Series) -> Optional[float]:
+        if len(close) < self.vol_window + 1:
             return None
-        return df["close"].pct_change().rolling(self.vol_window).std().iloc[-1]
+        return close.pct_change().rolling(self.vol_window).std().iloc[-1]
 
-    def _atr_levels(self, df: pd.DataFrame) -> tuple[float, float] | tuple[None, None]:
-        highs = df["high"].tolist()
-        lows = df["low"].tolist()
-        closes = df["close"].tolist()
-        atr_val = atr(highs, lows, closes, 14)
+    def _atr_levels(self, df: Bars) -> tuple[float, float] | tuple[None, None]:
+        closes = self._column(df, "close")
+        atr_val = atr(self._column(df, "high"), self._column(df, "low"), closes, 14)
         if atr_val is None:
             return None, None
-        price = closes[-1]
+        price = float(closes[-1])
         return price - atr_val * 0.3, price + atr_val * 0.3
 
-    def generate_signal(self, df: pd.DataFrame) -> Signal:
-        if df.empty or len(df) < self.slow + 1:
+    def generate_signal(self, df: Bars) -> Signal:
+        if len(df) < self.slow + 1:
             return self._signal("hold")
-        ema_fast = df["close"].ewm(span=self.fast, adjust=False).mean().iloc[-1]
-        ema_slow = df["close"].ewm(span=self.slow, adjust=False).mean().iloc[-1]
-        vol = self._volatility(df)
+        close = pd.Series(self._column(df, "close"), copy=False)
+        ema_fast = close.ewm(span=self.fast, adjust=False).mean().iloc[-1]
+        ema_slow = close.ewm(span=self.slow, adjust=False).mean().iloc[-1]
+        vol = self._volatility(close)
         if vol is None or vol > self.vol_threshold:
             return self._signal("hold")
         sl, tp = self._atr_levels(df)
@@ -55,3 +57,27 @@ class ScalperBot(BaseStrategy):
         if ema_fast < ema_slow:
             return self._signal("sell", 0.7, sl, tp)
         return self._signal("hold")
+
+    def generate_signals(self, df: Bars) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        actions, sl, tp = self._empty_signals(len(df))
+        if len(df) < self.slow + 1:
+            return actions, sl, tp
+        price = self._column(df, "close")
+        close = pd.Series(price, copy=False)
+        ema_fast = self._indicator(df, ("ema", self.fast), lambda: close.ewm(span=self.fast, adjust=False).mean().to_numpy())
+        ema_slow = self._indicator(df, ("ema", self.slow), lambda: close.ewm(span=self.slow, adjust=False).mean().to_numpy())
+        vol = self._indicator(
+            df, ("vol", self.vol_window), lambda: close.pct_change().rolling(self.vol_window).std().to_numpy()
+        )
+        bars = np.arange(1, len(df) + 1)
+        # NaN volatility does not exceed the threshold, matching generate_signal
+        active = (bars >= self.slow + 1) & (bars >= self.vol_window + 1) & ~(vol > self.vol_threshold)
+        actions[active & (ema_fast > ema_slow)] = BUY
+        actions[active & (ema_fast < ema_slow)] = SELL
+        atr_vals = self._indicator(
+            df, ("atr", 14), lambda: atr_series(self._column(df, "high"), self._column(df, "low"), price, 14).to_numpy()
+        )
+        levels = (actions != 0) & (bars >= 15)
+        sl[levels] = price[levels] - atr_vals[levels] * 0.3
+        tp[levels] = price[levels] + atr_vals[levels] * 0.3
+        return actions, sl, tp
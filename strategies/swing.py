@@ -1,15 +1,18 @@
 from __future__ import annotations
 
+import numpy as np
 import pandas as pd
 from typing import Optional
 
-from .base import BaseStrategy, Signal
-from utils.indicators import rsi, macd
+from .base import BaseStrategy, Bars, Signal, BUY, SELL
+from utils.indicators import rsi, macd, rsi_series, macd_series
 
 
 class SwingBot(BaseStrategy):
     """Swing trading strategy using EMA/SMA cross and MACD."""
 
+    accepts_bars = True
+
     def __init__(
         self,
         symbol: str,
@@ -22,13 +25,15 @@ class SwingBot(BaseStrategy):
         self.ema_fast = ema_fast
         self.sma_slow = sma_slow
 
-    def generate_signal(self, df: pd.DataFrame) -> Signal:
+    def generate_signal(self, df: Bars) -> Signal:
         if len(df) < max(self.ema_fast, self.sma_slow) + 2:
             return self._signal("hold")
-        ema_fast = df["close"].ewm(span=self.ema_fast, adjust=False).mean().iloc[-1]
-        sma_slow = df["close"].rolling(self.sma_slow).mean().iloc[-1]
-        macd_val = macd(df["close"].tolist())
-        rsi_val = rsi(df["close"].tolist())
+        prices = self._column(df, "close")
+        close = pd.Series(prices, copy=False)
+        ema_fast = close.ewm(span=self.ema_fast, adjust=False).mean().iloc[-1]
+        sma_slow = close.rolling(self.sma_slow).mean().iloc[-1]
+        macd_val = macd(prices)
+        rsi_val = rsi(prices)
         if not macd_val or rsi_val is None:
             return self._signal("hold")
         macd_line, macd_signal = macd_val
@@ -45,3 +50,27 @@ class SwingBot(BaseStrategy):
         ):
             return self._signal("sell", 0.6)
         return self._signal("hold")
+
+    def generate_signals(self, df: Bars) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        actions, sl, tp = self._empty_signals(len(df))
+        if len(df) < max(self.ema_fast, self.sma_slow) + 2:
+            return actions, sl, tp
+        prices = self._column(df, "close")
+        close = pd.Series(prices, copy=False)
+        ema_fast = self._indicator(
+            df, ("ema", self.ema_fast), lambda: close.ewm(span=self.ema_fast, adjust=False).mean().to_numpy()
+        )
+        sma_slow = self._indicator(df, ("sma", self.sma_slow), lambda: close.rolling(self.sma_slow).mean().to_numpy())
+        macd_line, macd_signal = self._indicator(
+            df, ("macd", 12, 26, 9), lambda: np.vstack([s.to_numpy() for s in macd_series(prices)])
+        )
+        # rsi_series starts at the second bar
+        rsi_val = self._indicator(
+            df, ("rsi", 14), lambda: np.concatenate(([np.nan], rsi_series(prices).to_numpy()))
+        )
+        active = np.arange(1, len(df) + 1) >= max(self.ema_fast, self.sma_slow) + 2
+        buy = active & (ema_fast > sma_slow) & (macd_line > macd_signal) & (rsi_val < 70)
+        sell = active & (ema_fast < sma_slow) & (macd_line < macd_signal) & (rsi_val > 30)
+        actions[buy] = BUY
+        actions[sell] = SELL
+        return actions, sl, tp
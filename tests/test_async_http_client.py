@@ -0,0 +1,176 @@
+import asyncio
+import json
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer as LocalServer
+
+from api.open_api_http_async import AsyncOpenApiHttpFuture
+from api.open_api_http_sign import generate_signature, sort_params
+from data.fetch_api import fetch_klines_async
+
+
+class MockExchange:
+    """Local stand-in for the Bitunix REST API."""
+
+    def __init__(self, failures=0, status=429, order_delay=0.0):
+        self.failures = failures
+        self.status = status
+        self.order_delay = order_delay
+        self.calls = []
+        self.app = web.Application()
+        self.app.router.add_get("/api/v1/futures/market/tickers", self.tickers)
+        self.app.router.add_get("/api/v1/futures/market/depth", self.depth)
+        self.app.router.add_get("/api/v1/futures/market/kline", self.kline)
+        self.app.router.add_get("/api/v1/futures/market/funding_rate/batch", self.funding)
+        self.app.router.add_post("/api/v1/futures/trade/place_order", self.place_order)
+
+    def _ok(self, data):
+        return web.json_response({"code": 0, "msg": "ok", "data": data})
+
+    async def tickers(self, request):
+        self.calls.append(("tickers", dict(request.query), dict(request.headers)))
+        if self.failures:
+            self.failures -= 1
+            return web.Response(status=self.status, headers={"Retry-After": "0.01"})
+        symbols = request.query["symbols"].split(",")
+        return self._ok([{"symbol": s, "lastPrice": str(i)} for i, s in enumerate(symbols)])
+
+    async def depth(self, request):
+        symbol = request.query["symbol"]
+        self.calls.append(("depth", dict(request.query), dict(request.headers)))
+        if symbol == "BAD":
+            return web.json_response({"code": 2, "msg": "bad symbol", "data": None})
+        return self._ok({"bids": [["1", "1"]], "asks": [["2", "1"]]})
+
+    async def kline(self, request):
+        self.calls.append(("kline", dict(request.query), dict(request.headers)))
+        rows = [
+            {"time": 60_000 * i, "open": "1", "high": "2", "low": "0.5", "close": "1.5", "baseVol": "3"}
+            for i in range(int(request.query["limit"]))
+        ]
+        return self._ok(rows)
+
+    async def funding(self, request):
+        return self._ok([{"symbol": "BTCUSDT", "fundingRate": "0.0001"}, {"symbol": "ETHUSDT", "fundingRate": "0.0002"}])
+
+    async def place_order(self, request):
+        body = await request.text()
+        self.calls.append(("place_order", body, dict(request.headers)))
+        if self.order_delay:
+            # Accepted, but the answer arrives after the client gave up
+            await asyncio.sleep(self.order_delay)
+        return self._ok({"orderId": "1", "clientId": json.loads(body).get("clientId")})
+
+
+def _run(exchange, scenario, **kwargs):
+    async def main():
+        server = LocalServer(exchange.app)
+        await server.start_server()
+        try:
+            async with AsyncOpenApiHttpFuture(base_url=str(server.make_url("")), **kwargs) as client:
+                return await scenario(client)
+        finally:
+            await server.close()
+
+    return asyncio.run(main())
+
+
+def test_batch_tickers_are_chunked_and_unsigned():
+    exchange = MockExchange()
+    symbols = [f"S{i}USDT" for i in range(120)]
+    tickers = _run(exchange, lambda client: client.tickers(symbols, chunk=50))
+    assert sorted(tickers) == sorted(symbols)
+    assert len(exchange.calls) == 3
+    assert all("sign" not in headers for _, _, headers in exchange.calls)
+
+
+def test_funding_rates_filter_batch_endpoint():
+    exchange = MockExchange()
+    rates = _run(exchange, lambda client: client.funding_rates(["ETHUSDT"]))
+    assert rates == {"ETHUSDT": {"symbol": "ETHUSDT", "fundingRate": "0.0002"}}
+
+
+def test_retries_on_429_then_succeeds():
+    exchange = MockExchange(failures=2)
+
+    async def scenario(client):
+        result = await client.get_tickers("BTCUSDT")
+        return result, client.retried
+
+    result, retried = _run(exchange, scenario, backoff=0.01)
+    assert result == [{"symbol": "BTCUSDT", "lastPrice": "0"}]
+    assert retried == 2
+
+
+def test_gives_up_after_retries_on_5xx():
+    exchange = MockExchange(failures=10, status=503)
+    with pytest.raises(Exception, match="HTTP Error: 503"):
+        _run(exchange, lambda client: client.get_tickers("BTCUSDT"), retries=2, backoff=0.01)
+    assert len(exchange.calls) == 3
+
+
+def test_timed_out_order_is_not_resent():
+    exchange = MockExchange(order_delay=0.5)
+    with pytest.raises(asyncio.TimeoutError):
+        _run(
+            exchange,
+            lambda client: client.place_order("BTCUSDT", "BUY", "MARKET", "0.1"),
+            timeout=0.1,
+            backoff=0.01,
+        )
+    assert len(exchange.calls) == 1
+
+
+def test_timed_out_order_with_client_id_is_retried():
+    exchange = MockExchange(order_delay=0.5)
+    with pytest.raises(asyncio.TimeoutError):
+        _run(
+            exchange,
+            lambda client: client.place_order("BTCUSDT", "BUY", "MARKET", "0.1", client_id="abc"),
+            timeout=0.1,
+            retries=2,
+            backoff=0.01,
+        )
+    assert len(exchange.calls) == 3
+
+
+def test_depths_skip_failed_symbols_and_share_rate_limit():
+    exchange = MockExchange()
+
+    async def scenario(client):
+        start = time.monotonic()
+        depths = await client.depths(["BTCUSDT", "BAD", "ETHUSDT", "XRPUSDT"])
+        return depths, time.monotonic() - start
+
+    depths, elapsed = _run(exchange, scenario, limits={"market": (20.0, 2)})
+    assert sorted(depths) == ["BTCUSDT", "ETHUSDT", "XRPUSDT"]
+    # Burst of 2 then 20/s: the last two requests wait for tokens
+    assert elapsed >= 0.09
+
+
+def test_private_requests_are_signed_over_the_sent_body():
+    exchange = MockExchange()
+
+    async def scenario(client):
+        client.api_key, client.secret_key = "key", "secret"
+        return await client.place_order("BTCUSDT", "BUY", "MARKET", "0.1", client_id="abc")
+
+    result = _run(exchange, scenario)
+    assert result == {"orderId": "1", "clientId": "abc"}
+    _, body, headers = exchange.calls[0]
+    expected = generate_signature("key", "secret", headers["nonce"], headers["timestamp"], sort_params({}), body)
+    assert headers["sign"] == expected
+
+
+def test_fetch_klines_async_returns_frames():
+    exchange = MockExchange()
+    frames = _run(exchange, lambda client: fetch_klines_async(client, ["BTCUSDT", "ETHUSDT"], "1m", limit=5))
+    assert set(frames) == {"BTCUSDT", "ETHUSDT"}
+    assert len(frames["BTCUSDT"]) == 5
+    assert frames["ETHUSDT"]["close"].iloc[0] == 1.5
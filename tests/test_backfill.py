@@ -0,0 +1,127 @@
+import json
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pandas as pd
+import pytest
+
+from data.backfill import KlineBackfill, interval_ms
+from data.candle_store import CandleStore
+
+MINUTE = 60_000
+
+
+class _KlineHandler(BaseHTTPRequestHandler):
+    requests_seen: list = []
+
+    def do_GET(self):  # noqa: N802 - http.server API
+        query = {k: v[0] for k, v in parse_qs(urlparse(self.path).query).items()}
+        self.requests_seen.append(query)
+        start, end, limit = int(query["startTime"]), int(query["endTime"]), int(query["limit"])
+        # one extra bar before the window to exercise de-duplication
+        first = start - MINUTE
+        rows = [
+            {
+                "time": str(t),
+                "open": "1",
+                "high": "2",
+                "low": "0.5",
+                "close": str(t // MINUTE),
+                "baseVol": "3",
+                "quoteVol": "4",
+            }
+            for t in range(first, min(end, first + limit * MINUTE) + 1, MINUTE)
+        ]
+        body = json.dumps({"code": 0, "data": rows[::-1]}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def kline_server():
+    _KlineHandler.requests_seen = []
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _KlineHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/kline", _KlineHandler.requests_seen
+    server.shutdown()
+
+
+def test_interval_ms():
+    assert interval_ms("1m") == MINUTE
+    assert interval_ms("4h") == 240 * MINUTE
+    with pytest.raises(ValueError):
+        interval_ms("1M")
+
+
+def test_backfill_paginates_dedupes_and_resumes(tmp_path, kline_server):
+    url, seen = kline_server
+    store = CandleStore(tmp_path)
+    backfill = KlineBackfill(store, base_url=url, max_workers=4, rate=1000, page_limit=100)
+    start = pd.Timestamp("2024-01-01")
+    end = start + pd.Timedelta(minutes=999)
+
+    assert backfill.backfill("BTCUSDT", "1m", start, end) == 1000
+    assert len(seen) == 10
+    df = store.read("BTCUSDT", "1m")
+    assert df["timestamp"].is_unique
+    assert df["timestamp"].iloc[0] == start
+    assert df["timestamp"].iloc[-1] == end
+
+    # a second run only asks for bars after the stored history
+    seen.clear()
+    later = end + pd.Timedelta(minutes=150)
+    assert backfill.backfill("BTCUSDT", "1m", start, later) == 150
+    assert len(seen) == 2
+    assert min(int(q["startTime"]) for q in seen) == (end + pd.Timedelta(minutes=1)).value // 1_000_000
+    backfill.close()
+
+
+def test_backfill_fills_history_before_collected_bars(tmp_path, kline_server):
+    url, seen = kline_server
+    store = CandleStore(tmp_path)
+    start = pd.Timestamp("2024-01-01")
+    # the live collector already stored the most recent bars
+    recent = pd.DataFrame(
+        {
+            "timestamp": pd.date_range(start + pd.Timedelta(minutes=500), periods=10, freq="min"),
+            "open": 1.0, "high": 2.0, "low": 0.5, "close": -1.0, "volume": 3.0,
+        }
+    )
+    store.append("BTCUSDT", "1m", recent)
+    backfill = KlineBackfill(store, base_url=url, max_workers=4, rate=1000, page_limit=100)
+
+    end = start + pd.Timedelta(minutes=599)
+    assert backfill.missing("BTCUSDT", "1m", start, end) == [
+        (start, start + pd.Timedelta(minutes=499)),
+        (start + pd.Timedelta(minutes=510), end),
+    ]
+    assert backfill.backfill("BTCUSDT", "1m", start, end) == 590
+    df = store.read("BTCUSDT", "1m")
+    assert df["timestamp"].tolist() == list(pd.date_range(start, end, freq="min"))
+    # the collected bars were kept, not overwritten
+    assert (df["close"].iloc[500:510] == -1.0).all()
+    assert backfill.backfill("BTCUSDT", "1m", start, end) == 0
+    backfill.close()
+
+
+def test_backfill_to_now_skips_forming_bar(tmp_path, kline_server):
+    url, _ = kline_server
+    store = CandleStore(tmp_path)
+    backfill = KlineBackfill(store, base_url=url, rate=1000, page_limit=100)
+    start = pd.Timestamp.now(tz="UTC").tz_localize(None).floor("min") - pd.Timedelta(minutes=5)
+    assert backfill.backfill("BTCUSDT", "1m", start) > 0
+    now = pd.Timestamp.now(tz="UTC").tz_localize(None)
+    assert store.last_timestamp("BTCUSDT", "1m") + pd.Timedelta(minutes=1) <= now
+    backfill.close()
@@ -0,0 +1,73 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest.engine import BacktestEngine
+from backtest.kernel import TRADE_DTYPE, simulate
+from strategies.base import BaseStrategy
+
+
+class _RandomSignals(BaseStrategy):
+    """Random actions with SL/TP bands around the close."""
+
+    def __init__(self, symbol, timeframe, seed=0):
+        super().__init__("random", symbol, timeframe, risk_pct=0.1)
+        self.seed = seed
+
+    def generate_signals(self, df):
+        rng = np.random.default_rng(self.seed)
+        close = df["close"].to_numpy()
+        actions = rng.choice(np.array([-1, 0, 0, 0, 1], dtype=np.int8), len(df))
+        sl = np.where(actions == 1, close * 0.995, close * 1.005)
+        tp = np.where(actions == 1, close * 1.01, close * 0.99)
+        sl[rng.random(len(df)) < 0.3] = np.nan
+        tp[rng.random(len(df)) < 0.3] = np.nan
+        return actions, sl, tp
+
+
+def _walk(rows, seed=11):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.003, rows)))
+    spread = np.abs(rng.normal(0, 0.003, rows)) * close
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=rows, freq="min"),
+            "open": close,
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": 1.0,
+        }
+    )
+
+
+@pytest.mark.parametrize("config", [{}, {"slippage_pct": 0.0005, "fee_pct": 0.001}])
+def test_kernel_matches_reference_loop(config):
+    data = {("A", "1m"): _walk(20_000), ("B", "1m"): _walk(5_000, seed=12)}
+    runs = []
+    for use_kernel in (True, False):
+        strategies = [_RandomSignals("A", "1m", 1), _RandomSignals("B", "1m", 2)]
+        engine = BacktestEngine(data, strategies, config, use_kernel=use_kernel)
+        engine.run()
+        runs.append(engine)
+    kernel, reference = runs
+    assert len(kernel.trade_log) > 1000
+    assert kernel.trade_log == reference.trade_log
+    assert kernel.equity_curve == reference.equity_curve
+    assert kernel.equity == reference.equity
+
+
+def test_simulate_returns_structured_trades():
+    closes = np.array([10.0, 11.0, 12.0, 9.0, 9.5])
+    actions = np.array([1, 0, -1, -1, 0], dtype=np.int8)
+    nan = np.full(5, np.nan)
+    trades, equity = simulate(closes, closes, closes, actions, nan, nan, risk_pct=1.0, equity=100.0)
+    assert trades.dtype == TRADE_DTYPE
+    assert trades[["entry_idx", "exit_idx", "side"]].tolist() == [(0, 2, 1), (3, 4, -1)]
+    assert trades["pnl"][0] == pytest.approx(20.0)
+    assert equity == pytest.approx(100.0 + 20.0 + (9.0 - 9.5) * 120.0 / 9.0)
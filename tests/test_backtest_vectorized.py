@@ -0,0 +1,57 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest.data_loader import CSVDataLoader
+from backtest.engine import BacktestEngine
+from strategies.breakout import BreakoutBot
+from strategies.grid import GridBot
+from strategies.liquidity_sweep import LiquiditySweepBot
+from strategies.mean_reversion_bot import MeanReversionBot
+from strategies.scalper import ScalperBot
+from strategies.swing import SwingBot
+
+STRATEGIES = [ScalperBot, SwingBot, MeanReversionBot, BreakoutBot, GridBot, LiquiditySweepBot]
+FIXTURES = Path(__file__).resolve().parents[1] / "data" / "processed"
+
+
+def _random_walk(rows: int = 600, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, rows)))
+    spread = np.abs(rng.normal(0, 0.002, rows)) * close
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=rows, freq="min"),
+            "open": close,
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.lognormal(3, 0.5, rows),
+        }
+    )
+
+
+def _trades(data, cls, vectorized):
+    strategies = [cls(symbol=symbol, timeframe=timeframe) for symbol, timeframe in data]
+    engine = BacktestEngine(data, strategies, {"fee_pct": 0.001, "slippage_pct": 0.0005}, vectorized=vectorized)
+    engine.run()
+    return engine.trade_log
+
+
+@pytest.mark.parametrize("cls", STRATEGIES)
+def test_vectorized_matches_per_bar_on_fixtures(cls):
+    data = CSVDataLoader(str(FIXTURES)).load()
+    assert _trades(data, cls, True) == _trades(data, cls, False)
+
+
+@pytest.mark.parametrize("cls", STRATEGIES)
+def test_vectorized_matches_per_bar_on_random_walk(cls):
+    data = {("TEST", "1m"): _random_walk()}
+    trades = _trades(data, cls, True)
+    assert trades
+    assert trades == _trades(data, cls, False)
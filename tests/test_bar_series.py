@@ -0,0 +1,114 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from core.bar_series import BarSeries
+from engine.bot_engine import BotEngine
+from strategies.breakout import BreakoutBot
+from strategies.grid import GridBot
+from strategies.liquidity_sweep import LiquiditySweepBot
+from strategies.mean_reversion_bot import MeanReversionBot
+from strategies.scalper import ScalperBot
+from strategies.swing import SwingBot
+
+STRATEGIES = [ScalperBot, SwingBot, MeanReversionBot, BreakoutBot, GridBot, LiquiditySweepBot]
+
+
+def _frame(rows: int = 300, seed: int = 3) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, rows)))
+    spread = np.abs(rng.normal(0, 0.002, rows)) * close
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=rows, freq="min"),
+            "open": close,
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.lognormal(3, 0.5, rows),
+        }
+    )
+
+
+def test_append_grows_and_views_share_memory():
+    bars = BarSeries(capacity=2)
+    for i in range(5):
+        bars.append({"timestamp": 60_000 * i, "open": i, "high": i, "low": i, "close": float(i), "volume": 1.0})
+    assert len(bars) == 5
+    assert bars.capacity == 8
+    assert bars["close"].tolist() == [0.0, 1.0, 2.0, 3.0, 4.0]
+    window = bars.window(2)
+    assert window["close"].tolist() == [3.0, 4.0]
+    assert np.shares_memory(window["close"], bars["close"])
+    assert bars[1:3]["close"].tolist() == [1.0, 2.0]
+    assert pd.Timestamp(bars.timestamps[1]) == pd.Timestamp("1970-01-01 00:01")
+    with pytest.raises(ValueError):
+        window.append({"open": 0, "high": 0, "low": 0, "close": 0, "volume": 0})
+
+
+def test_max_bars_keeps_a_rolling_window():
+    bars = BarSeries(capacity=2, max_bars=5)
+    for i in range(100):
+        bars.append({"timestamp": 60_000 * i, "open": i, "high": i, "low": i, "close": float(i), "volume": 1.0})
+        assert bars["close"].tolist() == [float(j) for j in range(max(0, i - 4), i + 1)]
+    assert bars.capacity == 10 and bars.total == 100
+    assert pd.Timestamp(bars.timestamps[0]) == pd.Timestamp("1970-01-01") + pd.Timedelta(minutes=95)
+    bars.extend(_frame(7))
+    assert len(bars) == 5 and bars.total == 107
+    assert bars["close"].tolist() == _frame(7)["close"].tolist()[-5:]
+
+
+def test_from_frame_round_trip():
+    df = _frame(10)
+    bars = BarSeries.from_frame(df)
+    pd.testing.assert_frame_equal(bars.to_frame(), df[["timestamp", "open", "high", "low", "close", "volume"]])
+
+
+def test_frame_view_is_zero_copy_and_read_only():
+    bars = BarSeries.from_frame(_frame(10))
+    view = bars.frame_view()
+    pd.testing.assert_frame_equal(view, bars.to_frame())
+    assert np.shares_memory(view["close"].to_numpy(), bars["close"])
+    with pytest.raises(ValueError):
+        view["close"].to_numpy()[0] = 0.0
+
+
+@pytest.mark.parametrize("cls", STRATEGIES)
+def test_strategies_match_on_frames_and_bars(cls):
+    df = _frame()
+    bars = BarSeries.from_frame(df)
+    for got, want in zip(cls("T", "1m").generate_signals(bars), cls("T", "1m").generate_signals(df)):
+        np.testing.assert_array_equal(got, want)
+    frame_strategy, bar_strategy = cls("T", "1m"), cls("T", "1m")
+    for i in range(len(df) - 40, len(df)):
+        a = frame_strategy.generate_signal(df.iloc[: i + 1])
+        b = bar_strategy.generate_signal(bars[: i + 1])
+        assert (a.action, a.sl, a.tp) == (b.action, b.sl, b.tp)
+
+
+class _Orders:
+    def __init__(self):
+        self.orders = []
+
+    def place_order(self, side, symbol, qty, price=None):
+        self.orders.append((side, qty, price))
+        return {}
+
+
+class _Risk:
+    def size_position(self, balance, price):
+        return 1.0
+
+
+def test_bot_engine_feeds_bar_series():
+    orders = _Orders()
+    engine = BotEngine(LiquiditySweepBot("T", "1m"), orders, _Risk())
+    for bar in _frame(20).assign(timestamp=lambda d: d["timestamp"].astype("int64") // 1_000_000).to_dict("records"):
+        engine.on_bar(bar)
+    assert len(engine.bars) == 20
+    assert orders.orders
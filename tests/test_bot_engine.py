@@ -0,0 +1,133 @@
+import asyncio
+import sys
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from dashboard.dashboard import PerformanceMetrics
+from engine.bot_engine import BotEngine
+from strategies.base import BaseStrategy
+from strategies.liquidity_sweep import LiquiditySweepBot
+from utils.latency import LatencyHistogram
+
+
+class Orders:
+    def __init__(self):
+        self.placed = []
+        self._lock = threading.Lock()
+
+    def place_order(self, side, symbol, qty, price=None, order_type="market"):
+        with self._lock:
+            self.placed.append((side, symbol, price))
+        return {"side": side, "symbol": symbol}
+
+
+class Risk:
+    def size_position(self, balance, price):
+        return 1.0
+
+
+class Threshold(BaseStrategy):
+    """Buy above ``level`` and sell below it, from tick prices."""
+
+    def __init__(self, level):
+        super().__init__("Threshold")
+        self.level = level
+        self.price = None
+
+    def on_data(self, price):
+        self.price = price
+
+    def generate_signal(self):
+        if self.price is None:
+            return "hold"
+        return "buy" if self.price > self.level else "sell" if self.price < self.level else "hold"
+
+
+def test_single_strategy_uses_its_symbol():
+    orders = Orders()
+    engine = BotEngine(Threshold(100), orders, Risk(), symbol="ETHUSDT")
+    engine.on_price_update(101)
+    engine.on_price_update(100)
+    engine.on_price_update(99, symbol="ETHUSDT")
+    assert orders.placed == [("BUY", "ETHUSDT", 101), ("SELL", "ETHUSDT", 99)]
+    assert engine.symbols["ETHUSDT"].signals == engine.symbols["ETHUSDT"].orders == 2
+
+
+def test_engine_without_order_manager_only_counts_signals():
+    metrics = PerformanceMetrics()
+    engine = BotEngine(Threshold(100), metrics=metrics, symbol="ETHUSDT")
+    engine.on_price_update(101)
+    engine.on_price_update(99)
+    state = engine.symbols["ETHUSDT"]
+    assert (state.signals, state.orders) == (2, 0)
+    assert engine.balance == 1.0
+
+
+def test_async_dispatch_routes_many_symbols():
+    orders = Orders()
+    engine = BotEngine(order_manager=orders, risk_manager=Risk(), workers=4)
+    symbols = [f"SYM{i}USDT" for i in range(150)]
+    for i, symbol in enumerate(symbols):
+        engine.add_route(symbol, "tick", Threshold(100), cpu_bound=i % 2 == 0)
+        engine.add_route(symbol, "1m", LiquiditySweepBot(symbol, "1m"))
+
+    async def session():
+        await engine.start()
+        feeder = threading.Thread(
+            target=lambda: [engine.submit_tick(symbol, price) for price in (99, 100, 101) for symbol in symbols]
+        )
+        feeder.start()
+        feeder.join()
+        for symbol in symbols:
+            engine.submit_bar(symbol, "1m", {"timestamp": 0, "open": 1, "high": 2, "low": 0.5, "close": 1, "volume": 1})
+        await engine.stop()
+
+    asyncio.run(session())
+    for symbol in symbols:
+        ticks = [(side, price) for side, sym, price in orders.placed if sym == symbol]
+        assert ticks == [("SELL", 99), ("BUY", 101)]
+        assert len(engine.symbols[symbol].bars["1m"]) == 1
+        assert engine.symbols[symbol].orders == 2
+    latency = engine.latency_snapshot()
+    assert set(latency) == set(symbols)
+    assert all(stats["count"] == 4 for stats in latency.values())
+
+
+def test_unrouted_symbols_are_rejected_and_metrics_pair_per_symbol():
+    orders = Orders()
+    metrics = PerformanceMetrics()
+    engine = BotEngine(order_manager=orders, risk_manager=Risk(), metrics=metrics, initial_balance=1000.0)
+    engine.add_route("AAAUSDT", "tick", Threshold(100))
+    engine.add_route("BBBUSDT", "tick", Threshold(10))
+
+    async def session():
+        await engine.start()
+        # buy AAA at 101 and BBB at 11, then sell BBB at 9 and AAA at 99
+        accepted = [engine.submit_tick("AAAUSDT", 101), engine.submit_tick("BBBUSDT", 11)]
+        await engine.drain()
+        accepted += [engine.submit_tick("BBBUSDT", 9), engine.submit_tick("AAAUSDT", 99)]
+        accepted.append(engine.submit_tick("ZZZUSDT", 1))
+        await engine.stop()
+        return accepted
+
+    assert asyncio.run(session()) == [True, True, True, True, False]
+    assert "ZZZUSDT" not in engine.symbols
+    # each sell closes the same symbol's buy: two losing round trips of -2
+    assert metrics.round_trips.count == 2
+    assert metrics.win_rate() == 0.0
+    assert metrics.pnl() == -4.0
+
+
+def test_latency_histogram_percentiles():
+    hist = LatencyHistogram()
+    for _ in range(90):
+        hist.record(0.001)
+    for _ in range(10):
+        hist.record(0.1)
+    stats = hist.snapshot()
+    assert stats["count"] == 100
+    assert 0.001 <= stats["p50"] < 0.0013
+    assert 0.1 <= stats["p99"] <= 0.1 * 10 ** 0.1
+    assert stats["max"] == 0.1
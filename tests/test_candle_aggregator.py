@@ -0,0 +1,94 @@
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import websockets
+
+from api.config import Config
+from api.open_api_ws_future_public import OpenApiWsFuturePublic
+from data.candle_aggregator import CandleAggregator
+from engine.regime_detector import RegimeDetector
+
+BASE = 1_704_067_200_000  # 2024-01-01 00:00 UTC
+MINUTE = 60_000
+
+
+def _recorded_messages():
+    """Trade pushes in the Bitunix format, 4 trades per minute for 11 minutes."""
+    messages = []
+    for minute in range(11):
+        trades = []
+        for k, price in enumerate([100 + minute, 102 + minute, 99 + minute, 101 + minute]):
+            ts = BASE + minute * MINUTE + k * 10_000
+            trades.append({"t": ts, "p": str(price), "v": "0.5", "s": "buy"})
+        messages.append({"ch": "trade", "symbol": "BTCUSDT", "ts": trades[-1]["t"], "data": trades})
+    return messages
+
+
+def test_aggregator_builds_bars_and_emits_on_close():
+    agg = CandleAggregator(["1m", "5m"])
+    closed = []
+    agg.subscribe(lambda s, tf, bar: closed.append((s, tf, bar)))
+    for message in _recorded_messages():
+        agg.on_message(message)
+    minute_bars = agg.bars("BTCUSDT", "1m")
+    assert len(minute_bars) == 10
+    first = minute_bars.iloc[0]
+    assert (first["open"], first["high"], first["low"], first["close"], first["volume"]) == (100, 102, 99, 101, 2.0)
+    five = agg.bars("BTCUSDT", "5m")
+    assert len(five) == 2
+    assert five.iloc[0]["high"] == 106 and five.iloc[0]["volume"] == 10.0
+    assert [tf for _, tf, _ in closed].count("5m") == 2
+    # late trade for an already closed minute is ignored
+    agg.on_trade("BTCUSDT", BASE, 500.0, 1.0)
+    assert agg.bars("BTCUSDT", "1m")["high"].max() < 500
+    agg.flush(BASE + 11 * MINUTE)
+    assert len(agg.bars("BTCUSDT", "1m")) == 11
+
+
+def test_ring_buffer_keeps_latest_bars():
+    agg = CandleAggregator(["1m"], capacity=3)
+    for minute in range(6):
+        agg.on_trade("ETHUSDT", BASE + minute * MINUTE, float(minute), 1.0)
+    bars = agg.bars("ETHUSDT", "1m")
+    assert bars["close"].tolist() == [2.0, 3.0, 4.0]
+
+
+def test_replay_through_fake_ws_server():
+    messages = _recorded_messages()
+
+    async def handler(ws):
+        # skip heartbeats until the client subscribes
+        while json.loads(await ws.recv()).get("op") != "subscribe":
+            pass
+        for message in messages:
+            await ws.send(json.dumps(message))
+        await ws.wait_closed()
+
+    async def scenario():
+        async with websockets.serve(handler, "127.0.0.1", 0) as server:
+            port = server.sockets[0].getsockname()[1]
+            config = Config("missing.yaml")
+            config.config_data = {"websocket": {"public_uri": f"ws://127.0.0.1:{port}", "reconnect_interval": 0.1}}
+            agg = CandleAggregator(["1m"])
+            detector = RegimeDetector(atr_period=3)
+            agg.subscribe(detector.on_bar)
+            client = OpenApiWsFuturePublic(config, aggregator=agg)
+            task = asyncio.create_task(client.start())
+            while not client.is_connected:
+                await asyncio.sleep(0.01)
+            await client.subscribe([{"symbol": "BTCUSDT", "ch": "trade"}])
+            for _ in range(200):
+                if len(agg.bars("BTCUSDT", "1m")) == 10:
+                    break
+                await asyncio.sleep(0.01)
+            task.cancel()
+            await asyncio.gather(task, return_exceptions=True)
+            return agg, detector
+
+    agg, detector = asyncio.run(scenario())
+    assert len(agg.bars("BTCUSDT", "1m")) == 10
+    assert detector.detect("BTCUSDT", "1m") in {"trending", "ranging"}
@@ -0,0 +1,88 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pandas as pd
+
+from backtest.data_loader import CandleStoreLoader
+from data.candle_store import CandleStore, closed_bars
+
+
+def _bars(start: str, periods: int) -> pd.DataFrame:
+    ts = pd.date_range(start, periods=periods, freq="min")
+    return pd.DataFrame(
+        {
+            "timestamp": ts,
+            "open": range(periods),
+            "high": [float(i) + 1 for i in range(periods)],
+            "low": [float(i) for i in range(periods)],
+            "close": [float(i) + 0.5 for i in range(periods)],
+            "volume": [10] * periods,
+        }
+    )
+
+
+def test_append_is_incremental_and_typed(tmp_path):
+    store = CandleStore(tmp_path)
+    assert store.append("BTCUSDT", "1m", _bars("2024-01-01", 10)) == 10
+    # overlapping fetch only adds the new tail (and rewrites the last stored bar)
+    assert store.append("BTCUSDT", "1m", _bars("2024-01-01 00:05", 10)) == 6
+    df = store.read("BTCUSDT", "1m")
+    assert len(df) == 15
+    assert df["timestamp"].is_monotonic_increasing
+    assert str(df["timestamp"].dtype) == "datetime64[ns]"
+    assert df["open"].dtype == "int64"
+    assert df["close"].dtype == "float64"
+    assert store.last_timestamp("BTCUSDT", "1m") == pd.Timestamp("2024-01-01 00:14")
+
+
+def test_range_read_and_compact(tmp_path):
+    store = CandleStore(tmp_path)
+    store.append("ETHUSDT", "1m", _bars("2024-01-01", 10))
+    store.append("ETHUSDT", "1m", _bars("2024-01-01 00:10", 10))
+    window = store.read("ETHUSDT", "1m", "2024-01-01 00:08", "2024-01-01 00:11")
+    assert window["timestamp"].tolist() == list(pd.date_range("2024-01-01 00:08", periods=4, freq="min"))
+    before = store.read("ETHUSDT", "1m")
+    store.compact("ETHUSDT", "1m")
+    assert len(list((tmp_path / "ETHUSDT" / "1m").glob("*.arrow"))) == 1
+    pd.testing.assert_frame_equal(store.read("ETHUSDT", "1m"), before)
+
+
+def test_loader_reads_every_key(tmp_path):
+    store = CandleStore(tmp_path)
+    store.append("AAA", "1h", _bars("2024-01-01", 3))
+    store.append("BBB", "4h", _bars("2024-01-01", 3))
+    data = CandleStoreLoader(str(tmp_path)).load()
+    assert set(data) == {("AAA", "1h"), ("BBB", "4h")}
+
+
+def test_forming_bar_is_replaced_on_next_fetch(tmp_path):
+    store = CandleStore(tmp_path)
+    store.append("BTCUSDT", "1m", _bars("2024-01-01", 5))
+    # the 00:04 kline was still forming; the next poll brings its final values
+    final = _bars("2024-01-01 00:04", 3).assign(close=[99.0, 100.0, 101.0])
+    assert store.append("BTCUSDT", "1m", final) == 3
+    df = store.read("BTCUSDT", "1m")
+    assert df["timestamp"].is_unique and len(df) == 7
+    assert df["close"].tolist()[3:] == [3.5, 99.0, 100.0, 101.0]
+    assert store.read("BTCUSDT", "1m", "2024-01-01 00:04", "2024-01-01 00:04")["close"].tolist() == [99.0]
+    store.compact("BTCUSDT", "1m")
+    pd.testing.assert_frame_equal(store.read("BTCUSDT", "1m"), df)
+
+
+def test_polling_compacts_small_partitions(tmp_path):
+    store = CandleStore(tmp_path, compact_every=8)
+    expected = []
+    for i in range(40):
+        bars = _bars("2024-01-01", i + 2).tail(2)
+        store.append("BTCUSDT", "1m", bars)
+        expected = bars["timestamp"].tolist() if not expected else expected[:-1] + bars["timestamp"].tolist()
+    assert len(list((tmp_path / "BTCUSDT" / "1m").glob("*.arrow"))) <= 8
+    assert store.read("BTCUSDT", "1m")["timestamp"].tolist() == expected
+
+
+def test_closed_bars_drops_the_forming_kline():
+    bars = _bars("2024-01-01", 3)
+    assert len(closed_bars(bars, "1m", now="2024-01-01 00:02:30")) == 2
+    assert len(closed_bars(bars, "1m", now="2024-01-01 00:03")) == 3
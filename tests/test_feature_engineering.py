@@ -33,4 +33,36 @@ def test_preprocess_and_engineer_features():
     }
     assert expected_cols.issubset(processed.columns)
     # Ensure returned DataFrame retains original length
-    assert len(processed) == len(df)
\ No newline at end of file
+    assert len(processed) == len(df)
+
+def test_incremental_features_match_full_recomputation():
+    import numpy as np
+    from data.feature_engineering import IncrementalFeatureEngineer
+
+    rng = np.random.default_rng(5)
+    rows = 300
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=rows, freq="min"),
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": rng.integers(1, 100, rows),
+        }
+    )
+    full = preprocess_and_engineer_features(df)
+
+    engineer = IncrementalFeatureEngineer()
+    parts = [engineer.fit(df.iloc[:100])]
+    for start in range(100, rows, 7):
+        parts.append(engineer.update(df.iloc[start : start + 7]))
+    # already seen bars are ignored
+    assert engineer.update(df.iloc[-3:]).empty
+    incremental = pd.concat(parts, ignore_index=True)
+
+    assert list(incremental.columns) == list(full.columns)
+    for col in ["ema_10", "ema_20", "macd", "macd_signal", "returns", "log_returns"]:
+        pd.testing.assert_series_equal(incremental[col], full[col], check_exact=True)
+    pd.testing.assert_frame_equal(incremental, full, check_exact=False, rtol=1e-9)
@@ -5,28 +5,61 @@ sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 import pandas as pd
 from data.market_data_collector import MarketDataCollector
 
-def test_get_ohlcv_creates_file(tmp_path):
-    # Use tmp_path for raw and save dir
+def test_get_ohlcv_stores_closed_bars_only(tmp_path, monkeypatch):
+    import data.market_data_collector as mdc
+    from data.candle_store import closed_bars
+
+    # The last kline opens at ``now`` and is still forming; pin the clock so
+    # a minute boundary during the test cannot close it
+    now = pd.Timestamp("2024-05-01 12:00", tz="UTC")
+    clock = now + pd.Timedelta(seconds=30)
+    monkeypatch.setattr(mdc, "closed_bars", lambda df, tf: closed_bars(df, tf, clock.tz_localize(None)))
+
+    def fake_klines(symbol, interval, limit=100, start_time=None, end_time=None, session=None, base_url=None):
+        base = int((now - pd.Timedelta(minutes=limit - 1)).timestamp() * 1000)
+        return [
+            {"time": base + i * 60_000, "open": 1, "high": 2, "low": 0.5, "close": 1.5, "baseVol": 3}
+            for i in range(limit)
+        ]
+
+    monkeypatch.setattr(mdc, "get_klines", fake_klines)
     raw_dir = tmp_path / "raw"
-    raw_dir.mkdir()
-    collector = MarketDataCollector(raw_save_dir=raw_dir, save_dir=raw_dir)
+    collector = MarketDataCollector(raw_save_dir=raw_dir, save_dir=raw_dir, processed_dir=tmp_path / "processed")
 
-    df = collector.get_ohlcv("BTCUSDT", "1m", limit=1)
+    df = collector.get_ohlcv("BTCUSDT", "1m", limit=5)
 
     assert isinstance(df, pd.DataFrame)
-    assert not df.empty
-    print("GG")
-
-    expected_file = raw_dir / "BTCUSDT_1m.csv"
-    assert expected_file.exists(), f"Expected file not found: {expected_file}"
-    print("Saved file:", expected_file)
-
-    # Debug: Print first few rows of the DataFrame
-    print("Sample data:")
-    print(df.head())
-
-    # Simulate passing data to a strategy for signal testing
-    from strategies.scalper import ScalperBot
-    bot = ScalperBot(symbol="BTCUSDT", timeframe="1m", risk_pct=0.005)
-    signal = bot.generate_signal(df.tail(50))
-    print(f"Generated Signal: {signal}")
+    assert len(df) == 5
+    stored = collector.raw_store.read("BTCUSDT", "1m")
+    assert len(stored) == 4
+    assert stored["timestamp"].max() == now.tz_localize(None) - pd.Timedelta(minutes=1)
+
+    # A single forming kline stores nothing
+    collector.get_ohlcv("ETHUSDT", "1m", limit=1)
+    assert not collector.raw_store.has("ETHUSDT", "1m")
+
+
+def test_get_ohlcv_fans_out_concurrently(tmp_path, monkeypatch):
+    import time
+    import data.market_data_collector as mdc
+
+    def fake_klines(symbol, interval, limit=100, start_time=None, end_time=None, session=None, base_url=None):
+        time.sleep(0.2)
+        base = 1_700_000_000_000
+        return [
+            {"time": base + i * 60_000, "open": 1, "high": 2, "low": 0.5, "close": 1.5, "baseVol": 3}
+            for i in range(limit)
+        ]
+
+    monkeypatch.setattr(mdc, "get_klines", fake_klines)
+    collector = MarketDataCollector(raw_save_dir=tmp_path / "raw", processed_dir=tmp_path / "processed")
+    symbols = [f"SYM{i}" for i in range(10)]
+    start = time.perf_counter()
+    frames = collector.get_ohlcv(symbols, ["1m", "5m"], limit=30)
+    elapsed = time.perf_counter() - start
+
+    assert list(frames) == [(s, tf) for s in symbols for tf in ["1m", "5m"]]
+    assert all(len(df) == 30 for df in frames.values())
+    assert collector.processed_store.has("SYM9", "5m")
+    # 20 requests of 0.2s each complete in roughly one round trip
+    assert elapsed < 2.0
@@ -0,0 +1,67 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+import pytest
+
+from analysis.metrics import RunningMetrics, drawdown_duration, max_drawdown, summarize
+from dashboard.dashboard import PerformanceMetrics
+
+
+def _reference_drawdown(equity):
+    peak, max_dd = equity[0], 0.0
+    for val in equity:
+        peak = max(peak, val)
+        max_dd = max(max_dd, peak - val)
+    return max_dd
+
+
+def test_vectorized_drawdown_matches_loop():
+    rng = np.random.default_rng(0)
+    equity = (1000 + np.cumsum(rng.normal(0, 10, 5000))).tolist()
+    assert max_drawdown(equity) == pytest.approx(_reference_drawdown(equity))
+    assert drawdown_duration([10, 12, 11, 11, 13, 9, 14]) == 2
+
+
+def test_running_metrics_match_summary():
+    rng = np.random.default_rng(1)
+    pnls = rng.normal(5, 50, 2000)
+    equity = np.concatenate(([10_000.0], 10_000.0 + np.cumsum(pnls)))
+    full = summarize(pnls, equity, 10_000.0)
+    running = RunningMetrics(10_000.0)
+    for pnl in pnls:
+        running.update(pnl)
+    snap = running.snapshot()
+    for key, value in snap.items():
+        assert value == pytest.approx(full[key], rel=1e-9, abs=1e-9), key
+
+
+def test_summary_edge_cases():
+    empty = summarize([], [100.0], 100.0)
+    assert empty["trades"] == 0 and empty["profit_factor"] == 0.0
+    assert summarize([5.0], [100.0, 105.0], 100.0, 3, 10)["exposure"] == 30.0
+
+
+def test_performance_metrics_running_stats():
+    metrics = PerformanceMetrics(100.0)
+    for side, qty, price in [("buy", 1, 10), ("sell", 1, 12), ("buy", 1, 15), ("sell", 1, 11), ("buy", 2, 50)]:
+        metrics.record_trade(side, qty, price)
+    assert metrics.win_rate() == 50.0
+    assert metrics.pnl() == -102.0
+    assert metrics.drawdown() == 104.0
+    # Re-basing the balance replays the trades, as BotEngine does after construction
+    metrics.initial_balance = 200.0
+    assert metrics.drawdown() == 104.0
+    assert metrics.snapshot()["round_trips"] == 2
+
+
+def test_performance_metrics_pair_round_trips_per_symbol():
+    metrics = PerformanceMetrics(0.0)
+    metrics.record_trade("buy", 1, 100, "AAA")
+    metrics.record_trade("buy", 1, 10, "BBB")
+    metrics.record_trade("sell", 1, 9, "BBB")
+    metrics.record_trade("sell", 1, 101, "AAA")
+    assert metrics.round_trips.count == 2
+    assert metrics.win_rate() == 50.0
@@ -0,0 +1,83 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+import pandas as pd
+
+from analysis.optimizer import StrategyOptimizer
+from backtest.engine import BacktestEngine
+from data.candle_store import CandleStore
+from strategies.scalper import ScalperBot
+
+GRID = {"fast": [3, 5], "slow": [8, 13], "vol_threshold": [0.002, 0.01]}
+
+
+def _frame(seed: int, rows: int = 3000) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, rows)))
+    spread = np.abs(rng.normal(0, 0.002, rows)) * close
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=rows, freq="min"),
+            "open": close,
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.lognormal(3, 0.5, rows),
+        }
+    )
+
+
+def _data():
+    return {("AAA", "1m"): _frame(1), ("BBB", "1m"): _frame(2)}
+
+
+def test_grid_search_matches_plain_backtests(tmp_path):
+    data = _data()
+    optimizer = StrategyOptimizer(ScalperBot, GRID, data=data, workers=1, results_path=tmp_path / "sweep.csv")
+    table = optimizer.grid_search()
+    assert len(table) == 8
+    assert len(pd.read_csv(tmp_path / "sweep.csv")) == 8
+    # Shared indicators were computed once per series, not per parameter set
+    assert optimizer._caches[("AAA", "1m")].hits > 0
+    best = table.iloc[0]
+    params = {name: best[name] for name in GRID}
+    engine = BacktestEngine(data, [ScalperBot(sym, tf, **params) for sym, tf in data])
+    engine.run()
+    assert engine.summary()["net_profit"] == best["net_profit"]
+
+
+def test_process_workers_match_inline():
+    inline = StrategyOptimizer(ScalperBot, GRID, data=_data(), workers=1).grid_search()
+    streamed = []
+    parallel = StrategyOptimizer(ScalperBot, GRID, data=_data(), workers=2, on_result=streamed.append)
+    table = parallel.grid_search()
+    assert len(streamed) == 8
+    key = list(GRID)
+    pd.testing.assert_frame_equal(
+        inline.sort_values(key).reset_index(drop=True), table.sort_values(key).reset_index(drop=True)
+    )
+
+
+def test_random_and_halving_search():
+    optimizer = StrategyOptimizer(ScalperBot, GRID, data=_data(), workers=1)
+    assert len(optimizer.random_search(3, seed=1)) == 3
+    table = optimizer.successive_halving(eta=2, min_bars=500)
+    final = table[table["rung"] == table["rung"].max()]
+    assert len(final) == 1
+    assert final["bars"].iloc[0] == 6000
+    assert (table["rung"] == 0).sum() == 8
+    params, score = optimizer.optimize("halving", eta=2, min_bars=500)
+    assert set(params) == set(GRID)
+
+
+def test_loads_from_candle_store(tmp_path):
+    store = CandleStore(tmp_path)
+    store.append("AAA", "1m", _frame(1, 600))
+    store.append("AAA", "5m", _frame(2, 600))
+    optimizer = StrategyOptimizer(ScalperBot, {"fast": [3]}, symbol="AAA", timeframe="1m", store_dir=tmp_path, workers=1)
+    params, _ = optimizer.optimize()
+    assert params == {"fast": 3}
+    assert list(optimizer.data) == [("AAA", "1m")]
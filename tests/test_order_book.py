@@ -0,0 +1,104 @@
+import sys
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from backtest.engine import BacktestEngine
+from data.order_book import OrderBook, OrderBookManager
+from strategies.base import BaseStrategy, Signal
+
+
+def _book():
+    book = OrderBook("BTCUSDT")
+    book.apply_snapshot(
+        bids=[["99.5", "2"], ["100", "1"], ["99", "3"]],
+        asks=[["101", "1"], ["102", "2"], ["101.5", "0"]],
+    )
+    return book
+
+
+def test_snapshot_and_top_of_book():
+    book = _book()
+    assert book.best_bid == 100.0
+    assert book.best_ask == 101.0
+    assert book.mid == 100.5
+    assert book.spread == 1.0
+    prices, qtys = book.bids.top()
+    assert prices.tolist() == [100.0, 99.5, 99.0]
+    assert qtys.tolist() == [1.0, 2.0, 3.0]
+    assert len(book.asks) == 2
+
+
+def test_incremental_updates_match_reference():
+    rng = np.random.default_rng(1)
+    book = OrderBook()
+    reference = {"bid": {}, "ask": {}}
+    for _ in range(5000):
+        bid = rng.random() < 0.5
+        price = float(np.round(100 + (-1 if bid else 1) * rng.integers(1, 50) * 0.1, 1))
+        qty = 0.0 if rng.random() < 0.3 else float(rng.integers(1, 10))
+        side = reference["bid" if bid else "ask"]
+        if qty:
+            side[price] = qty
+        else:
+            side.pop(price, None)
+        book.apply_update(bids=[(price, qty)] if bid else (), asks=() if bid else [(price, qty)])
+    bids, _ = book.bids.top()
+    asks, _ = book.asks.top()
+    assert bids.tolist() == sorted(reference["bid"], reverse=True)
+    assert asks.tolist() == sorted(reference["ask"])
+    assert book.best_bid == max(reference["bid"])
+    assert book.best_ask == min(reference["ask"])
+
+
+def test_weighted_price_and_slippage():
+    book = _book()
+    assert book.weighted_price("ask", 2) == pytest.approx((101 * 1 + 102 * 2) / 3)
+    assert book.estimate_fill("buy", 2) == pytest.approx((101 + 102) / 2)
+    assert book.estimate_fill("sell", 2) == pytest.approx((100 + 99.5) / 2)
+    # Beyond visible depth the remainder fills at the worst level
+    assert book.estimate_fill("buy", 4) == pytest.approx((101 + 102 * 3) / 4)
+    assert book.slippage_pct("buy", 1) == pytest.approx(0.5 / 100.5)
+    assert OrderBook().slippage_pct("buy", 1) is None
+
+
+def test_manager_handles_ws_and_rest_payloads():
+    manager = OrderBookManager()
+    manager.on_depth("ETHUSDT", {"bids": [["10", "1"]], "asks": [["11", "1"]]})
+    manager.on_message({"ch": "depth_book1", "symbol": "BTCUSDT", "ts": 5, "data": {"b": [["1", "2"]], "a": [["2", "3"]]}})
+    assert manager.on_message({"ch": "trade", "data": []}) is None
+    assert manager.books["ETHUSDT"].mid == 10.5
+    assert manager.books["BTCUSDT"].spread == 1.0
+    assert manager.books["BTCUSDT"].ts == 5
+
+
+class _BuyOnce(BaseStrategy):
+    def __init__(self):
+        super().__init__("buy_once", "BTCUSDT", "1m", risk_pct=1.0)
+
+    def generate_signal(self, df):
+        return Signal(action="buy") if len(df) == 1 else None
+
+
+def test_backtest_uses_book_slippage():
+    df = pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=3, freq="min"),
+            "open": [100.0] * 3,
+            "high": [100.0] * 3,
+            "low": [100.0] * 3,
+            "close": [100.0] * 3,
+            "volume": [1.0] * 3,
+        }
+    )
+    book = OrderBook("BTCUSDT")
+    book.apply_snapshot([(99.9, 1000)], [(100.1, 1000)])
+    engine = BacktestEngine({("BTCUSDT", "1m"): df}, [_BuyOnce()], order_books={"BTCUSDT": book})
+    engine.run()
+    trade = engine.trade_log[0]
+    assert trade.entry_price == pytest.approx(100.1)
+    assert trade.exit_price == pytest.approx(99.9)
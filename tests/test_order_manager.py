@@ -0,0 +1,130 @@
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from execution.order_manager import OrderManager
+from utils.trade_logger import TradeLogger
+
+
+class SlowBroker:
+    """Broker whose every call takes one simulated round trip."""
+
+    def __init__(self, latency=0.05):
+        self.latency = latency
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def _call(self, *args):
+        time.sleep(self.latency)
+        with self._lock:
+            self.calls.append(args)
+
+    def market_order(self, symbol, side, qty):
+        self._call("market", symbol, side, qty)
+        return {"side": side, "symbol": symbol, "qty": qty, "price": None}
+
+    def limit_order(self, symbol, side, qty, price):
+        self._call("limit", symbol, side, qty, price)
+        return {"side": side, "symbol": symbol, "qty": qty, "price": price}
+
+    def cancel_orders(self, symbol, order_ids):
+        self._call("cancel", symbol, tuple(order_ids))
+        return {"symbol": symbol, "cancelled": list(order_ids)}
+
+
+def test_batch_of_50_orders_takes_about_one_round_trip():
+    broker = SlowBroker()
+    manager = OrderManager(broker, auto_flush=False)
+    orders = [{"side": "buy", "symbol": f"S{i}USDT", "qty": 1.0} for i in range(50)]
+    start = time.perf_counter()
+    results = manager.place_orders(orders)
+    elapsed = time.perf_counter() - start
+    manager.close()
+    assert [r["symbol"] for r in results] == [o["symbol"] for o in orders]
+    assert len(broker.calls) == 50
+    assert elapsed < 50 * broker.latency / 5
+
+
+def test_same_side_intents_are_merged_per_symbol():
+    broker = SlowBroker(latency=0)
+    manager = OrderManager(broker, auto_flush=False)
+    buys = [manager.submit("BUY", "BTCUSDT", 1.0), manager.submit("buy", "BTCUSDT", 0.5)]
+    limits = [manager.submit("buy", "XRPUSDT", 5, price=0.5, order_type="limit") for _ in range(2)]
+    manager.flush()
+    first, second = (f.result(1) for f in buys)
+    assert (first["side"], first["qty"], second["qty"]) == ("buy", 1.0, 0.5)
+    assert first["order"] is second["order"] and first["order"]["qty"] == 1.5
+    assert [f.result(1)["qty"] for f in limits] == [5, 5]
+    assert limits[0].result()["order"]["qty"] == 10
+    manager.close()
+    assert sorted(call[0] for call in broker.calls) == ["limit", "market"]
+
+
+def test_opposite_market_orders_are_not_netted(tmp_path):
+    broker = SlowBroker(latency=0)
+    logger = TradeLogger(str(tmp_path / "journal.db"))
+    manager = OrderManager(broker, logger=logger, auto_flush=False)
+    buy = manager.submit("buy", "BTCUSDT", 1.0)
+    sell = manager.submit("sell", "BTCUSDT", 0.4)
+    flat = [manager.submit("buy", "ETHUSDT", 2.0), manager.submit("sell", "ETHUSDT", 2.0)]
+    manager.flush()
+    assert (buy.result(1)["side"], buy.result()["qty"]) == ("buy", 1.0)
+    assert (sell.result(1)["side"], sell.result()["qty"]) == ("sell", 0.4)
+    assert [(f.result(1)["side"], f.result()["qty"]) for f in flat] == [("buy", 2.0), ("sell", 2.0)]
+    assert all("status" not in f.result() for f in [buy, sell] + flat)
+    manager.close()
+    logger.close()
+    assert sorted(call[1:] for call in broker.calls) == [
+        ("BTCUSDT", "buy", 1.0),
+        ("BTCUSDT", "sell", 0.4),
+        ("ETHUSDT", "buy", 2.0),
+        ("ETHUSDT", "sell", 2.0),
+    ]
+    journal = sqlite3.connect(tmp_path / "journal.db").execute("SELECT symbol, side, qty FROM trades").fetchall()
+    assert sorted(journal) == [("BTCUSDT", "buy", 1.0), ("BTCUSDT", "sell", 0.4), ("ETHUSDT", "buy", 2.0), ("ETHUSDT", "sell", 2.0)]
+
+
+def test_auto_flush_and_grouped_cancels():
+    broker = SlowBroker(latency=0)
+    manager = OrderManager(broker, linger=0.001)
+    cancels = [manager.cancel("BTCUSDT", str(i)) for i in range(3)]
+    order = manager.submit("buy", "BTCUSDT", 1.0)
+    assert order.result(1)["qty"] == 1.0
+    assert all(f.result(1)["cancelled"] == ["0", "1", "2"] for f in cancels)
+    manager.close()
+    assert [call for call in broker.calls if call[0] == "cancel"] == [("cancel", "BTCUSDT", ("0", "1", "2"))]
+
+
+def test_journal_is_written_by_the_logger_and_flushed_on_close(tmp_path):
+    logger = TradeLogger(str(tmp_path / "journal.db"))
+    manager = OrderManager(SlowBroker(latency=0), logger=logger, auto_flush=False)
+    orders = [{"side": "buy", "symbol": f"S{i}", "qty": 1.0, "price": 10.0, "order_type": "limit"} for i in range(20)]
+    manager.place_orders(orders)
+    manager.close()
+    logger.close()
+    rows = sqlite3.connect(tmp_path / "journal.db").execute("SELECT COUNT(*) FROM trades").fetchone()
+    assert rows == (20,)
+
+
+def test_bad_journal_row_does_not_drop_the_others(tmp_path):
+    class PartialBroker(SlowBroker):
+        def limit_order(self, symbol, side, qty, price):
+            order = super().limit_order(symbol, side, qty, price)
+            if symbol == "BAD":
+                del order["qty"]
+            return order
+
+    logger = TradeLogger(str(tmp_path / "journal.db"))
+    manager = OrderManager(PartialBroker(latency=0), logger=logger, auto_flush=False)
+    symbols = ["S0", "BAD", "S1", "S2"]
+    orders = [{"side": "buy", "symbol": s, "qty": 1.0, "price": 10.0, "order_type": "limit"} for s in symbols]
+    results = manager.place_orders(orders)
+    manager.close()
+    logger.close()
+    assert [r["symbol"] for r in results] == symbols
+    journal = sqlite3.connect(tmp_path / "journal.db").execute("SELECT symbol FROM trades").fetchall()
+    assert sorted(journal) == [("S0",), ("S1",), ("S2",)]
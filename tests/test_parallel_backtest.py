@@ -0,0 +1,118 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+import pandas as pd
+
+from backtest.engine import BacktestEngine
+from backtest.parallel import ParallelBacktestEngine, SharedFrameStore, _attach_frame
+from strategies.grid import GridBot
+from strategies.liquidity_sweep import LiquiditySweepBot
+from strategies.scalper import ScalperBot
+
+
+def _frame(seed: int, rows: int = 400) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, rows)))
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=rows, freq="min"),
+            "open": close,
+            "high": close * 1.001,
+            "low": close * 0.999,
+            "close": close,
+            "volume": rng.integers(1, 100, rows),
+        }
+    )
+
+
+def _setup():
+    data = {("AAA", "1m"): _frame(1), ("BBB", "1m"): _frame(2)}
+    strategies = [
+        cls(symbol=symbol, timeframe=tf)
+        for cls in (ScalperBot, GridBot, LiquiditySweepBot)
+        for symbol, tf in data
+    ]
+    return data, strategies
+
+
+def test_parallel_matches_inline_and_single_cells():
+    data, strategies = _setup()
+    parallel = ParallelBacktestEngine(data, strategies, workers=2)
+    parallel.run()
+    inline = ParallelBacktestEngine(*_setup(), workers=1)
+    inline.run()
+    assert parallel.trade_log
+    assert parallel.trade_log == inline.trade_log
+    assert parallel.summary() == inline.summary()
+    assert parallel.per_strategy_metrics() == inline.per_strategy_metrics()
+
+    # each cell equals a standalone run of that strategy
+    data, strategies = _setup()
+    expected = []
+    for key in data:
+        for strategy in strategies:
+            if (strategy.symbol, strategy.timeframe) == key:
+                engine = BacktestEngine({key: data[key]}, [strategy])
+                engine.run()
+                expected.extend(engine.trade_log)
+    assert parallel.trade_log == expected
+
+
+def _labelled_frame(seed: int) -> pd.DataFrame:
+    df = _frame(seed)
+    df["timestamp"] = df["timestamp"].dt.tz_localize("Asia/Tehran")
+    df.insert(1, "venue", "bitunix")
+    return df
+
+
+def test_shared_frames_keep_column_order_dtypes_and_tz():
+    df = _frame(3)
+    df["timestamp"] = df["timestamp"].dt.tz_localize("Asia/Tehran")
+    df.insert(0, "close_time", df["timestamp"].dt.tz_localize(None).astype("datetime64[us]"))
+    df["closed"] = True
+    labelled = _labelled_frame(4)
+    with SharedFrameStore({("AAA", "1m"): df, ("BBB", "1m"): labelled}) as store:
+        assert store.handles[("AAA", "1m")][0] == "shm"
+        assert store.handles[("BBB", "1m")][0] == "pickle"
+        for key, original in ((("AAA", "1m"), df), (("BBB", "1m"), labelled)):
+            attached, shm = _attach_frame(store.handles[key])
+            pd.testing.assert_frame_equal(attached, original)
+            if shm is not None:
+                del attached
+                shm.close()
+
+
+def test_parallel_matches_serial_on_tz_aware_labelled_frames():
+    def setup():
+        data = {("AAA", "1m"): _labelled_frame(1), ("BBB", "1m"): _labelled_frame(2).drop(columns="venue")}
+        strategies = [cls(symbol=s, timeframe=tf) for cls in (ScalperBot, GridBot) for s, tf in data]
+        return data, strategies
+
+    parallel = ParallelBacktestEngine(*setup(), workers=2)
+    parallel.run()
+    data, strategies = setup()
+    expected = []
+    for key in data:
+        for strategy in strategies:
+            if (strategy.symbol, strategy.timeframe) == key:
+                engine = BacktestEngine({key: data[key]}, [strategy])
+                engine.run()
+                expected.extend(engine.trade_log)
+    assert parallel.trade_log
+    assert str(parallel.trade_log[0].entry_time.tz) == "Asia/Tehran"
+    assert parallel.trade_log == expected
+
+
+def test_run_backtest_results_do_not_depend_on_workers(monkeypatch):
+    from backtest import run_backtest
+
+    monkeypatch.setattr(BacktestEngine, "save_trade_log", lambda self, path=None: None)
+    data = {("AAA", "1m"): _frame(5, rows=200), ("BBB", "1m"): _frame(6, rows=200)}
+    serial = run_backtest.run(workers=1, data=data)
+    parallel = run_backtest.run(workers=3, data=data)
+    assert serial.trade_log
+    assert serial.trade_log == parallel.trade_log
+    assert serial.summary() == parallel.summary()
@@ -1,9 +1,19 @@
 import sys
+import threading
+import time
 from pathlib import Path
 
+import numpy as np
+import pytest
+
 sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
 
+from core.arbitration_engine import ArbitrationEngine
+from core.replay_buffer import ReplayBuffer
 from core.rl_arbitrator import RLArbitrator
+from core.rl_trainer import BackgroundTrainer, RLTrainer
+from core.state_encoder import StateEncoder
+from engine.score_manager import ScoreManager
 
 
 def test_action_mapping():
@@ -21,4 +31,112 @@ def test_action_mapping():
     ]
     arb = RLArbitrator(strategies)
     assert arb.action_space.n == 10
-    assert len(arb.strategies) == 10
\ No newline at end of file
+    assert len(arb.strategies) == 10
+
+def _arbitrator(algo="dqn"):
+    return RLArbitrator([f"S{i}" for i in range(4)], state_size=3, algo=algo, buffer_size=5000)
+
+
+def _rewarded_transitions(arb, n=2000, good=2):
+    rng = np.random.default_rng(1)
+    for _ in range(n):
+        state = rng.normal(size=3).astype(np.float32)
+        action = int(rng.integers(4))
+        arb.memory.append((state, action, 1.0 if action == good else -1.0, state, True))
+
+
+def test_batched_selection_matches_model_predict():
+    for algo in ("dqn", "ppo"):
+        arb = _arbitrator(algo)
+        obs = np.random.default_rng(0).normal(size=(64, 3)).astype(np.float32)
+        expected, _ = arb.model.predict(obs, deterministic=True)
+        keys = [(f"SYM{i}", "1m") for i in range(64)]
+        assert arb.select_batch(keys, obs) == [f"S{a}" for a in expected]
+        assert arb.pending[("SYM5", "1m")][1] == int(expected[5])
+
+
+def test_selection_can_be_restricted_to_candidates():
+    arb = _arbitrator()
+    obs = np.random.default_rng(0).normal(size=(32, 3))
+    picks = arb.select_batch([("X", "1m")] * 32, obs, strategies=["S1", "S3"])
+    assert set(picks) <= {"S1", "S3"}
+    assert arb.select_strategy("X", "1m", ["S0"]) == "S0"
+
+
+def test_update_by_key_fills_replay_buffer():
+    arb = _arbitrator()
+    arb.select_batch([("BTCUSDT", "1m"), ("ETHUSDT", "5m")], np.zeros((2, 3)))
+    arb.update(1.0, np.ones(3), key=("ETHUSDT", "5m"))
+    arb.update(1.0, np.ones(3), key=("ETHUSDT", "5m"))
+    assert len(arb.memory) == 1
+    assert ("BTCUSDT", "1m") in arb.pending
+
+
+def test_replay_buffer_wraps_and_tracks_new_rows():
+    buffer = ReplayBuffer(4, 2)
+    for i in range(6):
+        buffer.append((np.full(2, i), i, float(i), np.full(2, i + 1), False))
+    assert len(buffer) == 4 and buffer.total == 6
+    (states, actions, *_), cursor = buffer.since(3)
+    assert actions.tolist() == [3, 4, 5] and cursor == 6
+    buffer.add_batch(np.zeros((6, 2)), np.arange(10, 16), np.zeros(6), np.zeros((6, 2)), np.ones(6))
+    assert sorted(buffer.actions.tolist()) == [12, 13, 14, 15]
+    assert buffer.sample(8, np.random.default_rng(0))[1].shape == (8,)
+
+
+def test_trainer_learns_rewarded_action():
+    for algo in ("dqn", "ppo"):
+        arb = _arbitrator(algo)
+        _rewarded_transitions(arb)
+        RLTrainer(arb, batch_size=64, seed=0).train(steps=400)
+        obs = np.random.default_rng(2).normal(size=(50, 3))
+        assert set(arb.select_batch([("X", "1m")] * 50, obs)) == {"S2"}
+
+
+def test_background_training_hot_swaps_without_blocking_selection():
+    arb = _arbitrator()
+    _rewarded_transitions(arb)
+    trainer = BackgroundTrainer(arb, interval=3600, steps=400, batch_size=64).start()
+    obs = np.random.default_rng(2).normal(size=(50, 3))
+    keys = [("X", "1m")] * 50
+    before = arb.policy
+    done = threading.Event()
+    worker = threading.Thread(target=lambda: (trainer.train_once(), done.set()))
+    worker.start()
+    slowest = 0.0
+    while not done.is_set():
+        start = time.perf_counter()
+        arb.select_batch(keys, obs)
+        slowest = max(slowest, time.perf_counter() - start)
+    worker.join()
+    trainer.close()
+    assert trainer.generation == 1 and arb.policy is not before
+    assert set(arb.select_batch(keys, obs)) == {"S2"}
+    assert slowest < 0.05
+
+
+def test_background_round_after_timeout_discards_stale_result():
+    arb = _arbitrator()
+    _rewarded_transitions(arb)
+    trainer = BackgroundTrainer(arb, interval=3600, steps=200, batch_size=64, timeout=0.001).start()
+    try:
+        with pytest.raises(TimeoutError):
+            trainer.train_once()
+        # the timed-out round's rows are not shipped again
+        assert trainer._cursor == arb.memory.total
+        trainer.timeout = 300
+        assert trainer.train_once()
+        assert trainer.generation == 1
+        assert trainer.trained_rows == len(arb.memory)
+    finally:
+        trainer.close()
+
+
+def test_arbitration_engine_uses_the_training_state_encoder():
+    engine = ArbitrationEngine(["ScalperBot", "GridBot"], ScoreManager())
+    assert engine.arbitrator.state_size == StateEncoder().dim
+    market = {"volatility_5": 0.02, "recent_return": 0.01, "drawdown": -0.05}
+    assert engine.select_strategy("BTCUSDT", "1m", market) in ("ScalperBot", "GridBot")
+    engine.update_rewards("ScalperBot", 1.0, "BTCUSDT", "1m", market)
+    assert len(engine.arbitrator.memory) == 1
+    assert engine.arbitrator.memory.states[0].any()
@@ -0,0 +1,81 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+import pandas as pd
+
+from core.state_encoder import FEATURES, StateEncoder, encode_state
+from data.feature_engineering import preprocess_and_engineer_features
+
+ROOT = Path(__file__).resolve().parents[1]
+
+
+def _candles(seed, rows=60):
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=rows, freq="min"),
+            "open": close,
+            "high": close * 1.01,
+            "low": close * 0.99,
+            "close": close,
+            "volume": rng.integers(1, 100, rows),
+        }
+    )
+
+
+def test_encodes_batch_from_feature_columns():
+    frames = {(f"S{i}USDT", tf): preprocess_and_engineer_features(_candles(i)) for i in range(5) for tf in ("1m", "5m")}
+    encoder = StateEncoder()
+    keys, states = encoder.encode_latest(frames)
+    assert keys == list(frames)
+    assert states.shape == (10, encoder.dim) and states.dtype == np.float32
+    assert np.isfinite(states).all() and np.abs(states).max() <= 3
+    last = frames[("S3USDT", "5m")].iloc[-1]
+    row = states[keys.index(("S3USDT", "5m"))]
+    assert row[FEATURES.index("rsi")] == np.float32(np.tanh((last["rsi_14"] - 50) / 50))
+    assert np.allclose(row[FEATURES.index("returns")], np.tanh(last["returns"]))
+
+
+def test_encode_latest_of_no_frames_is_empty():
+    encoder = StateEncoder()
+    keys, states = encoder.encode_latest({})
+    assert keys == []
+    assert states.shape == (0, encoder.dim) and states.dtype == np.float32
+
+
+def test_embeddings_do_not_depend_on_order_and_missing_columns_are_zero():
+    frame = pd.DataFrame({"symbol": ["BTCUSDT", "ETHUSDT", "BTCUSDT"], "timeframe": ["1m", "1h", "4h"]})
+    a = StateEncoder().encode(frame)
+    b = StateEncoder(symbols=["ETHUSDT", "XRPUSDT"]).encode(frame.iloc[::-1].reset_index(drop=True))[::-1]
+    assert np.array_equal(a, b)
+    assert not a[:, : len(FEATURES)].any()
+    assert np.array_equal(a[0, len(FEATURES) : len(FEATURES) + 4], a[2, len(FEATURES) : len(FEATURES) + 4])
+
+
+def test_encoding_is_identical_across_processes():
+    script = (
+        "import pandas as pd; from core.state_encoder import StateEncoder, encode_state;"
+        "f = pd.DataFrame({'symbol': ['BTCUSDT', 'DOGEUSDT'], 'timeframe': ['1m', '15m']});"
+        "print(StateEncoder().encode(f).tobytes().hex(), encode_state('BTCUSDT', '1m', {}, {}).tobytes().hex())"
+    )
+    outputs = {
+        subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=ROOT,
+            env={**os.environ, "PYTHONHASHSEED": seed},
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        for seed in ("1", "2")
+    }
+    assert len(outputs) == 1
+    frame = pd.DataFrame({"symbol": ["BTCUSDT", "DOGEUSDT"], "timeframe": ["1m", "15m"]})
+    expected = StateEncoder().encode(frame).tobytes().hex() + " " + encode_state("BTCUSDT", "1m", {}, {}).tobytes().hex()
+    assert outputs == {expected + "\n"}
@@ -0,0 +1,112 @@
+import asyncio
+import csv
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import grpc
+
+from services.grpc import strategy_manager_pb2 as pb
+from services.grpc import strategy_manager_pb2_grpc
+from services.strategy_manager_server import StrategyManager, create_server
+
+
+class Router:
+    def __init__(self):
+        self.orders = []
+
+    def execute(self, order):
+        self.orders.append(order)
+
+
+def _signal(symbol="BTCUSDT", side="buy", strategy="alpha", confidence=0.8):
+    return pb.SignalMessage(
+        strategy_name=strategy,
+        symbol=symbol,
+        timeframe="1m",
+        signal_type=side,
+        confidence=confidence,
+        entry_price=100.0,
+        sl=99.0,
+        tp=102.0,
+    )
+
+
+def _run(tmp_path, scenario, flush_interval=0.05):
+    router = Router()
+    manager = StrategyManager(
+        scores_file=str(tmp_path / "scores.json"),
+        log_file=str(tmp_path / "log.csv"),
+        flush_interval=flush_interval,
+        execution_router=router,
+    )
+
+    async def main():
+        server, port = await create_server(manager, "127.0.0.1:0")
+        try:
+            async with grpc.aio.insecure_channel(f"127.0.0.1:{port}") as channel:
+                return await scenario(strategy_manager_pb2_grpc.StrategyManagerStub(channel), manager)
+        finally:
+            await server.stop(grace=None)
+            await manager.close()
+
+    return asyncio.run(main()), router
+
+
+def _log_rows(tmp_path):
+    with open(tmp_path / "log.csv") as f:
+        return list(csv.reader(f))[1:]
+
+
+def test_batch_responses_keep_order_and_skip_duplicates(tmp_path):
+    async def scenario(stub, manager):
+        batch = pb.SignalBatch(signals=[_signal(), _signal(), _signal(side="sell"), _signal("ETHUSDT")])
+        return await stub.SendSignals(batch)
+
+    result, router = _run(tmp_path, scenario)
+    assert [r.message for r in result.responses] == ["ok", "duplicate signal ignored", "ok", "ok"]
+    assert [r.orders[0].side for r in result.responses if r.orders] == ["buy", "sell", "buy"]
+    assert [(o["symbol"], o["side"]) for o in router.orders] == [("BTCUSDT", "buy"), ("BTCUSDT", "sell"), ("ETHUSDT", "buy")]
+
+
+def test_stream_answers_each_signal(tmp_path):
+    async def scenario(stub, manager):
+        call = stub.StreamSignals()
+        replies = []
+        for side in ("buy", "sell", "sell"):
+            await call.write(_signal(side=side))
+            replies.append((await call.read()).message)
+        await call.done_writing()
+        return replies
+
+    replies, _ = _run(tmp_path, scenario)
+    assert replies == ["ok", "ok", "duplicate signal ignored"]
+
+
+def test_concurrent_unary_calls_share_one_consistent_state(tmp_path):
+    async def scenario(stub, manager):
+        signals = [_signal(f"S{i % 10}", ("buy", "sell")[i // 10 % 2], f"strat{i % 3}") for i in range(200)]
+        return await asyncio.gather(*(stub.SendSignal(s) for s in signals))
+
+    responses, router = _run(tmp_path, scenario)
+    accepted = sum(r.message == "ok" for r in responses)
+    assert accepted == len(router.orders) == len(_log_rows(tmp_path))
+    scores = json.loads((tmp_path / "scores.json").read_text())
+    assert sum(len(p["recent_outcomes"]) for p in scores.values()) == accepted
+
+
+def test_persistence_is_debounced_and_flushed_on_close(tmp_path):
+    async def scenario(stub, manager):
+        for i in range(50):
+            await stub.SendSignal(_signal(f"S{i}"))
+        written_early = (tmp_path / "scores.json.log").exists()
+        await asyncio.sleep(0.3)
+        return written_early, len(_log_rows(tmp_path))
+
+    (written_early, rows_after_interval), _ = _run(tmp_path, scenario, flush_interval=0.2)
+    assert not written_early
+    assert rows_after_interval == 50
+    assert len(_log_rows(tmp_path)) == 50
+    assert json.loads((tmp_path / "scores.json").read_text())["alpha"]["hit_rate"] == 1.0
@@ -0,0 +1,79 @@
+import json
+import random
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+from storage.strategy_score_store import OutcomeWindow, StrategyScoreStore
+
+
+def test_window_matches_full_recompute():
+    rng = random.Random(1)
+    window = OutcomeWindow(100)
+    history = []
+    for _ in range(1000):
+        value = rng.uniform(-1, 1)
+        window.push(value)
+        history.append(value)
+        recent = history[-100:]
+        assert window.outcomes() == recent
+        assert window.hit_rate == sum(v > 0 for v in recent) / len(recent)
+        assert window.average == pytest.approx(sum(recent) / len(recent), abs=1e-12)
+
+
+def test_reload_replays_log_and_compaction(tmp_path):
+    path = tmp_path / "scores.json"
+    store = StrategyScoreStore(str(path), window=5, save_interval=0, compact_every=7)
+    for i in range(10):
+        store.update_score(f"s{i % 2}", i - 4.5)
+        store.save()
+    # Seven records were compacted into the snapshot, three remain in the log
+    assert len(path.with_name("scores.json.log").read_text().splitlines()) == 3
+    reloaded = StrategyScoreStore(str(path), window=5)
+    assert reloaded.scores == store.scores
+    assert reloaded.get_score("s1")["recent_outcomes"] == [-3.5, -1.5, 0.5, 2.5, 4.5]
+    assert reloaded.get_score("s1")["hit_rate"] == 0.6
+
+
+def test_crash_between_rename_and_log_truncate_does_not_double_count(tmp_path):
+    path = tmp_path / "scores.json"
+    store = StrategyScoreStore(str(path), save_interval=0)
+    for result in (1.0, -1.0, 2.0):
+        store.update_score("alpha", result)
+    store.save()
+    log = path.with_name("scores.json.log").read_text()
+    store.compact()
+    # Restore the log as if the process died before emptying it, plus a torn line
+    path.with_name("scores.json.log").write_text(log + '[4, "alpha", 3.')
+    reloaded = StrategyScoreStore(str(path))
+    assert reloaded.get_score("alpha")["recent_outcomes"] == [1.0, -1.0, 2.0]
+    reloaded.update_score("alpha", 5.0)
+    reloaded.close()
+    assert StrategyScoreStore(str(path)).get_score("alpha")["recent_outcomes"] == [1.0, -1.0, 2.0, 5.0]
+
+
+def test_save_is_rate_limited(tmp_path):
+    path = tmp_path / "scores.json"
+    store = StrategyScoreStore(str(path), save_interval=60)
+    store.update_score("alpha", 1.0)
+    store.save()
+    store.update_score("alpha", 2.0)
+    store.save()
+    assert len(path.with_name("scores.json.log").read_text().splitlines()) == 1
+    store.close()
+    assert len(path.with_name("scores.json.log").read_text().splitlines()) == 2
+
+
+def test_loads_older_file_formats(tmp_path):
+    path = tmp_path / "scores.json"
+    path.write_text(json.dumps({
+        "old": 0.8,
+        "profile": {"strategy_name": "profile", "recent_outcomes": [1.0, -2.0], "last_updated": "x"},
+    }))
+    store = StrategyScoreStore(str(path))
+    assert store.get_score("old")["avg_return"] == 0.8
+    assert store.get_score("profile")["avg_return"] == -0.5
+    assert store.update_score("profile", 4.0)["avg_return"] == 1.0
@@ -0,0 +1,96 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from engine.regime_detector import RegimeDetector
+from utils.indicators import atr, ema, macd, rsi
+from utils.streaming_indicators import ATR, EMA, MACD, RSI, RollingMax, RollingMean, RollingMin, RollingStd
+
+
+def _prices(n: int = 300, seed: int = 3) -> list[float]:
+    rng = np.random.default_rng(seed)
+    return (100 * np.exp(np.cumsum(rng.normal(0, 0.01, n)))).tolist()
+
+
+def test_ema_rsi_macd_match_list_helpers():
+    prices = _prices()
+    e, r, m = EMA(10), RSI(14), MACD()
+    for i, price in enumerate(prices):
+        window = prices[: i + 1]
+        e.update(price)
+        r.update(price)
+        m.update(price)
+        if e.ready:
+            assert e.value == pytest.approx(ema(window, 10))
+        else:
+            assert ema(window, 10) is None
+        if r.ready:
+            assert r.value == pytest.approx(rsi(window, 14))
+        else:
+            assert rsi(window, 14) is None
+        if m.ready:
+            assert m.value == pytest.approx(macd(window))
+    assert e.ready and r.ready and m.ready
+
+
+def test_atr_matches_list_helper():
+    closes = _prices()
+    highs = [c * 1.01 for c in closes]
+    lows = [c * 0.99 for c in closes]
+    indicator = ATR(14)
+    for i in range(len(closes)):
+        value = indicator.update(highs[i], lows[i], closes[i])
+        expected = atr(highs[: i + 1], lows[: i + 1], closes[: i + 1], 14)
+        assert (value is None) == (expected is None)
+        if value is not None:
+            assert value == pytest.approx(expected)
+
+
+def test_rolling_windows_match_pandas():
+    prices = _prices(500)
+    series = pd.Series(prices)
+    expected = {
+        "mean": series.rolling(20).mean(),
+        "std": series.rolling(20).std(),
+        "max": series.rolling(20, min_periods=1).max(),
+        "min": series.rolling(20, min_periods=1).min(),
+    }
+    indicators = {"mean": RollingMean(20), "std": RollingStd(20), "max": RollingMax(20), "min": RollingMin(20)}
+    for i, price in enumerate(prices):
+        for key, ind in indicators.items():
+            value = ind.update(price)
+            if np.isnan(expected[key].iloc[i]):
+                assert value is None
+            else:
+                assert value == pytest.approx(expected[key].iloc[i], rel=1e-9)
+
+
+def test_seed_returns_latest_value():
+    prices = _prices(50)
+    assert EMA(10).seed(prices) == pytest.approx(ema(prices, 10))
+
+
+def test_regime_detector_uses_streaming_state():
+    detector = RegimeDetector(atr_period=3)
+    assert detector.detect() == "unknown"
+    for price in [100, 101, 102, 103, 104, 105]:
+        detector.on_data({"high": price + 0.5, "low": price - 0.5, "close": price})
+    assert detector.detect() == "trending"
+
+
+def test_regime_detector_keeps_bars_per_symbol():
+    detector = RegimeDetector(atr_period=3)
+    for i, price in enumerate([100, 101, 102, 103, 104, 105]):
+        detector.on_bar("BTCUSDT", "1m", {"high": price + 0.5, "low": price - 0.5, "close": price})
+        # a flat market on another symbol, interleaved bar by bar
+        flat = 50 + (i % 2) * 0.1
+        detector.on_bar("ETHUSDT", "1m", {"high": flat + 0.5, "low": flat - 0.5, "close": flat})
+    assert detector.detect("BTCUSDT", "1m") == "trending"
+    assert detector.detect("ETHUSDT", "1m") == "ranging"
+    assert detector.detect("BTCUSDT", "5m") == "unknown"
+    assert detector.detect() == "unknown"
@@ -0,0 +1,148 @@
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from engine.bot_engine import BotEngine
+from utils.telegram_notifier import TelegramDispatcher
+
+
+class StubTelegram:
+    """Local stand-in for the Telegram Bot API ``sendMessage`` endpoint."""
+
+    def __init__(self, delay=0.0, failures=0, status=500, retry_after=None):
+        self.delay = delay
+        self.failures = failures
+        self.status = status
+        self.retry_after = retry_after
+        self.messages = []
+        self.calls = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                time.sleep(stub.delay)
+                stub.calls += 1
+                if stub.failures:
+                    stub.failures -= 1
+                    payload = {"ok": False}
+                    if stub.retry_after is not None:
+                        payload["parameters"] = {"retry_after": stub.retry_after}
+                    self._reply(stub.status, payload)
+                    return
+                stub.messages.append((self.path, body))
+                self._reply(200, {"ok": True})
+
+            def _reply(self, status, payload):
+                data = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}"
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def _dispatcher(stub, **kwargs):
+    kwargs.setdefault("interval", 0.05)
+    return TelegramDispatcher("token", "chat", api_url=stub.url, **kwargs)
+
+
+def test_burst_is_coalesced_into_one_message():
+    stub = StubTelegram()
+    dispatcher = _dispatcher(stub, interval=0.2)
+    dispatcher.send("warm up")
+    assert dispatcher.flush(2)
+    for i in range(20):
+        dispatcher.send(f"alert {i}")
+    assert dispatcher.flush(2)
+    dispatcher.close()
+    stub.close()
+    assert len(stub.messages) == 2
+    path, body = stub.messages[1]
+    assert path == "/bottoken/sendMessage" and body["chat_id"] == "chat"
+    assert body["text"].splitlines() == [f"alert {i}" for i in range(20)]
+
+
+def test_send_never_waits_for_slow_endpoint():
+    stub = StubTelegram(delay=0.3)
+    dispatcher = _dispatcher(stub)
+    start = time.perf_counter()
+    for i in range(200):
+        dispatcher.send(f"alert {i}")
+    assert time.perf_counter() - start < 0.1
+    assert dispatcher.flush(5)
+    dispatcher.close()
+    stub.close()
+    assert sum(len(body["text"].splitlines()) for _, body in stub.messages) == 200
+
+
+def test_failed_sends_are_retried_with_backoff():
+    stub = StubTelegram(failures=2, status=429, retry_after=0.05)
+    dispatcher = _dispatcher(stub, backoff=0.01)
+    dispatcher.send("trade opened")
+    assert dispatcher.flush(2)
+    dispatcher.close()
+    stub.close()
+    assert stub.calls == 3
+    assert [body["text"] for _, body in stub.messages] == ["trade opened"]
+    assert dispatcher.sent == 1 and dispatcher.failed == 0
+
+
+def test_gives_up_after_max_retries():
+    stub = StubTelegram(failures=10)
+    dispatcher = _dispatcher(stub, max_retries=2, backoff=0.01)
+    dispatcher.send("lost")
+    assert dispatcher.flush(2)
+    dispatcher.close()
+    stub.close()
+    assert stub.calls == 3 and dispatcher.failed == 1
+
+
+def test_overload_drops_and_summarises():
+    stub = StubTelegram(delay=0.2)
+    dispatcher = _dispatcher(stub, max_queue=5)
+    dispatcher.send("first")
+    time.sleep(0.1)
+    accepted = [dispatcher.send(f"alert {i}") for i in range(20)]
+    assert accepted.count(True) == 5 and dispatcher.dropped == 15
+    assert dispatcher.flush(3)
+    dispatcher.close()
+    stub.close()
+    assert stub.messages[-1][1]["text"].endswith("15 alerts dropped while the queue was full")
+
+
+def test_bot_engine_alerts_do_not_block_on_telegram():
+    class Orders:
+        def place_order(self, side, symbol, qty, price=None, order_type="market"):
+            return {"side": side, "symbol": symbol}
+
+    class Risk:
+        def size_position(self, balance, price):
+            return 1.0
+
+    stub = StubTelegram(delay=0.5)
+    dispatcher = _dispatcher(stub)
+    engine = BotEngine(order_manager=Orders(), risk_manager=Risk(), notifier=dispatcher, symbol="ETHUSDT")
+    start = time.perf_counter()
+    for price in (100.0, 101.0, 102.0):
+        engine._execute("buy", price)
+    assert time.perf_counter() - start < 0.1
+    dispatcher.close()
+    stub.close()
+    assert stub.messages[0][1]["text"].startswith("BUY ETHUSDT 1 @ 100")
@@ -0,0 +1,47 @@
+import sqlite3
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from utils.trade_logger import TradeLogger
+
+
+def _trade(i, symbol="BTCUSDT"):
+    timestamp = f"2024-01-01T00:{i // 60:02d}:{i % 60:02d}"
+    return {"timestamp": timestamp, "side": "buy", "symbol": symbol, "qty": 1.0, "price": 100.0 + i}
+
+
+def test_rows_are_buffered_and_flushed_on_close(tmp_path):
+    path = tmp_path / "journal.db"
+    logger = TradeLogger(str(path), batch_size=1000, flush_interval=60)
+    logger.log_trades(_trade(i) for i in range(10))
+    logger.log_trade({"side": "sell", "symbol": "ETHUSDT", "amount": "2", "price": None})
+    logger.close()
+    conn = sqlite3.connect(path)
+    assert conn.execute("SELECT COUNT(*) FROM trades").fetchone() == (11,)
+    assert conn.execute("PRAGMA journal_mode").fetchone() == ("wal",)
+    indexes = [row[1] for row in conn.execute("PRAGMA index_list(trades)")]
+    assert "idx_trades_symbol_timestamp" in indexes
+
+
+def test_size_threshold_triggers_write(tmp_path):
+    path = tmp_path / "journal.db"
+    logger = TradeLogger(str(path), batch_size=5, flush_interval=60)
+    logger.log_trades(_trade(i) for i in range(5))
+    deadline = time.monotonic() + 2
+    count = 0
+    while time.monotonic() < deadline and count < 5:
+        count = sqlite3.connect(path).execute("SELECT COUNT(*) FROM trades").fetchone()[0]
+        time.sleep(0.01)
+    assert count == 5
+    logger.close()
+
+
+def test_trades_query_filters_by_symbol_and_time(tmp_path):
+    logger = TradeLogger(str(tmp_path / "journal.db"), flush_interval=60)
+    logger.log_trades([_trade(i, "BTCUSDT") for i in range(5)] + [_trade(i, "ETHUSDT") for i in range(5)])
+    rows = logger.trades("ETHUSDT", start="2024-01-01T00:00:02", end="2024-01-01T00:00:03")
+    assert [(r[2], r[4]) for r in rows] == [("ETHUSDT", 102.0), ("ETHUSDT", 103.0)]
+    logger.close()
@@ -0,0 +1,155 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from backtest.backtester import Backtester
+from backtest.engine import BacktestEngine
+from engine.brokers import LiveBroker, SimulatedBroker
+from engine.events import BAR, FILL, TICK, Event, EventLoop
+from engine.feeds import FrameFeed, ReplayFeed
+from engine.trading_core import TradingCore
+from strategies.base import BaseStrategy
+from strategies.breakout import BreakoutBot
+from strategies.liquidity_sweep import LiquiditySweepBot
+from strategies.scalper import ScalperBot
+
+
+def _random_walk(rows: int = 600, seed: int = 7) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, rows)))
+    spread = np.abs(rng.normal(0, 0.002, rows)) * close
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=rows, freq="min"),
+            "open": close,
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.lognormal(3, 0.5, rows),
+        }
+    )
+
+
+class CountingStrategy(BaseStrategy):
+    def __init__(self, actions):
+        super().__init__("Counting")
+        self.actions = iter(actions)
+        self.calls = 0
+
+    def on_data(self, price):
+        pass
+
+    def generate_signal(self):
+        self.calls += 1
+        return next(self.actions)
+
+
+def test_loop_orders_by_timestamp_then_priority():
+    loop = EventLoop()
+    seen = []
+    for kind in (BAR, TICK, FILL):
+        loop.subscribe(kind, lambda event: seen.append((event.ts, event.kind)))
+
+    class Feed:
+        def __init__(self, events):
+            self._events = events
+
+        def events(self):
+            return iter(self._events)
+
+    loop.add_feed(Feed([Event(1, TICK), Event(3, TICK)]))
+    loop.add_feed(Feed([Event(1, BAR), Event(2, BAR)]))
+    loop.put(Event(1, FILL))
+    assert loop.run() == 5
+    assert seen == [(1, FILL), (1, BAR), (1, TICK), (2, BAR), (3, TICK)]
+
+
+@pytest.mark.parametrize("cls", [ScalperBot, BreakoutBot, LiquiditySweepBot])
+def test_core_matches_backtest_engine(cls):
+    data = {("TEST", "1m"): _random_walk()}
+    config = {"fee_pct": 0.001, "slippage_pct": 0.0005}
+    engine = BacktestEngine(data, [cls(symbol="TEST", timeframe="1m")], config, vectorized=False)
+    engine.run()
+
+    core = TradingCore([cls(symbol="TEST", timeframe="1m")], SimulatedBroker(**config))
+    core.add_feed(FrameFeed(data))
+    core.run()
+    core.close_positions()
+    assert engine.trade_log
+    assert core.trade_log == engine.trade_log
+    assert core.summary() == engine.summary()
+    assert core.evaluations == len(data[("TEST", "1m")])
+
+
+class FrameStrategy(BaseStrategy):
+    """Pandas strategy without ``accepts_bars``: buys above the running mean."""
+
+    def __init__(self):
+        super().__init__("Frame", "TEST", "1m")
+        self.lengths = []
+
+    def generate_signal(self, df):
+        self.lengths.append(len(df))
+        close = df["close"]
+        return "buy" if close.iloc[-1] > close.mean() else "sell"
+
+
+def test_frame_strategies_see_the_whole_history():
+    data = {("TEST", "1m"): _random_walk(200)}
+    strategy = FrameStrategy()
+    core = TradingCore([strategy])
+    actions = []
+    core.on_signal(lambda event, _, action: actions.append(action))
+    core.add_feed(FrameFeed(data))
+    core.run()
+    assert strategy.lengths == list(range(1, 201))
+    close = data[("TEST", "1m")]["close"]
+    expected = ["buy" if close.iloc[i] > close.iloc[: i + 1].mean() else "sell" for i in range(200)]
+    assert actions == expected
+
+
+def test_rolling_bar_window_keeps_results_and_exposure():
+    results = []
+    for max_bars in (None, 64):
+        core = TradingCore([LiquiditySweepBot(symbol="TEST", timeframe="1m")], SimulatedBroker(), max_bars=max_bars)
+        core.add_feed(FrameFeed({("TEST", "1m"): _random_walk()}))
+        core.run()
+        core.close_positions()
+        results.append((core.trade_log, core.summary(), len(core.bars[("TEST", "1m")])))
+    assert results[0][:2] == results[1][:2]
+    assert results[0][2] == 600 and results[1][2] == 64
+
+
+def test_backtester_evaluates_once_per_tick():
+    strategy = CountingStrategy(["buy", "hold", "sell"])
+    trades = Backtester(strategy).run([1.0, 2.0, 3.0])
+    assert trades == [("buy", 1.0), ("sell", 3.0)]
+    assert strategy.calls == 3
+
+
+def test_live_broker_places_orders_and_settles_fills():
+    class Manager:
+        def __init__(self):
+            self.orders = []
+
+        def place_order(self, side, symbol, qty, price=None, order_type="market"):
+            self.orders.append((side, symbol, qty))
+            return {"side": side, "avgPrice": str(price + 1)}
+
+    manager = Manager()
+    strategy = CountingStrategy(["buy", "hold", "sell"])
+    strategy.symbol = "BTCUSDT"
+    core = TradingCore([strategy], LiveBroker(manager), initial_balance=1000.0)
+    core.add_feed(ReplayFeed([100.0, 101.0, 102.0], symbol="BTCUSDT"))
+    core.run()
+    assert [order[0] for order in manager.orders] == ["BUY", "SELL"]
+    assert manager.orders[0][1] == "BTCUSDT"
+    (trade,) = core.trade_log
+    assert trade.entry_price == 101.0
+    assert trade.exit_price == 103.0
+    assert trade.pnl == pytest.approx((103.0 - 101.0) * trade.qty)
@@ -0,0 +1,79 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+import pandas as pd
+
+from ai.train_rl_arbitrator import STRATEGIES
+from ai.transitions import build_transitions, iter_transitions, load_transitions
+from backtest.engine import BacktestEngine, Trade
+from core.state_encoder import FEATURES, StateEncoder
+
+
+def _engine_with_trades(n=250):
+    rng = np.random.default_rng(4)
+    engine = BacktestEngine({}, [])
+    names = STRATEGIES + ["RetiredBot"]
+    for i in range(n):
+        entry = float(rng.uniform(90, 110))
+        exit_ = entry * float(1 + rng.normal(0, 0.01))
+        side = "buy" if i % 3 else "sell"
+        pnl = (exit_ - entry) if side == "buy" else (entry - exit_)
+        engine.trade_log.append(
+            Trade(
+                strategy=names[i % len(names)],
+                symbol=f"S{i % 7}USDT",
+                timeframe=("1m", "1h")[i % 2],
+                side=side,
+                entry_time=pd.Timestamp("2024-01-01") + pd.Timedelta(minutes=i),
+                exit_time=pd.Timestamp("2024-01-01") + pd.Timedelta(minutes=i + 5),
+                entry_price=entry,
+                exit_price=exit_,
+                sl=None,
+                tp=None,
+                qty=1.0,
+                pnl=pnl,
+            )
+        )
+    return engine
+
+
+def test_builds_actions_rewards_and_states(tmp_path):
+    engine = _engine_with_trades()
+    path = tmp_path / "trades.csv"
+    engine.save_trade_log(str(path))
+    log = pd.read_csv(path)
+    batch = load_transitions(str(path), STRATEGIES)
+
+    known = log[log["strategy"] != "RetiredBot"].reset_index(drop=True)
+    assert len(batch.actions) == len(known)
+    assert [STRATEGIES[a] for a in batch.actions] == known["strategy"].tolist()
+    assert batch.rewards.tolist() == [1.0 if p > 0 else -1.0 for p in known["pnl"]]
+    assert batch.states.shape == (len(known), StateEncoder().dim) and batch.states.dtype == np.float32
+    assert batch.dones.all()
+    row = known.iloc[0]
+    sign = -1 if row["side"] == "sell" else 1
+    expected = np.tanh((row["exit_price"] / row["entry_price"] - 1) * sign)
+    assert np.isclose(batch.next_states[0, FEATURES.index("recent_return")], expected)
+
+
+def test_chunked_parquet_matches_whole_csv(tmp_path):
+    engine = _engine_with_trades()
+    engine.save_trade_log(str(tmp_path / "trades.csv"))
+    engine.save_trade_log(str(tmp_path / "trades.parquet"))
+    whole = load_transitions(str(tmp_path / "trades.csv"), STRATEGIES)
+    chunks = list(iter_transitions(str(tmp_path / "trades.parquet"), STRATEGIES, chunksize=40))
+    assert len(chunks) == 7
+    for column, parts in zip(whole, zip(*chunks)):
+        assert np.array_equal(column, np.concatenate(parts))
+
+
+def test_build_transitions_on_frame_without_known_strategies():
+    frame = pd.DataFrame(
+        {"strategy": ["Nope"], "symbol": ["BTCUSDT"], "timeframe": ["1m"], "side": ["buy"],
+         "entry_price": [1.0], "exit_price": [2.0], "pnl": [1.0]}
+    )
+    batch = build_transitions(frame, STRATEGIES)
+    assert batch.states.shape == (0, StateEncoder().dim) and len(batch.actions) == 0
@@ -0,0 +1,79 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+import pandas as pd
+
+from analysis.walk_forward import WalkForward, _walk
+from backtest.engine import BacktestEngine
+from strategies.scalper import ScalperBot
+from utils.indicator_cache import IndicatorCache
+
+GRID = {"fast": [3, 5], "slow": [8, 13]}
+
+
+def _frame(seed: int, rows: int = 2000) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, rows)))
+    spread = np.abs(rng.normal(0, 0.002, rows)) * close
+    return pd.DataFrame(
+        {
+            "timestamp": pd.date_range("2024-01-01", periods=rows, freq="min"),
+            "open": close,
+            "high": close + spread,
+            "low": close - spread,
+            "close": close,
+            "volume": rng.lognormal(3, 0.5, rows),
+        }
+    )
+
+
+def test_windows_rolling_and_anchored():
+    wf = WalkForward(ScalperBot, GRID, train_bars=500, test_bars=200, data={})
+    assert wf.windows(1200) == [(0, 500, 500, 700), (200, 700, 700, 900), (400, 900, 900, 1100)]
+    wf.anchored = True
+    assert [w[0] for w in wf.windows(1200)] == [0, 0, 0]
+
+
+def test_walk_forward_selects_best_train_params():
+    data = {("AAA", "1m"): _frame(1), ("BBB", "1m"): _frame(2)}
+    wf = WalkForward(ScalperBot, GRID, train_bars=800, test_bars=300, data=data, workers=1)
+    table = wf.run()
+    assert len(table) == 2 * 4
+    windows = wf.windows(2000)
+    for key in data:
+        scores = {
+            tuple(p.values()): _walk((ScalperBot, p, key, windows), data, {key: IndicatorCache()}, {})
+            for p in wf.optimizer.candidates()
+        }
+        rows = table[table["symbol"] == key[0]]
+        for w, row in enumerate(rows.itertuples()):
+            best = max(s[w][0]["net_profit"] for s in scores.values())
+            assert row.train_net_profit == best
+            assert row.test_net_profit == scores[(row.fast, row.slow)][w][1]["net_profit"]
+    summary = wf.summary()
+    assert summary["windows"] == 8
+    assert summary["test_net_profit"] == table["test_net_profit"].sum()
+
+
+def test_test_window_uses_warmed_up_signals():
+    df = _frame(3)
+    key = ("AAA", "1m")
+    windows = [(0, 800, 800, 1100)]
+    _, test = _walk((ScalperBot, {"fast": 3, "slow": 8}, key, windows), {key: df}, {key: IndicatorCache()}, {})[0]
+    # Equivalent to running the full history and keeping only trades inside the test window
+    actions, sl, tp = ScalperBot("AAA", "1m", fast=3, slow=8).generate_signals(df)
+    strategy = ScalperBot("AAA", "1m", fast=3, slow=8)
+    strategy.generate_signals = lambda _: (actions[800:1100], sl[800:1100], tp[800:1100])
+    engine = BacktestEngine({key: df.iloc[800:1100]}, [strategy])
+    engine.run()
+    assert test["net_profit"] == engine.summary()["net_profit"]
+
+
+def test_parallel_matches_inline():
+    data = {("AAA", "1m"): _frame(1)}
+    inline = WalkForward(ScalperBot, GRID, 800, 300, data=data, workers=1).run()
+    parallel = WalkForward(ScalperBot, GRID, 800, 300, data=data, workers=2).run()
+    pd.testing.assert_frame_equal(inline, parallel)
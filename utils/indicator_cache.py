@@ -0,0 +1,38 @@
+from __future__ import annotations
+
+from typing import Callable, Dict, Hashable
+
+import numpy as np
+
+
+class IndicatorCache:
+    """Memoize indicator arrays computed over one bar series.
+
+    Strategies evaluated on the same bars (e.g. a parameter sweep) share one
+    cache so an EMA of a given span is computed once, not once per parameter
+    set. Cached arrays are read-only. A cache must only be shared by
+    strategies run over the same series; keys include the series length so
+    prefixes and suffixes of different sizes do not collide.
+    """
+
+    def __init__(self) -> None:
+        self._values: Dict[Hashable, np.ndarray] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def get(self, key: Hashable, compute: Callable[[], np.ndarray]) -> np.ndarray:
+        value = self._values.get(key)
+        if value is not None:
+            self.hits += 1
+            return value
+        self.misses += 1
+        value = np.asarray(compute())
+        value.flags.writeable = False
+        self._values[key] = value
+        return value
+
+    def clear(self) -> None:
+        self._values.clear()
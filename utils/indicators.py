@@ -28,10 +28,8 @@ def ema(prices: List[float], period: int) -> Optional[float]:
     return pd.Series(prices).ewm(span=period, adjust=False).mean().iloc[-1]
 
 
-def rsi(prices: List[float], period: int = 14) -> Optional[float]:
-    """Compute Relative Strength Index."""
-    if len(prices) < period + 1:
-        return None
+def rsi_series(prices: List[float], period: int = 14) -> pd.Series:
+    """Return the RSI for every bar after the first (aligned to ``prices[1:]``)."""
     series = pd.Series(prices)
     diff = series.diff().dropna()
     up = diff.clip(lower=0)
@@ -39,28 +37,46 @@ def rsi(prices: List[float], period: int = 14) -> Optional[float]:
     ma_up = up.ewm(com=period - 1, adjust=False).mean()
     ma_down = down.ewm(com=period - 1, adjust=False).mean()
     rs = ma_up / ma_down
-    return 100 - (100 / (1 + rs.iloc[-1]))
+    return 100 - (100 / (1 + rs))
 
 
-def macd(prices: List[float], fast: int = 12, slow: int = 26, signal: int = 9) -> Optional[tuple[float, float]]:
-    """Return MACD line and signal line."""
-    if len(prices) < slow:
+def rsi(prices: List[float], period: int = 14) -> Optional[float]:
+    """Compute Relative Strength Index."""
+    if len(prices) < period + 1:
         return None
+    return rsi_series(prices, period).iloc[-1]
+
+
+def macd_series(prices: List[float], fast: int = 12, slow: int = 26, signal: int = 9) -> tuple[pd.Series, pd.Series]:
+    """Return the full MACD and signal line series."""
     series = pd.Series(prices)
     ema_fast = series.ewm(span=fast, adjust=False).mean()
     ema_slow = series.ewm(span=slow, adjust=False).mean()
     macd_line = ema_fast - ema_slow
     signal_line = macd_line.ewm(span=signal, adjust=False).mean()
-    return macd_line.iloc[-1], signal_line.iloc[-1]
+    return macd_line, signal_line
 
 
-def atr(highs: List[float], lows: List[float], closes: List[float], period: int = 14) -> Optional[float]:
-    """Calculate Average True Range."""
-    if len(highs) < period + 1 or len(lows) < period + 1 or len(closes) < period + 1:
+def macd(prices: List[float], fast: int = 12, slow: int = 26, signal: int = 9) -> Optional[tuple[float, float]]:
+    """Return MACD line and signal line."""
+    if len(prices) < slow:
         return None
+    macd_line, signal_line = macd_series(prices, fast, slow, signal)
+    return macd_line.iloc[-1], signal_line.iloc[-1]
+
+
+def atr_series(highs: List[float], lows: List[float], closes: List[float], period: int = 14) -> pd.Series:
+    """Return the rolling Average True Range for every bar."""
     df = pd.DataFrame({"high": highs, "low": lows, "close": closes})
     high_low = df["high"] - df["low"]
     high_close = (df["high"] - df["close"].shift()).abs()
     low_close = (df["low"] - df["close"].shift()).abs()
     tr = pd.concat([high_low, high_close, low_close], axis=1).max(axis=1)
-    return tr.rolling(window=period).mean().iloc[-1]
+    return tr.rolling(window=period).mean()
+
+
+def atr(highs: List[float], lows: List[float], closes: List[float], period: int = 14) -> Optional[float]:
+    """Calculate Average True Range."""
+    if len(highs) < period + 1 or len(lows) < period + 1 or len(closes) < period + 1:
+        return None
+    return atr_series(highs, lows, closes, period).iloc[-1]
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import math
+from typing import Dict, List
+
+
+class LatencyHistogram:
+    """Fixed log-scale histogram of durations in seconds.
+
+    Buckets split each decade from ``min_s`` to ``max_s`` into
+    ``per_decade`` steps, so recording is O(1) and memory is constant.
+    Percentiles report the upper edge of the bucket they fall in.
+    """
+
+    def __init__(self, min_s: float = 1e-6, max_s: float = 10.0, per_decade: int = 10) -> None:
+        self.min_s = min_s
+        self.per_decade = per_decade
+        self.buckets = int(math.ceil(math.log10(max_s / min_s) * per_decade)) + 1
+        self.counts: List[int] = [0] * self.buckets
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def _bucket(self, seconds: float) -> int:
+        if seconds <= self.min_s:
+            return 0
+        index = int(math.log10(seconds / self.min_s) * self.per_decade) + 1
+        return min(index, self.buckets - 1)
+
+    def _upper(self, index: int) -> float:
+        return self.min_s * 10 ** (index / self.per_decade)
+
+    def record(self, seconds: float) -> None:
+        self.counts[self._bucket(seconds)] += 1
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, pct: float) -> float:
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * pct / 100))
+        seen = 0
+        for index, n in enumerate(self.counts):
+            seen += n
+            if seen >= rank:
+                return min(self._upper(index), self.max)
+        return self.max
+
+    def snapshot(self) -> Dict[str, float]:
+        return {
+            "count": self.count,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "max": self.max,
+        }
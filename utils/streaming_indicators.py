@@ -0,0 +1,217 @@
+"""Stateful indicators that update in O(1) per new value.
+
+Each indicator takes one observation per :meth:`update` call and returns the
+current reading, or ``None`` while it is still warming up. ``seed`` feeds a
+batch of history in one call. The warm-up rules mirror the list based helpers
+in :mod:`utils.indicators` so the two can be used interchangeably.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import deque
+from typing import Deque, Iterable, Optional, Tuple
+
+
+class StreamingIndicator:
+    """Base class for incremental indicators."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.value: Optional[float] = None
+
+    @property
+    def ready(self) -> bool:
+        return self.value is not None
+
+    def update(self, value: float) -> Optional[float]:
+        raise NotImplementedError
+
+    def seed(self, values: Iterable[float]) -> Optional[float]:
+        """Warm up from historical ``values`` and return the latest reading."""
+        for value in values:
+            self.update(value)
+        return self.value
+
+
+class EMA(StreamingIndicator):
+    """Exponential moving average (``adjust=False``, seeded with the first value)."""
+
+    def __init__(self, period: int, alpha: float | None = None) -> None:
+        super().__init__()
+        self.period = period
+        self.alpha = alpha if alpha is not None else 2 / (period + 1)
+        self._ema: Optional[float] = None
+
+    def update(self, value: float) -> Optional[float]:
+        self.count += 1
+        if self._ema is None:
+            self._ema = float(value)
+        else:
+            self._ema += self.alpha * (value - self._ema)
+        if self.count >= self.period:
+            self.value = self._ema
+        return self.value
+
+
+class RSI(StreamingIndicator):
+    """Wilder Relative Strength Index."""
+
+    def __init__(self, period: int = 14) -> None:
+        super().__init__()
+        self.period = period
+        self._last: Optional[float] = None
+        self._up = EMA(1, alpha=1 / period)
+        self._down = EMA(1, alpha=1 / period)
+
+    def update(self, value: float) -> Optional[float]:
+        self.count += 1
+        if self._last is not None:
+            diff = value - self._last
+            up = self._up.update(max(diff, 0.0))
+            down = self._down.update(max(-diff, 0.0))
+            if self.count >= self.period + 1:
+                if down:
+                    self.value = 100 - 100 / (1 + up / down)
+                else:
+                    self.value = 100.0 if up else math.nan
+        self._last = value
+        return self.value
+
+
+class MACD(StreamingIndicator):
+    """MACD line and signal line; ``value`` holds the ``(macd, signal)`` pair."""
+
+    def __init__(self, fast: int = 12, slow: int = 26, signal: int = 9) -> None:
+        super().__init__()
+        self.slow = slow
+        self._fast = EMA(1, alpha=2 / (fast + 1))
+        self._slow = EMA(1, alpha=2 / (slow + 1))
+        self._signal = EMA(1, alpha=2 / (signal + 1))
+        self.value: Optional[Tuple[float, float]] = None  # type: ignore[assignment]
+
+    def update(self, value: float) -> Optional[Tuple[float, float]]:  # type: ignore[override]
+        self.count += 1
+        line = self._fast.update(value) - self._slow.update(value)
+        signal = self._signal.update(line)
+        if self.count >= self.slow:
+            self.value = (line, signal)
+        return self.value
+
+
+class RollingMean(StreamingIndicator):
+    """Simple moving average over a fixed window."""
+
+    def __init__(self, window: int) -> None:
+        super().__init__()
+        self.window = window
+        self._values: Deque[float] = deque(maxlen=window)
+        self._sum = 0.0
+
+    def update(self, value: float) -> Optional[float]:
+        self.count += 1
+        if len(self._values) == self.window:
+            self._sum -= self._values[0]
+        self._values.append(value)
+        # re-sum once per window to stop floating point drift (amortised O(1))
+        if self.count % self.window == 0:
+            self._sum = math.fsum(self._values)
+        else:
+            self._sum += value
+        if len(self._values) == self.window:
+            self.value = self._sum / self.window
+        return self.value
+
+
+class RollingStd(StreamingIndicator):
+    """Sample standard deviation (``ddof=1``) over a fixed window."""
+
+    def __init__(self, window: int) -> None:
+        super().__init__()
+        self.window = window
+        self._values: Deque[float] = deque(maxlen=window)
+        self._mean = 0.0
+        self._m2 = 0.0
+
+    def _resync(self) -> None:
+        n = len(self._values)
+        self._mean = math.fsum(self._values) / n
+        self._m2 = math.fsum((v - self._mean) ** 2 for v in self._values)
+
+    def update(self, value: float) -> Optional[float]:
+        self.count += 1
+        if len(self._values) < self.window:
+            self._values.append(value)
+            n = len(self._values)
+            delta = value - self._mean
+            self._mean += delta / n
+            self._m2 += delta * (value - self._mean)
+        else:
+            old = self._values[0]
+            self._values.append(value)
+            old_mean = self._mean
+            self._mean += (value - old) / self.window
+            self._m2 += (value - old) * (value - self._mean + old - old_mean)
+        if self.count % self.window == 0:
+            self._resync()
+        if len(self._values) == self.window and self.window > 1:
+            self.value = math.sqrt(max(self._m2, 0.0) / (self.window - 1))
+        return self.value
+
+
+class RollingMax(StreamingIndicator):
+    """Rolling maximum using a monotonic deque."""
+
+    def __init__(self, window: int) -> None:
+        super().__init__()
+        self.window = window
+        self._deque: Deque[Tuple[int, float]] = deque()
+
+    def _better(self, new: float, old: float) -> bool:
+        return new >= old
+
+    def update(self, value: float) -> Optional[float]:
+        idx = self.count
+        self.count += 1
+        while self._deque and self._better(value, self._deque[-1][1]):
+            self._deque.pop()
+        self._deque.append((idx, value))
+        if self._deque[0][0] <= idx - self.window:
+            self._deque.popleft()
+        # like max() over a deque, report as soon as anything is buffered
+        self.value = self._deque[0][1]
+        return self.value
+
+
+class RollingMin(RollingMax):
+    """Rolling minimum using a monotonic deque."""
+
+    def _better(self, new: float, old: float) -> bool:
+        return new <= old
+
+
+class ATR(StreamingIndicator):
+    """Average True Range as a simple mean of the last ``period`` true ranges."""
+
+    def __init__(self, period: int = 14) -> None:
+        super().__init__()
+        self.period = period
+        self._prev_close: Optional[float] = None
+        self._mean = RollingMean(period)
+
+    def update(self, high: float, low: float, close: float) -> Optional[float]:  # type: ignore[override]
+        self.count += 1
+        tr = high - low
+        if self._prev_close is not None:
+            tr = max(tr, abs(high - self._prev_close), abs(low - self._prev_close))
+        self._prev_close = close
+        atr_val = self._mean.update(tr)
+        if self.count >= self.period + 1:
+            self.value = atr_val
+        return self.value
+
+    def seed(self, candles: Iterable[Tuple[float, float, float]]) -> Optional[float]:  # type: ignore[override]
+        """Warm up from ``(high, low, close)`` tuples."""
+        for high, low, close in candles:
+            self.update(high, low, close)
+        return self.value
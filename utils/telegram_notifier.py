@@ -1,47 +1,202 @@
-import requests
-import time
+import logging
 import os
-from collections import deque
-from datetime import datetime
+import queue
+import threading
+import time
+from typing import Any, List, Optional
+
+import requests
 
 TELEGRAM_BOT_TOKEN = os.getenv("TELEGRAM_TOKEN")
 TELEGRAM_CHAT_ID = os.getenv("TELEGRAM_CHAT_ID")
+TELEGRAM_API_URL = "https://api.telegram.org"
 
-telegram_queue: deque[dict] = deque()
 MAX_RETRIES = 3
+# Telegram rejects messages longer than 4096 characters
+MAX_MESSAGE_CHARS = 4000
+
+
+class TelegramDispatcher:
+    """Deliver Telegram alerts from a background thread.
+
+    ``send`` only puts the message on a bounded queue, so callers on the
+    trading path never wait for the network. The worker sends at most one
+    message per ``interval`` seconds, joining everything queued in the
+    meantime. Failed sends are retried with exponential backoff on the
+    worker thread, up to ``max_retries`` times. When the queue is full, new
+    alerts are dropped and counted, and the next message says how many
+    were lost.
+    """
+
+    def __init__(
+        self,
+        token: Optional[str] = None,
+        chat_id: Optional[str] = None,
+        api_url: str = TELEGRAM_API_URL,
+        interval: float = 1.0,
+        max_queue: int = 1000,
+        max_retries: int = MAX_RETRIES,
+        backoff: float = 1.0,
+        max_backoff: float = 60.0,
+        timeout: float = 10.0,
+    ) -> None:
+        self.token = token if token is not None else TELEGRAM_BOT_TOKEN
+        self.chat_id = chat_id if chat_id is not None else TELEGRAM_CHAT_ID
+        self.api_url = api_url.rstrip("/")
+        self.interval = interval
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.timeout = timeout
+        self.queue: "queue.Queue[str]" = queue.Queue(maxsize=max_queue)
+        self.session = requests.Session()
+        self.sent = 0
+        self.failed = 0
+        self.dropped = 0
+        self._reported_drops = 0
+        self._pending = 0
+        self._cond = threading.Condition()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="telegram", daemon=True)
+        self._thread.start()
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.token and self.chat_id)
+
+    def send(self, message: Any) -> bool:
+        """Queue ``message``; returns False if it was dropped."""
+        if not self.enabled:
+            return False
+        with self._cond:
+            try:
+                self.queue.put_nowait(str(message))
+            except queue.Full:
+                self.dropped += 1
+                return False
+            self._pending += 1
+        return True
+
+    # Lets the dispatcher stand in where a notifier module object was expected
+    send_telegram_alert = send
+
+    # ------------------------------------------------------------------
+    def _post(self, text: str) -> Optional[float]:
+        """Send ``text``; return None on success or seconds to wait before retrying."""
+        url = f"{self.api_url}/bot{self.token}/sendMessage"
+        try:
+            resp = self.session.post(url, json={"chat_id": self.chat_id, "text": text}, timeout=self.timeout)
+        except requests.RequestException as e:
+            logging.warning(f"Telegram send failed: {e}")
+            return 0.0
+        if resp.status_code == 200:
+            return None
+        retry_after = 0.0
+        if resp.status_code == 429:
+            try:
+                retry_after = float(resp.json()["parameters"]["retry_after"])
+            except (ValueError, KeyError, TypeError):
+                pass
+        logging.warning(f"Telegram send failed with HTTP {resp.status_code}")
+        return retry_after
+
+    def _drain(self) -> List[str]:
+        messages = []
+        while True:
+            try:
+                messages.append(self.queue.get_nowait())
+            except queue.Empty:
+                return messages
+
+    def _compose(self, messages: List[str]) -> str:
+        lost = self.dropped - self._reported_drops
+        self._reported_drops = self.dropped
+        if lost:
+            messages = messages + [f"⚠️ {lost} alerts dropped while the queue was full"]
+        lines: List[str] = []
+        size = 0
+        for i, message in enumerate(messages):
+            size += len(message) + 1
+            if lines and size > MAX_MESSAGE_CHARS:
+                lines.append(f"… and {len(messages) - i} more alerts")
+                break
+            lines.append(message[:MAX_MESSAGE_CHARS])
+        return "\n".join(lines)
+
+    def _deliver(self, text: str) -> None:
+        for attempt in range(self.max_retries + 1):
+            wait = self._post(text)
+            if wait is None:
+                self.sent += 1
+                return
+            if attempt == self.max_retries:
+                break
+            delay = max(wait, min(self.backoff * 2 ** attempt, self.max_backoff))
+            if self._stop.wait(delay):
+                # Shutting down: one last attempt without waiting further
+                if self._post(text) is None:
+                    self.sent += 1
+                    return
+                break
+        self.failed += 1
+        print(f"⚠️ Telegram failed for: {text}")
+
+    def _run(self) -> None:
+        last = 0.0
+        while True:
+            try:
+                first = self.queue.get(timeout=0.1)
+            except queue.Empty:
+                if self._stop.is_set():
+                    return
+                continue
+            # Coalesce the burst: wait out the rest of the interval, then drain
+            pause = last + self.interval - time.monotonic()
+            if pause > 0 and not self._stop.is_set():
+                self._stop.wait(pause)
+            messages = [first] + self._drain()
+            self._deliver(self._compose(messages))
+            last = time.monotonic()
+            with self._cond:
+                self._pending -= len(messages)
+                self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every queued alert has been sent or given up on."""
+        with self._cond:
+            return self._cond.wait_for(lambda: self._pending == 0 or not self._thread.is_alive(), timeout)
+
+    def close(self, timeout: Optional[float] = None) -> None:
+        """Send what is queued (without further coalescing delay) and stop."""
+        self._stop.set()
+        self._thread.join(timeout)
+        self.session.close()
+
+
+_dispatcher: Optional[TelegramDispatcher] = None
+_dispatcher_lock = threading.Lock()
+
+
+def get_dispatcher() -> TelegramDispatcher:
+    """Return the process-wide dispatcher configured from the environment."""
+    global _dispatcher
+    with _dispatcher_lock:
+        if _dispatcher is None:
+            _dispatcher = TelegramDispatcher()
+        return _dispatcher
+
+
+def send_telegram_alert(message: Any) -> None:
+    """Queue ``message`` for delivery via Telegram; never blocks."""
+    get_dispatcher().send(message)
 
-def _send_telegram(message: str) -> bool:
-    if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
-        return False
-    url = f"https://api.telegram.org/bot{TELEGRAM_BOT_TOKEN}/sendMessage"
-    payload = {"chat_id": TELEGRAM_CHAT_ID, "text": message}
-    try:
-        resp = requests.post(url, json=payload, timeout=10)
-        return resp.status_code == 200
-    except Exception:
-        return False
-
-def send_telegram_alert(message: str) -> None:
-    """Send ``message`` immediately via Telegram or queue for retry."""
-    if not _send_telegram(message):
-        telegram_queue.append({"msg": message, "retries": 0, "ts": datetime.utcnow()})
 
 def _notify(message: str) -> None:
-     if not _send_telegram(message):
-        telegram_queue.append({"msg": message, "retries": 0, "ts": datetime.utcnow()})
+    get_dispatcher().send(message)
 
 
 def retry_failed_alerts() -> None:
-    for alert in list(telegram_queue):
-        if alert["retries"] >= MAX_RETRIES:
-            print(f"⚠️ Telegram failed for: {alert['msg']}")
-            telegram_queue.remove(alert)
-            continue
-        if _send_telegram(alert["msg"]):
-            telegram_queue.remove(alert)
-        else:
-            alert["retries"] += 1
-            time.sleep(2 ** alert["retries"])
+    """Kept for callers of the old API; retries now run on the dispatcher thread."""
 
 
 def alert_trade_opened(symbol: str, timeframe: str, direction: str, entry: float, sl: float, tp: float) -> None:
@@ -64,4 +219,4 @@ def alert_trade_closed(symbol: str, timeframe: str, reason: str) -> None:
 
 def alert_daily_guard(reason: str) -> None:
     msg = f"🚫 Daily guard triggered: {reason}"
-    _notify(msg)
\ No newline at end of file
+    _notify(msg)
@@ -1,17 +1,56 @@
+import atexit
+import logging
 import sqlite3
-from typing import Any, Dict, Optional
+import threading
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+INSERT = "INSERT INTO trades (timestamp, side, symbol, qty, price) VALUES (?, ?, ?, ?, ?)"
 
 
 class TradeLogger:
-    """Log executed trades to a SQLite database."""
+    """Log executed trades to a SQLite database.
+
+    Rows are buffered in memory and written by a dedicated writer thread
+    with ``executemany`` once ``batch_size`` rows are waiting or
+    ``flush_interval`` seconds have passed, one commit per batch. The
+    database runs in WAL mode so readers never block the writer. ``flush``
+    and ``close`` (also run at interpreter exit) return only after every
+    buffered row is committed.
+    """
 
-    def __init__(self, db_path: str = "journal/trade_log.db") -> None:
+    def __init__(
+        self,
+        db_path: str = "journal/trade_log.db",
+        batch_size: int = 500,
+        flush_interval: float = 0.2,
+    ) -> None:
         self.db_path = db_path
-        self.conn = sqlite3.connect(self.db_path)
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self._buffer: List[Tuple] = []
+        self._queued = 0
+        self._written = 0
+        self._flush_target = 0
+        self._closing = False
+        self._cond = threading.Condition()
         self._create_table()
+        # Reads go through their own connection; WAL lets them run while writing
+        self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._writer = threading.Thread(target=self._run, name="trade-journal", daemon=True)
+        self._writer.start()
+        atexit.register(self.close)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # Safe with WAL: a crash can only lose the last commits, never corrupt
+        conn.execute("PRAGMA synchronous=NORMAL")
+        return conn
 
     def _create_table(self) -> None:
-        self.conn.execute(
+        conn = self._connect()
+        conn.execute(
             """CREATE TABLE IF NOT EXISTS trades (
             id INTEGER PRIMARY KEY AUTOINCREMENT,
             timestamp TEXT,
@@ -21,22 +60,107 @@ class TradeLogger:
             price REAL
         )"""
         )
-        self.conn.commit()
+        conn.execute("CREATE INDEX IF NOT EXISTS idx_trades_symbol_timestamp ON trades (symbol, timestamp)")
+        conn.commit()
+        conn.close()
 
-    def log_trade(self, trade: Dict[str, Any]) -> None:
-        """Insert a trade record into the database."""
-        self.conn.execute(
-            "INSERT INTO trades (timestamp, side, symbol, qty, price) VALUES (?, ?, ?, ?, ?)",
-            (
-                trade.get("timestamp")
-                or trade.get("datetime"),
-                trade.get("side"),
-                trade.get("symbol"),
-                float(trade.get("amount") or trade.get("qty")),
-                float(trade.get("price")) if trade.get("price") is not None else None,
-            ),
+    @staticmethod
+    def _row(trade: Dict[str, Any]) -> Tuple:
+        return (
+            trade.get("timestamp")
+            or trade.get("datetime")
+            or datetime.now(timezone.utc).isoformat(),
+            trade.get("side"),
+            trade.get("symbol"),
+            float(trade.get("amount") or trade.get("qty")),
+            float(trade.get("price")) if trade.get("price") is not None else None,
         )
-        self.conn.commit()
+
+    # ------------------------------------------------------------------
+    def log_trade(self, trade: Dict[str, Any]) -> None:
+        """Queue a trade record for the writer thread."""
+        self.log_trades([trade])
+
+    def log_trades(self, trades: Iterable[Dict[str, Any]]) -> None:
+        """Queue several trade records; rows are validated here, written later."""
+        rows = [self._row(trade) for trade in trades]
+        with self._cond:
+            if self._closing:
+                raise RuntimeError("trade logger is closed")
+            self._buffer.extend(rows)
+            self._queued += len(rows)
+            if len(self._buffer) >= self.batch_size:
+                self._cond.notify_all()
+
+    def _run(self) -> None:
+        conn = self._connect()
+        try:
+            while True:
+                with self._cond:
+                    # Size threshold, flush request or close; otherwise the interval
+                    self._cond.wait_for(
+                        lambda: len(self._buffer) >= self.batch_size
+                        or self._closing
+                        or self._flush_target > self._written,
+                        self.flush_interval,
+                    )
+                    rows, self._buffer = self._buffer, []
+                    done = self._closing
+                if rows:
+                    try:
+                        with conn:
+                            conn.executemany(INSERT, rows)
+                    except sqlite3.Error as e:
+                        if done:
+                            logging.error(f"Trade journal write failed, dropping {len(rows)} rows: {e}")
+                            return
+                        logging.error(f"Trade journal write failed, retrying: {e}")
+                        with self._cond:
+                            self._buffer[:0] = rows
+                            self._cond.wait(self.flush_interval)
+                        continue
+                with self._cond:
+                    self._written += len(rows)
+                    self._cond.notify_all()
+                if done:
+                    return
+        finally:
+            conn.close()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Block until everything queued so far is committed."""
+        with self._cond:
+            target = self._queued
+            self._flush_target = max(self._flush_target, target)
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._written >= target or not self._writer.is_alive(), timeout)
+
+    def trades(
+        self, symbol: Optional[str] = None, start: Optional[str] = None, end: Optional[str] = None
+    ) -> List[Tuple]:
+        """Return journal rows, oldest first, filtered by symbol and time range."""
+        self.flush()
+        clauses, params = [], []
+        if symbol is not None:
+            clauses.append("symbol = ?")
+            params.append(symbol)
+        if start is not None:
+            clauses.append("timestamp >= ?")
+            params.append(start)
+        if end is not None:
+            clauses.append("timestamp <= ?")
+            params.append(end)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        query = f"SELECT timestamp, side, symbol, qty, price FROM trades{where} ORDER BY timestamp, id"
+        return self.conn.execute(query, params).fetchall()
 
     def close(self) -> None:
+        """Write every buffered row, stop the writer and close the database."""
+        with self._cond:
+            if self._closing:
+                return
+            self._closing = True
+            self._cond.notify_all()
+        self._writer.join()
         self.conn.close()
+        atexit.unregister(self.close)